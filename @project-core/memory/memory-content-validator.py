@@ -6,16 +6,27 @@ GRUPO US VIBECODE SYSTEM - Native RAG System V1.0
 
 Sistema inteligente para validar conteúdo antes de adicionar aos arquivos de memória,
 prevenindo duplicações, redundâncias e informações obsoletas.
+
+Detecção de duplicatas em duas etapas: assinaturas MinHash (shingles de
+caracteres) com índice LSH por bandas selecionam os candidatos, e apenas
+esses são verificados com difflib.SequenceMatcher. As assinaturas ficam em
+`native-rag-system/cache/content-validator/<tipo>.minhash.json` (fora do
+controle de versão) e são invalidadas pelo mtime do arquivo de memória.
 """
 
 import os
 import re
+import json
 import hashlib
+from array import array
 from pathlib import Path
 from typing import List, Dict, Any, Set
 from datetime import datetime
 import difflib
 
+MINHASH_CACHE_VERSION = 1
+_MASK64 = (1 << 64) - 1
+
 class MemoryContentValidator:
     """
     Validador inteligente de conteúdo para arquivos de memória
@@ -39,21 +50,43 @@ class MemoryContentValidator:
                 'TaskMaster', 'task-master', 'taskmaster',
                 'deprecated', 'obsolete', 'removed'
             ],
-            'required_quality_score': 0.7  # Mínimo 70% qualidade
+            'required_quality_score': 0.7,  # Mínimo 70% qualidade
+            'shingle_size': 4,             # Shingles de 4 caracteres
+            'minhash_bands': 42,           # 42 bandas x 3 linhas = 126 permutações
+            'minhash_rows': 3,
+            'signature_cache_dir': self.project_root / 'native-rag-system' / 'cache' / 'content-validator'
         }
         
         # Cache de conteúdo existente
         self.existing_content = {}
         self.content_hashes = set()
+        self.file_mtimes = {}
+        
+        # Índice MinHash-LSH por arquivo: assinaturas e bandas -> posições das entradas
+        self.signatures = {}
+        self.lsh_buckets = {}
+        self.duplicate_stats = {'validations': 0, 'candidates_checked': 0, 'entries_skipped': 0}
+        
+        # Máscaras das permutações (determinísticas, para que as assinaturas possam persistir)
+        permutations = self.config['minhash_bands'] * self.config['minhash_rows']
+        seed = hashlib.sha256(b'memory-content-validator-minhash').digest()
+        self.permutation_masks = [
+            int.from_bytes(hashlib.blake2b(i.to_bytes(4, 'little'), digest_size=8, key=seed).digest(), 'little')
+            for i in range(permutations)
+        ]
         
     def load_existing_content(self):
         """Carrega conteúdo existente dos arquivos de memória"""
         self.existing_content = {}
         self.content_hashes = set()
+        self.file_mtimes = {}
+        self.signatures = {}
+        self.lsh_buckets = {}
         
         for file_type, file_path in self.memory_files.items():
             if file_path.exists():
                 try:
+                    mtime_ns = file_path.stat().st_mtime_ns
                     with open(file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
                     
@@ -69,10 +102,120 @@ class MemoryContentValidator:
                     for entry in entries:
                         content_hash = hashlib.md5(entry.lower().strip().encode()).hexdigest()
                         self.content_hashes.add(content_hash)
+                    
+                    self.file_mtimes[file_type] = mtime_ns
+                    self._build_lsh_index(file_type, entries, mtime_ns)
                         
                 except Exception as e:
                     print(f"⚠️ Error loading {file_type}: {e}")
     
+    def _memory_files_changed(self) -> bool:
+        """Verifica se algum arquivo de memória mudou desde o último carregamento"""
+        for file_type, file_path in self.memory_files.items():
+            try:
+                mtime_ns = file_path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if self.file_mtimes.get(file_type) != mtime_ns:
+                return True
+        return False
+    
+    # MINHASH-LSH
+    
+    def _shingle_hashes(self, content: str) -> Set[int]:
+        """Hashes de 64 bits dos shingles de caracteres do texto normalizado"""
+        text = ' '.join(content.lower().split())
+        size = self.config['shingle_size']
+        shingles = {text[i:i + size] for i in range(max(1, len(text) - size + 1))}
+        return {
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+            for shingle in shingles
+        }
+    
+    def _minhash_signature(self, content: str) -> List[int]:
+        """Assinatura MinHash: mínimo de cada permutação (XOR com máscara) sobre os shingles"""
+        hashes = list(self._shingle_hashes(content))
+        return [min(map(mask.__xor__, hashes)) for mask in self.permutation_masks]
+    
+    def _band_keys(self, signature: List[int]) -> List[tuple]:
+        rows = self.config['minhash_rows']
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self.config['minhash_bands'])]
+    
+    def _signature_cache_path(self, file_type: str) -> Path:
+        return Path(self.config['signature_cache_dir']) / f"{file_type}.minhash.json"
+    
+    def _cache_params(self) -> Dict[str, Any]:
+        return {
+            'version': MINHASH_CACHE_VERSION,
+            'shingle_size': self.config['shingle_size'],
+            'bands': self.config['minhash_bands'],
+            'rows': self.config['minhash_rows']
+        }
+    
+    def _load_signature_cache(self, cache_path: Path) -> Dict[str, Any]:
+        """Carrega assinaturas persistidas (vazio se ausentes ou com parâmetros diferentes)"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('params') != self._cache_params():
+                return {}
+            return cache
+        except (OSError, ValueError):
+            return {}
+    
+    def _build_lsh_index(self, file_type: str, entries: List[str], mtime_ns: int):
+        """
+        Monta o índice LSH de um arquivo de memória
+        
+        Com mtime inalterado as assinaturas persistidas são usadas diretamente;
+        caso contrário apenas entradas novas ou alteradas são recalculadas
+        (as demais são reaproveitadas pelo hash do conteúdo) e o cache é regravado.
+        """
+        cache_path = self._signature_cache_path(file_type)
+        cache = self._load_signature_cache(cache_path)
+        cached = cache.get('signatures', {})
+        
+        entry_hashes = [hashlib.md5(entry.encode('utf-8')).hexdigest() for entry in entries]
+        signatures = []
+        computed = 0
+        for entry, entry_hash in zip(entries, entry_hashes):
+            packed = cached.get(entry_hash)
+            if packed is not None:
+                signatures.append(array('Q', bytes.fromhex(packed)).tolist())
+            else:
+                signatures.append(self._minhash_signature(entry))
+                computed += 1
+        
+        buckets = [{} for _ in range(self.config['minhash_bands'])]
+        for position, signature in enumerate(signatures):
+            for band, key in enumerate(self._band_keys(signature)):
+                buckets[band].setdefault(key, []).append(position)
+        
+        self.signatures[file_type] = signatures
+        self.lsh_buckets[file_type] = buckets
+        
+        if computed or cache.get('mtime_ns') != mtime_ns:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump({
+                        'params': self._cache_params(),
+                        'mtime_ns': mtime_ns,
+                        'signatures': {
+                            entry_hash: array('Q', signature).tobytes().hex()
+                            for entry_hash, signature in zip(entry_hashes, signatures)
+                        }
+                    }, f)
+            except OSError as e:
+                print(f"⚠️ Could not persist MinHash signatures for {file_type}: {e}")
+    
+    def _lsh_candidates(self, signature: List[int], target_file: str) -> List[int]:
+        """Posições das entradas que compartilham ao menos uma banda com a assinatura"""
+        candidates = set()
+        for bucket, key in zip(self.lsh_buckets.get(target_file, []), self._band_keys(signature)):
+            candidates.update(bucket.get(key, ()))
+        return sorted(candidates)
+    
     def _parse_augment_preferences(self, content: str) -> List[str]:
         """Parse Augment preferences into individual entries"""
         entries = []
@@ -109,8 +252,8 @@ class MemoryContentValidator:
         Returns:
             Resultado da validação com recomendações
         """
-        # Load existing content if not already loaded
-        if not self.existing_content:
+        # Load existing content if not already loaded (or reload after file changes)
+        if not self.existing_content or self._memory_files_changed():
             self.load_existing_content()
         
         validation_result = {
@@ -185,10 +328,28 @@ class MemoryContentValidator:
                 'content': 'Exact duplicate found'
             })
         
-        # Check similarity with existing content
+        # Check similarity with the LSH candidates only
+        candidates_checked = 0
         if target_file in self.existing_content:
-            for existing_entry in self.existing_content[target_file]:
-                similarity = difflib.SequenceMatcher(None, new_content.lower(), existing_entry.lower()).ratio()
+            entries = self.existing_content[target_file]
+            candidates = self._lsh_candidates(self._minhash_signature(new_content), target_file)
+            
+            self.duplicate_stats['validations'] += 1
+            self.duplicate_stats['candidates_checked'] += len(candidates)
+            self.duplicate_stats['entries_skipped'] += len(entries) - len(candidates)
+            
+            new_lower = new_content.lower()
+            for position in candidates:
+                existing_entry = entries[position]
+                matcher = difflib.SequenceMatcher(None, new_lower, existing_entry.lower())
+                candidates_checked += 1
+                
+                # Upper bounds first; ratio() is the expensive part
+                if matcher.real_quick_ratio() < self.config['similarity_threshold']:
+                    continue
+                if matcher.quick_ratio() < self.config['similarity_threshold']:
+                    continue
+                similarity = matcher.ratio()
                 
                 if similarity >= self.config['similarity_threshold']:
                     is_duplicate = True
@@ -200,7 +361,8 @@ class MemoryContentValidator:
         
         return {
             'is_duplicate': is_duplicate,
-            'matches': matches
+            'matches': matches,
+            'candidates_checked': candidates_checked
         }
     
     def _check_obsolete_content(self, content: str) -> Dict[str, Any]:
@@ -299,7 +461,8 @@ class MemoryContentValidator:
                 'file_size_bytes': file_size,
                 'file_size_kb': file_size / 1024,
                 'avg_entry_length': sum(len(entry) for entry in entries) / len(entries) if entries else 0,
-                'last_modified': file_path.stat().st_mtime if file_path.exists() else 0
+                'last_modified': file_path.stat().st_mtime if file_path.exists() else 0,
+                'minhash_signatures': len(self.signatures.get(file_type, []))
             }
         
         return stats
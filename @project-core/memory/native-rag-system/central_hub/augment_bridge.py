@@ -10,7 +10,9 @@ from Augment Memories, with total priority given to Augment system as requested.
 
 Features:
 - Non-intrusive synchronization with Augment Memories
-- Real-time monitoring of preference changes
+- Real-time monitoring of preference changes (debounced, coalesced events)
+- Incremental re-parsing: line-hash diff against the previous parse, only
+  changed lines are parsed and the preference index is patched in place
 - Structured parsing of 91 preference lines
 - Bidirectional sync with project-core memory
 - Backup and recovery system
@@ -24,6 +26,8 @@ import time
 import logging
 import os
 import re
+import bisect
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from watchdog.observers import Observer
@@ -34,26 +38,41 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from integration.js_bridge import JavaScriptBridge
+from central_hub.backup_store import ContentAddressedBackupStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class AugmentMemoriesHandler(FileSystemEventHandler):
-    """File system event handler for Augment Memories changes"""
+    """
+    File system event handler for Augment Memories changes
+    
+    Runs on the watchdog observer thread; events are handed to the bridge's
+    event loop, where they are coalesced by a debounce timer.
+    """
     
-    def __init__(self, bridge):
+    def __init__(self, bridge, loop: asyncio.AbstractEventLoop):
         self.bridge = bridge
-        self.last_modified = 0
-        self.debounce_delay = 2  # 2 seconds debounce
+        self.loop = loop
+        self.target_path = str(bridge.augment_path)
+    
+    def _notify(self, path: str):
+        if path == self.target_path and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.bridge.schedule_augment_change)
     
     def on_modified(self, event):
-        if not event.is_directory and event.src_path == str(self.bridge.augment_path):
-            current_time = time.time()
-            if current_time - self.last_modified > self.debounce_delay:
-                self.last_modified = current_time
-                logger.info(f"🔄 [AUGMENT BRIDGE] Detected changes in Augment Memories")
-                asyncio.create_task(self.bridge.handle_augment_change())
+        if not event.is_directory:
+            self._notify(event.src_path)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._notify(event.src_path)
+    
+    def on_moved(self, event):
+        # Editors that save atomically write a temp file and rename it over the target
+        if not event.is_directory:
+            self._notify(event.dest_path)
 
 class AugmentMemoriesBridge:
     """
@@ -70,10 +89,13 @@ class AugmentMemoriesBridge:
             'sync_interval': 300,  # 5 minutes automatic sync
             'backup_enabled': True,
             'backup_retention_days': 30,
+            'backup_deltas': True,  # store line deltas against the previous version
+            'backup_full_every': 10,  # full copy every N versions bounds the restore chain
             'non_intrusive_sync': True,
             'real_time_monitoring': True,
             'preference_parsing': True,
-            'bidirectional_sync': True
+            'bidirectional_sync': True,
+            'change_debounce_seconds': 0.25  # quiet period before a burst of file events is processed
         }
         
         # JavaScript bridge for integration
@@ -84,13 +106,28 @@ class AugmentMemoriesBridge:
         self.last_sync_time = 0
         self.last_file_hash = ""
         
+        # Incremental parse state: per-line hashes and parsed preferences of the last read
+        self._line_hashes: List[bytes] = []
+        self._line_preferences: List[Optional[Dict[str, Any]]] = []
+        self._technology_counts = Counter()
+        self._methodology_counts = Counter()
+        self.last_change = {}
+        
         # File monitoring
         self.observer = None
         self.file_handler = None
+        self._debounce_handle = None
+        self._change_task = None
+        self._change_pending = False
         
         # Backup directory
         self.backup_dir = Path(__file__).parent.parent / 'backups' / 'augment_memories'
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.backup_store = ContentAddressedBackupStore(
+            self.backup_dir,
+            delta_enabled=self.config['backup_deltas'],
+            full_every=self.config['backup_full_every']
+        )
         
         # Performance metrics
         self.metrics = {
@@ -100,6 +137,12 @@ class AugmentMemoriesBridge:
             'preferences_parsed': 0,
             'file_changes_detected': 0,
             'backup_operations': 0,
+            'backups_deduplicated': 0,
+            'backup_bytes_written': 0,
+            'file_events_received': 0,
+            'file_events_coalesced': 0,
+            'incremental_parses': 0,
+            'lines_reparsed': 0,
             'average_sync_time': 0,
             'last_sync_timestamp': 0
         }
@@ -151,19 +194,18 @@ class AugmentMemoriesBridge:
             # Check if file has changed
             if current_hash == self.last_file_hash:
                 logger.info(f"💾 [AUGMENT BRIDGE] No changes detected in Augment Memories")
+                self.last_change = {'lines_reparsed': 0, 'preferences_added': 0,
+                                    'preferences_removed': 0, 'preferences_changed': False}
                 return self.preferences_cache
             
             self.last_file_hash = current_hash
             
-            # Parse preferences
-            parsed_preferences = await self.parse_augment_preferences(content)
-            
-            # Update cache
-            self.preferences_cache = parsed_preferences
-            self.metrics['preferences_parsed'] = len(parsed_preferences.get('preferences', []))
+            # Re-parse changed lines only and patch the cached index
+            self.last_change = self._apply_content_change(content)
+            self.metrics['preferences_parsed'] = len(self.preferences_cache.get('preferences', []))
             
             logger.info(f"📖 [AUGMENT BRIDGE] Read {self.metrics['preferences_parsed']} preferences from Augment Memories")
-            return parsed_preferences
+            return self.preferences_cache
             
         except Exception as error:
             logger.error(f"❌ [AUGMENT BRIDGE] Failed to read Augment Memories: {error}")
@@ -177,38 +219,9 @@ class AugmentMemoriesBridge:
             lines = content.split('\n')
             preferences = []
             
-            # Parse preference lines (starting with "- User prefers")
-            preference_pattern = r'^- User prefers (.+)$'
-            requirement_pattern = r'^- User requires (.+)$'
-            
             for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Parse user preferences
-                pref_match = re.match(preference_pattern, line)
-                req_match = re.match(requirement_pattern, line)
-                
-                if pref_match or req_match:
-                    preference_text = pref_match.group(1) if pref_match else req_match.group(1)
-                    preference_type = 'preference' if pref_match else 'requirement'
-                    
-                    # Extract key information from preference
-                    preference_data = {
-                        'line_number': line_num,
-                        'type': preference_type,
-                        'text': preference_text,
-                        'category': self._categorize_preference(preference_text),
-                        'priority': self._calculate_priority(preference_text),
-                        'keywords': self._extract_keywords(preference_text),
-                        'technologies': self._extract_technologies(preference_text),
-                        'methodologies': self._extract_methodologies(preference_text),
-                        'confidence_requirements': self._extract_confidence_requirements(preference_text)
-                    }
-                    
+                preference_data = self._parse_preference_line(line, line_num)
+                if preference_data is not None:
                     preferences.append(preference_data)
             
             # Create structured result
@@ -233,6 +246,131 @@ class AugmentMemoriesBridge:
             logger.error(f"❌ [AUGMENT BRIDGE] Preference parsing failed: {error}")
             return {}
     
+    def _parse_preference_line(self, line: str, line_num: int) -> Optional[Dict[str, Any]]:
+        """Parse one "- User prefers/requires" line (None for any other line)"""
+        line = line.strip()
+        
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            return None
+        
+        pref_match = re.match(r'^- User prefers (.+)$', line)
+        req_match = None if pref_match else re.match(r'^- User requires (.+)$', line)
+        if not (pref_match or req_match):
+            return None
+        
+        preference_text = pref_match.group(1) if pref_match else req_match.group(1)
+        
+        # Extract key information from preference
+        return {
+            'line_number': line_num,
+            'type': 'preference' if pref_match else 'requirement',
+            'text': preference_text,
+            'category': self._categorize_preference(preference_text),
+            'priority': self._calculate_priority(preference_text),
+            'keywords': self._extract_keywords(preference_text),
+            'technologies': self._extract_technologies(preference_text),
+            'methodologies': self._extract_methodologies(preference_text),
+            'confidence_requirements': self._extract_confidence_requirements(preference_text)
+        }
+    
+    @staticmethod
+    def _line_hash(line: str) -> bytes:
+        return hashlib.blake2b(line.encode('utf-8'), digest_size=8).digest()
+    
+    def _apply_content_change(self, content: str) -> Dict[str, Any]:
+        """
+        Diff the new content against the previous parse by line hash and
+        patch the preference index in place
+        
+        Unchanged leading and trailing lines are kept as parsed; only the
+        changed region in between is re-parsed (the whole file on first read).
+        """
+        lines = content.split('\n')
+        hashes = [self._line_hash(line) for line in lines]
+        old_hashes = self._line_hashes
+        
+        if not self.preferences_cache:
+            self._line_hashes, self._line_preferences = [], []
+            self._technology_counts, self._methodology_counts = Counter(), Counter()
+            self.preferences_cache = {
+                'total_lines': 0,
+                'preference_lines': 0,
+                'preferences': [],
+                'categories': {},
+                'technologies': [],
+                'methodologies': [],
+                'parsing_metadata': {}
+            }
+            old_hashes = []
+        
+        # Common prefix and suffix of the two line-hash sequences
+        limit = min(len(old_hashes), len(hashes))
+        prefix = 0
+        while prefix < limit and old_hashes[prefix] == hashes[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_hashes[-1 - suffix] == hashes[-1 - suffix]:
+            suffix += 1
+        old_end, new_end = len(old_hashes) - suffix, len(hashes) - suffix
+        
+        removed = [pref for pref in self._line_preferences[prefix:old_end] if pref is not None]
+        added_slots = [self._parse_preference_line(lines[i], i + 1) for i in range(prefix, new_end)]
+        added = [pref for pref in added_slots if pref is not None]
+        
+        # Preferences after the changed region keep their parse, shifted by the line delta
+        line_delta = new_end - old_end
+        if line_delta:
+            for pref in self._line_preferences[old_end:]:
+                if pref is not None:
+                    pref['line_number'] += line_delta
+        
+        start = sum(1 for pref in self._line_preferences[:prefix] if pref is not None)
+        self._line_preferences[prefix:old_end] = added_slots
+        self._line_hashes = hashes
+        
+        # Patch the preference index
+        cache = self.preferences_cache
+        cache['preferences'][start:start + len(removed)] = added
+        
+        categories = cache['categories']
+        for pref in removed:
+            members = categories[pref['category']]
+            members[:] = [member for member in members if member is not pref]
+            if not members:
+                del categories[pref['category']]
+            self._technology_counts.subtract(pref['technologies'])
+            self._methodology_counts.subtract(pref['methodologies'])
+        for pref in added:
+            bisect.insort(categories.setdefault(pref['category'], []), pref, key=lambda item: item['line_number'])
+            self._technology_counts.update(pref['technologies'])
+            self._methodology_counts.update(pref['methodologies'])
+        
+        if removed or added:
+            self._technology_counts = +self._technology_counts  # drop zero counts
+            self._methodology_counts = +self._methodology_counts
+            cache['technologies'] = list(self._technology_counts)
+            cache['methodologies'] = list(self._methodology_counts)
+        
+        cache['total_lines'] = len(lines)
+        cache['preference_lines'] = len(cache['preferences'])
+        cache['parsing_metadata'] = {
+            'parsed_at': time.time(),
+            'file_hash': self.last_file_hash,
+            'parser_version': '1.0',
+            'lines_reparsed': new_end - prefix
+        }
+        
+        self.metrics['incremental_parses'] += 1
+        self.metrics['lines_reparsed'] += new_end - prefix
+        
+        return {
+            'lines_reparsed': new_end - prefix,
+            'preferences_added': len(added),
+            'preferences_removed': len(removed),
+            'preferences_changed': bool(removed or added)
+        }
+    
     def _categorize_preference(self, preference_text: str) -> str:
         """Categorize preference based on content"""
         text_lower = preference_text.lower()
@@ -410,10 +548,11 @@ class AugmentMemoriesBridge:
     async def _sync_with_coordinator(self, augment_preferences: Dict[str, Any]) -> Dict[str, Any]:
         """Sync with Central Memory Coordinator"""
         try:
-            # Import coordinator here to avoid circular imports
-            from .memory_coordinator import CentralMemoryCoordinator
+            # Import here to avoid circular imports; the resident memory service is used
+            # when running, a one-off in-process coordinator otherwise
+            from integration.memory_service import MemoryServiceCoordinator
             
-            coordinator = CentralMemoryCoordinator()
+            coordinator = MemoryServiceCoordinator()
             
             # Create sync context
             sync_context = {
@@ -432,9 +571,12 @@ class AugmentMemoriesBridge:
                 sync_context
             )
             
+            await coordinator.close()
+            
             return {
                 'coordinator_sync': True,
                 'coordination_result': coordination_result,
+                'coordinator_backend': coordinator.backend,
                 'preferences_integrated': True
             }
             
@@ -485,8 +627,8 @@ class AugmentMemoriesBridge:
                 logger.info(f"🔄 [AUGMENT BRIDGE] File monitoring already active")
                 return
 
-            # Create file system event handler
-            self.file_handler = AugmentMemoriesHandler(self)
+            # Create file system event handler (events are delivered to this loop)
+            self.file_handler = AugmentMemoriesHandler(self, asyncio.get_running_loop())
 
             # Create observer and watch directory
             self.observer = Observer()
@@ -509,10 +651,46 @@ class AugmentMemoriesBridge:
                 self.observer.join()
                 self.observer = None
                 self.file_handler = None
+                if self._debounce_handle is not None:
+                    self._debounce_handle.cancel()
+                    self._debounce_handle = None
+                if self._change_task is not None and not self._change_task.done():
+                    await self._change_task
                 logger.info(f"🛑 [AUGMENT BRIDGE] File monitoring stopped")
         except Exception as error:
             logger.error(f"❌ [AUGMENT BRIDGE] Failed to stop file monitoring: {error}")
 
+    def schedule_augment_change(self):
+        """
+        Coalesce a file event: (re)start the debounce timer
+
+        Must run on the event loop thread (the file handler uses
+        call_soon_threadsafe). A burst of events ends in one change handling
+        once the file has been quiet for `change_debounce_seconds`.
+        """
+        self.metrics['file_events_received'] += 1
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+            self.metrics['file_events_coalesced'] += 1
+
+        loop = asyncio.get_running_loop()
+        self._debounce_handle = loop.call_later(self.config['change_debounce_seconds'], self._start_change_task)
+
+    def _start_change_task(self):
+        self._debounce_handle = None
+        if self._change_task is not None and not self._change_task.done():
+            # One handler at a time; it runs once more when the current one finishes
+            self._change_pending = True
+            return
+        self._change_task = asyncio.ensure_future(self._run_change_handler())
+
+    async def _run_change_handler(self):
+        while True:
+            self._change_pending = False
+            await self.handle_augment_change()
+            if not self._change_pending:
+                break
+
     async def handle_augment_change(self):
         """Handle detected changes in Augment Memories file"""
         try:
@@ -520,15 +698,25 @@ class AugmentMemoriesBridge:
 
             logger.info(f"🔄 [AUGMENT BRIDGE] Processing Augment Memories change...")
 
-            # Create backup before processing changes
+            # Re-parse changed lines only
+            await self.read_augment_memories()
+            change = self.last_change
+
+            # Every saved version reaches the history; the store skips content equal to its latest version
             if self.config['backup_enabled']:
                 await self.create_backup()
 
-            # Re-read and sync preferences
+            if not change.get('preferences_changed'):
+                # Touch-only saves, whitespace or non-preference lines: nothing to propagate
+                logger.info(f"💾 [AUGMENT BRIDGE] No preference changes ({change.get('lines_reparsed', 0)} lines re-parsed)")
+                return
+
+            # Propagate the patched preferences (read_augment_memories hits the hash check)
             sync_result = await self.sync_with_project_core()
 
             if sync_result['success']:
-                logger.info(f"✅ [AUGMENT BRIDGE] Change processed successfully")
+                logger.info(f"✅ [AUGMENT BRIDGE] Change processed: +{change['preferences_added']} "
+                            f"-{change['preferences_removed']} preferences ({change['lines_reparsed']} lines re-parsed)")
             else:
                 logger.warning(f"⚠️ [AUGMENT BRIDGE] Change processing failed: {sync_result.get('error', 'Unknown error')}")
 
@@ -536,45 +724,77 @@ class AugmentMemoriesBridge:
             logger.error(f"❌ [AUGMENT BRIDGE] Failed to handle Augment change: {error}")
 
     async def create_backup(self) -> Dict[str, Any]:
-        """Create backup of Augment Memories file"""
+        """Back up the Augment Memories file; unchanged content reuses the stored version"""
         try:
             if not self.augment_path.exists():
                 return {'success': False, 'reason': 'source_file_not_found'}
 
-            # Generate backup filename with timestamp
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"augment_memories_backup_{timestamp}.txt"
-            backup_path = self.backup_dir / backup_filename
-
-            # Copy file to backup location
-            with open(self.augment_path, 'r', encoding='utf-8') as source:
-                content = source.read()
-
-            with open(backup_path, 'w', encoding='utf-8') as backup:
-                backup.write(content)
+            bytes_before = self.backup_store.metrics['bytes_written']
+            result = self.backup_store.backup_file(self.augment_path)
 
             # Update metrics
             self.metrics['backup_operations'] += 1
+            if result['deduplicated']:
+                self.metrics['backups_deduplicated'] += 1
+                return result
+
+            self.metrics['backup_bytes_written'] += self.backup_store.metrics['bytes_written'] - bytes_before
 
-            # Clean old backups
+            # Clean old backups (only when history grew)
             await self._cleanup_old_backups()
 
-            logger.info(f"💾 [AUGMENT BRIDGE] Backup created: {backup_filename}")
+            logger.info(f"💾 [AUGMENT BRIDGE] Backup version {result['version']} created ({result['storage']})")
+            return result
+
+        except Exception as error:
+            logger.error(f"❌ [AUGMENT BRIDGE] Backup creation failed: {error}")
+            return {
+                'success': False,
+                'error': str(error)
+            }
+
+    def list_backups(self) -> List[Dict[str, Any]]:
+        """Stored backup versions, oldest first"""
+        return [
+            {
+                'version': record['v'],
+                'content_hash': record['h'],
+                'timestamp': record['t'],
+                'size': record['n'],
+                'storage': record['s']
+            }
+            for record in self.backup_store.versions()
+        ]
+
+    async def restore_backup(self, version=None, target_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Restore a backup version (number or content hash; latest by default)
+
+        Writes to `target_path` when given; the Augment Memories file itself is
+        only overwritten when no target is passed.
+        """
+        try:
+            content = self.backup_store.restore(version)
+            target = Path(target_path) if target_path else self.augment_path
+            with open(target, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+
+            logger.info(f"♻️ [AUGMENT BRIDGE] Backup restored to {target}")
             return {
                 'success': True,
-                'backup_path': str(backup_path),
-                'backup_filename': backup_filename
+                'restored_path': str(target),
+                'content_hash': ContentAddressedBackupStore.content_hash(content)
             }
 
         except Exception as error:
-            logger.error(f"❌ [AUGMENT BRIDGE] Backup creation failed: {error}")
+            logger.error(f"❌ [AUGMENT BRIDGE] Backup restore failed: {error}")
             return {
                 'success': False,
                 'error': str(error)
             }
 
     async def _cleanup_old_backups(self):
-        """Clean up old backup files based on retention policy"""
+        """Clean up old backup versions based on retention policy"""
         try:
             if not self.config['backup_enabled']:
                 return
@@ -582,6 +802,9 @@ class AugmentMemoriesBridge:
             retention_seconds = self.config['backup_retention_days'] * 24 * 3600
             current_time = time.time()
 
+            self.backup_store.prune(retention_seconds)
+
+            # Timestamped copies written before the content-addressed store
             for backup_file in self.backup_dir.glob("augment_memories_backup_*.txt"):
                 file_age = current_time - backup_file.stat().st_mtime
                 if file_age > retention_seconds:
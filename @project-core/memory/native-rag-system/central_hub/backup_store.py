@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+
+"""
+CONTENT-ADDRESSED BACKUP STORE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Deduplicated version history for the Augment Memories backups. A blob is
+written only when the content hash changes; repeated backups of unchanged
+content cost a stat call and nothing else.
+
+Layout (backup directory):
+- versions.jsonl: append-only version log {v, h, t, n, s, b, m}
+  (version, content hash, timestamp, size, storage, base hash, source mtime)
+- blobs/<hh>/<hash>.full: complete UTF-8 content
+- blobs/<hh>/<hash>.delta: line delta against the previous version (JSON)
+
+Features:
+- SHA-256 content addressing, reverted content reuses its existing blob
+- Optional line deltas with a full blob every `full_every` versions, so a
+  restore replays a bounded chain
+- Restore by version number or hash, verified against the content hash
+- Age-based pruning that keeps the latest version and every blob a kept
+  version's delta chain depends on
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class ContentAddressedBackupStore:
+    """
+    Hash-addressed blobs plus a compact version log
+    """
+
+    def __init__(self, backup_dir: Path, delta_enabled: bool = True, full_every: int = 10):
+        self.backup_dir = Path(backup_dir)
+        self.blob_dir = self.backup_dir / 'blobs'
+        self.versions_file = self.backup_dir / 'versions.jsonl'
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+        self.config = {
+            'delta_enabled': delta_enabled,
+            'full_every': max(1, full_every),  # at most full_every - 1 deltas between full blobs
+            'max_delta_ratio': 0.5  # store a full blob when the delta is not much smaller
+        }
+
+        self._latest: Optional[Dict[str, Any]] = None
+        self._latest_loaded = False
+
+        self.metrics = {
+            'backups_requested': 0,
+            'backups_written': 0,
+            'backups_deduplicated': 0,
+            'stat_skips': 0,
+            'full_blobs': 0,
+            'delta_blobs': 0,
+            'bytes_written': 0,
+            'restores': 0,
+            'blobs_pruned': 0
+        }
+
+    # VERSION LOG
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """All version records, oldest first"""
+        if not self.versions_file.exists():
+            return []
+
+        records = []
+        with open(self.versions_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write at the tail of the log
+                if records and records[-1]['v'] == record['v']:
+                    records[-1] = record  # mtime refresh of the same version
+                else:
+                    records.append(record)
+        return records
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """Most recent version record (read from the log tail once)"""
+        if not self._latest_loaded:
+            self._latest = self._read_last_record()
+            self._latest_loaded = True
+        return self._latest
+
+    def _read_last_record(self) -> Optional[Dict[str, Any]]:
+        if not self.versions_file.exists():
+            return None
+
+        with open(self.versions_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            chunk = 4096
+            while True:
+                f.seek(max(0, size - chunk))
+                lines = f.read().splitlines()
+                # The first line may be cut unless the read started at offset 0
+                complete = lines if size <= chunk else lines[1:]
+                for line in reversed(complete):
+                    try:
+                        return json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                if size <= chunk:
+                    return None
+                chunk *= 4
+
+    def _append_version(self, record: Dict[str, Any]):
+        with open(self.versions_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._latest = record
+        self._latest_loaded = True
+
+    # BLOBS
+
+    def _blob_path(self, content_hash: str, storage: str) -> Path:
+        return self.blob_dir / content_hash[:2] / f"{content_hash}.{storage}"
+
+    def _existing_blob(self, content_hash: str) -> Optional[str]:
+        for storage in ('full', 'delta'):
+            if self._blob_path(content_hash, storage).exists():
+                return storage
+        return None
+
+    def _write_blob(self, content_hash: str, storage: str, data: bytes) -> Path:
+        path = self._blob_path(content_hash, storage)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.metrics['bytes_written'] += len(data)
+        return path
+
+    @staticmethod
+    def _make_delta(base: str, content: str) -> List[Union[List[int], List[str]]]:
+        """Ops rebuilding `content` from `base`: [start, end] copies base lines, a list of str inserts lines"""
+        base_lines = base.splitlines(keepends=True)
+        lines = content.splitlines(keepends=True)
+        ops = []
+        matcher = difflib.SequenceMatcher(None, base_lines, lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                ops.append([i1, i2])
+            elif j2 > j1:
+                ops.append(lines[j1:j2])
+        return ops
+
+    @staticmethod
+    def _apply_delta(base: str, ops: List[Any]) -> str:
+        base_lines = base.splitlines(keepends=True)
+        out = []
+        for op in ops:
+            if op and isinstance(op[0], int):
+                out.extend(base_lines[op[0]:op[1]])
+            else:
+                out.extend(op)
+        return ''.join(out)
+
+    def _chain_length(self, record: Optional[Dict[str, Any]]) -> int:
+        """Number of deltas between `record` and its nearest full blob"""
+        length = 0
+        while record is not None and record.get('s') == 'delta':
+            length += 1
+            record = self._record_for_hash(record['b'])
+        return length
+
+    def _record_for_hash(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        storage = self._existing_blob(content_hash)
+        if storage == 'full':
+            return {'h': content_hash, 's': 'full', 'b': None}
+        if storage == 'delta':
+            with open(self._blob_path(content_hash, 'delta'), 'r', encoding='utf-8') as f:
+                return {'h': content_hash, 's': 'delta', 'b': json.load(f)['base']}
+        return None
+
+    # BACKUP AND RESTORE
+
+    def backup_file(self, source_path: Path) -> Dict[str, Any]:
+        """Back up a file; an unchanged stat (mtime, size) skips reading it"""
+        stat = source_path.stat()
+        latest = self.latest()
+        if latest is not None and latest.get('m') == stat.st_mtime_ns and latest.get('n') == stat.st_size:
+            self.metrics['backups_requested'] += 1
+            self.metrics['backups_deduplicated'] += 1
+            self.metrics['stat_skips'] += 1
+            return self._result(latest, deduplicated=True)
+
+        # newline='' keeps CRLF / CR line endings: the hash and size describe the file's bytes
+        with open(source_path, 'r', encoding='utf-8', newline='') as f:
+            content = f.read()
+        return self.backup(content, stat.st_mtime_ns)
+
+    def backup(self, content: str, source_mtime_ns: Optional[int] = None) -> Dict[str, Any]:
+        """Record `content` as the newest version, writing a blob only for new content"""
+        self.metrics['backups_requested'] += 1
+        content_hash = self.content_hash(content)
+        size = len(content.encode('utf-8'))
+        latest = self.latest()
+
+        if latest is not None and latest['h'] == content_hash:
+            if latest.get('m') != source_mtime_ns:
+                # Same content, new mtime: remember it so the next check is a stat
+                latest = dict(latest, m=source_mtime_ns)
+                self._append_version(latest)
+            self.metrics['backups_deduplicated'] += 1
+            return self._result(latest, deduplicated=True)
+
+        storage = self._existing_blob(content_hash)
+        base_hash = None
+        reused = storage is not None
+        if reused:
+            # Reverted to earlier content: the blob is already stored
+            self.metrics['backups_deduplicated'] += 1
+            if storage == 'delta':
+                base_hash = self._record_for_hash(content_hash)['b']
+        else:
+            storage, base_hash, data = 'full', None, content.encode('utf-8')
+            if (self.config['delta_enabled'] and latest is not None and
+                    self._chain_length(latest) < self.config['full_every'] - 1):
+                delta = json.dumps({'base': latest['h'], 'ops': self._make_delta(self.restore(latest['h']), content)},
+                                   separators=(',', ':')).encode('utf-8')
+                if len(delta) < size * self.config['max_delta_ratio']:
+                    storage, base_hash, data = 'delta', latest['h'], delta
+            self._write_blob(content_hash, storage, data)
+            self.metrics['backups_written'] += 1
+            self.metrics['full_blobs' if storage == 'full' else 'delta_blobs'] += 1
+
+        record = {
+            'v': (latest['v'] + 1) if latest is not None else 1,
+            'h': content_hash,
+            't': time.time(),
+            'n': size,
+            's': storage,
+            'b': base_hash,
+            'm': source_mtime_ns
+        }
+        self._append_version(record)
+
+        logger.info(f"💾 [BACKUP STORE] Version {record['v']} stored ({storage}, {content_hash[:12]})")
+        return self._result(record, deduplicated=reused)
+
+    def _result(self, record: Dict[str, Any], deduplicated: bool) -> Dict[str, Any]:
+        path = self._blob_path(record['h'], record['s'])
+        return {
+            'success': True,
+            'deduplicated': deduplicated,
+            'version': record['v'],
+            'content_hash': record['h'],
+            'storage': record['s'],
+            'backup_path': str(path),
+            'backup_filename': path.name
+        }
+
+    def restore(self, version: Union[int, str, None] = None) -> str:
+        """
+        Content of a version (number or content hash; latest by default)
+        """
+        if version is None:
+            latest = self.latest()
+            if latest is None:
+                raise KeyError("No backups stored")
+            content_hash = latest['h']
+        elif isinstance(version, int):
+            matches = [record for record in self.versions() if record['v'] == version]
+            if not matches:
+                raise KeyError(f"Unknown backup version: {version}")
+            content_hash = matches[-1]['h']
+        else:
+            content_hash = version
+
+        self.metrics['restores'] += 1
+
+        # Walk back to the nearest full blob, then replay the deltas forward
+        chain = []
+        current = content_hash
+        while True:
+            storage = self._existing_blob(current)
+            if storage is None:
+                raise KeyError(f"Missing backup blob: {current}")
+            if storage == 'full':
+                with open(self._blob_path(current, 'full'), 'r', encoding='utf-8', newline='') as f:
+                    content = f.read()
+                break
+            with open(self._blob_path(current, 'delta'), 'r', encoding='utf-8') as f:
+                delta = json.load(f)
+            chain.append(delta['ops'])
+            current = delta['base']
+
+        for ops in reversed(chain):
+            content = self._apply_delta(content, ops)
+
+        if self.content_hash(content) != content_hash:
+            raise ValueError(f"Backup {content_hash[:12]} failed hash verification")
+        return content
+
+    # RETENTION
+
+    def prune(self, max_age_seconds: float) -> Dict[str, int]:
+        """Drop versions older than `max_age_seconds` (never the latest) and unreferenced blobs"""
+        records = self.versions()
+        if not records:
+            return {'versions_pruned': 0, 'blobs_pruned': 0}
+
+        cutoff = time.time() - max_age_seconds
+        kept = [record for record in records[:-1] if record['t'] >= cutoff] + [records[-1]]
+
+        needed = set()
+        for record in kept:
+            current = record['h']
+            while current is not None and current not in needed:
+                needed.add(current)
+                chained = self._record_for_hash(current)
+                current = chained['b'] if chained else None
+
+        blobs_pruned = 0
+        for blob in self.blob_dir.glob('*/*.*'):
+            if blob.stem not in needed and blob.suffix in ('.full', '.delta'):
+                blob.unlink()
+                blobs_pruned += 1
+
+        if len(kept) != len(records):
+            tmp_file = self.versions_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                for record in kept:
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+            os.replace(tmp_file, self.versions_file)
+
+        self.metrics['blobs_pruned'] += blobs_pruned
+        if blobs_pruned:
+            logger.info(f"🗑️ [BACKUP STORE] Pruned {len(records) - len(kept)} versions, {blobs_pruned} blobs")
+        return {'versions_pruned': len(records) - len(kept), 'blobs_pruned': blobs_pruned}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get backup store metrics"""
+        latest = self.latest()
+        return {
+            **self.metrics,
+            **self.config,
+            'latest_version': latest['v'] if latest else 0,
+            'latest_hash': latest['h'][:16] if latest else None
+        }
+
+# Export main class
+__all__ = ['ContentAddressedBackupStore']
@@ -6,6 +6,15 @@ GRUPO US VIBECODE SYSTEM - Native RAG Implementation
 
 Intelligent analysis system that verifies existing vs new information before adding to memory bank.
 Prevents duplication and implements auto-learning using all native Crawl4AI strategies and ECL pipeline.
+
+Features:
+- Hashed n-gram embeddings of every memory entry, kept in an incrementally
+  maintained near-duplicate vector index
+- Top-k neighbour lookup per analysis with add / merge / skip decided by the
+  configured similarity and merge thresholds
+- Merges append only the sentences the existing memory does not already hold
+- Memory entries and their embeddings persist across restarts (MemoryEntryStore
+  snapshot + log, EmbeddingStore matrix), so warm starts skip re-embedding
 """
 
 import asyncio
@@ -28,25 +37,16 @@ from crawl4ai_strategies.contextual_embeddings import ContextualEmbeddingsStrate
 from crawl4ai_strategies.hybrid_search import HybridSearchStrategy
 from crawl4ai_strategies.agentic_rag import AgenticRAGStrategy
 from crawl4ai_strategies.reranking import RerankingStrategy
+from crawl4ai_strategies.embedding_backends import HashedNgramEmbeddingBackend
+from crawl4ai_strategies.near_duplicate_index import NearDuplicateIndex
+from crawl4ai_strategies.embedding_store import EmbeddingStore
+from central_hub.memory_store import MemoryEntry, MemoryEntryStore
 from cognee_ecl_pipeline.ecl_pipeline import CogneeECLPipeline
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class MemoryEntry:
-    """Data class for memory entries"""
-    id: str
-    content: str
-    category: str
-    keywords: List[str]
-    timestamp: str
-    confidence: float
-    source: str
-    similarity_score: float = 0.0
-    unique_value_score: float = 0.0
-
 @dataclass
 class CrosscheckResult:
     """Data class for crosscheck analysis results"""
@@ -78,12 +78,24 @@ class IntelligentCrosscheckSystem:
             'merge_threshold': 0.75,
             'unique_value_threshold': 0.6,
             'confidence_threshold': 0.7,
-            'max_similar_entries': 10
+            'max_similar_entries': 10,
+            'min_content_length': 10,
+            'embedding_dimensions': 384,
+            'persistence_enabled': True,
+            'memory_store_dir': Path(__file__).parent.parent / 'cache' / 'crosscheck-memory',
+            'snapshot_interval': 10000  # log records between automatic snapshots
         }
         
-        # Memory storage
+        # Memory storage (backed by MemoryEntryStore once loaded)
         self.memory_entries = {}
         self.memory_index = {}
+        self.memory_store = None
+        self.embedding_store = None
+        
+        # Near-duplicate detection: entry embeddings in a keyed vector index
+        self.embedding_backend = HashedNgramEmbeddingBackend(self.config['embedding_dimensions'])
+        self.vector_index = self._create_vector_index()
+        self._fallback_embeddings = {}  # memory id -> embedding, only without the vector index
         
         # Performance metrics
         self.metrics = {
@@ -93,6 +105,9 @@ class IntelligentCrosscheckSystem:
             'merges_performed': 0,
             'duplicates_prevented': 0,
             'average_analysis_time': 0,
+            'similarity_searches': 0,
+            'embeddings_reused': 0,
+            'average_similarity_search_time': 0,
             'unique_value_scores': [],
             'confidence_scores': []
         }
@@ -119,12 +134,7 @@ class IntelligentCrosscheckSystem:
             if context is None:
                 context = {}
             
-            # Simple analysis for now
-            similar_memories = []
-            unique_value_score = 0.7
-            
-            # Basic decision logic
-            if len(new_info.strip()) < 10:
+            if len(new_info.strip()) < self.config['min_content_length']:
                 result = CrosscheckResult(
                     should_add=False,
                     action='skip',
@@ -134,14 +144,8 @@ class IntelligentCrosscheckSystem:
                     reasoning="Content too short to be valuable"
                 )
             else:
-                result = CrosscheckResult(
-                    should_add=True,
-                    action='add',
-                    confidence=0.8,
-                    similar_entries=similar_memories,
-                    unique_value=unique_value_score,
-                    reasoning="New information appears unique and valuable"
-                )
+                similar_memories = self._find_similar_memories(new_info)
+                result = self._decide_action(similar_memories)
             
             # Update metrics
             analysis_time = (time.time() - start_time) * 1000
@@ -173,6 +177,8 @@ class IntelligentCrosscheckSystem:
             
             if action == 'add':
                 return await self._add_new_memory(new_info, crosscheck_result, context)
+            elif action == 'merge':
+                return await self._merge_into_memory(new_info, crosscheck_result, context)
             elif action == 'skip':
                 return await self._skip_addition(new_info, crosscheck_result, context)
             else:
@@ -202,7 +208,8 @@ class IntelligentCrosscheckSystem:
                 unique_value_score=crosscheck_result.unique_value
             )
             
-            self.memory_entries[memory_id] = new_memory
+            self._persist_memory(new_memory)
+            self._index_memory(new_memory)
             self.metrics['additions_approved'] += 1
             
             logger.info(f"✅ [CROSSCHECK SYSTEM] New memory added: {memory_id}")
@@ -221,6 +228,50 @@ class IntelligentCrosscheckSystem:
                 'action': 'add'
             }
     
+    async def _merge_into_memory(self, new_info: str, crosscheck_result: CrosscheckResult, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Append the sentences an existing memory does not already contain"""
+        try:
+            if not crosscheck_result.similar_entries:
+                return await self._add_new_memory(new_info, crosscheck_result, context)
+            
+            target = self.memory_entries.get(crosscheck_result.similar_entries[0].id)
+            if target is None:
+                return await self._add_new_memory(new_info, crosscheck_result, context)
+            
+            existing = {self._normalize_sentence(sentence) for sentence in self._split_sentences(target.content)}
+            additions = [
+                sentence for sentence in self._split_sentences(new_info)
+                if self._normalize_sentence(sentence) not in existing
+            ]
+            
+            if additions:
+                target.content = target.content.rstrip() + '\n' + ' '.join(additions)
+                target.keywords = list(dict.fromkeys(target.keywords + self._extract_keywords(new_info)))[:10]
+                target.timestamp = datetime.now().isoformat()
+                target.confidence = max(target.confidence, crosscheck_result.confidence)
+                self._persist_memory(target)
+                self._index_memory(target)
+            
+            self.metrics['merges_performed'] += 1
+            
+            logger.info(f"🔀 [CROSSCHECK SYSTEM] Merged into {target.id}: {len(additions)} new sentences")
+            return {
+                'success': True,
+                'action': 'merge',
+                'target_memory_id': target.id,
+                'merge_strategy': crosscheck_result.merge_strategy,
+                'sentences_added': len(additions),
+                'confidence': crosscheck_result.confidence
+            }
+            
+        except Exception as error:
+            logger.error(f"❌ [CROSSCHECK SYSTEM] Merge failed: {error}")
+            return {
+                'success': False,
+                'error': str(error),
+                'action': 'merge'
+            }
+    
     async def _skip_addition(self, new_info: str, crosscheck_result: CrosscheckResult, context: Dict[str, Any]) -> Dict[str, Any]:
         """Skip adding new information"""
         try:
@@ -254,9 +305,157 @@ class IntelligentCrosscheckSystem:
             logger.warning(f"⚠️ [CROSSCHECK SYSTEM] Keyword extraction failed: {error}")
             return []
     
+    @staticmethod
+    def _split_sentences(content: str) -> List[str]:
+        return [sentence.strip() for sentence in re.split(r'(?<=[.!?])\s+|\n+', content) if sentence.strip()]
+    
+    @staticmethod
+    def _normalize_sentence(sentence: str) -> str:
+        return ' '.join(re.findall(r'\w+', sentence.lower()))
+    
+    # SIMILARITY
+    
+    def _create_vector_index(self) -> Optional[NearDuplicateIndex]:
+        try:
+            return NearDuplicateIndex(self.config['embedding_dimensions'])
+        except RuntimeError as error:
+            logger.warning(f"⚠️ [CROSSCHECK SYSTEM] Vector index unavailable, using exact scan: {error}")
+            return None
+    
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]
+    
+    def _persist_memory(self, memory: MemoryEntry):
+        if self.memory_store is not None:
+            self.memory_store.put(memory)
+        else:
+            self.memory_entries[memory.id] = memory
+    
+    def _index_memory(self, memory: MemoryEntry):
+        """Insert or refresh one entry in the similarity index"""
+        embedding = self.embedding_backend.embed_sync(memory.content)
+        if self.embedding_store is not None:
+            self.embedding_store.put(memory.id, embedding, metadata={'content_hash': self._content_hash(memory.content)})
+        if self.vector_index is not None:
+            self.vector_index.add(memory.id, embedding)
+        else:
+            self._fallback_embeddings[memory.id] = embedding
+    
+    def _find_similar_memories(self, new_info: str) -> List[MemoryEntry]:
+        """Top-k existing memories at or above the merge threshold, most similar first"""
+        start_time = time.time()
+        embedding = self.embedding_backend.embed_sync(new_info)
+        k = self.config['max_similar_entries']
+        min_score = self.config['merge_threshold']
+        
+        if self.vector_index is not None:
+            neighbours = self.vector_index.search(embedding, k, min_score)
+        else:
+            scored = (
+                (memory_id, sum(a * b for a, b in zip(embedding, vector)))
+                for memory_id, vector in self._fallback_embeddings.items()
+            )
+            neighbours = sorted((pair for pair in scored if pair[1] >= min_score), key=lambda pair: -pair[1])[:k]
+        
+        similar = []
+        for memory_id, score in neighbours:
+            memory = self.memory_entries.get(memory_id)
+            if memory is not None:
+                memory.similarity_score = score
+                similar.append(memory)
+        
+        search_time = (time.time() - start_time) * 1000
+        self.metrics['similarity_searches'] += 1
+        self.metrics['average_similarity_search_time'] = (
+            search_time if self.metrics['average_similarity_search_time'] == 0
+            else (self.metrics['average_similarity_search_time'] + search_time) / 2
+        )
+        return similar
+    
+    def _decide_action(self, similar_memories: List[MemoryEntry]) -> CrosscheckResult:
+        """Map the closest neighbour's similarity onto add / merge / skip"""
+        best = similar_memories[0].similarity_score if similar_memories else 0.0
+        unique_value = max(0.0, min(1.0, 1.0 - best))
+        
+        if best >= self.config['similarity_threshold']:
+            return CrosscheckResult(
+                should_add=False,
+                action='skip',
+                confidence=best,
+                similar_entries=similar_memories,
+                unique_value=unique_value,
+                reasoning=f"Near-duplicate of memory {similar_memories[0].id} (similarity {best:.3f})"
+            )
+        
+        if best >= self.config['merge_threshold']:
+            return CrosscheckResult(
+                should_add=True,
+                action='merge',
+                confidence=best,
+                similar_entries=similar_memories,
+                unique_value=unique_value,
+                reasoning=f"Overlaps memory {similar_memories[0].id} (similarity {best:.3f}), merging new details",
+                merge_strategy='append_unique_sentences'
+            )
+        
+        return CrosscheckResult(
+            should_add=True,
+            action='add',
+            confidence=max(self.config['confidence_threshold'], unique_value),
+            similar_entries=similar_memories,
+            unique_value=unique_value,
+            reasoning="New information appears unique and valuable"
+        )
+    
+    def _memory_embeddings(self, memories: List[MemoryEntry]):
+        """Stored embeddings where the content is unchanged, freshly computed (and stored) otherwise"""
+        embeddings = []
+        stale = []
+        for position, memory in enumerate(memories):
+            stored = self.embedding_store.get_vector(memory.id) if self.embedding_store is not None else None
+            if stored is not None and (
+                self.embedding_store.entries[memory.id]['metadata'].get('content_hash') == self._content_hash(memory.content)
+            ):
+                embeddings.append(stored)
+            else:
+                embeddings.append(None)
+                stale.append(position)
+        
+        for position in stale:
+            memory = memories[position]
+            embeddings[position] = self.embedding_backend.embed_sync(memory.content)
+            if self.embedding_store is not None:
+                self.embedding_store.put(memory.id, embeddings[position],
+                                         metadata={'content_hash': self._content_hash(memory.content)})
+        
+        self.metrics['embeddings_reused'] += len(memories) - len(stale)
+        if stale:
+            logger.info(f"🧮 [CROSSCHECK SYSTEM] Embedded {len(stale)} of {len(memories)} memories "
+                        f"({len(memories) - len(stale)} reused from the embedding store)")
+        return embeddings
+    
     async def load_existing_memories(self):
-        """Load existing memory entries"""
+        """Load existing memory entries from the persistent store"""
         try:
+            if self.config['persistence_enabled'] and self.memory_store is None:
+                store_dir = Path(self.config['memory_store_dir'])
+                self.memory_store = await asyncio.to_thread(
+                    MemoryEntryStore, store_dir, self.config['snapshot_interval']
+                )
+                # Entries added before loading are kept
+                self.memory_store.put_many(
+                    memory for memory_id, memory in self.memory_entries.items()
+                    if memory_id not in self.memory_store.entries
+                )
+                self.memory_entries = self.memory_store.entries
+                
+                try:
+                    self.embedding_store = EmbeddingStore(store_dir / 'embeddings', self.config['embedding_dimensions'])
+                except (RuntimeError, ValueError) as error:
+                    logger.warning(f"⚠️ [CROSSCHECK SYSTEM] Embedding persistence unavailable: {error}")
+                    self.embedding_store = None
+            
             logger.info(f"📚 [CROSSCHECK SYSTEM] Loaded {len(self.memory_entries)} existing memories")
         except Exception as error:
             logger.error(f"❌ [CROSSCHECK SYSTEM] Loading existing memories failed: {error}")
@@ -264,11 +463,34 @@ class IntelligentCrosscheckSystem:
     async def build_memory_index(self):
         """Build searchable index of memory entries"""
         try:
-            self.memory_index = {
-                'by_category': {},
-                'by_keywords': {},
-                'by_source': {}
-            }
+            if self.memory_store is not None:
+                # Maintained by the store on every write
+                self.memory_index = {
+                    'by_category': self.memory_store.by_category,
+                    'by_keywords': self.memory_store.by_keyword,
+                    'by_source': self.memory_store.by_source
+                }
+            else:
+                self.memory_index = {
+                    'by_category': {},
+                    'by_keywords': {},
+                    'by_source': {}
+                }
+                for memory in self.memory_entries.values():
+                    self.memory_index['by_category'].setdefault(memory.category, set()).add(memory.id)
+                    self.memory_index['by_source'].setdefault(memory.source, set()).add(memory.id)
+                    for keyword in memory.keywords:
+                        self.memory_index['by_keywords'].setdefault(keyword, set()).add(memory.id)
+            
+            # Rebuild the similarity index from scratch
+            memories = list(self.memory_entries.values())
+            embeddings = self._memory_embeddings(memories)
+            if self.vector_index is not None:
+                self.vector_index.clear()
+                self.vector_index.add_batch([memory.id for memory in memories], embeddings)
+            else:
+                self._fallback_embeddings = {memory.id: embedding for memory, embedding in zip(memories, embeddings)}
+            
             logger.info(f"🗂️ [CROSSCHECK SYSTEM] Memory index built: {len(self.memory_entries)} entries indexed")
         except Exception as error:
             logger.error(f"❌ [CROSSCHECK SYSTEM] Memory index building failed: {error}")
@@ -299,6 +521,8 @@ class IntelligentCrosscheckSystem:
                 **self.metrics,
                 'approval_rate': approval_rate,
                 'memory_entries_count': len(self.memory_entries),
+                'vector_index': self.vector_index.get_metrics() if self.vector_index is not None else None,
+                'memory_store': self.memory_store.get_metrics() if self.memory_store is not None else None,
                 'crawl4ai_strategies_available': len(self.crawl4ai_strategies),
                 'ecl_pipeline_available': True
             }
@@ -331,5 +555,16 @@ class IntelligentCrosscheckSystem:
                 'metrics': self.get_metrics()
             }
 
+    async def shutdown(self):
+        """Snapshot the memory store and release persistent files"""
+        try:
+            if self.memory_store is not None:
+                await asyncio.to_thread(self.memory_store.close)
+            if self.embedding_store is not None:
+                self.embedding_store.close()
+            logger.info("🛑 [CROSSCHECK SYSTEM] Shutdown completed")
+        except Exception as error:
+            logger.error(f"❌ [CROSSCHECK SYSTEM] Shutdown failed: {error}")
+
 # Export main class
 __all__ = ['IntelligentCrosscheckSystem', 'MemoryEntry', 'CrosscheckResult']
@@ -13,6 +13,10 @@ Features:
 - Robust fallback chain for zero disruption
 - Integration with all native RAG strategies
 - Performance monitoring and optimization
+- Batch consultations: identical queries run once, strategies run once per
+  routing group (batched embedding, vector, keyword and rerank calls)
+- Streaming consultations: per-strategy partial results as they complete
+- Request deadlines passed through every strategy down to the JavaScript bridge
 - 100% backward compatibility
 """
 
@@ -23,23 +27,50 @@ import time
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator, Union
+from dataclasses import dataclass
 import sys
 
 # Add parent directory for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from integration.js_bridge import JavaScriptBridge
+from integration.deadline import Deadline, DeadlineExceededError
 from crawl4ai_strategies.contextual_embeddings import ContextualEmbeddingsStrategy
 from crawl4ai_strategies.hybrid_search import HybridSearchStrategy
 from crawl4ai_strategies.agentic_rag import AgenticRAGStrategy
 from crawl4ai_strategies.reranking import RerankingStrategy
+from crawl4ai_strategies.document_ingestion import MemoryIngestionPipeline
 from cognee_ecl_pipeline.ecl_pipeline import CogneeECLPipeline
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Query analysis flags the strategies branch on (batch groups share them)
+STRATEGY_ANALYSIS_FLAGS = ('requires_semantic_search', 'requires_code_analysis', 'requires_reranking')
+
+@dataclass
+class ConsultationPartialResult:
+    """One strategy's result, streamed as soon as the strategy completes"""
+    strategy: str
+    success: bool
+    results: Dict[str, Any]
+    confidence: float  # Aggregated confidence over the strategies completed so far
+    elapsed_ms: float
+    completed: int
+    total: int
+    type: str = 'partial'
+
+@dataclass
+class ConsultationFinalResult:
+    """Aggregated consultation result closing a stream"""
+    result: Dict[str, Any]
+    confidence: float
+    elapsed_ms: float
+    cached: bool = False
+    type: str = 'final'
+
 class CentralMemoryCoordinator:
     """
     Central coordinator for all memory sources and RAG strategies
@@ -57,9 +88,20 @@ class CentralMemoryCoordinator:
             'reranking': RerankingStrategy()
         }
         
+        # Contextual embeddings store feeds the hybrid search vector leg directly
+        self.crawl4ai_strategies['hybrid_search'].attach_embedding_store(
+            self.crawl4ai_strategies['contextual_embeddings'].get_embedding_store()
+        )
+        
+        # Memory corpus ingestion into the hybrid search indexes (lazy)
+        self.ingestion_pipeline = None
+        
         # Initialize Cognee ECL pipeline
         self.cognee_pipeline = CogneeECLPipeline()
         
+        # Its knowledge graph store backs the hybrid search graph-neighbourhood leg
+        self.crawl4ai_strategies['hybrid_search'].attach_graph_store(self.cognee_pipeline.get_graph_store())
+        
         # Configuration - FASE 3 Optimized
         self.config = {
             'routing_enabled': True,
@@ -69,8 +111,11 @@ class CentralMemoryCoordinator:
             'cache_enabled': True,
             'cache_ttl': 3600,  # 1 hour
             'max_concurrent_strategies': 3,
-            'timeout_seconds': 30,
+            'timeout_seconds': 30,  # Default consultation budget (None = no deadline)
             'backward_compatibility': True,
+            'code_index_enabled': True,  # Code questions without code go to the code pattern index
+            'memory_root': None,  # None = the memory directory above native-rag-system
+            'ingestion_manifest_path': None,  # None = cache/ingestion/manifest.json
             # FASE 3 Cache Optimizations
             'intelligent_cache_enabled': True,
             'cache_compression': True,
@@ -123,6 +168,10 @@ class CentralMemoryCoordinator:
         # Performance metrics - FASE 3 Enhanced
         self.metrics = {
             'total_consultations': 0,
+            'batch_consultations': 0,
+            'batch_queries_deduplicated': 0,
+            'streamed_consultations': 0,
+            'deadline_exceeded': 0,
             'routing_decisions': {},
             'strategy_usage': {},
             'fallback_activations': 0,
@@ -180,17 +229,41 @@ class CentralMemoryCoordinator:
         except Exception as error:
             logger.warning(f"⚠️ [CENTRAL HUB] MCP integration setup failed: {error}")
     
-    async def coordinate_memory_operations(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def ingest_memory_corpus(self, paths: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Incrementally ingest the memory corpus (or specific files) into hybrid search
+        """
+        if self.ingestion_pipeline is None:
+            self.ingestion_pipeline = MemoryIngestionPipeline(
+                contextual_embeddings=self.crawl4ai_strategies['contextual_embeddings'],
+                hybrid_search=self.crawl4ai_strategies['hybrid_search'],
+                memory_root=self.config['memory_root'],
+                manifest_path=self.config['ingestion_manifest_path'],
+                ecl_pipeline=self.cognee_pipeline
+            )
+        return await self.ingestion_pipeline.ingest([Path(path) for path in paths] if paths is not None else None)
+    
+    async def index_code_repository(self) -> Dict[str, Any]:
+        """
+        Incrementally re-index code patterns and symbols across the project (changed files only)
+        """
+        return await self.crawl4ai_strategies['agentic_rag'].get_code_index().refresh()
+    
+    async def coordinate_memory_operations(self, query: str, context: Dict[str, Any] = None,
+                                           deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Alias for coordinate_memory_consultation for MCP integration compatibility"""
-        return await self.coordinate_memory_consultation(query, context)
+        return await self.coordinate_memory_consultation(query, context, deadline)
 
-    async def coordinate_memory_consultation(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def coordinate_memory_consultation(self, query: str, context: Dict[str, Any] = None,
+                                             deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Central coordination of memory consultation across all sources
         
         Args:
             query: Query string or complex query object
             context: Additional context information
+            deadline: Request deadline (Deadline or budget in seconds); defaults to
+                context['deadline'], else a fresh timeout_seconds budget
             
         Returns:
             Coordinated response from appropriate memory sources
@@ -200,8 +273,7 @@ class CentralMemoryCoordinator:
         
         try:
             # Prepare context information
-            if context is None:
-                context = {}
+            context = self._attach_deadline(context, deadline)
             
             # Generate cache key
             cache_key = self._generate_cache_key(query, context)
@@ -223,26 +295,9 @@ class CentralMemoryCoordinator:
             # Step 2: Execute consultation strategy
             consultation_result = await self._execute_consultation_strategy(query, context, routing_decision)
             
-            # Step 3: Apply fallback if needed
-            if not consultation_result['success'] and self.config['fallback_enabled']:
-                consultation_result = await self._execute_fallback_chain(query, context, routing_decision)
-            
-            # Step 4: Optimize and enhance results
-            optimized_result = await self._optimize_consultation_result(consultation_result, context)
-            
-            # Step 5: Integrate with MCP Shrimp if configured
-            if self.config['mcp_integration']:
-                await self._integrate_with_mcp_shrimp(optimized_result, context)
-            
-            # FASE 3 Intelligent Cache Storage
-            await self._cache_result_intelligent(cache_key, optimized_result, query, context)
-            
-            # Update metrics
-            response_time = (time.time() - start_time) * 1000
-            self._update_response_time_metrics(response_time)
-            
-            logger.info(f"✅ [CENTRAL HUB] Memory consultation completed ({response_time:.1f}ms)")
-            return optimized_result
+            # Steps 3-5: Fallback, optimization, MCP Shrimp and cache storage
+            return await self._finalize_consultation(query, context, cache_key, routing_decision,
+                                                     consultation_result, start_time)
             
         except Exception as error:
             logger.error(f"❌ [CENTRAL HUB] Memory consultation failed: {error}")
@@ -253,6 +308,250 @@ class CentralMemoryCoordinator:
             
             raise
     
+    async def stream_memory_consultation(self, query: str, context: Dict[str, Any] = None,
+                                         deadline: Optional[Deadline] = None
+                                         ) -> AsyncIterator[Union[ConsultationPartialResult, ConsultationFinalResult]]:
+        """
+        Streaming variant of coordinate_memory_consultation
+        
+        The routed strategies run concurrently (up to max_concurrent_strategies)
+        and a ConsultationPartialResult is yielded as each one completes, so
+        callers can act on fast strategies (self correction, keyword hits)
+        before slow ones finish. The stream ends with a ConsultationFinalResult
+        carrying exactly what coordinate_memory_consultation would return; that
+        result is cached as usual. A cache hit yields only the final event.
+        Closing the generator early cancels the strategies still running.
+        
+        Args:
+            query: Query string or complex query object
+            context: Additional context information
+            deadline: Request deadline, as for coordinate_memory_consultation
+            
+        Yields:
+            Partial results in completion order, then one final result
+        """
+        start_time = time.time()
+        self.metrics['total_consultations'] += 1
+        self.metrics['streamed_consultations'] += 1
+        
+        context = self._attach_deadline(context, deadline)
+        
+        def elapsed_ms() -> float:
+            return (time.time() - start_time) * 1000
+        
+        pending = set()
+        try:
+            cache_key = self._generate_cache_key(query, context)
+            
+            # FASE 3 Intelligent Cache Check
+            cached_result = await self._get_cached_result_intelligent(cache_key, query, context)
+            if cached_result is not None:
+                self.metrics['cache_hits'] += 1
+                self._update_cache_hit_rate()
+                yield ConsultationFinalResult(
+                    result=cached_result,
+                    confidence=cached_result.get('results', {}).get('confidence_score', 0.0),
+                    elapsed_ms=elapsed_ms(),
+                    cached=True
+                )
+                return
+            
+            self.metrics['cache_misses'] += 1
+            
+            # Step 1: Intelligent routing decision
+            routing_decision = await self._make_routing_decision(query, context)
+            execution_order = routing_decision['execution_order']
+            strategy_context = self._strategy_context(context, routing_decision)
+            
+            # Step 2: Run strategies concurrently, reporting each as it completes
+            slots = asyncio.Semaphore(max(1, self.config['max_concurrent_strategies']))
+            
+            async def run(strategy_name: str) -> Tuple[str, Dict[str, Any]]:
+                async with slots:
+                    return strategy_name, await self._run_strategy(strategy_name, query, strategy_context)
+            
+            pending = {asyncio.ensure_future(run(strategy_name)) for strategy_name in execution_order}
+            completed: Dict[str, Dict[str, Any]] = {}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    strategy_name, strategy_result = task.result()
+                    completed[strategy_name] = strategy_result
+                    yield ConsultationPartialResult(
+                        strategy=strategy_name,
+                        success=strategy_result.get('success', False),
+                        results=strategy_result,
+                        confidence=self._aggregate_strategy_results(completed, routing_decision)['confidence_score'],
+                        elapsed_ms=elapsed_ms(),
+                        completed=len(completed),
+                        total=len(execution_order)
+                    )
+            
+            # Aggregate in routing order so the result matches the sequential path
+            consultation_result = self._build_consultation_result(
+                {strategy_name: completed[strategy_name] for strategy_name in execution_order}, routing_decision
+            )
+            
+            # Steps 3-5: Fallback, optimization, MCP Shrimp and cache storage
+            optimized_result = await self._finalize_consultation(query, context, cache_key, routing_decision,
+                                                                 consultation_result, start_time)
+            
+        except Exception as error:
+            logger.error(f"❌ [CENTRAL HUB] Streaming memory consultation failed: {error}")
+            if not self.config['fallback_enabled']:
+                raise
+            optimized_result = await self._ultimate_fallback(query, context, error)
+            
+        finally:
+            # Stopped early: cancel the remaining strategies and wait for their cleanup
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        yield ConsultationFinalResult(
+            result=optimized_result,
+            confidence=optimized_result.get('results', {}).get('confidence_score', 0.0),
+            elapsed_ms=elapsed_ms()
+        )
+    
+    def _attach_deadline(self, context: Optional[Dict[str, Any]], deadline: Optional[Deadline]) -> Dict[str, Any]:
+        """
+        Copy of the context carrying the request deadline
+        
+        The explicit deadline wins, then context['deadline'], then a fresh
+        timeout_seconds budget.
+        """
+        context = dict(context or {})
+        deadline = Deadline.coerce(deadline) or Deadline.coerce(context.get('deadline'))
+        if deadline is None and self.config['timeout_seconds']:
+            deadline = Deadline(self.config['timeout_seconds'])
+        context['deadline'] = deadline
+        return context
+    
+    async def _finalize_consultation(self, query: Any, context: Dict[str, Any], cache_key: str,
+                                     routing_decision: Dict[str, Any], consultation_result: Dict[str, Any],
+                                     start_time: float) -> Dict[str, Any]:
+        """
+        Fallback, optimization, MCP Shrimp integration and caching of one consultation
+        """
+        # Step 3: Apply fallback if needed
+        if not consultation_result['success'] and self.config['fallback_enabled']:
+            consultation_result = await self._execute_fallback_chain(query, context, routing_decision)
+        
+        # Step 4: Optimize and enhance results
+        optimized_result = await self._optimize_consultation_result(consultation_result, context)
+        
+        # Step 5: Integrate with MCP Shrimp if configured
+        if self.config['mcp_integration']:
+            await self._integrate_with_mcp_shrimp(optimized_result, context)
+        
+        # FASE 3 Intelligent Cache Storage
+        await self._cache_result_intelligent(cache_key, optimized_result, query, context)
+        
+        # Update metrics
+        response_time = (time.time() - start_time) * 1000
+        self._update_response_time_metrics(response_time)
+        
+        logger.info(f"✅ [CENTRAL HUB] Memory consultation completed ({response_time:.1f}ms)")
+        return optimized_result
+    
+    async def coordinate_memory_consultations_batch(self, queries: List[Any], context: Dict[str, Any] = None,
+                                                    deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        """
+        Coordinate several memory consultations at once
+        
+        Identical queries are consulted once and cache hits are served
+        directly. The remaining queries are grouped by routing decision and each
+        group runs every strategy once over all of its queries: one embedding
+        call, one vector matrix product, shared keyword postings, one rerank
+        call and one self correction log scan.
+        
+        Args:
+            queries: Query strings or complex query objects
+            context: Context shared by every query
+            deadline: Deadline for the whole batch, as for coordinate_memory_consultation
+            
+        Returns:
+            One consultation result per query, in input order (same shape as
+            coordinate_memory_consultation)
+        """
+        start_time = time.time()
+        self.metrics['total_consultations'] += len(queries)
+        self.metrics['batch_consultations'] += 1
+        
+        context = self._attach_deadline(context, deadline)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        
+        # Identical queries share one consultation
+        unique_queries: Dict[str, List[int]] = {}
+        for index, query in enumerate(queries):
+            unique_queries.setdefault(self._generate_cache_key(query, context), []).append(index)
+        self.metrics['batch_queries_deduplicated'] += len(queries) - len(unique_queries)
+        
+        try:
+            pending = []
+            for cache_key, indexes in unique_queries.items():
+                query = queries[indexes[0]]
+                cached_result = await self._get_cached_result_intelligent(cache_key, query, context)
+                if cached_result is not None:
+                    self.metrics['cache_hits'] += 1
+                    for index in indexes:
+                        results[index] = cached_result
+                else:
+                    self.metrics['cache_misses'] += 1
+                    pending.append((cache_key, query))
+            self._update_cache_hit_rate()
+            
+            if pending:
+                # Step 1: Route every query and group by execution plan and analysis flags
+                groups: Dict[Tuple[Tuple[Any, ...], ...], List[Tuple[str, Any, Dict[str, Any]]]] = {}
+                for cache_key, query in pending:
+                    routing_decision = await self._make_routing_decision(query, context)
+                    group_key = (
+                        tuple(routing_decision['execution_order']),
+                        tuple(routing_decision['query_analysis'].get(flag, False) for flag in STRATEGY_ANALYSIS_FLAGS)
+                    )
+                    groups.setdefault(group_key, []).append((cache_key, query, routing_decision))
+                
+                # Step 2: Each group runs its strategies once over all of its queries
+                group_results = await asyncio.gather(*(
+                    self._execute_consultation_strategy_batch(members, context) for members in groups.values()
+                ))
+                
+                optimized_result = None
+                for members, consultation_results in zip(groups.values(), group_results):
+                    for (cache_key, query, routing_decision), consultation_result in zip(members, consultation_results):
+                        # Step 3: Apply fallback if needed
+                        if not consultation_result['success'] and self.config['fallback_enabled']:
+                            consultation_result = await self._execute_fallback_chain(query, context, routing_decision)
+                        
+                        # Step 4: Optimize and enhance results
+                        optimized_result = await self._optimize_consultation_result(consultation_result, context)
+                        await self._cache_result_intelligent(cache_key, optimized_result, query, context)
+                        for index in unique_queries[cache_key]:
+                            results[index] = optimized_result
+                
+                # Step 5: One MCP Shrimp update for the whole batch
+                if self.config['mcp_integration']:
+                    await self._integrate_with_mcp_shrimp(optimized_result, context)
+            
+        except Exception as error:
+            logger.error(f"❌ [CENTRAL HUB] Batch consultation failed: {error}")
+            if not self.config['fallback_enabled']:
+                raise
+            for index, query in enumerate(queries):
+                if results[index] is None:
+                    results[index] = await self._ultimate_fallback(query, context, error)
+        
+        response_time = (time.time() - start_time) * 1000
+        if queries:
+            self._update_response_time_metrics(response_time / len(queries))
+        
+        logger.info(f"✅ [CENTRAL HUB] Batch of {len(queries)} consultations completed "
+                    f"({len(unique_queries)} unique, {response_time:.1f}ms)")
+        return results
+    
     async def _make_routing_decision(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make intelligent routing decision based on query type and context
@@ -410,34 +709,13 @@ class CentralMemoryCoordinator:
         """
         try:
             execution_order = routing_decision['execution_order']
+            strategy_context = self._strategy_context(context, routing_decision)
             results = {}
             
             for strategy_name in execution_order:
-                try:
-                    strategy_result = await self._execute_single_strategy(strategy_name, query, context)
-                    results[strategy_name] = strategy_result
-                    
-                    # Update strategy usage metrics
-                    self.metrics['strategy_usage'][strategy_name] = self.metrics['strategy_usage'].get(strategy_name, 0) + 1
-                    
-                except Exception as strategy_error:
-                    logger.warning(f"⚠️ [CENTRAL HUB] Strategy {strategy_name} failed: {strategy_error}")
-                    results[strategy_name] = {
-                        'success': False,
-                        'error': str(strategy_error),
-                        'strategy': strategy_name
-                    }
-            
-            # Aggregate results
-            aggregated_result = self._aggregate_strategy_results(results, routing_decision)
+                results[strategy_name] = await self._run_strategy(strategy_name, query, strategy_context)
             
-            return {
-                'success': True,
-                'results': aggregated_result,
-                'strategies_used': list(results.keys()),
-                'routing_decision': routing_decision,
-                'execution_timestamp': time.time()
-            }
+            return self._build_consultation_result(results, routing_decision)
             
         except Exception as error:
             logger.error(f"❌ [CENTRAL HUB] Strategy execution failed: {error}")
@@ -449,6 +727,137 @@ class CentralMemoryCoordinator:
                 'execution_timestamp': time.time()
             }
     
+    def _strategy_context(self, context: Dict[str, Any], routing_decision: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Context the strategies run with: the request context plus the routing decision's query analysis
+        """
+        return {**context, 'query_analysis': routing_decision['query_analysis']}
+    
+    async def _run_strategy(self, strategy_name: str, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one strategy, converting a failure into a failed strategy result
+        """
+        try:
+            strategy_result = await self._execute_strategy_within_deadline(strategy_name, query, context)
+            
+            # Update strategy usage metrics
+            self.metrics['strategy_usage'][strategy_name] = self.metrics['strategy_usage'].get(strategy_name, 0) + 1
+            return strategy_result
+            
+        except DeadlineExceededError as deadline_error:
+            logger.warning(f"⏱️ [CENTRAL HUB] Strategy {strategy_name} stopped: {deadline_error}")
+            return {
+                'success': False,
+                'error': str(deadline_error),
+                'deadline_exceeded': True,
+                'strategy': strategy_name
+            }
+            
+        except Exception as strategy_error:
+            logger.warning(f"⚠️ [CENTRAL HUB] Strategy {strategy_name} failed: {strategy_error}")
+            return {
+                'success': False,
+                'error': str(strategy_error),
+                'strategy': strategy_name
+            }
+    
+    async def _execute_strategy_within_deadline(self, strategy_name: str, query: Any, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one strategy, cancelling it (and its bridge calls) when the request deadline runs out
+        """
+        return await self._within_deadline(self._execute_single_strategy(strategy_name, query, context),
+                                           context, f"Strategy {strategy_name}")
+    
+    async def _within_deadline(self, awaitable, context: Dict[str, Any], operation: str):
+        """Await within the context's deadline (if any)"""
+        deadline = context.get('deadline')
+        if deadline is None:
+            return await awaitable
+        try:
+            return await deadline.wait_for(awaitable, operation=operation)
+        except DeadlineExceededError:
+            self.metrics['deadline_exceeded'] += 1
+            raise
+    
+    def _build_consultation_result(self, results: Dict[str, Dict[str, Any]], routing_decision: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Aggregate per-strategy results into a consultation result
+        """
+        return {
+            'success': True,
+            'results': self._aggregate_strategy_results(results, routing_decision),
+            'strategies_used': list(results.keys()),
+            'routing_decision': routing_decision,
+            'execution_timestamp': time.time()
+        }
+    
+    async def _execute_consultation_strategy_batch(self, members: List[Tuple[str, Any, Dict[str, Any]]],
+                                                   context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Execute one routing group's strategies, each once for all of the group's queries
+        """
+        routing_decisions = [routing_decision for _, _, routing_decision in members]
+        queries = [query for _, query, _ in members]
+        # Members share the analysis flags the strategies read (see the batch group key)
+        strategy_context = self._strategy_context(context, routing_decisions[0])
+        try:
+            strategy_results = [{} for _ in members]
+            
+            for strategy_name in routing_decisions[0]['execution_order']:
+                try:
+                    outcomes = await self._within_deadline(
+                        self._execute_strategy_batch(strategy_name, queries, strategy_context),
+                        context, f"Strategy {strategy_name}"
+                    )
+                    self.metrics['strategy_usage'][strategy_name] = self.metrics['strategy_usage'].get(strategy_name, 0) + len(queries)
+                except Exception as strategy_error:
+                    logger.warning(f"⚠️ [CENTRAL HUB] Strategy {strategy_name} failed for batch: {strategy_error}")
+                    outcomes = [
+                        {'success': False, 'error': str(strategy_error), 'strategy': strategy_name}
+                        for _ in queries
+                    ]
+                for results, outcome in zip(strategy_results, outcomes):
+                    results[strategy_name] = outcome
+            
+            return [
+                self._build_consultation_result(results, routing_decision)
+                for results, routing_decision in zip(strategy_results, routing_decisions)
+            ]
+            
+        except Exception as error:
+            logger.error(f"❌ [CENTRAL HUB] Batch strategy execution failed: {error}")
+            return [
+                {
+                    'success': False,
+                    'error': str(error),
+                    'strategies_used': [],
+                    'routing_decision': routing_decision,
+                    'execution_timestamp': time.time()
+                }
+                for routing_decision in routing_decisions
+            ]
+    
+    async def _execute_strategy_batch(self, strategy_name: str, queries: List[Any], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Execute one strategy for several queries (batched where the strategy supports it)
+        """
+        if len(queries) > 1:
+            if strategy_name == 'crawl4ai_rag':
+                return await self._execute_crawl4ai_strategies_batch(queries, context)
+            if strategy_name == 'self_correction':
+                return await self._execute_self_correction_batch(queries, context)
+        
+        # Bridge and pipeline strategies: independent calls overlap
+        outcomes = await asyncio.gather(
+            *(self._execute_single_strategy(strategy_name, query, context) for query in queries),
+            return_exceptions=True
+        )
+        return [
+            outcome if not isinstance(outcome, BaseException)
+            else {'success': False, 'error': str(outcome), 'strategy': strategy_name}
+            for outcome in outcomes
+        ]
+    
     async def _execute_single_strategy(self, strategy_name: str, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute a single strategy
@@ -475,13 +884,14 @@ class CentralMemoryCoordinator:
             memory_args = [query, {
                 'source': context.get('source', 'central_hub'),
                 'consultation_type': 'enhanced_memory',
-                'context': context
+                'context': {key: value for key, value in context.items() if key != 'deadline'}
             }]
             
             result = await self.js_bridge.call_js_component(
                 'enhanced_memory',
                 'consultMemory',
-                memory_args
+                memory_args,
+                deadline=context.get('deadline')
             )
             
             return {
@@ -503,6 +913,12 @@ class CentralMemoryCoordinator:
         """
         Execute self correction log consultation
         """
+        return (await self._execute_self_correction_batch([query], context))[0]
+    
+    async def _execute_self_correction_batch(self, queries: List[Any], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Execute self correction log consultation for several queries with one read of the log
+        """
         try:
             # Read self correction log
             log_file = Path(__file__).parent.parent.parent / 'self_correction_log.md'
@@ -511,37 +927,48 @@ class CentralMemoryCoordinator:
                 with open(log_file, 'r', encoding='utf-8') as f:
                     log_content = f.read()
                 
-                # Simple search in log content
-                query_text = self._extract_query_text(query).lower()
-                relevant_lines = []
+                lines = log_content.split('\n')
+                lowered_lines = [line.lower() for line in lines]
                 
-                for line in log_content.split('\n'):
-                    if any(keyword in line.lower() for keyword in query_text.split()):
-                        relevant_lines.append(line.strip())
-                
-                return {
-                    'success': True,
-                    'data': {
-                        'relevant_entries': relevant_lines[:10],  # Limit to 10 entries
-                        'total_matches': len(relevant_lines)
-                    },
-                    'strategy': 'self_correction',
-                    'source': 'file_based'
-                }
+                results = []
+                for query in queries:
+                    # Simple search in log content
+                    query_terms = self._extract_query_text(query).lower().split()
+                    relevant_lines = [
+                        line.strip() for line, lowered in zip(lines, lowered_lines)
+                        if any(keyword in lowered for keyword in query_terms)
+                    ]
+                    
+                    results.append({
+                        'success': True,
+                        'data': {
+                            'relevant_entries': relevant_lines[:10],  # Limit to 10 entries
+                            'total_matches': len(relevant_lines)
+                        },
+                        'strategy': 'self_correction',
+                        'source': 'file_based'
+                    })
+                return results
             else:
-                return {
-                    'success': False,
-                    'error': 'Self correction log not found',
-                    'strategy': 'self_correction'
-                }
+                return [
+                    {
+                        'success': False,
+                        'error': 'Self correction log not found',
+                        'strategy': 'self_correction'
+                    }
+                    for _ in queries
+                ]
                 
         except Exception as error:
             logger.warning(f"⚠️ [CENTRAL HUB] Self correction failed: {error}")
-            return {
-                'success': False,
-                'error': str(error),
-                'strategy': 'self_correction'
-            }
+            return [
+                {
+                    'success': False,
+                    'error': str(error),
+                    'strategy': 'self_correction'
+                }
+                for _ in queries
+            ]
     
     async def _execute_augment_memories(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -619,21 +1046,27 @@ class CentralMemoryCoordinator:
             if query_analysis.get('requires_semantic_search', False):
                 # Contextual embeddings + hybrid search
                 contextual_result = await self.crawl4ai_strategies['contextual_embeddings'].generate_contextual_embeddings(
-                    query, context
+                    query, {**context, 'embedding_role': 'query'}
                 )
                 results['contextual_embeddings'] = contextual_result
 
                 hybrid_result = await self.crawl4ai_strategies['hybrid_search'].perform_hybrid_search(
-                    query, context
+                    query, {**context, 'query_embedding': contextual_result.get('embedding')}
                 )
                 results['hybrid_search'] = hybrid_result
 
             if query_analysis.get('requires_code_analysis', False):
-                # Agentic RAG for code analysis
-                agentic_result = await self.crawl4ai_strategies['agentic_rag'].extract_code_patterns(
-                    query, context
-                )
-                results['agentic_rag'] = agentic_result
+                agentic_rag = self.crawl4ai_strategies['agentic_rag']
+                query_text = self._extract_query_text(query)
+                if self.config['code_index_enabled'] and not agentic_rag.contains_code(query_text):
+                    # Questions about the project's code are answered from the code pattern index
+                    results['code_index'] = await agentic_rag.lookup_code_index(query_text, context)
+                else:
+                    # Agentic RAG for code analysis
+                    agentic_result = await agentic_rag.extract_code_patterns(
+                        query, context
+                    )
+                    results['agentic_rag'] = agentic_result
 
             if query_analysis.get('requires_reranking', False) and 'hybrid_search' in results:
                 # Reranking for result optimization
@@ -645,7 +1078,7 @@ class CentralMemoryCoordinator:
             # If no specific requirements, use contextual embeddings as default
             if not results:
                 contextual_result = await self.crawl4ai_strategies['contextual_embeddings'].generate_contextual_embeddings(
-                    query, context
+                    query, {**context, 'embedding_role': 'query'}
                 )
                 results['contextual_embeddings'] = contextual_result
 
@@ -664,16 +1097,93 @@ class CentralMemoryCoordinator:
                 'strategy': 'crawl4ai_rag'
             }
 
+    async def _execute_crawl4ai_strategies_batch(self, queries: List[Any], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Execute Crawl4AI native strategies for several queries with batched calls
+        
+        Mirrors _execute_crawl4ai_strategies: one embedding backend call for all
+        queries, one batched hybrid search and one batched rerank.
+        """
+        try:
+            query_analysis = context.get('query_analysis', {})
+            query_texts = [self._extract_query_text(query) for query in queries]
+            contextual_embeddings = self.crawl4ai_strategies['contextual_embeddings']
+            per_query = [{} for _ in queries]
+
+            if query_analysis.get('requires_semantic_search', False):
+                contextual_results = await contextual_embeddings.generate_contextual_embeddings_batch(
+                    query_texts, {**context, 'embedding_role': 'query'}
+                )
+                hybrid_results = await self.crawl4ai_strategies['hybrid_search'].perform_hybrid_search_batch(
+                    query_texts,
+                    [{**context, 'query_embedding': contextual_result.get('embedding')} for contextual_result in contextual_results]
+                )
+                for results, contextual_result, hybrid_result in zip(per_query, contextual_results, hybrid_results):
+                    results['contextual_embeddings'] = contextual_result
+                    results['hybrid_search'] = hybrid_result
+
+            if query_analysis.get('requires_code_analysis', False):
+                agentic_rag = self.crawl4ai_strategies['agentic_rag']
+                code_results = await asyncio.gather(*(
+                    agentic_rag.lookup_code_index(query_text, context)
+                    if self.config['code_index_enabled'] and not agentic_rag.contains_code(query_text)
+                    else agentic_rag.extract_code_patterns(query, context)
+                    for query, query_text in zip(queries, query_texts)
+                ))
+                for results, query_text, code_result in zip(per_query, query_texts, code_results):
+                    if self.config['code_index_enabled'] and not agentic_rag.contains_code(query_text):
+                        results['code_index'] = code_result
+                    else:
+                        results['agentic_rag'] = code_result
+
+            rerank = [i for i, results in enumerate(per_query) if 'hybrid_search' in results]
+            if query_analysis.get('requires_reranking', False) and rerank:
+                reranked = await self.crawl4ai_strategies['reranking'].rerank_results_batch(
+                    [query_texts[i] for i in rerank], [per_query[i]['hybrid_search'] for i in rerank], context
+                )
+                for i, reranking_result in zip(rerank, reranked):
+                    per_query[i]['reranking'] = reranking_result
+
+            # If no specific requirements, use contextual embeddings as default
+            default = [i for i, results in enumerate(per_query) if not results]
+            if default:
+                contextual_results = await contextual_embeddings.generate_contextual_embeddings_batch(
+                    [query_texts[i] for i in default], {**context, 'embedding_role': 'query'}
+                )
+                for i, contextual_result in zip(default, contextual_results):
+                    per_query[i]['contextual_embeddings'] = contextual_result
+
+            return [
+                {
+                    'success': True,
+                    'data': results,
+                    'strategy': 'crawl4ai_rag',
+                    'strategies_executed': list(results.keys())
+                }
+                for results in per_query
+            ]
+
+        except Exception as error:
+            logger.warning(f"⚠️ [CENTRAL HUB] Crawl4AI batch strategies failed: {error}")
+            return [
+                {
+                    'success': False,
+                    'error': str(error),
+                    'strategy': 'crawl4ai_rag'
+                }
+                for _ in queries
+            ]
+
     async def _execute_cognee_pipeline(self, query: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute Cognee ECL pipeline
         """
         try:
-            # Execute ECL pipeline
+            # Execute ECL pipeline; the query is not a document, keep it out of the graph
             ecl_result = await self.cognee_pipeline.execute_ecl_pipeline(
                 self._extract_query_text(query),
                 context.get('source', 'central_hub'),
-                context
+                {**context, 'persist_graph': False}
             )
 
             return {
@@ -742,11 +1252,12 @@ class CentralMemoryCoordinator:
 
         try:
             fallback_chain = routing_decision.get('fallback_chain', ['enhanced_memory'])
+            strategy_context = self._strategy_context(context, routing_decision)
             fallback_results = {}
 
             for strategy_name in fallback_chain:
                 try:
-                    fallback_result = await self._execute_single_strategy(strategy_name, query, context)
+                    fallback_result = await self._execute_strategy_within_deadline(strategy_name, query, strategy_context)
                     if fallback_result.get('success', False):
                         fallback_results[strategy_name] = fallback_result
                         logger.info(f"✅ [CENTRAL HUB] Fallback strategy {strategy_name} succeeded")
@@ -1228,4 +1739,4 @@ class CentralMemoryCoordinator:
             del self.preload_cache[oldest_pattern]
 
 # Export main class
-__all__ = ['CentralMemoryCoordinator']
+__all__ = ['CentralMemoryCoordinator', 'ConsultationPartialResult', 'ConsultationFinalResult']
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+
+"""
+CROSSCHECK MEMORY STORE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Persistent storage for the crosscheck system's memory entries, so duplicate
+detection works against history across restarts.
+
+Layout (one directory per store):
+- snapshot.bin: binary snapshot, fixed-width record table + one UTF-8 text blob
+  (offsets and lengths are in characters, so the blob is decoded in one call)
+- log.jsonl: append-only put / delete records since the last snapshot
+
+Features:
+- `__slots__` MemoryEntry records in memory
+- Append-only log with torn-tail tolerant replay (puts and deletes are idempotent)
+- Periodic snapshot (atomic replace) that truncates the log
+- Startup decodes the memory-mapped snapshot without copying it into Python bytes
+- Secondary indexes by category, keyword and source, maintained on every write
+"""
+
+import gc
+import json
+import mmap
+import os
+import struct
+import time
+import logging
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Iterable
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b'XCMEMSN1'
+SNAPSHOT_VERSION = 1
+# magic, version, record count
+_HEADER = struct.Struct('<8sIQ')
+# text offset, lengths of id / content / category / keywords / timestamp / source, confidence, unique value
+_RECORD = struct.Struct('<QIIIIIIdd')
+_KEYWORD_SEPARATOR = '\x1f'
+
+@dataclass(slots=True)
+class MemoryEntry:
+    """Data class for memory entries"""
+    id: str
+    content: str
+    category: str
+    keywords: List[str]
+    timestamp: str
+    confidence: float
+    source: str
+    similarity_score: float = 0.0
+    unique_value_score: float = 0.0
+
+class MemoryEntryStore:
+    """
+    Append-only log + snapshot store for MemoryEntry records
+    """
+
+    def __init__(self, store_dir: Path, snapshot_interval: int = 10000):
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+        self.snapshot_file = self.store_dir / 'snapshot.bin'
+        self.log_file = self.store_dir / 'log.jsonl'
+
+        self.config = {
+            'snapshot_interval': snapshot_interval  # log records before an automatic snapshot
+        }
+
+        self.entries: Dict[str, MemoryEntry] = {}
+        self.by_category: Dict[str, Set[str]] = {}
+        self.by_keyword: Dict[str, Set[str]] = {}
+        self.by_source: Dict[str, Set[str]] = {}
+
+        self._log_handle = None
+        self._log_records = 0
+
+        self.metrics = {
+            'puts': 0,
+            'deletes': 0,
+            'snapshots': 0,
+            'snapshot_entries_loaded': 0,
+            'log_records_replayed': 0,
+            'load_time_ms': 0.0,
+            'last_snapshot_time_ms': 0.0
+        }
+
+        self._open()
+
+    # STORAGE LIFECYCLE
+
+    def _open(self):
+        """Load the snapshot, then replay the log written after it"""
+        start_time = time.time()
+        self._load_snapshot()
+        self._replay_log()
+        self._log_handle = open(self.log_file, 'a', encoding='utf-8')
+        self.metrics['load_time_ms'] = (time.time() - start_time) * 1000
+
+        logger.info(f"✅ [MEMORY STORE] Loaded {len(self.entries)} entries "
+                    f"({self.metrics['log_records_replayed']} log records, {self.metrics['load_time_ms']:.1f}ms)")
+
+    def _load_snapshot(self):
+        if not self.snapshot_file.exists() or self.snapshot_file.stat().st_size < _HEADER.size:
+            return
+
+        with open(self.snapshot_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            magic, version, count = _HEADER.unpack_from(view, 0)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported memory snapshot at {self.snapshot_file}")
+
+            table_end = _HEADER.size + count * _RECORD.size
+            buffer = memoryview(view)
+            try:
+                records = list(_RECORD.iter_unpack(buffer[_HEADER.size:table_end]))
+                text = str(buffer[table_end:], 'utf-8')
+            finally:
+                buffer.release()
+
+        # Only long-lived objects are created here; cyclic GC passes would just rescan them
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            entries = self.entries
+            for start, id_length, content_length, category_length, keywords_length, timestamp_length, \
+                    source_length, confidence, unique_value in records:
+                content_start = start + id_length
+                category_start = content_start + content_length
+                keywords_start = category_start + category_length
+                timestamp_start = keywords_start + keywords_length
+                source_start = timestamp_start + timestamp_length
+                memory_id = text[start:content_start]
+                keywords = text[keywords_start:timestamp_start]
+                entries[memory_id] = MemoryEntry(
+                    memory_id,
+                    text[content_start:category_start],
+                    text[category_start:keywords_start],
+                    keywords.split(_KEYWORD_SEPARATOR) if keywords else [],
+                    text[timestamp_start:source_start],
+                    confidence,
+                    text[source_start:source_start + source_length],
+                    0.0,
+                    unique_value
+                )
+            self._rebuild_indexes()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        self.metrics['snapshot_entries_loaded'] = len(self.entries)
+
+    def _replay_log(self):
+        self._log_records = 0
+        if not self.log_file.exists():
+            return
+
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write at the tail of the log
+                self._apply_record(record)
+                self._log_records += 1
+
+        self.metrics['log_records_replayed'] = self._log_records
+
+    def _apply_record(self, record: Dict[str, Any]):
+        if record.get('d'):
+            self._unindex(record['id'])
+        else:
+            self._index(MemoryEntry(**record['e']))
+
+    def _append_records(self, records: List[Dict[str, Any]]):
+        for record in records:
+            self._log_handle.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+        self._log_handle.flush()
+        self._log_records += len(records)
+
+        if self._log_records >= self.config['snapshot_interval']:
+            self.snapshot()
+
+    def snapshot(self):
+        """Write all entries to a new snapshot and truncate the log"""
+        start_time = time.time()
+        tmp_file = self.snapshot_file.with_suffix('.tmp')
+
+        table = bytearray()
+        texts = []
+        offset = 0
+        for entry in self.entries.values():
+            fields = (entry.id, entry.content, entry.category,
+                      _KEYWORD_SEPARATOR.join(entry.keywords), entry.timestamp, entry.source)
+            lengths = [len(value) for value in fields]
+            table += _RECORD.pack(offset, *lengths, float(entry.confidence), float(entry.unique_value_score))
+            texts.extend(fields)
+            offset += sum(lengths)
+
+        with open(tmp_file, 'wb') as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self.entries)))
+            f.write(table)
+            f.write(''.join(texts).encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.snapshot_file)
+
+        # Every logged record is now in the snapshot
+        self._log_handle.close()
+        self._log_handle = open(self.log_file, 'w', encoding='utf-8')
+        self._log_records = 0
+
+        self.metrics['snapshots'] += 1
+        self.metrics['last_snapshot_time_ms'] = (time.time() - start_time) * 1000
+        logger.info(f"💾 [MEMORY STORE] Snapshot written: {len(self.entries)} entries "
+                    f"({self.metrics['last_snapshot_time_ms']:.1f}ms)")
+
+    def close(self):
+        """Snapshot pending log records and release the log handle"""
+        if self._log_handle is None:
+            return
+        if self._log_records:
+            self.snapshot()
+        self._log_handle.close()
+        self._log_handle = None
+
+    # SECONDARY INDEXES
+
+    def _rebuild_indexes(self):
+        """Build the secondary indexes for all entries in one pass"""
+        by_category, by_keyword, by_source = {}, {}, {}
+        for memory_id, entry in self.entries.items():
+            ids = by_category.get(entry.category)
+            if ids is None:
+                ids = by_category[entry.category] = set()
+            ids.add(memory_id)
+            ids = by_source.get(entry.source)
+            if ids is None:
+                ids = by_source[entry.source] = set()
+            ids.add(memory_id)
+            for keyword in entry.keywords:
+                ids = by_keyword.get(keyword)
+                if ids is None:
+                    ids = by_keyword[keyword] = set()
+                ids.add(memory_id)
+        self.by_category, self.by_keyword, self.by_source = by_category, by_keyword, by_source
+
+    def _index(self, entry: MemoryEntry):
+        self._unindex(entry.id)
+        self.entries[entry.id] = entry
+        self.by_category.setdefault(entry.category, set()).add(entry.id)
+        self.by_source.setdefault(entry.source, set()).add(entry.id)
+        for keyword in entry.keywords:
+            self.by_keyword.setdefault(keyword, set()).add(entry.id)
+
+    def _unindex(self, memory_id: str):
+        entry = self.entries.pop(memory_id, None)
+        if entry is None:
+            return
+        for index, values in ((self.by_category, [entry.category]), (self.by_source, [entry.source]),
+                              (self.by_keyword, entry.keywords)):
+            for value in values:
+                ids = index.get(value)
+                if ids is not None:
+                    ids.discard(memory_id)
+                    if not ids:
+                        del index[value]
+
+    # WRITES
+
+    def put(self, entry: MemoryEntry):
+        """Insert or replace an entry"""
+        self.put_many([entry])
+
+    def put_many(self, entries: Iterable[MemoryEntry]):
+        records = []
+        for entry in entries:
+            record = asdict(entry)
+            record.pop('similarity_score')  # per-query value, not persisted
+            self._index(entry)
+            records.append({'e': record})
+        self.metrics['puts'] += len(records)
+        self._append_records(records)
+
+    def delete(self, memory_id: str) -> bool:
+        if memory_id not in self.entries:
+            return False
+        self._unindex(memory_id)
+        self.metrics['deletes'] += 1
+        self._append_records([{'id': memory_id, 'd': 1}])
+        return True
+
+    # QUERIES
+
+    def get(self, memory_id: str) -> Optional[MemoryEntry]:
+        return self.entries.get(memory_id)
+
+    def find(self, category: str = None, keyword: str = None, source: str = None) -> List[MemoryEntry]:
+        """Entries matching every given secondary-index filter"""
+        selections = [
+            index.get(value, set()) for index, value in (
+                (self.by_category, category), (self.by_keyword, keyword), (self.by_source, source)
+            ) if value is not None
+        ]
+        if not selections:
+            return list(self.entries.values())
+
+        ids = set.intersection(*sorted(selections, key=len))
+        return [self.entries[memory_id] for memory_id in ids]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get memory store metrics"""
+        return {
+            **self.metrics,
+            'entries': len(self.entries),
+            'categories': len(self.by_category),
+            'keywords': len(self.by_keyword),
+            'sources': len(self.by_source),
+            'pending_log_records': self._log_records
+        }
+
+# Export main class
+__all__ = ['MemoryEntryStore', 'MemoryEntry']
@@ -15,31 +15,49 @@ Based on Cognee research and ECL pipeline principles:
 Features:
 - Semantic entity extraction using NLP patterns
 - Integration with knowledge-graph-engine.js via bridge
-- Dynamic memory loading with persistence
+- Dynamic memory loading with persistence into a native SQLite knowledge graph
 - Modular ECL pipeline architecture
 - Performance monitoring and caching
+- Section-level incremental re-processing: unchanged sections reuse cached results
 - Robust fallback mechanisms
 """
 
 import asyncio
 import json
 import hashlib
+import os
 import time
 import logging
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Dict, Any, List, Optional, Tuple, Set, Iterator, Iterable, AsyncIterator
 import sys
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 # Add parent directory for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from integration.js_bridge import JavaScriptBridge
+from cognee_ecl_pipeline.entity_scanner import EntityScanner
+from cognee_ecl_pipeline.graph_store import KnowledgeGraphStore
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Markdown heading at the start of a line: preferred incremental section boundary
+_SECTION_HEADING = re.compile(r'^#{1,6}[ \t]', re.MULTILINE)
+
 class CogneeECLPipeline:
     """
     Native implementation of Cognee's ECL (Extract-Cognify-Load) pipeline
@@ -54,10 +72,13 @@ class CogneeECLPipeline:
             'entity_extraction_model': 'native_patterns',  # Use native patterns instead of spacy
             'relationship_threshold': 0.7,
             'memory_persistence': True,
+            'graph_store_path': None,  # None = cache/ecl-pipeline/knowledge_graph.db
             'bridge_integration': True,
             'cache_enabled': True,
             'cache_ttl': 3600,  # 1 hour
-            'max_entities_per_content': 50,
+            'max_entities_per_content': None,  # None = no cap; cognify is windowed, not pairwise
+            'relationship_window': 500,  # chars; proximity score bottoms out beyond this
+            'fast_relationship_window': 100,
             'min_entity_confidence': 0.6,
             'fallback_enabled': True,
             'performance_monitoring': True,
@@ -69,12 +90,50 @@ class CogneeECLPipeline:
             'fast_cognification': True,
             'memory_efficient': True,
             'target_execution_time': 80,  # ms
-            'early_termination': True,
-            'pattern_caching': True
+            'early_termination': False,
+            'pattern_caching': True,
+            # Windowed streaming for large documents
+            'window_size': 10000,  # chars; longer content is processed as overlapping windows
+            'window_overlap': 1000,  # >= relationship_window so close pairs share a window
+            'worker_processes': min(4, os.cpu_count() or 1),
+            # Batch ECL
+            'batch_chunk_size': 8,  # documents per worker task
+            'batch_load_size': 32,  # completed documents per bulk load
+            # Incremental ECL: content is split into sections whose results are cached by hash
+            'incremental_sections': True,
+            'incremental_min_chars': 4000,  # shorter content runs as a single unit
+            'section_min_chars': 1500,  # sections end at the first heading past this size
+            'section_cache_size': 4096  # cached section/seam results (in memory, LRU)
         }
 
         # Performance metrics - FASE 3 Enhanced
-        self.metrics = {
+        self.metrics = self._initial_metrics()
+
+        # Cache directory
+        self.cache_dir = Path(__file__).parent.parent / 'cache' / 'ecl-pipeline'
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Entity patterns, vocabularies and scanners (all that pool workers need)
+        self._init_extractors()
+
+        # Memory integration
+        self.memory_system = None
+
+        # Worker pool for windowed and batch extraction (lazy)
+        self._worker_pool: Optional[ProcessPoolExecutor] = None
+        self._worker_pool_disabled = False
+
+        # Persistent knowledge graph (lazy; only the parent process loads into it)
+        self._graph_store: Optional[KnowledgeGraphStore] = None
+
+        # Section/seam results keyed by content hash, positions relative to the unit
+        self._section_cache: OrderedDict = OrderedDict()
+
+        logger.info("✅ [ECL PIPELINE] Cognee ECL Pipeline initialized successfully")
+
+    @staticmethod
+    def _initial_metrics() -> Dict[str, Any]:
+        return {
             'total_ecl_executions': 0,
             'extract_operations': 0,
             'cognify_operations': 0,
@@ -92,30 +151,29 @@ class CogneeECLPipeline:
             'pattern_cache_hits': 0,
             'early_terminations': 0,
             'batch_processing_efficiency': 0,
-            'memory_optimization_savings': 0
+            'windowed_executions': 0,
+            'windows_processed': 0,
+            'batch_executions': 0,
+            'batch_documents': 0,
+            'incremental_executions': 0,
+            'sections_reused': 0,
+            'sections_processed': 0,
+            'worker_pool_failures': 0
         }
 
-        # Cache directory
-        self.cache_dir = Path(__file__).parent.parent / 'cache' / 'ecl-pipeline'
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
+    def _init_extractors(self):
         # Entity extraction patterns (Cognee-style)
         self.entity_patterns = {
             'CONCEPT': [
-                r'#{1,6}\s+(.+)',  # Headings
+                r'^[ \t]*#{1,6}[ \t]+(.+)',  # Headings
                 r'\*\*([^*]+)\*\*',  # Bold text
                 r'`([^`]+)`',  # Code snippets
-                r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b'  # Title case phrases
+                r'\b([A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+)*)\b'  # Title case phrases
             ],
             'TECHNOLOGY': [
-                r'\b(React|Next\.js|TypeScript|JavaScript|Python|Node\.js|Supabase|Tailwind|MCP|Sequential Thinking|TaskMaster|Playwright|Figma|Docker|Kubernetes|AWS|Azure|GCP)\b',
                 r'\b([A-Z][a-z]+\.js)\b',  # JavaScript frameworks
                 r'\b([A-Z][a-z]+SQL)\b'  # Database technologies
             ],
-            'TOOL': [
-                r'\b(VS Code|GitHub|GitLab|Jira|Slack|Discord|Zoom|Teams)\b',
-                r'\b([A-Z][a-z]+\s+[A-Z][a-z]+)\b'  # Tool names
-            ],
             'METHOD': [
                 r'\bdef\s+(\w+)',  # Python methods
                 r'\bfunction\s+(\w+)',  # JavaScript functions
@@ -128,10 +186,43 @@ class CogneeECLPipeline:
             ]
         }
 
-        # Memory integration
-        self.memory_system = None
+        # Fixed vocabularies, matched case-insensitively by an Aho-Corasick automaton
+        self.entity_dictionaries = {
+            'TECHNOLOGY': ['React', 'Next.js', 'TypeScript', 'JavaScript', 'Python', 'Node.js', 'Supabase',
+                           'Tailwind', 'MCP', 'Sequential Thinking', 'TaskMaster', 'Playwright', 'Figma',
+                           'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP'],
+            'TOOL': ['VS Code', 'GitHub', 'GitLab', 'Jira', 'Slack', 'Discord', 'Zoom', 'Teams']
+        }
 
-        logger.info("✅ [ECL PIPELINE] Cognee ECL Pipeline initialized successfully")
+        # In the combined scanner the first alternative wins at an offset, so the
+        # word-shape patterns that match almost anywhere are tried last
+        generic_patterns = [self.entity_patterns['METHOD'][3], self.entity_patterns['CONCEPT'][3]]
+        scan_order = [
+            (entity_type, pattern)
+            for entity_type, patterns in self.entity_patterns.items()
+            for pattern in patterns if pattern not in generic_patterns
+        ] + [('METHOD', generic_patterns[0]), ('CONCEPT', generic_patterns[1])]
+        self.entity_scanner = EntityScanner(scan_order, self.entity_dictionaries)
+
+        # Optimized mode keeps its reduced pattern set: headings, Python methods, technologies
+        self.fast_entity_scanner = EntityScanner(
+            [('CONCEPT', self.entity_patterns['CONCEPT'][0]), ('METHOD', self.entity_patterns['METHOD'][0])],
+            {'TECHNOLOGY': self.entity_dictionaries['TECHNOLOGY']}
+        )
+
+    @classmethod
+    def for_extraction(cls, config: Dict[str, Any]) -> 'CogneeECLPipeline':
+        """
+        Extraction-only pipeline for pool workers
+
+        Carries the configuration, entity patterns and scanners used by extract +
+        cognify; no JavaScript bridge, cache directory, section cache or graph store.
+        """
+        pipeline = cls.__new__(cls)
+        pipeline.config = dict(config)
+        pipeline.metrics = cls._initial_metrics()
+        pipeline._init_extractors()
+        return pipeline
 
     async def execute_ecl_pipeline(self, content: str, source: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -166,8 +257,14 @@ class CogneeECLPipeline:
 
             self.metrics['cache_misses'] += 1
 
+            # Long content reuses cached results for its unchanged sections
+            if self.config['incremental_sections'] and len(content) >= self.config['incremental_min_chars']:
+                extract_result, cognify_result, load_result = await self._execute_ecl_incremental(content, source, context)
+            # Large documents stream through overlapping windows instead of being truncated
+            elif len(content) > self.config['window_size']:
+                extract_result, cognify_result, load_result = await self._execute_ecl_windowed(content, source, context)
             # FASE 3: Optimized ECL execution with parallel processing
-            if self.config['performance_mode'] == 'optimized' and self.config['parallel_processing']:
+            elif self.config['performance_mode'] == 'optimized' and self.config['parallel_processing']:
                 # Execute phases with optimized parallel processing
                 extract_result, cognify_result, load_result = await self._execute_ecl_optimized(content, source, context)
             else:
@@ -263,52 +360,54 @@ class CogneeECLPipeline:
     def _extract_entities_native(self, content: str, source: str) -> List[Dict[str, Any]]:
         """
         Extract entities using native pattern matching (Cognee-style)
+
+        Single pass: one combined scan plus one term-frequency table per document.
         """
         entities = []
-        entity_id_counter = 0
-
-        for entity_type, patterns in self.entity_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-
-                for match in matches:
-                    entity_text = match.group(1) if match.groups() else match.group(0)
-                    entity_text = entity_text.strip()
-
-                    # Skip very short or very long entities
-                    if len(entity_text) < 2 or len(entity_text) > 100:
-                        continue
-
-                    # Calculate confidence based on various factors
-                    confidence = self._calculate_entity_confidence(entity_text, content, entity_type)
-
-                    entity = {
-                        'id': f"{source}_{entity_type}_{entity_id_counter}",
-                        'name': entity_text,
-                        'type': entity_type,
-                        'confidence': confidence,
-                        'source': source,
-                        'position': {
-                            'start': match.start(),
-                            'end': match.end()
-                        },
-                        'properties': {
-                            'pattern_matched': pattern,
-                            'context_snippet': self._extract_context_snippet(content, match.start(), match.end()),
-                            'frequency': content.lower().count(entity_text.lower()),
-                            'importance': self._calculate_importance(entity_text, content)
-                        }
-                    }
+        seen = set()
+        matches, statistics = self.entity_scanner.scan(content)
 
-                    entities.append(entity)
-                    entity_id_counter += 1
+        for match in matches:
+            entity_text = match['text'].strip()
+            entity_type = match['type']
 
-        # Remove duplicates based on name and type
-        unique_entities = self._remove_duplicate_entities(entities)
+            # Skip very short or very long entities
+            if len(entity_text) < 2 or len(entity_text) > 100:
+                continue
 
-        return unique_entities
+            # Remove duplicates based on name and type (first occurrence wins)
+            key = (entity_text.lower(), entity_type)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            frequency = self.entity_scanner.frequency(entity_text, statistics)
+            first_occurrence = statistics['first_occurrence'].get(entity_text.lower(), match['start'])
+
+            entity = {
+                'id': f"{source}_{entity_type}_{len(entities)}",
+                'name': entity_text,
+                'type': entity_type,
+                'confidence': self._calculate_entity_confidence(entity_text, content, entity_type, frequency),
+                'source': source,
+                'position': {
+                    'start': match['start'],
+                    'end': match['end']
+                },
+                'properties': {
+                    'pattern_matched': match['pattern'],
+                    'context_snippet': self._extract_context_snippet(content, match['start'], match['end']),
+                    'frequency': frequency,
+                    'importance': self._calculate_importance(entity_text, content, frequency, first_occurrence)
+                }
+            }
+
+            entities.append(entity)
+
+        return entities
 
-    def _calculate_entity_confidence(self, entity_text: str, content: str, entity_type: str) -> float:
+    def _calculate_entity_confidence(self, entity_text: str, content: str, entity_type: str,
+                                     frequency: Optional[int] = None) -> float:
         """
         Calculate confidence score for extracted entity
         """
@@ -326,7 +425,8 @@ class CogneeECLPipeline:
         confidence = base_confidence + type_boosts.get(entity_type, 0)
 
         # Boost for frequency (more mentions = higher confidence)
-        frequency = content.lower().count(entity_text.lower())
+        if frequency is None:
+            frequency = content.lower().count(entity_text.lower())
         if frequency > 1:
             confidence += min(frequency * 0.05, 0.2)
 
@@ -359,7 +459,8 @@ class CogneeECLPipeline:
 
         return snippet
 
-    def _calculate_importance(self, entity_text: str, content: str) -> float:
+    def _calculate_importance(self, entity_text: str, content: str, frequency: Optional[int] = None,
+                              first_occurrence: Optional[int] = None) -> float:
         """
         Calculate importance score for entity
         """
@@ -367,11 +468,13 @@ class CogneeECLPipeline:
         importance = 0.5
 
         # Boost for frequency
-        frequency = content.lower().count(entity_text.lower())
+        if frequency is None:
+            frequency = content.lower().count(entity_text.lower())
         importance += min(frequency * 0.1, 0.3)
 
         # Boost for position (entities at beginning are often more important)
-        first_occurrence = content.lower().find(entity_text.lower())
+        if first_occurrence is None:
+            first_occurrence = content.lower().find(entity_text.lower())
         if first_occurrence < len(content) * 0.1:  # First 10% of content
             importance += 0.2
 
@@ -387,6 +490,10 @@ class CogneeECLPipeline:
         """
         enhanced_entities = []
 
+        # Position-sorted view shared by every related-entity lookup
+        by_position = sorted(entities, key=lambda e: e['position']['start'])
+        starts = [entity['position']['start'] for entity in by_position]
+
         for entity in entities:
             enhanced_entity = {
                 **entity,
@@ -395,7 +502,7 @@ class CogneeECLPipeline:
                     'content_type': context.get('type', 'unknown'),
                     'extraction_timestamp': time.time(),
                     'semantic_category': self._classify_semantic_category(entity['name'], entity['type']),
-                    'related_entities': self._find_related_entities(entity, entities, content)
+                    'related_entities': self._find_related_entities(entity, by_position, content, starts)
                 }
             }
 
@@ -424,25 +531,31 @@ class CogneeECLPipeline:
         else:
             return 'general_entity'
 
-    def _find_related_entities(self, target_entity: Dict[str, Any], all_entities: List[Dict[str, Any]], content: str) -> List[str]:
+    def _find_related_entities(self, target_entity: Dict[str, Any], all_entities: List[Dict[str, Any]], content: str,
+                               starts: Optional[List[int]] = None) -> List[str]:
         """
         Find entities related to target entity based on proximity and context
+
+        With ``starts`` (start offsets of ``all_entities`` sorted by position)
+        only the entities inside the 200-character window are visited.
         """
-        related = []
-        target_pos = target_entity['position']
+        target_start = target_entity['position']['start']
 
-        for entity in all_entities:
+        if starts is None:
+            all_entities = sorted(all_entities, key=lambda e: e['position']['start'])
+            starts = [entity['position']['start'] for entity in all_entities]
+
+        related = []
+        # Check proximity (within 200 characters)
+        for index in range(bisect_right(starts, target_start - 200), bisect_left(starts, target_start + 200)):
+            entity = all_entities[index]
             if entity['id'] == target_entity['id']:
                 continue
+            related.append(entity['id'])
+            if len(related) == 5:  # Limit to 5 related entities
+                break
 
-            entity_pos = entity['position']
-
-            # Check proximity (within 200 characters)
-            distance = abs(target_pos['start'] - entity_pos['start'])
-            if distance < 200:
-                related.append(entity['id'])
-
-        return related[:5]  # Limit to 5 related entities
+        return related
 
     def _remove_duplicate_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -496,7 +609,8 @@ class CogneeECLPipeline:
             result = await self.js_bridge.call_js_component(
                 'knowledge_graph',
                 'extractRelationships',
-                cognify_args
+                cognify_args,
+                deadline=context.get('deadline')
             )
 
             # Normalize bridge results
@@ -535,41 +649,12 @@ class CogneeECLPipeline:
     async def _cognify_native(self, content: str, entities: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Native cognification of relationships between entities
+
+        Candidate pairs come from a sliding-window sweep over entity positions,
+        so the work grows with entities x neighbours instead of entities squared.
         """
         try:
-            relationships = []
-            relationship_id_counter = 0
-
-            # Create relationships based on proximity and semantic similarity
-            for i, entity1 in enumerate(entities):
-                for j, entity2 in enumerate(entities[i+1:], i+1):
-
-                    # Calculate relationship strength
-                    relationship_strength = self._calculate_relationship_strength(entity1, entity2, content)
-
-                    if relationship_strength >= self.config['relationship_threshold']:
-                        relationship = {
-                            'id': f"rel_{relationship_id_counter}",
-                            'source_entity': entity1['id'],
-                            'target_entity': entity2['id'],
-                            'relationship_type': self._determine_relationship_type(entity1, entity2, content),
-                            'strength': relationship_strength,
-                            'confidence': relationship_strength,  # Use strength as confidence
-                            'properties': {
-                                'context_snippet': self._extract_relationship_context(entity1, entity2, content),
-                                'proximity_score': self._calculate_proximity_score(entity1, entity2),
-                                'semantic_similarity': self._calculate_semantic_similarity(entity1, entity2),
-                                'co_occurrence_frequency': self._calculate_co_occurrence(entity1, entity2, content)
-                            },
-                            'cognification_method': 'native_cognification',
-                            'cognification_metadata': {
-                                'timestamp': time.time(),
-                                'algorithm': 'proximity_semantic_hybrid'
-                            }
-                        }
-
-                        relationships.append(relationship)
-                        relationship_id_counter += 1
+            relationships, candidate_pairs = self._build_native_relationships(content, entities)
 
             # Update metrics
             self.metrics['relationships_created_total'] += len(relationships)
@@ -578,17 +663,185 @@ class CogneeECLPipeline:
                 'relationships': relationships,
                 'cognification_method': 'native_cognification',
                 'total_relationships': len(relationships),
+                'candidate_pairs': candidate_pairs,
                 'bridge_success': False,
                 'relationship_threshold': self.config['relationship_threshold']
             }
 
-            logger.info(f"🧠 [ECL COGNIFY] Native cognification: {len(relationships)} relationships")
+            logger.info(f"🧠 [ECL COGNIFY] Native cognification: {len(relationships)} relationships from {candidate_pairs} candidate pairs")
             return cognify_result
 
         except Exception as error:
             logger.error(f"❌ [ECL COGNIFY] Native cognification failed: {error}")
             raise
 
+    def _build_native_relationships(self, content: str, entities: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Score windowed candidate pairs and keep those above the relationship threshold
+
+        Returns:
+            (relationships, number of candidate pairs scored)
+        """
+        relationships = []
+
+        pairs = self._generate_candidate_pairs(entities, self.config['relationship_window'])
+        sentences, sentence_sets = self._build_sentence_index(content, entities)
+        scores = self._score_relationship_candidates(entities, pairs, sentence_sets, len(sentences))
+
+        # Create relationships based on proximity and semantic similarity
+        for (i, j), (relationship_strength, proximity, semantic, co_occurrence) in zip(pairs, scores):
+            if relationship_strength < self.config['relationship_threshold']:
+                continue
+
+            entity1, entity2 = entities[i], entities[j]
+            relationship = {
+                'id': f"rel_{len(relationships)}",
+                'source_entity': entity1['id'],
+                'target_entity': entity2['id'],
+                'relationship_type': self._determine_relationship_type(entity1, entity2, content),
+                'strength': relationship_strength,
+                'confidence': relationship_strength,  # Use strength as confidence
+                'properties': {
+                    'context_snippet': self._relationship_context_from_index(
+                        entity1, content, sentences, sentence_sets[i] & sentence_sets[j]
+                    ),
+                    'proximity_score': proximity,
+                    'semantic_similarity': semantic,
+                    'co_occurrence_frequency': co_occurrence
+                },
+                'cognification_method': 'native_cognification',
+                'cognification_metadata': {
+                    'timestamp': time.time(),
+                    'algorithm': 'proximity_semantic_hybrid'
+                }
+            }
+
+            relationships.append(relationship)
+
+        return relationships, len(pairs)
+
+    def _generate_candidate_pairs(self, entities: List[Dict[str, Any]], window: int) -> List[Tuple[int, int]]:
+        """
+        Sliding-window sweep: index pairs (i < j) whose start offsets are closer than window
+        """
+        order = sorted(range(len(entities)), key=lambda index: entities[index]['position']['start'])
+        starts = [entities[index]['position']['start'] for index in order]
+
+        pairs = []
+        for a, i in enumerate(order):
+            b = a + 1
+            while b < len(order) and starts[b] - starts[a] < window:
+                j = order[b]
+                pairs.append((i, j) if i < j else (j, i))
+                b += 1
+
+        pairs.sort()
+        return pairs
+
+    def _build_sentence_index(self, content: str, entities: List[Dict[str, Any]]) -> Tuple[List[str], List[Set[int]]]:
+        """
+        Sentences (split on '.') and, per entity, the ids of sentences containing its name
+
+        Built once per document; pair co-occurrence is then a set intersection.
+        """
+        sentences = content.split('.')
+        sentence_starts = []
+        offset = 0
+        for sentence in sentences:
+            sentence_starts.append(offset)
+            offset += len(sentence) + 1
+
+        content_lower = content.lower()
+        sentence_sets = []
+        names: Dict[str, Set[int]] = {}
+        for entity in entities:
+            name = entity['name'].lower()
+            if name not in names:
+                found = set()
+                position = content_lower.find(name) if name else -1
+                while position != -1:
+                    sentence_id = bisect_right(sentence_starts, position) - 1
+                    # A name must fit inside one sentence, as with the per-sentence substring test
+                    if position + len(name) <= sentence_starts[sentence_id] + len(sentences[sentence_id]):
+                        found.add(sentence_id)
+                    position = content_lower.find(name, position + 1)
+                names[name] = found
+            sentence_sets.append(names[name])
+
+        return sentences, sentence_sets
+
+    def _score_relationship_candidates(self, entities: List[Dict[str, Any]], pairs: List[Tuple[int, int]],
+                                       sentence_sets: List[Set[int]], total_sentences: int) -> List[Tuple[float, float, float, float]]:
+        """
+        Score candidate pairs in one batch
+
+        Returns:
+            (strength, proximity, semantic similarity, co-occurrence) per pair,
+            the same weighting as _calculate_relationship_strength
+        """
+        if not pairs:
+            return []
+
+        word_sets = [set(entity['name'].lower().split()) for entity in entities]
+        name_similarity = []
+        co_occurrence = []
+        for i, j in pairs:
+            words1, words2 = word_sets[i], word_sets[j]
+            union = len(words1 | words2)
+            name_similarity.append(len(words1 & words2) / union if words1 and words2 and union else 0.0)
+            co_occurrence.append(
+                min(1.0, len(sentence_sets[i] & sentence_sets[j]) / total_sentences * 10) if total_sentences else 0.0
+            )
+
+        if not NUMPY_AVAILABLE:
+            scores = []
+            for (i, j), name_score, co_occurrence_score in zip(pairs, name_similarity, co_occurrence):
+                entity1, entity2 = entities[i], entities[j]
+                proximity = self._calculate_proximity_score(entity1, entity2)
+                semantic = (1.0 if entity1['type'] == entity2['type'] else 0.3) * 0.6 + name_score * 0.4
+                strength = (proximity * 0.3 + semantic * 0.3 + co_occurrence_score * 0.2 +
+                            self._calculate_type_compatibility(entity1, entity2) * 0.2)
+                scores.append((max(0.0, min(1.0, strength)), proximity, semantic, co_occurrence_score))
+            return scores
+
+        pair_array = np.asarray(pairs, dtype=np.int64)
+        starts = np.asarray([entity['position']['start'] for entity in entities], dtype=np.int64)
+        type_names = sorted({entity['type'] for entity in entities})
+        type_codes = np.asarray([type_names.index(entity['type']) for entity in entities], dtype=np.int64)
+        compatibility = np.asarray([
+            [self._calculate_type_compatibility({'type': type1}, {'type': type2}) for type2 in type_names]
+            for type1 in type_names
+        ])
+
+        left, right = pair_array[:, 0], pair_array[:, 1]
+        distance = np.abs(starts[left] - starts[right])
+        proximity = np.select(
+            [distance == 0, distance < 50, distance < 100, distance < 200, distance < 500],
+            [1.0, 0.9, 0.7, 0.5, 0.3],
+            default=0.1
+        )
+        same_type = type_codes[left] == type_codes[right]
+        semantic = np.where(same_type, 1.0, 0.3) * 0.6 + np.asarray(name_similarity) * 0.4
+        co_occurrence_array = np.asarray(co_occurrence)
+        strength = np.clip(
+            proximity * 0.3 + semantic * 0.3 + co_occurrence_array * 0.2 +
+            compatibility[type_codes[left], type_codes[right]] * 0.2,
+            0.0, 1.0
+        )
+
+        return list(zip(strength.tolist(), proximity.tolist(), semantic.tolist(), co_occurrence_array.tolist()))
+
+    def _relationship_context_from_index(self, entity1: Dict[str, Any], content: str, sentences: List[str],
+                                         shared_sentences: Set[int]) -> str:
+        """
+        First sentence containing both entities, else context around the first entity
+        """
+        if shared_sentences:
+            return sentences[min(shared_sentences)].strip()
+
+        pos1 = entity1['position']
+        return self._extract_context_snippet(content, pos1['start'], pos1['end'], 100)
+
     def _calculate_relationship_strength(self, entity1: Dict[str, Any], entity2: Dict[str, Any], content: str) -> float:
         """
         Calculate relationship strength between two entities
@@ -763,8 +1016,16 @@ class CogneeECLPipeline:
         load_phase.metrics = self.metrics
         load_phase.cache_dir = self.cache_dir
         load_phase.js_bridge = self.js_bridge
+        load_phase.get_graph_store = self.get_graph_store
         return load_phase
 
+    def get_graph_store(self) -> KnowledgeGraphStore:
+        """Persistent knowledge graph the LOAD phase writes into"""
+        if self._graph_store is None:
+            db_path = self.config['graph_store_path'] or self.cache_dir / 'knowledge_graph.db'
+            self._graph_store = KnowledgeGraphStore(db_path)
+        return self._graph_store
+
     # Inherit LOAD phase methods
     async def _load_phase(self, extract_result: Dict[str, Any], cognify_result: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """LOAD phase: Dynamic memory loading with persistence"""
@@ -814,12 +1075,9 @@ class CogneeECLPipeline:
         FASE 3: Optimized ECL execution with parallel processing and performance enhancements
         """
         try:
-            # Pre-process content for optimization
-            optimized_content = self._preprocess_content_for_performance(content)
-
             # Execute EXTRACT phase with optimizations
             extract_task = asyncio.create_task(
-                self._extract_phase_optimized(optimized_content, source, context)
+                self._extract_phase_optimized(content, source, context)
             )
 
             # Wait for extract to complete before starting cognify
@@ -827,7 +1085,7 @@ class CogneeECLPipeline:
 
             # Execute COGNIFY and LOAD phases in parallel (they can run concurrently)
             cognify_task = asyncio.create_task(
-                self._cognify_phase_optimized(optimized_content, extract_result['entities'], context)
+                self._cognify_phase_optimized(content, extract_result['entities'], context)
             )
 
             load_task = asyncio.create_task(
@@ -837,8 +1095,8 @@ class CogneeECLPipeline:
             # Wait for both to complete
             cognify_result, load_result = await asyncio.gather(cognify_task, load_task)
 
-            # Update load result with cognify data
-            load_result = await self._merge_cognify_into_load(load_result, cognify_result)
+            # Update load result with cognify data and persist the graph
+            load_result = await self._merge_cognify_into_load(load_result, cognify_result, extract_result['entities'], context)
 
             self.metrics['parallel_processing_gains'] += 1
 
@@ -852,23 +1110,6 @@ class CogneeECLPipeline:
             load_result = await self._load_phase(extract_result, cognify_result, context)
             return extract_result, cognify_result, load_result
 
-    def _preprocess_content_for_performance(self, content: str) -> str:
-        """Preprocess content for better performance"""
-        if not self.config['memory_efficient']:
-            return content
-
-        # Limit content size for performance
-        max_content_length = 10000  # 10KB limit
-        if len(content) > max_content_length:
-            # Take first and last parts to preserve context
-            first_part = content[:max_content_length // 2]
-            last_part = content[-max_content_length // 2:]
-            optimized_content = first_part + "\n...\n" + last_part
-            self.metrics['memory_optimization_savings'] += 1
-            return optimized_content
-
-        return content
-
     async def _extract_phase_optimized(self, content: str, source: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Optimized EXTRACT phase with performance enhancements"""
         if self.config['optimized_patterns']:
@@ -897,47 +1138,39 @@ class CogneeECLPipeline:
         }
 
     def _extract_entities_optimized(self, content: str, source: str) -> List[Dict[str, Any]]:
-        """Optimized entity extraction with pattern caching"""
+        """Optimized entity extraction with the reduced single-pass scanner"""
         entities = []
-        entity_id_counter = 0
-
-        # Use only most effective patterns for speed
-        optimized_patterns = {
-            'TECHNOLOGY': [self.entity_patterns['TECHNOLOGY'][0]],  # Most effective pattern
-            'CONCEPT': [self.entity_patterns['CONCEPT'][0]],
-            'METHOD': [self.entity_patterns['METHOD'][0]]
-        }
+        seen = set()
+        matches, _ = self.fast_entity_scanner.scan(content)
 
-        for entity_type, patterns in optimized_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE)
-
-                for match in matches:
-                    entity_text = match.group(1) if match.groups() else match.group(0)
-                    entity_text = entity_text.strip()
-
-                    if 2 <= len(entity_text) <= 50:  # Stricter length limits
-                        confidence = self._calculate_entity_confidence_fast(entity_text, entity_type)
-
-                        entity = {
-                            'id': f"{source}_{entity_type}_{entity_id_counter}",
-                            'name': entity_text,
-                            'type': entity_type,
-                            'confidence': confidence,
-                            'source': source,
-                            'position': {'start': match.start(), 'end': match.end()},
-                            'optimized': True
-                        }
+        for match in matches:
+            entity_text = match['text'].strip()
+            entity_type = match['type']
 
-                        entities.append(entity)
-                        entity_id_counter += 1
+            if not 2 <= len(entity_text) <= 50:  # Stricter length limits
+                continue
 
-                        # Early termination for performance
-                        if self.config['early_termination'] and len(entities) >= 30:
-                            self.metrics['early_terminations'] += 1
-                            break
+            key = (entity_text.lower(), entity_type)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            entities.append({
+                'id': f"{source}_{entity_type}_{len(entities)}",
+                'name': entity_text,
+                'type': entity_type,
+                'confidence': self._calculate_entity_confidence_fast(entity_text, entity_type),
+                'source': source,
+                'position': {'start': match['start'], 'end': match['end']},
+                'optimized': True
+            })
+
+            # Early termination for performance
+            if self.config['early_termination'] and len(entities) >= 30:
+                self.metrics['early_terminations'] += 1
+                break
 
-        return self._remove_duplicate_entities(entities)
+        return entities
 
     def _calculate_entity_confidence_fast(self, entity_text: str, entity_type: str) -> float:
         """Fast confidence calculation"""
@@ -985,38 +1218,24 @@ class CogneeECLPipeline:
             return await self._cognify_phase(content, entities, context)
 
     def _extract_relationships_fast(self, entities: List[Dict[str, Any]], content: str) -> List[Dict[str, Any]]:
-        """Fast relationship extraction based on proximity"""
+        """Fast relationship extraction based on proximity (sliding-window sweep)"""
         relationships = []
-        relationship_id = 0
-
-        for i, entity1 in enumerate(entities):
-            for j, entity2 in enumerate(entities[i+1:], i+1):
-                # Check proximity
-                pos1 = entity1['position']
-                pos2 = entity2['position']
-                distance = abs(pos1['start'] - pos2['start'])
-
-                if distance < 100:  # Close proximity
-                    relationship = {
-                        'id': f"rel_{relationship_id}",
-                        'source_entity': entity1['id'],
-                        'target_entity': entity2['id'],
-                        'relationship_type': 'PROXIMITY',
-                        'confidence': 0.8,
-                        'properties': {
-                            'distance': distance,
-                            'fast_extraction': True
-                        }
-                    }
-                    relationships.append(relationship)
-                    relationship_id += 1
 
-                    # Limit relationships for performance
-                    if len(relationships) >= 20:
-                        break
-
-            if len(relationships) >= 20:
-                break
+        for i, j in self._generate_candidate_pairs(entities, self.config['fast_relationship_window']):
+            entity1, entity2 = entities[i], entities[j]
+            distance = abs(entity1['position']['start'] - entity2['position']['start'])
+
+            relationships.append({
+                'id': f"rel_{len(relationships)}",
+                'source_entity': entity1['id'],
+                'target_entity': entity2['id'],
+                'relationship_type': 'PROXIMITY',
+                'confidence': 0.8,
+                'properties': {
+                    'distance': distance,
+                    'fast_extraction': True
+                }
+            })
 
         return relationships
 
@@ -1027,7 +1246,6 @@ class CogneeECLPipeline:
             'success': True,
             'entities_loaded': len(extract_result['entities']),
             'load_method': 'optimized_fast',
-            'memory_persistence': False,  # Skip persistence for speed
             'optimization_applied': True,
             'load_timestamp': time.time()
         }
@@ -1035,11 +1253,719 @@ class CogneeECLPipeline:
         self.metrics['load_operations'] += 1
         return load_result
 
-    async def _merge_cognify_into_load(self, load_result: Dict[str, Any], cognify_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge cognify results into load result"""
+    async def _merge_cognify_into_load(self, load_result: Dict[str, Any], cognify_result: Dict[str, Any],
+                                       entities: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge cognify results into load result and upsert the graph in one transaction"""
         load_result['relationships_loaded'] = len(cognify_result['relationships'])
         load_result['cognify_integration'] = True
+        load_result['graph_store_result'] = self._get_load_phase()._persist_to_graph_store(
+            entities, cognify_result['relationships'], context
+        )
+        load_result['memory_persistence'] = load_result['graph_store_result']['success']
         return load_result
 
+    # Windowed streaming ECL
+    def _iter_windows(self, content: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (global offset, text) for overlapping windows, cutting at line breaks when possible
+
+        Windows are sliced lazily, so only the windows in flight are held at once.
+        """
+        size = self.config['window_size']
+        overlap = min(self.config['window_overlap'], size // 2)
+        start = 0
+
+        while start < len(content):
+            end = min(len(content), start + size)
+            if end < len(content):
+                # Prefer a line break, else whitespace, in the last quarter of the window
+                cut = content.rfind('\n', start + size * 3 // 4, end)
+                if cut == -1:
+                    cut = content.rfind(' ', start + size * 3 // 4, end)
+                if cut != -1:
+                    end = cut + 1
+
+            yield start, content[start:end]
+
+            if end >= len(content):
+                break
+            start = max(end - overlap, start + 1)
+
+    def _process_window(self, text: str, offset: int, source: str) -> Dict[str, Any]:
+        """
+        Extract and cognify one window (runs in a worker process when the pool is enabled)
+
+        Entity positions are returned in global offsets; relationships refer to
+        entities by (normalized name, type) so windows can be merged.
+        """
+        optimized = self.config['performance_mode'] == 'optimized'
+        if optimized and self.config['optimized_patterns']:
+            entities = self._extract_entities_optimized(text, source)
+        else:
+            entities = self._extract_entities_native(text, source)
+
+        if optimized and self.config['fast_cognification']:
+            relationships = self._extract_relationships_fast(entities, text)
+            candidate_pairs = len(relationships)
+        else:
+            relationships, candidate_pairs = self._build_native_relationships(text, entities)
+
+        keys = {entity['id']: (entity['name'].lower(), entity['type']) for entity in entities}
+        for relationship in relationships:
+            relationship['source_key'] = keys[relationship['source_entity']]
+            relationship['target_key'] = keys[relationship['target_entity']]
+
+        for entity in entities:
+            entity['position'] = {
+                'start': entity['position']['start'] + offset,
+                'end': entity['position']['end'] + offset
+            }
+
+        return {
+            'entities': entities,
+            'relationships': relationships,
+            'candidate_pairs': candidate_pairs,
+            'offset': offset,
+            'length': len(text)
+        }
+
+    def _merge_window_result(self, window_result: Dict[str, Any], merged_entities: Dict[Tuple[str, str], Dict[str, Any]],
+                             merged_relationships: Dict[Tuple, Dict[str, Any]]):
+        """
+        Merge a window into the running document state
+
+        Entities merge by (normalized name, type): earliest global position wins,
+        confidence takes the maximum and frequency accumulates. Relationships
+        merge by their endpoint keys, keeping the strongest.
+        """
+        for entity in window_result['entities']:
+            key = (entity['name'].lower(), entity['type'])
+            existing = merged_entities.get(key)
+            if existing is None:
+                merged_entities[key] = entity
+                continue
+
+            if entity['position']['start'] < existing['position']['start']:
+                entity, existing = existing, entity
+                merged_entities[key] = existing
+            existing['confidence'] = max(existing['confidence'], entity['confidence'])
+            if 'properties' in existing and 'properties' in entity:
+                existing['properties']['frequency'] += entity['properties']['frequency']
+                existing['properties']['importance'] = max(existing['properties']['importance'],
+                                                           entity['properties']['importance'])
+
+        for relationship in window_result['relationships']:
+            key = tuple(sorted([relationship['source_key'], relationship['target_key']]))
+            existing = merged_relationships.get(key)
+            if existing is None or relationship['confidence'] > existing['confidence']:
+                merged_relationships[key] = relationship
+
+    def _get_worker_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the window worker pool; None means process windows inline"""
+        if self._worker_pool_disabled or self.config['worker_processes'] <= 1:
+            return None
+
+        if self._worker_pool is None:
+            try:
+                self._worker_pool = ProcessPoolExecutor(max_workers=self.config['worker_processes'])
+            except (OSError, NotImplementedError) as error:
+                logger.warning(f"⚠️ [ECL PIPELINE] Worker pool unavailable, processing inline: {error}")
+                self._worker_pool_disabled = True
+                return None
+
+        return self._worker_pool
+
+    def _discard_worker_pool(self, failed_future, scope: str):
+        """Shut down a broken worker pool (releasing its processes and semaphores); later work runs inline"""
+        if self._worker_pool is not None:
+            error = 'cancelled' if failed_future.cancelled() else failed_future.exception()
+            logger.warning(f"⚠️ [{scope}] Worker pool failed, processing inline: {error}")
+            self._worker_pool.shutdown(wait=False, cancel_futures=True)
+            self._worker_pool = None
+            self.metrics['worker_pool_failures'] += 1
+        self._worker_pool_disabled = True
+
+    @staticmethod
+    def _failed_in_pool(future) -> bool:
+        """A worker future lost to a broken (or shut down) pool rather than failed by its own work"""
+        return future.cancelled() or isinstance(future.exception(), BrokenProcessPool)
+
+    async def _execute_ecl_windowed(self, content: str, source: str, context: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        ECL over overlapping windows fanned out across the worker pool
+
+        At most two windows per worker are in flight, so memory stays bounded
+        regardless of document size.
+        """
+        self.metrics['windowed_executions'] += 1
+        self.metrics['extract_operations'] += 1
+        self.metrics['cognify_operations'] += 1
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_worker_pool()
+        max_in_flight = max(1, self.config['worker_processes']) * 2
+
+        merged_entities: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        merged_relationships: Dict[Tuple, Dict[str, Any]] = {}
+        window_count = 0
+        candidate_pairs = 0
+        pending: Dict[asyncio.Future, Tuple[str, int]] = {}
+
+        def merge(window_result: Dict[str, Any]):
+            nonlocal candidate_pairs
+            candidate_pairs += window_result['candidate_pairs']
+            self._merge_window_result(window_result, merged_entities, merged_relationships)
+
+        async def drain(return_when):
+            nonlocal pool
+            done, _ = await asyncio.wait(set(pending), return_when=return_when)
+            for future in done:
+                text, offset = pending.pop(future)
+                if not self._failed_in_pool(future):
+                    merge(future.result())
+                    continue
+                # Only the windows the broken pool lost are redone, inline
+                self._discard_worker_pool(future, 'ECL WINDOWED')
+                pool = None
+                merge(self._process_window(text, offset, source))
+
+        for offset, text in self._iter_windows(content):
+            window_count += 1
+            if pool is None:
+                merge(self._process_window(text, offset, source))
+                continue
+
+            pending[loop.run_in_executor(pool, _process_window_in_worker, self.config, text, offset, source)] = (text, offset)
+            if len(pending) >= max_in_flight:
+                await drain(asyncio.FIRST_COMPLETED)
+
+        while pending:
+            await drain(asyncio.ALL_COMPLETED)
+
+        self.metrics['windows_processed'] += window_count
+
+        extract_result, cognify_result = self._finalize_document(
+            merged_entities, merged_relationships, content, source, context, window_count, candidate_pairs
+        )
+        self.metrics['entities_extracted_total'] += extract_result['entities_final']
+        self.metrics['relationships_created_total'] += cognify_result['total_relationships']
+
+        if self.config['performance_mode'] == 'optimized':
+            load_result = await self._load_phase_optimized(extract_result, context)
+            load_result = await self._merge_cognify_into_load(load_result, cognify_result, extract_result['entities'], context)
+        else:
+            load_result = await self._load_phase(extract_result, cognify_result, context)
+
+        logger.info(f"🪟 [ECL WINDOWED] {window_count} windows: {extract_result['entities_final']} entities, "
+                    f"{cognify_result['total_relationships']} relationships")
+        return extract_result, cognify_result, load_result
+
+    def _finalize_document(self, merged_entities: Dict[Tuple[str, str], Dict[str, Any]], merged_relationships: Dict[Tuple, Dict[str, Any]],
+                           content: str, source: str, context: Dict[str, Any], window_count: int,
+                           candidate_pairs: int, method: str = 'windowed') -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Turn merged window state into extract and cognify results
+
+        Assigns ids in document order, enhances and filters entities and drops
+        relationships whose endpoints were filtered out.
+        """
+        entities = sorted(merged_entities.values(), key=lambda e: e['position']['start'])
+        entity_index = {}
+        for index, entity in enumerate(entities):
+            entity['id'] = f"{source}_{entity['type']}_{index}"
+            entity_index[(entity['name'].lower(), entity['type'])] = index
+
+        relationships = []
+        for relationship in sorted(merged_relationships.values(),
+                                   key=lambda r: sorted([entity_index[r['source_key']], entity_index[r['target_key']]])):
+            relationship['source_entity'] = entities[entity_index[relationship.pop('source_key')]]['id']
+            relationship['target_entity'] = entities[entity_index[relationship.pop('target_key')]]['id']
+            relationship['id'] = f"rel_{len(relationships)}"
+            relationships.append(relationship)
+
+        optimized = self.config['performance_mode'] == 'optimized'
+        if optimized:
+            enhanced_entities = self._enhance_entities_fast(entities, content, context)
+        else:
+            enhanced_entities = self._enhance_entities_with_context(entities, content, context)
+
+        filtered_entities = [
+            entity for entity in enhanced_entities
+            if entity['confidence'] >= self.config['min_entity_confidence']
+        ]
+        limited_entities = filtered_entities[:self.config['max_entities_per_content']]
+        kept_ids = {entity['id'] for entity in limited_entities}
+        relationships = [
+            relationship for relationship in relationships
+            if relationship['source_entity'] in kept_ids and relationship['target_entity'] in kept_ids
+        ]
+
+        extract_result = {
+            'entities': limited_entities,
+            'extraction_method': f"{method}_optimized_patterns" if optimized else f"{method}_native_patterns",
+            'total_entities_found': len(entities),
+            'entities_after_filtering': len(filtered_entities),
+            'entities_final': len(limited_entities),
+            'windows': window_count,
+            'window_size': self.config['window_size'],
+            'window_overlap': self.config['window_overlap']
+        }
+
+        cognify_result = {
+            'relationships': relationships,
+            'cognification_method': f"{method}_fast_native" if optimized and self.config['fast_cognification'] else f"{method}_native",
+            'total_relationships': len(relationships),
+            'candidate_pairs': candidate_pairs,
+            'bridge_success': False
+        }
+
+        return extract_result, cognify_result
+
+    # Incremental section-level ECL
+    def _iter_sections(self, content: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (offset, text) sections for incremental ECL
+
+        A section ends at the first heading (else blank line) once it holds
+        section_min_chars, so boundaries depend only on nearby text and an edit
+        leaves the other sections byte-identical. Sections never exceed window_size.
+        """
+        min_chars = self.config['section_min_chars']
+        max_chars = self.config['window_size']
+        start = 0
+
+        while start < len(content):
+            end = len(content)
+            if end - start > min_chars:
+                limit = min(len(content), start + max_chars)
+                heading = _SECTION_HEADING.search(content, start + min_chars, limit)
+                if heading:
+                    end = heading.start()
+                else:
+                    paragraph = content.find('\n\n', start + min_chars, limit)
+                    if paragraph != -1:
+                        end = paragraph + 2
+                    elif end > limit:
+                        # Unstructured text: cut at whitespace like the windows do
+                        end = limit
+                        cut = content.rfind('\n', start + max_chars * 3 // 4, limit)
+                        if cut == -1:
+                            cut = content.rfind(' ', start + max_chars * 3 // 4, limit)
+                        if cut != -1:
+                            end = cut + 1
+
+            yield start, content[start:end]
+            start = end
+
+    def _section_cache_key(self, kind: str, source: str, text: str, boundary: int = 0) -> str:
+        """Hash of a unit and the settings its extract/cognify result depends on"""
+        settings = json.dumps([self.config[key] for key in (
+            'performance_mode', 'optimized_patterns', 'fast_cognification', 'early_termination',
+            'relationship_window', 'fast_relationship_window', 'relationship_threshold'
+        )])
+        return hashlib.blake2b(f"{kind}\0{source}\0{boundary}\0{settings}\0{text}".encode('utf-8'),
+                               digest_size=16).hexdigest()
+
+    def _cache_section(self, key: str, result: Dict[str, Any]):
+        self._section_cache[key] = result
+        self._section_cache.move_to_end(key)
+        while len(self._section_cache) > self.config['section_cache_size']:
+            self._section_cache.popitem(last=False)
+
+    @staticmethod
+    def _crossing_relationships(seam_result: Dict[str, Any], boundary: int) -> Dict[str, Any]:
+        """Keep only seam relationships whose endpoints lie on opposite sides of the boundary"""
+        starts = {entity['id']: entity['position']['start'] for entity in seam_result['entities']}
+        crossing = [
+            relationship for relationship in seam_result['relationships']
+            if (starts[relationship['source_entity']] < boundary) != (starts[relationship['target_entity']] < boundary)
+        ]
+        return {'entities': [], 'relationships': crossing, 'candidate_pairs': len(crossing)}
+
+    @staticmethod
+    def _shift_unit_result(result: Dict[str, Any], offset: int) -> Dict[str, Any]:
+        """Copy a cached unit result into document offsets (merge and finalize mutate their input)"""
+        entities = []
+        for entity in result['entities']:
+            shifted = {
+                **entity,
+                'position': {'start': entity['position']['start'] + offset, 'end': entity['position']['end'] + offset}
+            }
+            if 'properties' in entity:
+                shifted['properties'] = dict(entity['properties'])
+            entities.append(shifted)
+        return {
+            'entities': entities,
+            'relationships': [dict(relationship) for relationship in result['relationships']],
+            'candidate_pairs': result['candidate_pairs']
+        }
+
+    async def _process_units(self, texts: List[str], source: str) -> List[Dict[str, Any]]:
+        """Extract + cognify dirty units, across the worker pool when there are several"""
+        pool = self._get_worker_pool() if len(texts) > 1 else None
+        if pool is None:
+            return [self._process_window(text, 0, source) for text in texts]
+
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(pool, _process_window_in_worker, self.config, text, 0, source) for text in texts]
+        await asyncio.wait(futures)
+
+        results = []
+        for text, future in zip(texts, futures):
+            if not self._failed_in_pool(future):
+                results.append(future.result())
+                continue
+            # Only the units the broken pool lost are redone, inline
+            self._discard_worker_pool(future, 'ECL INCREMENTAL')
+            results.append(self._process_window(text, 0, source))
+        return results
+
+    async def _execute_ecl_incremental(self, content: str, source: str, context: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """
+        ECL over hashed sections, recomputing only the dirty ones
+
+        Each section is extracted and cognified on its own; relationships that
+        cross a section boundary come from a "seam" spanning relationship_window
+        characters on both sides. Sections and seams are cached by content hash,
+        so an edit re-processes its section and the (at most two) seams touching
+        it. The whole document is loaded under its source, replacing what the
+        graph store held for it: counts stay per document, entities and edges
+        an edit removed are retracted, and a restart with an empty section cache
+        reloads the same graph instead of adding to it.
+        """
+        self.metrics['incremental_executions'] += 1
+        self.metrics['extract_operations'] += 1
+        self.metrics['cognify_operations'] += 1
+
+        sections = list(self._iter_sections(content))
+        seam_width = self.config['relationship_window']
+
+        # (kind, cache key, offset, text, boundary within the text)
+        units = [('section', self._section_cache_key('section', source, text), offset, text, 0)
+                 for offset, text in sections]
+        for (_, previous), (boundary, text) in zip(sections, sections[1:]):
+            seam_start = max(boundary - seam_width, boundary - len(previous))
+            seam_text = content[seam_start:boundary + min(seam_width, len(text))]
+            units.append(('seam', self._section_cache_key('seam', source, seam_text, boundary - seam_start),
+                          seam_start, seam_text, boundary - seam_start))
+
+        cached = {}
+        dirty = []
+        for unit in units:
+            result = self._section_cache.get(unit[1])
+            if result is None:
+                dirty.append(unit)
+            else:
+                self._section_cache.move_to_end(unit[1])
+                cached[unit[1]] = result
+
+        for unit, result in zip(dirty, await self._process_units([unit[3] for unit in dirty], source)):
+            kind, key, _, _, boundary = unit
+            if kind == 'seam':
+                result = self._crossing_relationships(result, boundary)
+            self._cache_section(key, result)
+            cached[key] = result
+
+        self.metrics['sections_processed'] += len(dirty)
+        self.metrics['sections_reused'] += len(units) - len(dirty)
+
+        # Merge in document order, so the result does not depend on which units were cached
+        merged_entities: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        merged_relationships: Dict[Tuple, Dict[str, Any]] = {}
+        candidate_pairs = 0
+        for _, key, offset, _, _ in sorted(units, key=lambda unit: (unit[2], unit[0] == 'seam')):
+            unit_result = self._shift_unit_result(cached[key], offset)
+            candidate_pairs += unit_result['candidate_pairs']
+            self._merge_window_result(unit_result, merged_entities, merged_relationships)
+
+        # Seam relationships may name entities cut off at the seam edge
+        for pair_key in [k for k in merged_relationships if k[0] not in merged_entities or k[1] not in merged_entities]:
+            del merged_relationships[pair_key]
+
+        extract_result, cognify_result = self._finalize_document(
+            merged_entities, merged_relationships, content, source, context, len(sections), candidate_pairs,
+            method='incremental'
+        )
+        extract_result['sections'] = len(sections)
+        extract_result['sections_processed'] = sum(1 for unit in dirty if unit[0] == 'section')
+        extract_result['seams_processed'] = sum(1 for unit in dirty if unit[0] == 'seam')
+        self.metrics['entities_extracted_total'] += extract_result['entities_final']
+        self.metrics['relationships_created_total'] += cognify_result['total_relationships']
+
+        # The graph store replaces this source's previous contribution with the whole document
+        if self.config['performance_mode'] == 'optimized':
+            load_result = await self._load_phase_optimized(extract_result, context)
+            load_result = await self._merge_cognify_into_load(load_result, cognify_result, extract_result['entities'], context)
+        else:
+            load_result = await self._load_phase(extract_result, cognify_result, context)
+        load_result['incremental'] = True
+
+        logger.info(f"🧩 [ECL INCREMENTAL] {len(sections)} sections: {extract_result['sections_processed']} re-processed, "
+                    f"{extract_result['seams_processed']} seams; {extract_result['entities_final']} entities, "
+                    f"{cognify_result['total_relationships']} relationships")
+        return extract_result, cognify_result, load_result
+
+    def _extract_and_cognify_document(self, content: str, source: str, context: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Synchronous extract + cognify of one document, windowing inline (batch worker path)
+        """
+        merged_entities: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        merged_relationships: Dict[Tuple, Dict[str, Any]] = {}
+        window_count = 0
+        candidate_pairs = 0
+
+        for offset, text in self._iter_windows(content):
+            window_result = self._process_window(text, offset, source)
+            self._merge_window_result(window_result, merged_entities, merged_relationships)
+            candidate_pairs += window_result['candidate_pairs']
+            window_count += 1
+
+        return self._finalize_document(
+            merged_entities, merged_relationships, content, source, context, window_count, candidate_pairs
+        )
+
+    def _process_document_chunk(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Extract + cognify a chunk of batch documents; failures are reported per document
+        """
+        results = []
+        for document in documents:
+            start_time = time.time()
+            try:
+                extract_result, cognify_result = self._extract_and_cognify_document(
+                    document['content'], document['source'], document['context']
+                )
+                results.append({
+                    'index': document['index'],
+                    'extract': extract_result,
+                    'cognify': cognify_result,
+                    'processing_time_ms': (time.time() - start_time) * 1000
+                })
+            except Exception as error:
+                results.append({'index': document['index'], 'error': str(error)})
+        return results
+
+    # Batch ECL
+    async def iter_ecl_batch(self, documents: Iterable[Dict[str, Any]]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Run ECL over many documents, yielding (input index, result) as documents complete
+
+        Extract and cognify run in the worker process pool in chunks of
+        batch_chunk_size documents, with at most two chunks per worker in
+        flight. Completed documents are loaded in bulk every batch_load_size
+        documents. Cached documents are yielded without touching the pool.
+
+        Args:
+            documents: Iterable of {'content', 'source'?, 'context'?} dicts
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_worker_pool()
+        max_in_flight = max(1, self.config['worker_processes']) * 2
+        chunk_size = max(1, self.config['batch_chunk_size'])
+
+        self.metrics['batch_executions'] += 1
+        documents_by_index: Dict[int, Dict[str, Any]] = {}
+        load_buffer: List[Dict[str, Any]] = []
+        pending = {}
+        chunk: List[Dict[str, Any]] = []
+
+        async def collect(chunk_results: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+            completed = []
+            for chunk_result in chunk_results:
+                document = documents_by_index.pop(chunk_result['index'])
+                if 'error' in chunk_result:
+                    error = RuntimeError(chunk_result['error'])
+                    logger.error(f"❌ [ECL BATCH] {document['source']} failed: {error}")
+                    if not self.config['fallback_enabled']:
+                        raise error
+                    completed.append((chunk_result['index'], await self._fallback_ecl_execution(
+                        document['content'], document['source'], document['context'], error
+                    )))
+                    continue
+                load_buffer.append({**chunk_result, 'document': document})
+
+            load_size = max(1, self.config['batch_load_size'])
+            while len(load_buffer) >= load_size:
+                completed.extend(await self._flush_batch_loads(load_buffer[:load_size]))
+                del load_buffer[:load_size]
+            return completed
+
+        def submit(documents_chunk: List[Dict[str, Any]]):
+            if pool is None:
+                return loop.run_in_executor(None, self._process_document_chunk, documents_chunk)
+            return loop.run_in_executor(pool, _process_documents_in_worker, self.config, documents_chunk)
+
+        async def drain(return_when) -> List[Tuple[int, Dict[str, Any]]]:
+            nonlocal pool
+            done, _ = await asyncio.wait(set(pending), return_when=return_when)
+            completed = []
+            for future in done:
+                documents_chunk = pending.pop(future)
+                if self._failed_in_pool(future):
+                    self._discard_worker_pool(future, 'ECL BATCH')
+                    pool = None
+                    chunk_results = self._process_document_chunk(documents_chunk)
+                else:
+                    chunk_results = future.result()
+                completed.extend(await collect(chunk_results))
+            return completed
+
+        for index, document in enumerate(documents):
+            context = document.get('context') or {}
+            source = document.get('source') or f"batch_{index}"
+            content = document['content']
+            self.metrics['total_ecl_executions'] += 1
+            self.metrics['batch_documents'] += 1
+
+            cache_key = self._generate_cache_key(content, source, context)
+            cached_result = await self._get_cached_result(cache_key)
+            if cached_result is not None:
+                self.metrics['cache_hits'] += 1
+                yield index, cached_result
+                continue
+            self.metrics['cache_misses'] += 1
+
+            documents_by_index[index] = {
+                'index': index, 'content': content, 'source': source, 'context': context, 'cache_key': cache_key
+            }
+            chunk.append(documents_by_index[index])
+            if len(chunk) >= chunk_size:
+                pending[submit(chunk)] = chunk
+                chunk = []
+
+            if len(pending) >= max_in_flight:
+                for completed in await drain(asyncio.FIRST_COMPLETED):
+                    yield completed
+
+        if chunk:
+            pending[submit(chunk)] = chunk
+        while pending:
+            for completed in await drain(asyncio.FIRST_COMPLETED):
+                yield completed
+
+        for completed in await self._flush_batch_loads(load_buffer):
+            yield completed
+
+    async def _flush_batch_loads(self, buffered: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Bulk LOAD phase for completed batch documents, then build and cache their results
+        """
+        if not buffered:
+            return []
+
+        # ECL ids are only unique within a document, prefix them so documents sharing a source stay apart
+        bulk_extract = {'entities': [
+            {**entity, 'id': f"{item['document']['index']}:{entity['id']}"}
+            for item in buffered for entity in item['extract']['entities']
+        ]}
+        bulk_cognify = {'relationships': [
+            {**relationship,
+             'source_entity': f"{item['document']['index']}:{relationship['source_entity']}",
+             'target_entity': f"{item['document']['index']}:{relationship['target_entity']}"}
+            for item in buffered for relationship in item['cognify']['relationships']
+        ]}
+        bulk_context = {'source': 'ecl_batch', 'documents': len(buffered)}
+
+        if self.config['performance_mode'] == 'optimized':
+            load_result = await self._load_phase_optimized(bulk_extract, bulk_context)
+            load_result = await self._merge_cognify_into_load(load_result, bulk_cognify, bulk_extract['entities'], bulk_context)
+        else:
+            load_result = await self._load_phase(bulk_extract, bulk_cognify, bulk_context)
+        load_result['bulk_documents'] = len(buffered)
+
+        completed = []
+        for item in buffered:
+            document = item['document']
+            ecl_result = {
+                'extract': item['extract'],
+                'cognify': item['cognify'],
+                'load': load_result,
+                'metadata': {
+                    'source': document['source'],
+                    'processing_time_ms': item['processing_time_ms'],
+                    'pipeline': 'cognee_ecl_batch',
+                    'entities_count': len(item['extract']['entities']),
+                    'relationships_count': len(item['cognify']['relationships']),
+                    'load_success': load_result['success'],
+                    'timestamp': time.time()
+                }
+            }
+            self.metrics['extract_operations'] += 1
+            self.metrics['cognify_operations'] += 1
+            self.metrics['entities_extracted_total'] += ecl_result['metadata']['entities_count']
+            self.metrics['relationships_created_total'] += ecl_result['metadata']['relationships_count']
+            self.metrics['windows_processed'] += item['extract']['windows']
+            self._update_processing_time_metrics(item['processing_time_ms'])
+
+            await self._cache_result(document['cache_key'], ecl_result)
+            completed.append((document['index'], ecl_result))
+
+        return completed
+
+    async def execute_ecl_batch(self, documents: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Execute ECL over a batch of documents using the worker process pool
+
+        Args:
+            documents: Iterable of {'content', 'source'?, 'context'?} dicts
+
+        Returns:
+            Dictionary with per-document results in input order and batch metadata
+        """
+        start_time = time.time()
+        results: Dict[int, Dict[str, Any]] = {}
+        cache_hits_before = self.metrics['cache_hits']
+
+        async for index, result in self.iter_ecl_batch(documents):
+            results[index] = result
+
+        elapsed = time.time() - start_time
+        throughput = len(results) / elapsed if elapsed > 0 else 0.0
+        self.metrics['batch_processing_efficiency'] = throughput
+
+        logger.info(f"📦 [ECL BATCH] {len(results)} documents in {elapsed * 1000:.1f}ms ({throughput:.1f} docs/s)")
+        return {
+            'results': [results[index] for index in sorted(results)],
+            'metadata': {
+                'documents': len(results),
+                'cache_hits': self.metrics['cache_hits'] - cache_hits_before,
+                'processing_time_ms': elapsed * 1000,
+                'throughput_docs_per_sec': throughput,
+                'workers': self.config['worker_processes'] if self._worker_pool is not None else 1,
+                'pipeline': 'cognee_ecl_batch'
+            }
+        }
+
+    def close(self):
+        """Shut down the window worker pool and close the graph store"""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown(wait=True)
+            self._worker_pool = None
+        if self._graph_store is not None:
+            self._graph_store.close()
+            self._graph_store = None
+
+
+# Per-process extraction-only pipeline for pool workers
+_WORKER_PIPELINE: Optional[CogneeECLPipeline] = None
+
+
+def _get_worker_pipeline(config: Dict[str, Any]) -> CogneeECLPipeline:
+    global _WORKER_PIPELINE
+    if _WORKER_PIPELINE is None:
+        _WORKER_PIPELINE = CogneeECLPipeline.for_extraction(config)
+    _WORKER_PIPELINE.config.update(config)
+    return _WORKER_PIPELINE
+
+
+def _process_window_in_worker(config: Dict[str, Any], text: str, offset: int, source: str) -> Dict[str, Any]:
+    """ProcessPoolExecutor entry point: process one window with the caller's configuration"""
+    return _get_worker_pipeline(config)._process_window(text, offset, source)
+
+
+def _process_documents_in_worker(config: Dict[str, Any], documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """ProcessPoolExecutor entry point: extract + cognify a chunk of batch documents"""
+    return _get_worker_pipeline(config)._process_document_chunk(documents)
+
 # Export main class
 __all__ = ['CogneeECLPipeline']
\ No newline at end of file
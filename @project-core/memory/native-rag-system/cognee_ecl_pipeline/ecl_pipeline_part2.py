@@ -41,11 +41,8 @@ class ECLPipelineLoadPhase:
             # Load relationships to memory system
             relationship_load_result = await self._load_relationships_to_memory(relationships, context)
             
-            # Update knowledge graph via bridge if available
-            graph_update_result = await self._update_knowledge_graph_via_bridge(entities, relationships, context)
-            
-            # Persist to local storage
-            persistence_result = await self._persist_to_storage(entities, relationships, context)
+            # Upsert entities and relationships into the persistent knowledge graph
+            graph_store_result = self._persist_to_graph_store(entities, relationships, context)
             
             load_result = {
                 'success': True,
@@ -53,8 +50,7 @@ class ECLPipelineLoadPhase:
                 'relationships_loaded': len(relationships),
                 'entity_load_result': entity_load_result,
                 'relationship_load_result': relationship_load_result,
-                'graph_update_result': graph_update_result,
-                'persistence_result': persistence_result,
+                'graph_store_result': graph_store_result,
                 'load_method': 'dynamic_memory_loading',
                 'timestamp': time.time()
             }
@@ -159,89 +155,22 @@ class ECLPipelineLoadPhase:
                 'relationships_processed': 0
             }
     
-    async def _update_knowledge_graph_via_bridge(self, entities: List[Dict[str, Any]], relationships: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Update knowledge graph via JavaScript bridge
-        """
-        try:
-            if not self.config['bridge_integration']:
-                return {'success': False, 'reason': 'bridge_disabled'}
-            
-            # Call knowledge graph engine to update graph
-            update_args = [entities, relationships, {
-                'source': context.get('source', 'unknown'),
-                'update_type': 'ecl_pipeline_load',
-                'timestamp': time.time()
-            }]
-            
-            result = await self.js_bridge.call_js_component(
-                'knowledge_graph',
-                'updateGraph',
-                update_args
-            )
-            
-            return {
-                'success': True,
-                'bridge_update': True,
-                'result': result
-            }
-            
-        except Exception as error:
-            logger.warning(f"⚠️ [ECL LOAD] Knowledge graph update failed: {error}")
-            return {
-                'success': False,
-                'error': str(error),
-                'bridge_update': False
-            }
-    
-    async def _persist_to_storage(self, entities: List[Dict[str, Any]], relationships: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _persist_to_graph_store(self, entities: List[Dict[str, Any]], relationships: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Persist entities and relationships to local storage
+        Upsert entities and relationships into the native knowledge graph store
         """
         try:
             if not self.config['memory_persistence']:
                 return {'success': False, 'reason': 'persistence_disabled'}
             
-            # Create storage directory
-            storage_dir = self.cache_dir / 'ecl_storage'
-            storage_dir.mkdir(exist_ok=True)
-            
-            # Generate storage key
-            storage_key = hashlib.sha256(f"{context.get('source', 'unknown')}_{time.time()}".encode()).hexdigest()[:16]
-            
-            # Save entities
-            entities_file = storage_dir / f"entities_{storage_key}.json"
-            with open(entities_file, 'w') as f:
-                json.dump({
-                    'entities': entities,
-                    'metadata': {
-                        'source': context.get('source', 'unknown'),
-                        'timestamp': time.time(),
-                        'ecl_pipeline': True
-                    }
-                }, f, indent=2)
-            
-            # Save relationships
-            relationships_file = storage_dir / f"relationships_{storage_key}.json"
-            with open(relationships_file, 'w') as f:
-                json.dump({
-                    'relationships': relationships,
-                    'metadata': {
-                        'source': context.get('source', 'unknown'),
-                        'timestamp': time.time(),
-                        'ecl_pipeline': True
-                    }
-                }, f, indent=2)
+            # Query-time runs read the graph, only ingestion writes it
+            if context.get('persist_graph') is False:
+                return {'success': False, 'reason': 'read_only'}
             
-            return {
-                'success': True,
-                'entities_file': str(entities_file),
-                'relationships_file': str(relationships_file),
-                'storage_key': storage_key
-            }
+            return self.get_graph_store().upsert_graph(entities, relationships, context.get('source'))
             
         except Exception as error:
-            logger.warning(f"⚠️ [ECL LOAD] Persistence failed: {error}")
+            logger.warning(f"⚠️ [ECL LOAD] Knowledge graph persistence failed: {error}")
             return {
                 'success': False,
                 'error': str(error)
@@ -361,6 +290,8 @@ class ECLPipelineLoadPhase:
             'context': context.get('source', 'unknown'),
             'pipeline': 'cognee_ecl'
         }
+        if context.get('persist_graph') is False:
+            key_data['read_only'] = True
         key_string = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_string.encode()).hexdigest()
     
@@ -448,7 +379,7 @@ class ECLPipelineLoadPhase:
             test_result = await self.execute_ecl_pipeline(
                 test_content,
                 'health_check',
-                {'source': 'health_check'}
+                {'source': 'health_check', 'persist_graph': False}
             )
             
             return {
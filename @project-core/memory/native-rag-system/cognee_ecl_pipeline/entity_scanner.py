@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+"""
+SINGLE-PASS ENTITY SCANNER V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Linear-time entity scanning for the Cognee ECL extract phase.
+
+Features:
+- One tokenization pass feeding both the term-frequency table and an
+  Aho-Corasick automaton over tokens for the fixed TECHNOLOGY/TOOL dictionaries
+- All regex entity patterns compiled into one alternation with named groups;
+  container matches (headings, bold, code) are rescanned inside their span only
+- Per-document statistics (frequency, first occurrence) computed once, so
+  confidence and importance no longer rescan the content per entity
+"""
+
+import re
+import logging
+from collections import Counter, deque
+from typing import Dict, Any, List, Tuple, Iterator
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Word tokens, keeping dotted/hyphenated names (Next.js, config.json, Event-Driven) whole
+TOKEN_PATTERN = re.compile(r'\w+(?:[.\-]\w+)*')
+
+
+class TokenAhoCorasick:
+    """
+    Aho-Corasick automaton whose alphabet is lowercase tokens
+
+    Dictionary terms are token sequences ("vs code"), so matches always fall
+    on word boundaries and the scan is linear in the number of tokens.
+    """
+
+    def __init__(self, terms: Dict[Tuple[str, ...], Any]):
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.failure: List[int] = [0]
+        self.outputs: List[List[Tuple[int, Any]]] = [[]]
+
+        for term, payload in terms.items():
+            state = 0
+            for token in term:
+                next_state = self.transitions[state].get(token)
+                if next_state is None:
+                    next_state = len(self.transitions)
+                    self.transitions[state][token] = next_state
+                    self.transitions.append({})
+                    self.failure.append(0)
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append((len(term), payload))
+
+        # Breadth-first failure links
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = self.failure[state]
+                while fallback and token not in self.transitions[fallback]:
+                    fallback = self.failure[fallback]
+                candidate = self.transitions[fallback].get(token, 0)
+                self.failure[next_state] = candidate if candidate != next_state else 0
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.failure[next_state]]
+
+    def iter_matches(self, tokens: List[str]) -> Iterator[Tuple[int, int, Any]]:
+        """Yield (first_token_index, last_token_index + 1, payload)"""
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in self.transitions[state]:
+                state = self.failure[state]
+            state = self.transitions[state].get(token, 0)
+            for length, payload in self.outputs[state]:
+                yield index - length + 1, index + 1, payload
+
+
+class EntityScanner:
+    """
+    Precompiled single-pass scanner for entity patterns and dictionaries
+    """
+
+    def __init__(self, entity_patterns: List[Tuple[str, str]], entity_dictionaries: Dict[str, List[str]],
+                 container_types: Tuple[str, ...] = ('CONCEPT',)):
+        """
+        Args:
+            entity_patterns: (entity type, regex) pairs in priority order; at a
+                given offset the first matching alternative wins
+            entity_dictionaries: entity type -> fixed terms, matched case-insensitively
+            container_types: types whose captured text is rescanned for nested entities
+        """
+        # group name -> (entity type, source pattern, index of the entity capture group)
+        self.group_specs: Dict[str, Tuple[str, str, int]] = {}
+        alternatives = []
+        group_index = 1
+        for entity_type, pattern in entity_patterns:
+            group = f'g{len(self.group_specs)}'
+            inner_groups = re.compile(pattern).groups
+            # The pattern's first capture group is the entity text, else the whole match
+            self.group_specs[group] = (entity_type, pattern, group_index + 1 if inner_groups else group_index)
+            alternatives.append(f'(?P<{group}>{pattern})')
+            group_index += 1 + inner_groups
+
+        self.combined_pattern = re.compile('|'.join(alternatives), re.MULTILINE)
+        self.container_types = set(container_types)
+
+        dictionary_terms = {}
+        for entity_type, terms in entity_dictionaries.items():
+            for term in terms:
+                dictionary_terms[tuple(TOKEN_PATTERN.findall(term.lower()))] = entity_type
+        self.dictionary_automaton = TokenAhoCorasick(dictionary_terms)
+
+    def _scan_patterns(self, content: str, pos: int, endpos: int, matches: List[Dict[str, Any]]):
+        for match in self.combined_pattern.finditer(content, pos, endpos):
+            # The named alternative closes last, so lastgroup identifies the pattern
+            entity_type, pattern, entity_group = self.group_specs[match.lastgroup]
+            start, end = match.span(entity_group)
+
+            matches.append({
+                'type': entity_type,
+                'text': content[start:end],
+                'text_start': start,
+                'start': match.start(),
+                'end': match.end(),
+                'pattern': pattern
+            })
+
+            # Containers (headings, bold, code) may hold nested entities
+            if entity_type in self.container_types and (start, end) != match.span() and end - start > 1:
+                self._scan_patterns(content, start, end, matches)
+
+    def scan(self, content: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Scan content once
+
+        Returns:
+            (matches, statistics) where matches are {'type', 'text', 'text_start',
+            'start', 'end', 'pattern'} sorted by position and statistics hold the
+            term-frequency table
+        """
+        token_matches = list(TOKEN_PATTERN.finditer(content))
+        tokens = [token.group(0).lower() for token in token_matches]
+
+        matches: List[Dict[str, Any]] = []
+        for first, last, entity_type in self.dictionary_automaton.iter_matches(tokens):
+            start, end = token_matches[first].start(), token_matches[last - 1].end()
+            matches.append({
+                'type': entity_type,
+                'text': content[start:end],
+                'text_start': start,
+                'start': start,
+                'end': end,
+                'pattern': f'dictionary:{entity_type}'
+            })
+
+        self._scan_patterns(content, 0, len(content), matches)
+        matches.sort(key=lambda m: (m['start'], m['end']))
+
+        # One frequency table: single-token names use token counts, longer names their match counts.
+        # Several patterns may match the same text, so occurrences are counted per distinct offset
+        name_counts = Counter()
+        first_occurrence: Dict[str, int] = {}
+        counted = set()
+        for match in matches:
+            name = match['text'].strip().lower()
+            if (name, match['text_start']) not in counted:
+                counted.add((name, match['text_start']))
+                name_counts[name] += 1
+            if name not in first_occurrence:
+                first_occurrence[name] = match['start']
+
+        statistics = {
+            'term_frequencies': Counter(tokens),
+            'name_counts': name_counts,
+            'first_occurrence': first_occurrence,
+            'content_length': len(content)
+        }
+        return matches, statistics
+
+    @staticmethod
+    def frequency(name: str, statistics: Dict[str, Any]) -> int:
+        """Occurrences of an entity name using the precomputed tables"""
+        key = name.lower()
+        token_count = statistics['term_frequencies'].get(key, 0)
+        return max(token_count, statistics['name_counts'].get(key, 0))
+
+# Export main classes
+__all__ = ['EntityScanner', 'TokenAhoCorasick', 'TOKEN_PATTERN']
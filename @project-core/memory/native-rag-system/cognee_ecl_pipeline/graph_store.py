@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+
+"""
+KNOWLEDGE GRAPH STORE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Persistent native knowledge graph for the Cognee ECL load phase, replacing the
+per-run JSON dumps and the bridge updateGraph call (which the JavaScript
+knowledge graph never implemented).
+
+Layout (single SQLite database, WAL mode):
+- entities: one row per (normalized name, type), mentions summed over sources
+- entity_sources: which sources mention an entity, and how often
+- edges: one row per (source entity, target entity, relationship type),
+  strength summed over sources
+- edge_sources: each source's contribution to an edge
+
+Features:
+- Entity upserts deduplicated by normalized name and type
+- Per-source replace: reloading a source swaps its contribution instead of adding to it
+- Entities and edges no source mentions any more are retracted, also when a source is removed
+- Bulk loads in a single transaction
+- Indexed lookups by name, type and edge endpoints, queryable without the bridge
+- Generation counter bumped by every load, so derived indexes know when to rebuild
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    normalized_name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    confidence REAL NOT NULL DEFAULT 0,
+    mentions INTEGER NOT NULL DEFAULT 0,
+    properties TEXT NOT NULL DEFAULT '{}',
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    UNIQUE (normalized_name, type)
+);
+CREATE INDEX IF NOT EXISTS idx_entities_name ON entities (normalized_name);
+CREATE INDEX IF NOT EXISTS idx_entities_type ON entities (type);
+
+CREATE TABLE IF NOT EXISTS entity_sources (
+    entity_id INTEGER NOT NULL REFERENCES entities (id) ON DELETE CASCADE,
+    source TEXT NOT NULL,
+    mentions INTEGER NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (entity_id, source)
+);
+CREATE INDEX IF NOT EXISTS idx_entity_sources_source ON entity_sources (source);
+
+CREATE TABLE IF NOT EXISTS edges (
+    source_id INTEGER NOT NULL REFERENCES entities (id) ON DELETE CASCADE,
+    target_id INTEGER NOT NULL REFERENCES entities (id) ON DELETE CASCADE,
+    relationship_type TEXT NOT NULL,
+    strength REAL NOT NULL DEFAULT 0,
+    confidence REAL NOT NULL DEFAULT 0,
+    observations INTEGER NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (source_id, target_id, relationship_type)
+);
+CREATE INDEX IF NOT EXISTS idx_edges_target ON edges (target_id);
+
+CREATE TABLE IF NOT EXISTS edge_sources (
+    source_id INTEGER NOT NULL,
+    target_id INTEGER NOT NULL,
+    relationship_type TEXT NOT NULL,
+    source TEXT NOT NULL,
+    strength REAL NOT NULL DEFAULT 0,
+    confidence REAL NOT NULL DEFAULT 0,
+    observations INTEGER NOT NULL DEFAULT 0,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (source_id, target_id, relationship_type, source),
+    FOREIGN KEY (source_id, target_id, relationship_type)
+        REFERENCES edges (source_id, target_id, relationship_type) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_edge_sources_source ON edge_sources (source);
+
+CREATE TABLE IF NOT EXISTS graph_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Rows per IN (...) lookup, below SQLite's default variable limit
+_LOOKUP_CHUNK = 500
+
+
+def normalize_entity_name(name: str) -> str:
+    """Case- and whitespace-insensitive entity key"""
+    return ' '.join(name.lower().split())
+
+
+class KnowledgeGraphStore:
+    """
+    SQLite-backed knowledge graph with upsert semantics
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Loads run on the event loop, batch workers may query from threads
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('PRAGMA foreign_keys=ON')
+        self._connection.executescript(SCHEMA)
+        with self._connection:
+            # Databases from before edge_sources: keep their edges as an unsourced contribution
+            self._connection.execute(
+                """
+                INSERT INTO edge_sources (source_id, target_id, relationship_type, source, strength, confidence, observations, last_seen)
+                SELECT source_id, target_id, relationship_type, '', strength, confidence, observations, last_seen FROM edges e
+                WHERE NOT EXISTS (SELECT 1 FROM edge_sources s WHERE s.source_id = e.source_id
+                                  AND s.target_id = e.target_id AND s.relationship_type = e.relationship_type)
+                """
+            )
+
+        self.metrics = {
+            'bulk_loads': 0,
+            'entities_upserted': 0,
+            'edges_upserted': 0,
+            'edges_skipped': 0,
+            'entities_retracted': 0,
+            'edges_retracted': 0,
+            'queries': 0,
+            'total_load_time_ms': 0.0
+        }
+
+    # WRITES
+
+    def upsert_graph(self, entities: List[Dict[str, Any]], relationships: List[Dict[str, Any]],
+                     source: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Load ECL entities and relationships in one transaction
+
+        Entities merge on (normalized name, type); relationships reference
+        entities by their ECL ids and merge on (endpoints, type). Each source
+        in the load replaces its previous contribution: its old mention counts
+        and edge strengths are dropped before the new ones are written, and
+        entities or edges no source contributes to any more are deleted.
+        Contributions without a source accumulate.
+
+        Args:
+            entities: ECL entity dicts ('id', 'name', 'type', 'confidence', ...)
+            relationships: ECL relationship dicts ('source_entity', 'target_entity', ...)
+            source: Fallback source label for entities without one
+
+        Returns:
+            Summary with counts of upserted entities and edges
+        """
+        start_time = time.time()
+        now = time.time()
+
+        with self._lock, self._connection:
+            entity_rows = {}
+            source_rows = {}
+            entity_keys = {}
+            for entity in entities:
+                key = (normalize_entity_name(entity['name']), entity['type'])
+                mentions = int(entity.get('properties', {}).get('frequency', 1) or 1)
+                entity_source = entity.get('source') or source or ''
+                entity_keys[entity['id']] = (key, entity_source)
+                row = entity_rows.get(key)
+                if row is None:
+                    entity_rows[key] = [entity['name'], key[0], key[1], entity.get('confidence', 0.0),
+                                        json.dumps(entity.get('properties', {}), default=str), now, now]
+                else:
+                    row[3] = max(row[3], entity.get('confidence', 0.0))
+                source_rows[(key, entity_source)] = source_rows.get((key, entity_source), 0) + mentions
+
+            replaced_sources = sorted({entity_source for _, entity_source in source_rows if entity_source})
+            touched_entities, touched_edges = self._retract_sources(replaced_sources)
+
+            self._connection.executemany(
+                """
+                INSERT INTO entities (name, normalized_name, type, confidence, properties, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (normalized_name, type) DO UPDATE SET
+                    confidence = MAX(entities.confidence, excluded.confidence),
+                    properties = excluded.properties,
+                    last_seen = excluded.last_seen
+                """,
+                entity_rows.values()
+            )
+
+            entity_ids = self._lookup_entity_ids(list(entity_rows))
+            touched_entities.update(entity_ids.values())
+
+            self._connection.executemany(
+                """
+                INSERT INTO entity_sources (entity_id, source, mentions, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT (entity_id, source) DO UPDATE SET
+                    mentions = entity_sources.mentions + excluded.mentions,
+                    last_seen = excluded.last_seen
+                """,
+                [(entity_ids[key], entity_source, mentions, now)
+                 for (key, entity_source), mentions in source_rows.items()]
+            )
+
+            # ECL ids are per run; resolve them through the entity keys
+            edge_rows = {}
+            skipped = 0
+            for relationship in relationships:
+                source_entity = entity_keys.get(relationship['source_entity'])
+                target_entity = entity_keys.get(relationship['target_entity'])
+                if source_entity is None or target_entity is None:
+                    skipped += 1
+                    continue
+                source_id, target_id = entity_ids[source_entity[0]], entity_ids[target_entity[0]]
+                if source_id == target_id:
+                    skipped += 1
+                    continue
+
+                strength = relationship.get('strength', relationship.get('confidence', 0.0))
+                key = (source_id, target_id, relationship.get('relationship_type', 'RELATED_TO'),
+                       relationship.get('source') or source_entity[1])
+                row = edge_rows.get(key)
+                if row is None:
+                    edge_rows[key] = [*key, strength, relationship.get('confidence', strength), 1, now]
+                else:
+                    row[4] += strength
+                    row[5] = max(row[5], relationship.get('confidence', strength))
+                    row[6] += 1
+
+            self._connection.executemany(
+                """
+                INSERT INTO edges (source_id, target_id, relationship_type, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT (source_id, target_id, relationship_type) DO UPDATE SET last_seen = excluded.last_seen
+                """,
+                {key[:3]: (*key[:3], now) for key in edge_rows}.values()
+            )
+            self._connection.executemany(
+                """
+                INSERT INTO edge_sources (source_id, target_id, relationship_type, source, strength, confidence, observations, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (source_id, target_id, relationship_type, source) DO UPDATE SET
+                    strength = edge_sources.strength + excluded.strength,
+                    confidence = MAX(edge_sources.confidence, excluded.confidence),
+                    observations = edge_sources.observations + excluded.observations,
+                    last_seen = excluded.last_seen
+                """,
+                edge_rows.values()
+            )
+            touched_edges.update(key[:3] for key in edge_rows)
+
+            retracted_entities, retracted_edges = self._refresh_totals(touched_entities, touched_edges)
+
+            self._connection.execute(
+                """
+                INSERT INTO graph_meta (key, value) VALUES ('generation', 1)
+                ON CONFLICT (key) DO UPDATE SET value = graph_meta.value + 1
+                """
+            )
+
+        load_time = (time.time() - start_time) * 1000
+        edges_upserted = len({key[:3] for key in edge_rows})
+        self.metrics['bulk_loads'] += 1
+        self.metrics['entities_upserted'] += len(entity_rows)
+        self.metrics['edges_upserted'] += edges_upserted
+        self.metrics['edges_skipped'] += skipped
+        self.metrics['entities_retracted'] += retracted_entities
+        self.metrics['edges_retracted'] += retracted_edges
+        self.metrics['total_load_time_ms'] += load_time
+
+        return {
+            'success': True,
+            'storage_method': 'sqlite_graph_store',
+            'entities_upserted': len(entity_rows),
+            'edges_upserted': edges_upserted,
+            'edges_skipped': skipped,
+            'entities_retracted': retracted_entities,
+            'edges_retracted': retracted_edges,
+            'sources_replaced': len(replaced_sources),
+            'load_time_ms': load_time
+        }
+
+    def remove_sources(self, sources: Iterable[str]) -> Dict[str, Any]:
+        """
+        Drop everything these sources contributed, retracting entities and
+        edges no other source mentions
+
+        Returns:
+            Summary with counts of retracted entities and edges
+        """
+        sources = sorted(set(sources))
+        with self._lock, self._connection:
+            touched_entities, touched_edges = self._retract_sources(sources)
+            if not touched_entities and not touched_edges:
+                return {'success': True, 'entities_retracted': 0, 'edges_retracted': 0}
+            retracted_entities, retracted_edges = self._refresh_totals(touched_entities, touched_edges)
+            self._connection.execute(
+                """
+                INSERT INTO graph_meta (key, value) VALUES ('generation', 1)
+                ON CONFLICT (key) DO UPDATE SET value = graph_meta.value + 1
+                """
+            )
+
+        self.metrics['entities_retracted'] += retracted_entities
+        self.metrics['edges_retracted'] += retracted_edges
+        return {'success': True, 'entities_retracted': retracted_entities, 'edges_retracted': retracted_edges}
+
+    def _retract_sources(self, sources: List[str]) -> Tuple[set, set]:
+        """Drop the stored contributions of these sources, returning the entities and edges they touched"""
+        touched_entities, touched_edges = set(), set()
+        for start in range(0, len(sources), _LOOKUP_CHUNK):
+            chunk = sources[start:start + _LOOKUP_CHUNK]
+            placeholders = ','.join('?' for _ in chunk)
+            touched_entities.update(row[0] for row in self._connection.execute(
+                f"SELECT entity_id FROM entity_sources WHERE source IN ({placeholders})", chunk
+            ))
+            touched_edges.update(tuple(row) for row in self._connection.execute(
+                f"SELECT source_id, target_id, relationship_type FROM edge_sources WHERE source IN ({placeholders})", chunk
+            ))
+            self._connection.execute(f"DELETE FROM entity_sources WHERE source IN ({placeholders})", chunk)
+            self._connection.execute(f"DELETE FROM edge_sources WHERE source IN ({placeholders})", chunk)
+        return touched_entities, touched_edges
+
+    def _refresh_totals(self, entity_ids: set, edge_keys: set) -> Tuple[int, int]:
+        """
+        Recompute entity mentions and edge strength from their per-source rows,
+        deleting the ones no source contributes to any more
+        """
+        edge_keys = list(edge_keys)
+        retracted_edges = 0
+        for start in range(0, len(edge_keys), _LOOKUP_CHUNK):
+            chunk = edge_keys[start:start + _LOOKUP_CHUNK]
+            placeholders = ','.join('(?, ?, ?)' for _ in chunk)
+            params = [value for key in chunk for value in key]
+            retracted_edges += self._connection.execute(
+                f"""
+                DELETE FROM edges WHERE (source_id, target_id, relationship_type) IN (VALUES {placeholders})
+                AND NOT EXISTS (SELECT 1 FROM edge_sources s WHERE s.source_id = edges.source_id
+                                AND s.target_id = edges.target_id AND s.relationship_type = edges.relationship_type)
+                """,
+                params
+            ).rowcount
+            self._connection.execute(
+                f"""
+                UPDATE edges SET (strength, confidence, observations) = (
+                    SELECT SUM(s.strength), MAX(s.confidence), SUM(s.observations) FROM edge_sources s
+                    WHERE s.source_id = edges.source_id AND s.target_id = edges.target_id
+                    AND s.relationship_type = edges.relationship_type)
+                WHERE (source_id, target_id, relationship_type) IN (VALUES {placeholders})
+                """,
+                params
+            )
+
+        entity_ids = list(entity_ids)
+        retracted_entities = 0
+        for start in range(0, len(entity_ids), _LOOKUP_CHUNK):
+            chunk = entity_ids[start:start + _LOOKUP_CHUNK]
+            placeholders = ','.join('?' for _ in chunk)
+            # Deleting an entity cascades to the edges touching it
+            retracted_entities += self._connection.execute(
+                f"""
+                DELETE FROM entities WHERE id IN ({placeholders})
+                AND NOT EXISTS (SELECT 1 FROM entity_sources s WHERE s.entity_id = entities.id)
+                """,
+                chunk
+            ).rowcount
+            self._connection.execute(
+                f"""
+                UPDATE entities SET mentions = (SELECT SUM(s.mentions) FROM entity_sources s WHERE s.entity_id = entities.id)
+                WHERE id IN ({placeholders})
+                """,
+                chunk
+            )
+        return retracted_entities, retracted_edges
+
+    def _lookup_entity_ids(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        """(normalized name, type) -> entity id, queried in chunks"""
+        entity_ids = {}
+        for start in range(0, len(keys), _LOOKUP_CHUNK):
+            chunk = keys[start:start + _LOOKUP_CHUNK]
+            placeholders = ','.join('(?, ?)' for _ in chunk)
+            rows = self._connection.execute(
+                f"SELECT id, normalized_name, type FROM entities WHERE (normalized_name, type) IN (VALUES {placeholders})",
+                [value for key in chunk for value in key]
+            )
+            for row in rows:
+                entity_ids[(row['normalized_name'], row['type'])] = row['id']
+        return entity_ids
+
+    # QUERIES
+
+    @staticmethod
+    def _entity_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'type': row['type'],
+            'confidence': row['confidence'],
+            'mentions': row['mentions'],
+            'properties': json.loads(row['properties']),
+            'first_seen': row['first_seen'],
+            'last_seen': row['last_seen']
+        }
+
+    def get_entity(self, name: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entities with this (normalized) name, optionally of one type"""
+        self.metrics['queries'] += 1
+        query = "SELECT * FROM entities WHERE normalized_name = ?"
+        params: List[Any] = [normalize_entity_name(name)]
+        if entity_type:
+            query += " AND type = ?"
+            params.append(entity_type)
+
+        with self._lock:
+            return [self._entity_dict(row) for row in self._connection.execute(query, params)]
+
+    def find_entities(self, prefix: str = '', entity_type: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Entities whose normalized name starts with prefix, most mentioned first"""
+        self.metrics['queries'] += 1
+        normalized = normalize_entity_name(prefix)
+        query = "SELECT * FROM entities WHERE normalized_name >= ? AND normalized_name < ?"
+        params: List[Any] = [normalized, normalized + '\uffff']
+        if entity_type:
+            query += " AND type = ?"
+            params.append(entity_type)
+        query += " ORDER BY mentions DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return [self._entity_dict(row) for row in self._connection.execute(query, params)]
+
+    def neighbors(self, entity_ids: Iterable[int], min_strength: float = 0.0, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Edges touching any of the given entities, strongest first
+
+        Returns:
+            List of {'entity_id', 'neighbor', 'relationship_type', 'strength',
+            'observations', 'direction'} with the neighbour entity expanded
+        """
+        self.metrics['queries'] += 1
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if not entity_ids:
+            return []
+
+        results = []
+        with self._lock:
+            for start in range(0, len(entity_ids), _LOOKUP_CHUNK):
+                chunk = entity_ids[start:start + _LOOKUP_CHUNK]
+                placeholders = ','.join('?' for _ in chunk)
+                rows = self._connection.execute(
+                    f"""
+                    SELECT e.source_id AS entity_id, e.target_id AS neighbor_id, 'out' AS direction,
+                           e.relationship_type, e.strength, e.observations
+                    FROM edges e WHERE e.source_id IN ({placeholders}) AND e.strength >= ?
+                    UNION ALL
+                    SELECT e.target_id, e.source_id, 'in', e.relationship_type, e.strength, e.observations
+                    FROM edges e WHERE e.target_id IN ({placeholders}) AND e.strength >= ?
+                    ORDER BY strength DESC LIMIT ?
+                    """,
+                    [*chunk, min_strength, *chunk, min_strength, limit]
+                ).fetchall()
+                results.extend(rows)
+
+            results.sort(key=lambda row: row['strength'], reverse=True)
+            results = results[:limit]
+            neighbor_rows = {}
+            neighbor_ids = list({row['neighbor_id'] for row in results})
+            for start in range(0, len(neighbor_ids), _LOOKUP_CHUNK):
+                chunk = neighbor_ids[start:start + _LOOKUP_CHUNK]
+                placeholders = ','.join('?' for _ in chunk)
+                for row in self._connection.execute(f"SELECT * FROM entities WHERE id IN ({placeholders})", chunk):
+                    neighbor_rows[row['id']] = self._entity_dict(row)
+
+        return [
+            {
+                'entity_id': row['entity_id'],
+                'neighbor': neighbor_rows[row['neighbor_id']],
+                'relationship_type': row['relationship_type'],
+                'strength': row['strength'],
+                'observations': row['observations'],
+                'direction': row['direction']
+            }
+            for row in results
+        ]
+
+    def entity_sources(self, entity_id: int) -> List[Dict[str, Any]]:
+        """Sources mentioning an entity, most mentions first"""
+        self.metrics['queries'] += 1
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT source, mentions, last_seen FROM entity_sources WHERE entity_id = ? ORDER BY mentions DESC",
+                (entity_id,)
+            )
+            return [dict(row) for row in rows]
+
+    def generation(self) -> int:
+        """Number of loads committed to this database (across processes)"""
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM graph_meta WHERE key = 'generation'").fetchone()
+        return row[0] if row else 0
+
+    def export_graph(self) -> Dict[str, Any]:
+        """
+        Snapshot of the whole graph for building in-memory indexes
+
+        Returns:
+            {'generation', 'entities': [(id, normalized_name, type)],
+            'edges': [(source_id, target_id, strength)],
+            'sources': [(entity_id, source, mentions)]}
+        """
+        with self._lock:
+            # One read transaction, so the snapshot matches its generation
+            self._connection.execute('BEGIN')
+            try:
+                row = self._connection.execute("SELECT value FROM graph_meta WHERE key = 'generation'").fetchone()
+                return {
+                    'generation': row[0] if row else 0,
+                    'entities': [tuple(r) for r in self._connection.execute("SELECT id, normalized_name, type FROM entities")],
+                    'edges': [tuple(r) for r in self._connection.execute("SELECT source_id, target_id, strength FROM edges")],
+                    'sources': [tuple(r) for r in self._connection.execute("SELECT entity_id, source, mentions FROM entity_sources")]
+                }
+            finally:
+                self._connection.commit()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            entities = self._connection.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+            edges = self._connection.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+        return {
+            **self.metrics,
+            'entities': entities,
+            'edges': edges,
+            'db_path': str(self.db_path)
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+# Export main classes
+__all__ = ['KnowledgeGraphStore', 'normalize_entity_name']
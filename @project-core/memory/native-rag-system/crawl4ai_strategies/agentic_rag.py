@@ -16,8 +16,10 @@ Based on Crawl4AI research and agentic RAG principles:
 
 Features:
 - Intelligent code block detection and extraction
-- Pattern recognition for design patterns and code smells
+- Linear-time pattern recognition for design patterns and code smells (ast for Python)
 - Integration with knowledge-graph-foundation.js via bridge
+- Analysis stages run as a dependency graph (bridge calls alongside CPU stages)
+- Project code questions answered from the incremental code pattern index
 - LLM summarization for code examples
 - Specialized code search capabilities
 - Performance monitoring and caching
@@ -30,13 +32,15 @@ import time
 import logging
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Callable, Awaitable
 import sys
 
 # Add parent directory for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from integration.js_bridge import JavaScriptBridge
+from crawl4ai_strategies.code_analysis import CodeAnalyzer
+from crawl4ai_strategies.code_index import CodePatternIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -57,6 +61,12 @@ class AgenticRAGStrategy:
             'max_code_length': 5000,  # Maximum characters for code extraction
             'pattern_types': ['DESIGN_PATTERN', 'ARCHITECTURAL_PATTERN', 'CODE_SMELL'],
             'confidence_threshold': 0.7,
+            'long_method_lines': 20,  # Code smell thresholds
+            'large_class_lines': 50,
+            'god_object_methods': 10,
+            'max_analysis_chars': 1_000_000,  # Larger inputs are analysed up to this size
+            'summary_concurrency': 4,  # Code block summaries generated at once
+            'code_index_path': None,  # Defaults to cache/code-index/code_index.db
             'llm_model': 'gpt-4o-mini',  # For code summarization
             'cache_enabled': True,
             'cache_ttl': 3600,  # 1 hour
@@ -67,6 +77,7 @@ class AgenticRAGStrategy:
         # Performance metrics
         self.metrics = {
             'total_code_extractions': 0,
+            'code_index_lookups': 0,
             'pattern_recognition_calls': 0,
             'ast_analysis_calls': 0,
             'code_summarization_calls': 0,
@@ -81,30 +92,16 @@ class AgenticRAGStrategy:
         self.cache_dir = Path(__file__).parent.parent / 'cache' / 'agentic-rag'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Code pattern definitions
-        self.pattern_definitions = {
-            'DESIGN_PATTERN': {
-                'singleton': r'class\s+\w+.*?(?:__new__|getInstance)',
-                'factory': r'(?:create|make|build)\w*\s*\(',
-                'observer': r'(?:subscribe|notify|observer|listener)',
-                'decorator': r'@\w+|def\s+\w+\s*\([^)]*\)\s*->.*?:',
-                'strategy': r'class\s+\w*Strategy\w*'
-            },
-            'ARCHITECTURAL_PATTERN': {
-                'mvc': r'(?:model|view|controller)',
-                'repository': r'class\s+\w*Repository\w*',
-                'service': r'class\s+\w*Service\w*',
-                'adapter': r'class\s+\w*Adapter\w*',
-                'facade': r'class\s+\w*Facade\w*'
-            },
-            'CODE_SMELL': {
-                'long_method': r'def\s+\w+.*?(?:\n.*?){20,}',
-                'large_class': r'class\s+\w+.*?(?:\n.*?){50,}',
-                'duplicate_code': r'(?:def\s+\w+.*?\n.*?){2,}',
-                'magic_numbers': r'\b(?:\d{2,}|\d+\.\d+)\b',
-                'god_object': r'class\s+\w+.*?(?:def\s+\w+.*?\n.*?){10,}'
-            }
-        }
+        # Linear-time pattern analysis (ast for Python, token scan otherwise)
+        self.code_analyzer = CodeAnalyzer(
+            long_method_lines=self.config['long_method_lines'],
+            large_class_lines=self.config['large_class_lines'],
+            god_object_methods=self.config['god_object_methods'],
+            max_chars=self.config['max_analysis_chars']
+        )
+        
+        # Project-wide code pattern index (lazy)
+        self._code_index: Optional[CodePatternIndex] = None
         
         logger.info("✅ [AGENTIC RAG] Strategy initialized successfully")
     
@@ -140,22 +137,23 @@ class AgenticRAGStrategy:
             
             self.metrics['cache_misses'] += 1
             
-            # Step 1: Extract code blocks
-            code_blocks = self._extract_code_blocks(code)
-            
-            # Step 2: Perform pattern recognition
-            patterns = await self._recognize_patterns(code, context)
-            
-            # Step 3: AST analysis via JavaScript bridge
-            ast_analysis = await self._perform_ast_analysis(code, context)
-            
-            # Step 4: Generate code summaries via LLM
-            summaries = await self._generate_code_summaries(code_blocks, context)
-            
-            # Step 5: Knowledge graph integration
-            knowledge_graph_data = await self._integrate_knowledge_graph(code, ast_analysis, context)
-            
-            # Step 6: Prepare final result
+            # Stage graph: name -> (dependencies, stage). The bridge calls (AST analysis and the
+            # knowledge graph built from its entities) run alongside the CPU stages, which are
+            # moved off the event loop so bridge I/O keeps progressing
+            stage_results, stage_timings = await self._run_stage_graph({
+                'code_blocks': ((), lambda: asyncio.to_thread(self._extract_code_blocks, code)),
+                'patterns': ((), lambda: self._recognize_patterns(code, context)),
+                'ast_analysis': ((), lambda: self._perform_ast_analysis(code, context)),
+                'summaries': (('code_blocks',), lambda blocks: self._generate_code_summaries(blocks, context)),
+                'knowledge_graph': (('ast_analysis',), lambda ast: self._integrate_knowledge_graph(code, ast, context))
+            })
+            code_blocks = stage_results['code_blocks']
+            patterns = stage_results['patterns']
+            ast_analysis = stage_results['ast_analysis']
+            summaries = stage_results['summaries']
+            knowledge_graph_data = stage_results['knowledge_graph']
+            
+            # Prepare final result
             result = {
                 'code_blocks': code_blocks,
                 'patterns': patterns,
@@ -166,6 +164,7 @@ class AgenticRAGStrategy:
                     'total_code_blocks': len(code_blocks),
                     'patterns_detected': len(patterns),
                     'processing_time_ms': (time.time() - start_time) * 1000,
+                    'stage_timings_ms': stage_timings,
                     'strategy': 'agentic_rag',
                     'confidence_threshold': self.config['confidence_threshold'],
                     'source': context.get('source', 'unknown')
@@ -191,6 +190,87 @@ class AgenticRAGStrategy:
             
             raise
     
+    def get_code_index(self) -> CodePatternIndex:
+        """Project-wide code pattern index consulted by lookup_code_index"""
+        if self._code_index is None:
+            self._code_index = CodePatternIndex(index_path=self.config['code_index_path'])
+        return self._code_index
+    
+    def contains_code(self, text: str) -> bool:
+        """Whether text carries code to analyse, rather than a question about the project's code"""
+        return bool(self._extract_code_blocks(text))
+    
+    async def lookup_code_index(self, query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Answer a code-analysis query from the project code index
+        
+        The index is refreshed incrementally (changed files only) when it is
+        older than its refresh_interval.
+        
+        Args:
+            query: Question about the project's code (pattern names, symbol names)
+            context: Additional context information
+            
+        Returns:
+            Dictionary with matching patterns, symbols and lookup metadata
+        """
+        start_time = time.time()
+        self.metrics['code_index_lookups'] += 1
+        code_index = self.get_code_index()
+        
+        refresh_summary = await code_index.ensure_fresh()
+        lookup = await asyncio.to_thread(code_index.lookup, query)
+        for pattern in lookup['patterns']:
+            pattern['description'] = self._get_pattern_description(pattern['type'], pattern['name'])
+        
+        lookup_time = (time.time() - start_time) * 1000
+        logger.info(f"📇 [AGENTIC RAG] Code index lookup: {len(lookup['patterns'])} patterns, "
+                    f"{len(lookup['symbols'])} symbols ({lookup_time:.1f}ms)")
+        return {
+            **lookup,
+            'metadata': {
+                'strategy': 'agentic_rag_code_index',
+                'refreshed': refresh_summary is not None,
+                'lookup_time_ms': lookup_time,
+                'source': (context or {}).get('source', 'unknown')
+            }
+        }
+    
+    async def _run_stage_graph(self, stages: Dict[str, Tuple[Tuple[str, ...], Callable[..., Awaitable[Any]]]]
+                               ) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """
+        Run analysis stages concurrently, each as soon as its dependencies finish
+        
+        Args:
+            stages: name -> (dependency names, stage callable taking the dependency results);
+                dependencies must be listed before the stages that use them
+            
+        Returns:
+            (results by stage name, stage execution time in ms by stage name)
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        timings: Dict[str, float] = {}
+        
+        async def run_stage(name: str, dependencies: Tuple[str, ...], stage: Callable[..., Awaitable[Any]]):
+            inputs = [await tasks[dependency] for dependency in dependencies]
+            stage_start = time.perf_counter()
+            result = await stage(*inputs)
+            timings[name] = (time.perf_counter() - stage_start) * 1000
+            return result
+        
+        for name, (dependencies, stage) in stages.items():
+            tasks[name] = asyncio.create_task(run_stage(name, dependencies, stage))
+        
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        
+        return {name: task.result() for name, task in tasks.items()}, {name: timings[name] for name in stages}
+    
     def _extract_code_blocks(self, content: str) -> List[Dict[str, Any]]:
         """
         Extract code blocks from content (≥300 characters)
@@ -282,61 +362,18 @@ class AgenticRAGStrategy:
         """
         self.metrics['pattern_recognition_calls'] += 1
         
+        analysis = await asyncio.to_thread(self.code_analyzer.analyze, code, context.get('language'))
+        
         patterns = []
+        for pattern in analysis['patterns']:
+            if pattern['confidence'] >= self.config['confidence_threshold']:
+                pattern['description'] = self._get_pattern_description(pattern['type'], pattern['name'])
+                patterns.append(pattern)
         
-        for pattern_type, pattern_dict in self.pattern_definitions.items():
-            for pattern_name, pattern_regex in pattern_dict.items():
-                matches = re.finditer(pattern_regex, code, re.IGNORECASE | re.DOTALL)
-                
-                for match in matches:
-                    confidence = self._calculate_pattern_confidence(match, code, pattern_type, pattern_name)
-                    
-                    if confidence >= self.config['confidence_threshold']:
-                        patterns.append({
-                            'type': pattern_type,
-                            'name': pattern_name,
-                            'confidence': confidence,
-                            'start_position': match.start(),
-                            'end_position': match.end(),
-                            'matched_text': match.group(0)[:200] + '...' if len(match.group(0)) > 200 else match.group(0),
-                            'description': self._get_pattern_description(pattern_type, pattern_name)
-                        })
-        
-        logger.info(f"🔍 [AGENTIC RAG] Recognized {len(patterns)} patterns")
+        logger.info(f"🔍 [AGENTIC RAG] Recognized {len(patterns)} patterns "
+                    f"({analysis['parser']}, {analysis['analysis_time_ms']:.1f}ms)")
         return patterns
     
-    def _calculate_pattern_confidence(self, match, code: str, pattern_type: str, pattern_name: str) -> float:
-        """
-        Calculate confidence score for pattern detection
-        """
-        base_confidence = 0.7
-        
-        # Adjust confidence based on context
-        matched_text = match.group(0).lower()
-        
-        # Boost confidence for specific indicators
-        if pattern_type == 'DESIGN_PATTERN':
-            if pattern_name == 'singleton' and 'instance' in matched_text:
-                base_confidence += 0.2
-            elif pattern_name == 'factory' and 'create' in matched_text:
-                base_confidence += 0.15
-            elif pattern_name == 'observer' and 'notify' in matched_text:
-                base_confidence += 0.15
-        
-        elif pattern_type == 'ARCHITECTURAL_PATTERN':
-            if pattern_name in matched_text:
-                base_confidence += 0.1
-        
-        elif pattern_type == 'CODE_SMELL':
-            # Code smells have lower base confidence
-            base_confidence = 0.6
-            if pattern_name == 'long_method':
-                lines = len(matched_text.split('\n'))
-                if lines > 30:
-                    base_confidence += 0.2
-        
-        return min(base_confidence, 1.0)
-    
     def _get_pattern_description(self, pattern_type: str, pattern_name: str) -> str:
         """
         Get description for detected pattern
@@ -384,7 +421,8 @@ class AgenticRAGStrategy:
             result = await self.js_bridge.call_js_component(
                 'knowledge_graph',
                 'extractEntities',
-                ast_args
+                ast_args,
+                deadline=context.get('deadline')
             )
             
             logger.info(f"🌳 [AGENTIC RAG] AST analysis completed: {len(result)} entities")
@@ -409,31 +447,34 @@ class AgenticRAGStrategy:
         """
         self.metrics['code_summarization_calls'] += 1
         
-        summaries = []
+        # Blocks are summarized independently, at most summary_concurrency at a time
+        semaphore = asyncio.Semaphore(self.config['summary_concurrency'])
         
-        for i, block in enumerate(code_blocks):
-            try:
-                # Generate summary for each code block
-                summary = await self._call_llm_for_summary(block['content'], context)
-                
-                summaries.append({
-                    'block_index': i,
-                    'summary': summary,
-                    'code_type': block['type'],
-                    'complexity': block['complexity'],
-                    'length': block['length']
-                })
-                
-            except Exception as error:
-                logger.warning(f"⚠️ [AGENTIC RAG] Summary generation failed for block {i}: {error}")
-                summaries.append({
-                    'block_index': i,
-                    'summary': f"Code block ({block['type']}) - {block['complexity']} complexity",
-                    'code_type': block['type'],
-                    'complexity': block['complexity'],
-                    'length': block['length'],
-                    'error': str(error)
-                })
+        async def summarize_block(i: int, block: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    summary = await self._call_llm_for_summary(block['content'], context)
+                    
+                    return {
+                        'block_index': i,
+                        'summary': summary,
+                        'code_type': block['type'],
+                        'complexity': block['complexity'],
+                        'length': block['length']
+                    }
+                    
+                except Exception as error:
+                    logger.warning(f"⚠️ [AGENTIC RAG] Summary generation failed for block {i}: {error}")
+                    return {
+                        'block_index': i,
+                        'summary': f"Code block ({block['type']}) - {block['complexity']} complexity",
+                        'code_type': block['type'],
+                        'complexity': block['complexity'],
+                        'length': block['length'],
+                        'error': str(error)
+                    }
+        
+        summaries = list(await asyncio.gather(*(summarize_block(i, block) for i, block in enumerate(code_blocks))))
         
         logger.info(f"📄 [AGENTIC RAG] Generated {len(summaries)} code summaries")
         return summaries
@@ -505,7 +546,8 @@ class AgenticRAGStrategy:
             result = await self.js_bridge.call_js_component(
                 'knowledge_graph',
                 'buildKnowledgeGraph',
-                kg_args
+                kg_args,
+                deadline=context.get('deadline')
             )
             
             return {
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+
+"""
+CODE PATTERN ANALYSIS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Linear-time structural analysis behind AgenticRAGStrategy pattern recognition,
+replacing the DOTALL regexes whose nested lazy quantifiers backtracked
+catastrophically on large files.
+
+Features:
+- Python sources parsed with the ast module: exact method length, class size,
+  method counts, decorator use, duplicate bodies and magic numbers
+- Class/function symbol definitions with their enclosing scope
+- Other languages (and Python that does not parse) go through a single-pass
+  tokenizer with a brace/indentation scanner for definition extents
+- Naming patterns for Strategy/Repository/Service/Adapter/Facade and MVC roles
+- Oversized input guard: analysis stops at max_chars on a line boundary
+"""
+
+import ast
+import hashlib
+import os
+import re
+import time
+import warnings
+import logging
+from bisect import bisect_right
+from typing import Dict, Any, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Every alternative consumes at least one character and never rescans input:
+# unterminated comments/strings run to the end of the input instead of failing
+_TOKEN_PATTERN = re.compile(r'''
+    (?P<comment>//[^\n]*|\#[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<string>"""[\s\S]*?(?:"""|\Z)|\'\'\'[\s\S]*?(?:\'\'\'|\Z)
+      |"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?|`(?:[^`\\]|\\.)*`?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<number>\d[\w.]*)
+  | (?P<punct>[{}()\[\];:=@,])
+  | (?P<newline>\n)
+''', re.VERBOSE)
+
+# Every pattern the analyzers can report, by type
+PATTERN_NAMES = {
+    'DESIGN_PATTERN': ('singleton', 'factory', 'observer', 'decorator', 'strategy'),
+    'ARCHITECTURAL_PATTERN': ('mvc', 'repository', 'service', 'adapter', 'facade'),
+    'CODE_SMELL': ('long_method', 'large_class', 'duplicate_code', 'magic_numbers', 'god_object')
+}
+
+_DEFINITION_KEYWORDS = {'def', 'function', 'func', 'fn', 'fun', 'sub'}
+_CLASS_KEYWORDS = {'class', 'interface', 'struct', 'trait'}
+_CONTROL_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'return', 'function', 'with', 'elif', 'else'}
+
+# Class-name suffixes -> (pattern type, pattern name)
+_NAMING_PATTERNS = [
+    (re.compile(r'Strategy'), 'DESIGN_PATTERN', 'strategy'),
+    (re.compile(r'Repository'), 'ARCHITECTURAL_PATTERN', 'repository'),
+    (re.compile(r'Service'), 'ARCHITECTURAL_PATTERN', 'service'),
+    (re.compile(r'Adapter'), 'ARCHITECTURAL_PATTERN', 'adapter'),
+    (re.compile(r'Facade'), 'ARCHITECTURAL_PATTERN', 'facade'),
+    (re.compile(r'(?:Model|View|Controller)(?:[A-Z_]|$)'), 'ARCHITECTURAL_PATTERN', 'mvc')
+]
+_FACTORY_NAME = re.compile(r'^_*(?:create|make|build)', re.IGNORECASE)
+_OBSERVER_NAME = re.compile(r'subscribe|notify|observer|listener', re.IGNORECASE)
+_SINGLETON_METHODS = {'__new__', 'getInstance', 'get_instance', 'instance'}
+
+
+class _SourceMap:
+    """Line/column -> character offsets for the original (possibly indented) source"""
+
+    def __init__(self, code: str, margin: int = 0):
+        self.code = code
+        self.margin = margin
+        self.line_starts = [0] + [match.end() for match in re.finditer('\n', code)]
+
+    def offset(self, lineno: int, col: int = 0) -> int:
+        line_index = min(max(lineno - 1, 0), len(self.line_starts) - 1)
+        start = self.line_starts[line_index]
+        end = self.line_starts[line_index + 1] if line_index + 1 < len(self.line_starts) else len(self.code)
+        line = self.code[start:end]
+        if not line.strip():
+            return start
+        shifted = line[self.margin:]
+        # ast columns are UTF-8 byte offsets
+        if not shifted.isascii():
+            col = len(shifted.encode('utf-8')[:col].decode('utf-8', errors='ignore'))
+        return min(start + self.margin + col, end)
+
+    def line_of(self, offset: int) -> int:
+        return bisect_right(self.line_starts, offset)
+
+
+def _dedent(code: str) -> Tuple[str, int]:
+    """Strip the common leading whitespace (indented snippets); returns (text, margin)"""
+    indents = [line[:len(line) - len(line.lstrip(' \t'))] for line in code.split('\n') if line.strip()]
+    margin = os.path.commonprefix(indents) if indents else ''
+    if not margin:
+        return code, 0
+    return '\n'.join(line[len(margin):] if line.strip() else '' for line in code.split('\n')), len(margin)
+
+
+def _finding(pattern_type: str, name: str, confidence: float, source_map: _SourceMap, start: int, end: int,
+             detection: str, **details) -> Dict[str, Any]:
+    matched_text = source_map.code[start:end]
+    return {
+        'type': pattern_type,
+        'name': name,
+        'confidence': round(min(confidence, 1.0), 3),
+        'start_position': start,
+        'end_position': end,
+        'matched_text': matched_text[:200] + '...' if len(matched_text) > 200 else matched_text,
+        'detection': detection,
+        **details
+    }
+
+
+def _smell_confidence(measure: int, threshold: int) -> float:
+    """0.75 just over the threshold, rising to 1.0 at twice the threshold"""
+    return 0.75 + 0.25 * min(1.0, (measure - threshold) / max(threshold, 1))
+
+
+class PythonASTAnalyzer(ast.NodeVisitor):
+    """
+    Single ast walk collecting pattern findings for Python sources
+    """
+
+    def __init__(self, source_map: _SourceMap, limits: Dict[str, int]):
+        self.source_map = source_map
+        self.limits = limits
+        self.findings: List[Dict[str, Any]] = []
+        self.symbols: List[Dict[str, Any]] = []
+        self.scope: List[str] = []
+        self.body_hashes: Dict[str, str] = {}
+        self.named_constant_depth = 0
+
+    def _span(self, node) -> Tuple[int, int]:
+        start = self.source_map.offset(node.lineno, node.col_offset)
+        end = self.source_map.offset(node.end_lineno, node.end_col_offset or 0)
+        return start, max(end, start)
+
+    def _add(self, pattern_type: str, name: str, confidence: float, node, **details):
+        start, end = self._span(node)
+        self.findings.append(_finding(pattern_type, name, confidence, self.source_map, start, end, 'python_ast', **details))
+
+    def _visit_scope(self, node, kind: str):
+        start, end = self._span(node)
+        self.symbols.append({'name': node.name, 'kind': kind, 'start_position': start, 'end_position': end,
+                             'parent': '.'.join(self.scope) or None})
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        methods = [item for item in node.body if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))]
+        method_names = {method.name for method in methods}
+        lines = node.end_lineno - node.lineno + 1
+
+        for pattern, pattern_type, pattern_name in _NAMING_PATTERNS:
+            if pattern.search(node.name):
+                self._add(pattern_type, pattern_name, 0.8, node, symbol=node.name)
+
+        if method_names & _SINGLETON_METHODS:
+            self._add('DESIGN_PATTERN', 'singleton', 0.9, node, symbol=node.name)
+
+        if lines > self.limits['large_class_lines']:
+            self._add('CODE_SMELL', 'large_class', _smell_confidence(lines, self.limits['large_class_lines']), node,
+                      symbol=node.name, lines=lines)
+        if len(methods) > self.limits['god_object_methods']:
+            self._add('CODE_SMELL', 'god_object', _smell_confidence(len(methods), self.limits['god_object_methods']), node,
+                      symbol=node.name, methods=len(methods))
+
+        self._visit_decorators(node)
+        self._visit_scope(node, 'class')
+
+    def _visit_function(self, node):
+        lines = node.end_lineno - node.lineno + 1
+
+        if _FACTORY_NAME.match(node.name):
+            self._add('DESIGN_PATTERN', 'factory', 0.85, node, symbol=node.name)
+        if _OBSERVER_NAME.search(node.name):
+            self._add('DESIGN_PATTERN', 'observer', 0.85 if 'notify' in node.name.lower() else 0.7, node, symbol=node.name)
+
+        if lines > self.limits['long_method_lines']:
+            self._add('CODE_SMELL', 'long_method', _smell_confidence(lines, self.limits['long_method_lines']), node,
+                      symbol=node.name, lines=lines)
+
+        # Structurally identical bodies (names included) of non-trivial functions
+        if len(node.body) >= 3:
+            body_hash = hashlib.blake2b(
+                ''.join(ast.dump(statement) for statement in node.body).encode('utf-8'), digest_size=8
+            ).hexdigest()
+            original = self.body_hashes.setdefault(body_hash, node.name)
+            if original != node.name:
+                self._add('CODE_SMELL', 'duplicate_code', 0.8, node, symbol=node.name, duplicate_of=original)
+
+        self._visit_decorators(node)
+        self._visit_scope(node, 'function')
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def _visit_decorators(self, node):
+        if node.decorator_list:
+            names = [ast.unparse(decorator).split('(')[0] for decorator in node.decorator_list]
+            self._add('DESIGN_PATTERN', 'decorator', 0.75, node.decorator_list[0], symbol=node.name, decorators=names)
+
+    def visit_Assign(self, node: ast.Assign):
+        # UPPER_CASE = 42 is how a magic number is meant to be named
+        named = all(isinstance(target, ast.Name) and target.id.isupper() for target in node.targets)
+        self.named_constant_depth += named
+        self.generic_visit(node)
+        self.named_constant_depth -= named
+
+    def visit_Constant(self, node: ast.Constant):
+        value = node.value
+        if self.named_constant_depth or isinstance(value, bool) or not isinstance(value, (int, float)):
+            return
+        if (isinstance(value, float) and value not in (0.0, 0.5, 1.0)) or (isinstance(value, int) and abs(value) >= 10):
+            self._add('CODE_SMELL', 'magic_numbers', 0.7, node, value=value)
+
+
+class TokenScanAnalyzer:
+    """
+    Language-agnostic single-pass scanner over a token stream
+
+    Definitions are found by keyword (class/function/def/...) or by the
+    `name(...) {` method shorthand inside class bodies; their extent comes from
+    brace matching, or from indentation when the header ends with ':'.
+    """
+
+    def __init__(self, source_map: _SourceMap, limits: Dict[str, int]):
+        self.source_map = source_map
+        self.limits = limits
+        self.symbols: List[Dict[str, Any]] = []
+
+    def analyze(self) -> List[Dict[str, Any]]:
+        code = self.source_map.code
+        tokens = [(match.lastgroup, match.group(), match.start(), match.end())
+                  for match in _TOKEN_PATTERN.finditer(code) if match.lastgroup != 'comment']
+        definitions = []  # [kind, name, start, body_start token index, end offset, methods]
+        open_braces: List[Optional[list]] = []  # definition whose body a brace opens, else None
+        class_stack: List[list] = []
+        pending: Optional[list] = None
+        findings = []
+        body_tokens: Dict[int, List[str]] = {}
+
+        for index, (kind, text, start, end) in enumerate(tokens):
+            if kind == 'name':
+                previous = tokens[index - 1][1] if index else ''
+                if text in _CLASS_KEYWORDS or text in _DEFINITION_KEYWORDS:
+                    following = tokens[index + 1] if index + 1 < len(tokens) else None
+                    if following and following[0] == 'name':
+                        pending = ['class' if text in _CLASS_KEYWORDS else 'function', following[1], start, None, None, 0]
+                elif (class_stack and len(open_braces) and open_braces[-1] is class_stack[-1]
+                      and text not in _CONTROL_KEYWORDS and previous in ('{', '}', ';', '\n', 'async', 'static', '')
+                      and index + 1 < len(tokens) and tokens[index + 1][1] == '('):
+                    # Method shorthand directly inside a class body
+                    pending = ['function', text, start, None, None, 0]
+            elif kind == 'punct' and text == '@':
+                following = tokens[index + 1] if index + 1 < len(tokens) else None
+                if following and following[0] == 'name':
+                    findings.append(_finding('DESIGN_PATTERN', 'decorator', 0.75, self.source_map, start, following[3],
+                                             'token_scan', decorators=[following[1]]))
+            elif kind == 'punct' and text == '{':
+                if pending is not None:
+                    pending[3] = index
+                    definitions.append(pending)
+                    if pending[0] == 'class':
+                        class_stack.append(pending)
+                    elif class_stack and open_braces and open_braces[-1] is class_stack[-1]:
+                        class_stack[-1][5] += 1
+                open_braces.append(pending)
+                pending = None
+            elif kind == 'punct' and text == '}':
+                if open_braces:
+                    closed = open_braces.pop()
+                    if closed is not None:
+                        closed[4] = end
+                        if class_stack and class_stack[-1] is closed:
+                            class_stack.pop()
+            elif (kind == 'punct' and text == ':' and pending is not None
+                  and (index + 1 == len(tokens) or tokens[index + 1][0] == 'newline')):
+                # Header ending in ':' opens an indentation-delimited body (Python that failed to parse)
+                pending[3] = index
+                pending[4] = self._indented_end(start)
+                definitions.append(pending)
+                pending = None
+            elif kind == 'punct' and text == ';' and pending is not None and not open_braces:
+                pending = None  # declaration without a body
+
+        for definition in definitions:
+            if definition[4] is None:
+                definition[4] = len(code)
+
+        # Method counts for indentation-delimited classes (nested functions included)
+        function_starts = sorted(definition[2] for definition in definitions if definition[0] == 'function')
+        for definition in definitions:
+            if definition[0] == 'class' and definition[5] == 0:
+                definition[5] = bisect_right(function_starts, definition[4]) - bisect_right(function_starts, definition[2])
+
+        # Definitions are collected in source order; enclosing ones are still on the stack
+        enclosing: List[list] = []
+        for definition in definitions:
+            while enclosing and enclosing[-1][4] < definition[2]:
+                enclosing.pop()
+            self.symbols.append({'name': definition[1], 'kind': definition[0], 'start_position': definition[2],
+                                 'end_position': definition[4], 'parent': '.'.join(d[1] for d in enclosing) or None})
+            enclosing.append(definition)
+
+        for kind, name, start, body_index, end, methods in definitions:
+            lines = self.source_map.line_of(end) - self.source_map.line_of(start) + 1
+            if kind == 'class':
+                for pattern, pattern_type, pattern_name in _NAMING_PATTERNS:
+                    if pattern.search(name):
+                        findings.append(_finding(pattern_type, pattern_name, 0.8, self.source_map, start, end,
+                                                 'token_scan', symbol=name))
+                if lines > self.limits['large_class_lines']:
+                    findings.append(_finding('CODE_SMELL', 'large_class', _smell_confidence(lines, self.limits['large_class_lines']),
+                                             self.source_map, start, end, 'token_scan', symbol=name, lines=lines))
+                if methods > self.limits['god_object_methods']:
+                    findings.append(_finding('CODE_SMELL', 'god_object', _smell_confidence(methods, self.limits['god_object_methods']),
+                                             self.source_map, start, end, 'token_scan', symbol=name, methods=methods))
+            else:
+                if name in _SINGLETON_METHODS:
+                    findings.append(_finding('DESIGN_PATTERN', 'singleton', 0.9, self.source_map, start, end,
+                                             'token_scan', symbol=name))
+                if _FACTORY_NAME.match(name):
+                    findings.append(_finding('DESIGN_PATTERN', 'factory', 0.85, self.source_map, start, end,
+                                             'token_scan', symbol=name))
+                if _OBSERVER_NAME.search(name):
+                    findings.append(_finding('DESIGN_PATTERN', 'observer', 0.85 if 'notify' in name.lower() else 0.7,
+                                             self.source_map, start, end, 'token_scan', symbol=name))
+                if lines > self.limits['long_method_lines']:
+                    findings.append(_finding('CODE_SMELL', 'long_method', _smell_confidence(lines, self.limits['long_method_lines']),
+                                             self.source_map, start, end, 'token_scan', symbol=name, lines=lines))
+
+        findings.extend(self._duplicates_and_numbers(tokens, definitions))
+        return findings
+
+    def _indented_end(self, header_offset: int) -> int:
+        """End offset of an indentation-delimited block starting after the header line"""
+        code = self.source_map.code
+        line_starts = self.source_map.line_starts
+        header_line = self.source_map.line_of(header_offset) - 1
+        header = code[line_starts[header_line]:]
+        indent = len(header) - len(header.lstrip(' \t'))
+        end = len(code)
+        for line_index in range(header_line + 1, len(line_starts)):
+            line_start = line_starts[line_index]
+            line_end = line_starts[line_index + 1] - 1 if line_index + 1 < len(line_starts) else len(code)
+            line = code[line_start:line_end]
+            if line.strip() and len(line) - len(line.lstrip(' \t')) <= indent:
+                end = line_start - 1
+                break
+        return max(end, header_offset)
+
+    def _duplicates_and_numbers(self, tokens: List[Tuple[str, str, int, int]], definitions: List[list]) -> List[Dict[str, Any]]:
+        findings = []
+        starts = [token[2] for token in tokens]
+
+        seen_bodies: Dict[str, str] = {}
+        for kind, name, start, body_index, end, _ in definitions:
+            if kind != 'function' or body_index is None:
+                continue
+            last = bisect_right(starts, end)
+            body = [text for token_kind, text, _, _ in tokens[body_index + 1:last] if token_kind != 'newline']
+            if len(body) < 12:
+                continue
+            body_hash = hashlib.blake2b('\0'.join(body).encode('utf-8'), digest_size=8).hexdigest()
+            original = seen_bodies.setdefault(body_hash, name)
+            if original != name:
+                findings.append(_finding('CODE_SMELL', 'duplicate_code', 0.8, self.source_map, start, end,
+                                         'token_scan', symbol=name, duplicate_of=original))
+
+        for index, (kind, text, start, end) in enumerate(tokens):
+            if kind != 'number':
+                continue
+            # NAME = 42 / const NAME = 42 names the constant
+            if index >= 2 and tokens[index - 1][1] == '=' and tokens[index - 2][1].isupper():
+                continue
+            try:
+                value = float(text) if '.' in text else int(text, 0)
+            except ValueError:
+                continue
+            if (isinstance(value, float) and value not in (0.0, 0.5, 1.0)) or (isinstance(value, int) and abs(value) >= 10):
+                findings.append(_finding('CODE_SMELL', 'magic_numbers', 0.7, self.source_map, start, end,
+                                         'token_scan', value=value))
+        return findings
+
+
+class CodeAnalyzer:
+    """
+    Linear-time code pattern analysis: ast for Python, token scan otherwise
+    """
+
+    def __init__(self, long_method_lines: int = 20, large_class_lines: int = 50,
+                 god_object_methods: int = 10, max_chars: int = 1_000_000):
+        if max_chars <= 0:
+            raise ValueError("max_chars must be positive")
+        self.limits = {
+            'long_method_lines': long_method_lines,
+            'large_class_lines': large_class_lines,
+            'god_object_methods': god_object_methods
+        }
+        self.max_chars = max_chars
+        self.metrics = {
+            'analyses': 0,
+            'ast_analyses': 0,
+            'token_scans': 0,
+            'truncated_inputs': 0,
+            'total_analysis_time_ms': 0.0
+        }
+
+    def analyze(self, code: str, language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Analyze code for design patterns, architectural patterns and code smells
+
+        Args:
+            code: Source text (a whole file or an indented snippet)
+            language: Known language; 'python' or None tries the ast parser first
+
+        Returns:
+            {'patterns': [...], 'symbols': [{'name', 'kind', 'start_position',
+            'end_position', 'parent'}], 'parser': 'python_ast' | 'token_scan',
+            'truncated': bool, 'analysis_time_ms': float}
+        """
+        start_time = time.time()
+        self.metrics['analyses'] += 1
+
+        truncated = len(code) > self.max_chars
+        if truncated:
+            # Oversized input guard: analyse a prefix ending on a line boundary
+            cut = code.rfind('\n', 0, self.max_chars)
+            code = code[:cut if cut > 0 else self.max_chars]
+            self.metrics['truncated_inputs'] += 1
+            logger.warning(f"⚠️ [CODE ANALYSIS] Input over {self.max_chars} chars, analysing the first {len(code)}")
+
+        patterns = None
+        symbols: List[Dict[str, Any]] = []
+        parser = 'token_scan'
+        if language in (None, 'python'):
+            dedented, margin = _dedent(code)
+            try:
+                with warnings.catch_warnings():
+                    # Invalid escape sequences in the analysed source are not our concern
+                    warnings.simplefilter('ignore', SyntaxWarning)
+                    tree = ast.parse(dedented)
+                visitor = PythonASTAnalyzer(_SourceMap(code, margin), self.limits)
+                visitor.visit(tree)
+                patterns = visitor.findings
+                symbols = visitor.symbols
+                parser = 'python_ast'
+                self.metrics['ast_analyses'] += 1
+            except (SyntaxError, ValueError, RecursionError):
+                patterns = None
+
+        if patterns is None:
+            scanner = TokenScanAnalyzer(_SourceMap(code), self.limits)
+            patterns = scanner.analyze()
+            symbols = scanner.symbols
+            self.metrics['token_scans'] += 1
+
+        patterns.sort(key=lambda pattern: (pattern['start_position'], pattern['type'], pattern['name']))
+        analysis_time = (time.time() - start_time) * 1000
+        self.metrics['total_analysis_time_ms'] += analysis_time
+
+        return {
+            'patterns': patterns,
+            'symbols': symbols,
+            'parser': parser,
+            'truncated': truncated,
+            'analysis_time_ms': analysis_time
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return dict(self.metrics)
+
+# Export main classes
+__all__ = ['CodeAnalyzer', 'PythonASTAnalyzer', 'TokenScanAnalyzer', 'PATTERN_NAMES']
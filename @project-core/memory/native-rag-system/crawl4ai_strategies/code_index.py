@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+
+"""
+CODE PATTERN INDEX V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Repository-wide index of code patterns, code smells and symbol definitions
+for @project-core (automation/, memory/native-rag-system/, scripts/), so code
+analysis consultations are index lookups instead of per-query analysis.
+
+Features:
+- Manifest of path -> (mtime, size, content hash): unchanged files are skipped
+  on the stat alone, touched-but-identical files after a hash check
+- Changed files analysed with CodeAnalyzer in a worker process pool
+- SQLite index (WAL) of patterns, smells and symbols with line ranges
+- Queries by pattern type/name, symbol name prefix, file and free-text lookup
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import logging
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+import sys
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawl4ai_strategies.code_analysis import CodeAnalyzer, PATTERN_NAMES
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_LANGUAGES = {
+    '.py': 'python',
+    '.js': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript', '.jsx': 'javascript',
+    '.ts': 'typescript', '.tsx': 'typescript',
+    '.ps1': 'powershell', '.psm1': 'powershell'
+}
+_QUERY_TOKEN = re.compile(r'[A-Za-z_][A-Za-z0-9_]{2,}')
+# Query words never looked up as symbol names
+_QUERY_STOPWORDS = {
+    'where', 'which', 'what', 'show', 'find', 'list', 'with', 'from', 'that', 'this', 'there', 'does', 'have',
+    'code', 'class', 'classes', 'method', 'methods', 'function', 'functions', 'pattern', 'patterns', 'smell', 'smells'
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    language TEXT NOT NULL,
+    parser TEXT,
+    truncated INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS patterns (
+    path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL,
+    symbol TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_patterns_name ON patterns(type, name);
+CREATE INDEX IF NOT EXISTS idx_patterns_path ON patterns(path);
+CREATE TABLE IF NOT EXISTS symbols (
+    path TEXT NOT NULL REFERENCES files(path) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    lower_name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    parent TEXT,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(lower_name);
+CREATE INDEX IF NOT EXISTS idx_symbols_path ON symbols(path);
+"""
+
+
+def _analyze_files(config: Dict[str, Any], jobs: List[Tuple[str, str, Optional[str]]]) -> List[Dict[str, Any]]:
+    """
+    Read, hash and analyse (path, absolute path, previous hash) jobs
+
+    Files whose hash matches the previous one come back with unchanged=True
+    and no analysis; positions are converted to 1-based line numbers.
+    """
+    analyzer = CodeAnalyzer(
+        long_method_lines=config['long_method_lines'],
+        large_class_lines=config['large_class_lines'],
+        god_object_methods=config['god_object_methods'],
+        max_chars=config['max_analysis_chars']
+    )
+    results = []
+
+    for path, absolute_path, previous_hash in jobs:
+        try:
+            file_path = Path(absolute_path)
+            stat = file_path.stat()
+            data = file_path.read_bytes()
+        except OSError as error:
+            results.append({'path': path, 'error': str(error), 'missing': True})
+            continue
+
+        content_hash = hashlib.sha256(data).hexdigest()
+        result = {'path': path, 'hash': content_hash, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if content_hash == previous_hash:
+            results.append({**result, 'unchanged': True})
+            continue
+
+        language = _LANGUAGES.get(file_path.suffix.lower(), 'unknown')
+        result.update({'language': language, 'patterns': [], 'symbols': []})
+        try:
+            code = data.decode('utf-8', errors='replace')
+            analysis = analyzer.analyze(code, 'python' if language == 'python' else language)
+        except Exception as error:
+            results.append({**result, 'error': str(error)})
+            continue
+
+        line_starts = [0] + [match.end() for match in re.finditer('\n', code)]
+
+        def line_of(offset: int) -> int:
+            return bisect_right(line_starts, offset)
+
+        for pattern in analysis['patterns']:
+            details = {key: value for key, value in pattern.items() if key not in (
+                'type', 'name', 'confidence', 'start_position', 'end_position', 'matched_text', 'symbol', 'description'
+            )}
+            result['patterns'].append((
+                pattern['type'], pattern['name'], pattern['confidence'],
+                line_of(pattern['start_position']), line_of(max(pattern['end_position'] - 1, pattern['start_position'])),
+                pattern.get('symbol'), json.dumps(details, default=str)
+            ))
+        for symbol in analysis['symbols']:
+            result['symbols'].append((
+                symbol['name'], symbol['kind'], symbol['parent'],
+                line_of(symbol['start_position']), line_of(max(symbol['end_position'] - 1, symbol['start_position']))
+            ))
+        result['parser'] = analysis['parser']
+        result['truncated'] = analysis['truncated']
+        results.append(result)
+
+    return results
+
+
+class CodePatternIndex:
+    """
+    Incremental, queryable index of code patterns and symbols across the project
+    """
+
+    def __init__(self, project_root: Optional[Path] = None, index_path: Optional[Path] = None):
+        self.config = {
+            'project_root': Path(project_root) if project_root else Path(__file__).parent.parent.parent.parent,
+            'roots': ['automation', 'memory/native-rag-system', 'scripts'],
+            'extensions': sorted(_LANGUAGES),
+            'exclude_dirs': ['node_modules', '__pycache__', 'cache', 'backups', 'archives', '.git', 'generated-tests'],
+            'max_file_bytes': 2_000_000,  # Larger files are not indexed
+            'worker_processes': min(4, os.cpu_count() or 1),
+            'files_per_task': 16,
+            'long_method_lines': 20,
+            'large_class_lines': 50,
+            'god_object_methods': 10,
+            'max_analysis_chars': 1_000_000,
+            'refresh_interval': 300  # Seconds between automatic refreshes on lookup
+        }
+
+        self.index_path = Path(index_path) if index_path else (
+            Path(__file__).parent.parent / 'cache' / 'code-index' / 'code_index.db'
+        )
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(_SCHEMA)
+
+        self._worker_pool: Optional[ProcessPoolExecutor] = None
+        self._worker_pool_disabled = False
+        self.last_refresh = None
+
+        self.metrics = {
+            'refreshes': 0,
+            'files_scanned': 0,
+            'files_skipped': 0,
+            'files_rehashed': 0,
+            'files_analyzed': 0,
+            'files_removed': 0,
+            'analysis_errors': 0,
+            'lookups': 0,
+            'average_refresh_time': 0
+        }
+
+        logger.info(f"✅ [CODE INDEX] Code pattern index initialized ({self.index_path.name})")
+
+    # WALK
+
+    def iter_source_files(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (project-relative path, absolute path) for every indexable file"""
+        project_root = self.config['project_root']
+        excluded = set(self.config['exclude_dirs'])
+        extensions = set(self.config['extensions'])
+
+        for root in self.config['roots']:
+            root_path = project_root / root
+            if not root_path.is_dir():
+                continue
+            for directory, dirnames, filenames in os.walk(root_path):
+                dirnames[:] = sorted(d for d in dirnames if d not in excluded and not d.startswith('.'))
+                for filename in sorted(filenames):
+                    if os.path.splitext(filename)[1].lower() in extensions:
+                        path = Path(directory) / filename
+                        yield path.relative_to(project_root).as_posix(), path
+
+    # INDEXING
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Bring the index up to date with the working tree
+
+        Returns:
+            Run summary
+        """
+        start_time = time.time()
+        self.metrics['refreshes'] += 1
+        summary = {'files_scanned': 0, 'files_skipped': 0, 'files_rehashed': 0, 'files_analyzed': 0,
+                   'files_removed': 0, 'analysis_errors': 0}
+
+        with self._lock:
+            manifest = {row['path']: (row['mtime_ns'], row['size'], row['hash'])
+                        for row in self._conn.execute('SELECT path, mtime_ns, size, hash FROM files')}
+
+        jobs = []
+        seen = set()
+        for path, absolute_path in self.iter_source_files():
+            try:
+                stat = absolute_path.stat()
+            except OSError:
+                continue
+            if stat.st_size > self.config['max_file_bytes']:
+                continue
+            seen.add(path)
+            summary['files_scanned'] += 1
+            previous = manifest.get(path)
+            # Fast path: same size and mtime, no read needed
+            if previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+                summary['files_skipped'] += 1
+                continue
+            jobs.append((path, str(absolute_path), previous[2] if previous else None))
+
+        if jobs:
+            for results in await self._run_jobs(jobs):
+                self._store_results(results, summary)
+
+        removed = [path for path in manifest if path not in seen]
+        if removed:
+            with self._lock, self._conn:
+                self._conn.executemany('DELETE FROM files WHERE path = ?', [(path,) for path in removed])
+            summary['files_removed'] = len(removed)
+
+        for key, value in summary.items():
+            self.metrics[key] += value
+        self.last_refresh = time.time()
+
+        refresh_time = (time.time() - start_time) * 1000
+        summary['refresh_time_ms'] = refresh_time
+        self.metrics['average_refresh_time'] = (
+            refresh_time if self.metrics['average_refresh_time'] == 0
+            else (self.metrics['average_refresh_time'] + refresh_time) / 2
+        )
+
+        logger.info(f"✅ [CODE INDEX] {summary['files_analyzed']} files analysed, {summary['files_skipped']} skipped, "
+                    f"{summary['files_removed']} removed ({refresh_time:.1f}ms)")
+        return summary
+
+    async def ensure_fresh(self) -> Optional[Dict[str, Any]]:
+        """Refresh when the index was never built or refresh_interval has passed"""
+        if self.last_refresh is None or time.time() - self.last_refresh >= self.config['refresh_interval']:
+            return await self.refresh()
+        return None
+
+    def _get_worker_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily create the analysis worker pool; None means analyse in a thread"""
+        if self._worker_pool_disabled or self.config['worker_processes'] <= 1:
+            return None
+
+        if self._worker_pool is None:
+            try:
+                self._worker_pool = ProcessPoolExecutor(max_workers=self.config['worker_processes'])
+            except (OSError, NotImplementedError) as error:
+                logger.warning(f"⚠️ [CODE INDEX] Worker pool unavailable, analysing inline: {error}")
+                self._worker_pool_disabled = True
+                return None
+
+        return self._worker_pool
+
+    async def _run_jobs(self, jobs: List[Tuple[str, str, Optional[str]]]) -> List[List[Dict[str, Any]]]:
+        loop = asyncio.get_running_loop()
+        pool = self._get_worker_pool()
+        task_size = max(1, self.config['files_per_task'])
+        batches = [jobs[i:i + task_size] for i in range(0, len(jobs), task_size)]
+
+        if pool is None:
+            return [await loop.run_in_executor(None, _analyze_files, self.config, batch) for batch in batches]
+
+        try:
+            return list(await asyncio.gather(*(
+                loop.run_in_executor(pool, _analyze_files, self.config, batch) for batch in batches
+            )))
+        except BrokenProcessPool as error:
+            logger.warning(f"⚠️ [CODE INDEX] Worker pool failed, analysing inline: {error}")
+            self._worker_pool = None
+            self._worker_pool_disabled = True
+            return [await loop.run_in_executor(None, _analyze_files, self.config, batch) for batch in batches]
+
+    def _store_results(self, results: List[Dict[str, Any]], summary: Dict[str, Any]):
+        now = time.time()
+        with self._lock, self._conn:
+            for result in results:
+                path = result['path']
+                if result.get('missing'):
+                    continue
+                if result.get('unchanged'):
+                    # Touched but identical: only the stat in the manifest moves
+                    self._conn.execute('UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?',
+                                       (result['mtime_ns'], result['size'], path))
+                    summary['files_rehashed'] += 1
+                    continue
+
+                self._conn.execute('DELETE FROM files WHERE path = ?', (path,))
+                self._conn.execute(
+                    'INSERT INTO files (path, mtime_ns, size, hash, language, parser, truncated, error, indexed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (path, result['mtime_ns'], result['size'], result['hash'], result['language'],
+                     result.get('parser'), int(result.get('truncated', False)), result.get('error'), now)
+                )
+                if 'error' in result:
+                    summary['analysis_errors'] += 1
+                    logger.warning(f"⚠️ [CODE INDEX] Analysis failed for {path}: {result['error']}")
+                    continue
+                self._conn.executemany(
+                    'INSERT INTO patterns (path, type, name, confidence, start_line, end_line, symbol, details) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(path, *pattern) for pattern in result['patterns']]
+                )
+                self._conn.executemany(
+                    'INSERT INTO symbols (path, name, lower_name, kind, parent, start_line, end_line) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(path, name, name.lower(), kind, parent, start_line, end_line)
+                     for name, kind, parent, start_line, end_line in result['symbols']]
+                )
+                summary['files_analyzed'] += 1
+
+    # QUERIES
+
+    @staticmethod
+    def _pattern_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'path': row['path'],
+            'type': row['type'],
+            'name': row['name'],
+            'confidence': row['confidence'],
+            'start_line': row['start_line'],
+            'end_line': row['end_line'],
+            'symbol': row['symbol'],
+            'details': json.loads(row['details']) if row['details'] else {}
+        }
+
+    def find_patterns(self, pattern_type: Optional[str] = None, name: Optional[str] = None,
+                      path_prefix: Optional[str] = None, symbol: Optional[str] = None,
+                      line_range: Optional[Tuple[int, int]] = None,
+                      min_confidence: float = 0.0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Patterns and smells, most confident first (line_range: starting within these lines)"""
+        clauses, params = ['confidence >= ?'], [min_confidence]
+        if pattern_type:
+            clauses.append('type = ?')
+            params.append(pattern_type)
+        if name:
+            clauses.append('name = ?')
+            params.append(name)
+        if path_prefix:
+            clauses.append('path >= ? AND path < ?')
+            params.extend([path_prefix, path_prefix + '\uffff'])
+        if symbol:
+            clauses.append('symbol = ?')
+            params.append(symbol)
+        if line_range:
+            clauses.append('start_line BETWEEN ? AND ?')
+            params.extend(line_range)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM patterns WHERE {' AND '.join(clauses)} "
+                f"ORDER BY confidence DESC, path, start_line LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [self._pattern_row(row) for row in rows]
+
+    def find_symbols(self, name: str, kind: Optional[str] = None, exact: bool = False,
+                     limit: int = 50) -> List[Dict[str, Any]]:
+        """Symbol definitions by (case-insensitive) name or name prefix"""
+        lower_name = name.lower()
+        if exact:
+            clauses, params = ['lower_name = ?'], [lower_name]
+        else:
+            clauses, params = ['lower_name >= ? AND lower_name < ?'], [lower_name, lower_name + '\uffff']
+        if kind:
+            clauses.append('kind = ?')
+            params.append(kind)
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT path, name, kind, parent, start_line, end_line FROM symbols WHERE {' AND '.join(clauses)} "
+                f"ORDER BY length(name), path, start_line LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def file_summary(self, path: str) -> Optional[Dict[str, Any]]:
+        """Indexed metadata, patterns and symbols of one file"""
+        with self._lock:
+            file_row = self._conn.execute('SELECT * FROM files WHERE path = ?', (path,)).fetchone()
+            if file_row is None:
+                return None
+            patterns = self._conn.execute(
+                'SELECT * FROM patterns WHERE path = ? ORDER BY start_line', (path,)
+            ).fetchall()
+            symbols = self._conn.execute(
+                'SELECT path, name, kind, parent, start_line, end_line FROM symbols WHERE path = ? ORDER BY start_line',
+                (path,)
+            ).fetchall()
+        return {
+            **dict(file_row),
+            'truncated': bool(file_row['truncated']),
+            'patterns': [self._pattern_row(row) for row in patterns],
+            'symbols': [dict(row) for row in symbols]
+        }
+
+    def pattern_counts(self) -> Dict[str, Dict[str, int]]:
+        """type -> name -> occurrences across the project"""
+        counts: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for row in self._conn.execute('SELECT type, name, COUNT(*) AS n FROM patterns GROUP BY type, name'):
+                counts.setdefault(row['type'], {})[row['name']] = row['n']
+        return counts
+
+    def lookup(self, query: str, limit: int = 20) -> Dict[str, Any]:
+        """
+        Answer a code-analysis query from the index
+
+        Query words that name a pattern (e.g. 'singleton', 'long method',
+        'repository') select those patterns; the remaining words are matched
+        against symbol names. When symbols match, patterns are looked up
+        inside their definitions only.
+
+        Returns:
+            {'patterns': [...], 'symbols': [...], 'matched_patterns': [...], 'indexed_files'}
+        """
+        self.metrics['lookups'] += 1
+        words = [word.lower() for word in _QUERY_TOKEN.findall(query)]
+        known = {name for names in PATTERN_NAMES.values() for name in names}
+        # 'long method', 'magic numbers', 'singletons', 'factories'
+        candidates = set(words) | {'_'.join(pair) for pair in zip(words, words[1:])}
+        candidates |= {word[:-1] for word in candidates if word.endswith('s')}
+        candidates |= {word[:-3] + 'y' for word in candidates if word.endswith('ies')}
+        matched_patterns = sorted(known & candidates)
+
+        pattern_words = {part for name in matched_patterns for part in name.split('_')}
+        symbols = []
+        seen = set()
+        for word in words:
+            if len(word) < 4 or word in _QUERY_STOPWORDS or word in pattern_words or word[:-1] in pattern_words:
+                continue
+            for symbol in self.find_symbols(word, limit=limit):
+                key = (symbol['path'], symbol['name'], symbol['start_line'])
+                if key not in seen:
+                    seen.add(key)
+                    symbols.append(symbol)
+
+        patterns = []
+        if symbols:
+            for symbol in symbols[:limit]:
+                for name in matched_patterns or [None]:
+                    patterns.extend(self.find_patterns(
+                        name=name, path_prefix=symbol['path'], line_range=(symbol['start_line'], symbol['end_line']),
+                        limit=limit
+                    ))
+            # Nested symbols report the same patterns
+            patterns = list({(p['path'], p['name'], p['start_line']): p for p in patterns}.values())
+        else:
+            for name in matched_patterns:
+                patterns.extend(self.find_patterns(name=name, limit=limit))
+        patterns.sort(key=lambda pattern: -pattern['confidence'])
+
+        with self._lock:
+            indexed_files = self._conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+        return {
+            'patterns': patterns[:limit],
+            'symbols': symbols[:limit],
+            'matched_patterns': matched_patterns,
+            'indexed_files': indexed_files
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = {
+                table: self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+                for table in ('files', 'patterns', 'symbols')
+            }
+        return {
+            **self.metrics,
+            'indexed_files': counts['files'],
+            'indexed_patterns': counts['patterns'],
+            'indexed_symbols': counts['symbols'],
+            'last_refresh': self.last_refresh
+        }
+
+    def close(self):
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown(wait=False, cancel_futures=True)
+            self._worker_pool = None
+        with self._lock:
+            self._conn.close()
+
+# Export main class
+__all__ = ['CodePatternIndex']
@@ -14,8 +14,12 @@ Based on Crawl4AI research:
 
 Features:
 - Context-aware embedding generation
-- Integration with JavaScript bridge for embedding service
+- Pluggable embedding backends (JavaScript bridge, offline hashed n-grams, local sentence model)
+- Batched embedding generation
 - Intelligent caching for performance optimization
+- Memory-mapped binary embedding store (zero-copy vectors, deduplicated texts)
+- Query embeddings (context embedding_role='query') kept in their own store,
+  apart from the document chunks searched by hybrid search
 - Robust fallback mechanisms
 - Performance monitoring and optimization
 """
@@ -33,11 +37,20 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from integration.js_bridge import JavaScriptBridge
+from crawl4ai_strategies.embedding_store import EmbeddingStore, NUMPY_AVAILABLE
+from crawl4ai_strategies.embedding_backends import (
+    HashedNgramEmbeddingBackend,
+    create_embedding_backend,
+    resolve_backend_name
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Embedding roles -> store directory suffix
+EMBEDDING_STORE_NAMESPACES = {'document': 'documents', 'query': 'queries'}
+
 class ContextualEmbeddingsStrategy:
     """
     Native implementation of Crawl4AI's contextual embeddings strategy
@@ -55,8 +68,15 @@ class ContextualEmbeddingsStrategy:
             'max_chunk_size': 1000,
             'context_overlap': 100,
             'llm_model': 'gpt-4o-mini',  # For context generation
+            # Embedding backend: 'bridge', 'hashed_ngram' or 'sentence_transformers'
+            # (defaults to NATIVE_RAG_EMBEDDING_BACKEND, then 'bridge')
+            'embedding_backend': resolve_backend_name(),
+            'native_embedding_dimensions': 384,
+            'local_embedding_model': 'sentence-transformers/all-MiniLM-L6-v2',
             'cache_enabled': True,
             'cache_ttl': 3600,  # 1 hour
+            'embedding_store_enabled': True,  # Binary store instead of JSON cache files
+            'embedding_store_dtype': 'float32',  # or 'float16' to halve storage
             'fallback_enabled': True,
             'performance_monitoring': True
         }
@@ -69,14 +89,24 @@ class ContextualEmbeddingsStrategy:
             'cache_hits': 0,
             'cache_misses': 0,
             'fallback_activations': 0,
+            'native_fallback_embeddings': 0,
+            'batch_calls': 0,
             'average_processing_time': 0,
             'context_enhancement_success_rate': 100.0
         }
         
+        # Embedding backends: the selected one plus the offline CPU backend used when it fails
+        self.native_embedding_backend = HashedNgramEmbeddingBackend(self.config['native_embedding_dimensions'])
+        self.embedding_backend = self._create_embedding_backend(self.config['embedding_backend'])
+        
         # Cache directory
         self.cache_dir = Path(__file__).parent.parent / 'cache' / 'contextual-embeddings'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Binary embedding stores keyed by (role, dimensions) (lazy)
+        self.embedding_store_dir = Path(__file__).parent.parent / 'cache' / 'embedding-store'
+        self.embedding_stores = {}
+        
         logger.info("✅ [CONTEXTUAL EMBEDDINGS] Strategy initialized successfully")
     
     async def generate_contextual_embeddings(self, content: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -101,12 +131,13 @@ class ContextualEmbeddingsStrategy:
             document_context = context.get('document', content)
             source_info = context.get('source', 'unknown')
             chunk_position = context.get('position', 0)
+            role = self._embedding_role(context)
             
             # Generate cache key
-            cache_key = self._generate_cache_key(content, document_context, source_info)
+            cache_key = self._generate_cache_key(content, document_context, source_info, role)
             
             # Check cache first
-            cached_result = await self._get_cached_result(cache_key)
+            cached_result = await self._get_cached_result(cache_key, role)
             if cached_result is not None:
                 self.metrics['cache_hits'] += 1
                 processing_time = (time.time() - start_time) * 1000
@@ -121,8 +152,8 @@ class ContextualEmbeddingsStrategy:
             # Step 2: Combine original content with enriched context
             enhanced_content = self._combine_content_with_context(content, enriched_context)
             
-            # Step 3: Generate embeddings using JavaScript bridge
-            embedding_result = await self._generate_embeddings_via_bridge(enhanced_content, context)
+            # Step 3: Generate embeddings using the configured backend
+            embedding_result = await self._generate_embeddings(enhanced_content, context)
             
             # Step 4: Prepare final result
             result = {
@@ -131,18 +162,21 @@ class ContextualEmbeddingsStrategy:
                 'enriched_context': enriched_context,
                 'enhanced_content': enhanced_content,
                 'metadata': {
-                    'model': self.config['embedding_model'],
+                    'model': embedding_result.get('model', self.config['embedding_model']),
+                    'backend': embedding_result.get('backend', self.embedding_backend.name),
                     'dimensions': len(embedding_result.get('embedding', [])),
                     'source': source_info,
                     'chunk_position': chunk_position,
                     'context_enhanced': True,
                     'processing_time_ms': (time.time() - start_time) * 1000,
-                    'strategy': 'contextual_embeddings'
+                    'strategy': 'contextual_embeddings',
+                    'fallback': embedding_result.get('fallback', False)
                 }
             }
             
-            # Cache the result
-            await self._cache_result(cache_key, result)
+            # Cache the result (offline fallback vectors are not cached, the next call retries the backend)
+            if not embedding_result.get('fallback'):
+                await self._cache_result(cache_key, result, role)
             
             # Update metrics
             processing_time = (time.time() - start_time) * 1000
@@ -256,35 +290,146 @@ class ContextualEmbeddingsStrategy:
         
         return enhanced_content
     
-    async def _generate_embeddings_via_bridge(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_embedding_backend(self, backend_name: str):
+        """
+        Create the selected embedding backend, defaulting to the offline backend on error
+        """
+        try:
+            backend = create_embedding_backend(backend_name, self.config, self.js_bridge)
+        except Exception as error:
+            logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Backend '{backend_name}' unavailable ({error}), using hashed_ngram")
+            backend = self.native_embedding_backend
+        
+        # Cache keys and the embedding store follow the active model
+        if backend.name != 'bridge':
+            self.config['embedding_model'] = backend.model_name
+            self.config['embedding_dimensions'] = backend.dimensions
+        
+        logger.info(f"🧩 [CONTEXTUAL EMBEDDINGS] Embedding backend: {backend.name} ({backend.model_name})")
+        return backend
+    
+    async def _generate_embeddings(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate embeddings with the configured backend
         """
-        Generate embeddings using JavaScript bridge
+        return (await self._generate_embeddings_batch([content], context))[0]
+    
+    async def _generate_embeddings_batch(self, contents: List[str], context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Generate embeddings for a batch with one backend call, falling back to the offline backend
         """
         self.metrics['embedding_generation_calls'] += 1
         
         try:
-            # Call embedding service via JavaScript bridge
-            embedding_args = [content, {
-                'model': self.config['embedding_model'],
-                'dimensions': self.config['embedding_dimensions'],
+            vectors = await self.embedding_backend.embed(contents, {
                 'domain': context.get('domain', 'technical'),
-                'source': context.get('source', 'unknown')
-            }]
+                'source': context.get('source', 'unknown'),
+                'deadline': context.get('deadline')
+            })
+            backend = self.embedding_backend
             
-            result = await self.js_bridge.call_js_component(
-                'embedding_service',
-                'generateContextualEmbedding',
-                embedding_args
-            )
+        except Exception as error:
+            logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] {self.embedding_backend.name} embedding failed: {error}")
+            # Offline backend keeps vectors content-dependent instead of a constant fallback
+            self.metrics['native_fallback_embeddings'] += len(contents)
+            vectors = await self.native_embedding_backend.embed(contents)
+            backend = self.native_embedding_backend
+        
+        return [
+            {
+                'embedding': vector,
+                'model': backend.model_name,
+                'backend': backend.name,
+                'dimensions': len(vector),
+                'fallback': backend is not self.embedding_backend
+            }
+            for vector in vectors
+        ]
+    
+    async def generate_contextual_embeddings_batch(self, contents: List[str], context: Dict[str, Any] = None,
+                                                   keys: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Generate contextual embeddings for several chunks of the same document
+        
+        Cached chunks are served from the store; the remaining ones share a
+        single backend call.
+        
+        Args:
+            contents: Text chunks to embed
+            context: Shared context information (document, source, etc.)
+            keys: Optional stable cache keys, one per chunk (e.g. ingestion chunk ids)
             
-            return result
+        Returns:
+            One result per chunk, in input order
+        """
+        start_time = time.time()
+        self.metrics['batch_calls'] += 1
+        self.metrics['total_chunks_processed'] += len(contents)
+        
+        if context is None:
+            context = {}
+        
+        document_context = context.get('document', '')
+        source_info = context.get('source', 'unknown')
+        base_position = context.get('position', 0)
+        role = self._embedding_role(context)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(contents)
+        pending = []
+        
+        for index, content in enumerate(contents):
+            cache_key = keys[index] if keys else self._generate_cache_key(content, document_context or content, source_info, role)
+            cached_result = await self._get_cached_result(cache_key, role)
+            if cached_result is not None:
+                self.metrics['cache_hits'] += 1
+                results[index] = cached_result
+            else:
+                self.metrics['cache_misses'] += 1
+                pending.append((index, content, cache_key))
+        
+        if pending:
+            enriched_contexts = await asyncio.gather(*(
+                self._generate_enriched_context(content, document_context or content, source_info)
+                for _, content, _ in pending
+            ))
+            enhanced_contents = [
+                self._combine_content_with_context(content, enriched_context)
+                for (_, content, _), enriched_context in zip(pending, enriched_contexts)
+            ]
+            embedding_results = await self._generate_embeddings_batch(enhanced_contents, context)
             
-        except Exception as error:
-            logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Bridge embedding failed: {error}")
-            # Use bridge fallback
-            return await self.js_bridge._embedding_fallback('generateContextualEmbedding', [content])
+            processing_time = (time.time() - start_time) * 1000
+            for (index, content, cache_key), enriched_context, enhanced_content, embedding_result in zip(
+                pending, enriched_contexts, enhanced_contents, embedding_results
+            ):
+                result = {
+                    'embedding': embedding_result['embedding'],
+                    'original_content': content,
+                    'enriched_context': enriched_context,
+                    'enhanced_content': enhanced_content,
+                    'metadata': {
+                        'model': embedding_result['model'],
+                        'backend': embedding_result['backend'],
+                        'dimensions': embedding_result['dimensions'],
+                        'source': source_info,
+                        'chunk_position': base_position + index,
+                        'context_enhanced': True,
+                        'processing_time_ms': processing_time,
+                        'strategy': 'contextual_embeddings',
+                        'batch_size': len(contents),
+                        'fallback': embedding_result['fallback']
+                    }
+                }
+                if not embedding_result['fallback']:
+                    await self._cache_result(cache_key, result, role)
+                results[index] = result
+        
+        processing_time = (time.time() - start_time) * 1000
+        self._update_processing_time_metrics(processing_time)
+        logger.info(f"✅ [CONTEXTUAL EMBEDDINGS] Batch of {len(contents)} chunks ({len(pending)} embedded, {processing_time:.1f}ms)")
+        return results
     
-    def _generate_cache_key(self, content: str, document: str, source: str) -> str:
+    def _generate_cache_key(self, content: str, document: str, source: str, role: str = 'document') -> str:
         """Generate cache key for contextual embedding"""
         key_data = {
             'content': content,
@@ -293,14 +438,69 @@ class ContextualEmbeddingsStrategy:
             'model': self.config['embedding_model'],
             'strategy': 'contextual_embeddings'
         }
+        if role != 'document':
+            key_data['role'] = role
         key_string = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_string.encode()).hexdigest()
     
-    async def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+    @staticmethod
+    def _embedding_role(context: Dict[str, Any]) -> str:
+        """'query' for query embeddings, 'document' (the default) for corpus chunks"""
+        return 'query' if context.get('embedding_role') == 'query' else 'document'
+    
+    def forget_embeddings(self, keys: List[str]) -> int:
+        """
+        Drop cached document embeddings by cache key (store rows are reclaimed on compaction)
+        """
+        removed = 0
+        store = self.get_embedding_store()
+        for key in keys:
+            if store is not None and store.delete(key):
+                removed += 1
+            cache_file = self.cache_dir / f"{key}.json"
+            if cache_file.exists():
+                cache_file.unlink()
+                removed += 1
+        return removed
+    
+    def get_embedding_store(self, dimensions: Optional[int] = None, role: str = 'document') -> Optional[EmbeddingStore]:
+        """
+        Get the binary embedding store for `dimensions` (defaults to the configured model size)
+        
+        Document chunks and query embeddings live in separate stores, so vector
+        search over the document store never returns past queries.
+        
+        Returns None when the store is disabled or numpy is unavailable.
+        """
+        if not self.config['embedding_store_enabled'] or not NUMPY_AVAILABLE:
+            return None
+        
+        if dimensions is None:
+            dimensions = self.config['embedding_dimensions']
+        
+        store_key = (role, dimensions)
+        if store_key not in self.embedding_stores:
+            try:
+                dtype = self.config['embedding_store_dtype']
+                namespace = EMBEDDING_STORE_NAMESPACES[role]
+                store_dir = self.embedding_store_dir / f"{self.config['embedding_model']}-{dimensions}-{dtype}-{namespace}"
+                self.embedding_stores[store_key] = EmbeddingStore(store_dir, dimensions, dtype)
+            except Exception as error:
+                logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Embedding store unavailable: {error}")
+                self.embedding_stores[store_key] = None
+        
+        return self.embedding_stores[store_key]
+    
+    async def _get_cached_result(self, cache_key: str, role: str = 'document') -> Optional[Dict[str, Any]]:
         """Get cached contextual embedding result"""
         if not self.config['cache_enabled']:
             return None
         
+        # Binary store first, legacy JSON files second
+        store_result = self._get_store_result(cache_key, role)
+        if store_result is not None:
+            return store_result
+        
         try:
             cache_file = self.cache_dir / f"{cache_key}.json"
             if not cache_file.exists():
@@ -321,11 +521,54 @@ class ContextualEmbeddingsStrategy:
             logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Cache read failed: {error}")
             return None
     
-    async def _cache_result(self, cache_key: str, result: Dict[str, Any]):
+    def _get_store_result(self, cache_key: str, role: str = 'document') -> Optional[Dict[str, Any]]:
+        """Rebuild a cached result from the binary embedding store"""
+        try:
+            store = self.get_embedding_store(role=role)
+            if store is None:
+                return None
+            
+            entry = store.get(cache_key)
+            if entry is None:
+                return None
+            
+            # Check TTL
+            if time.time() - entry['timestamp'] > self.config['cache_ttl']:
+                store.delete(cache_key)  # Row reclaimed on compaction
+                return None
+            
+            texts = entry['texts']
+            return {
+                'embedding': entry['vector'].tolist(),
+                'original_content': texts.get('original_content'),
+                'enriched_context': texts.get('enriched_context'),
+                'enhanced_content': texts.get('enhanced_content'),
+                'metadata': entry['metadata']
+            }
+            
+        except Exception as error:
+            logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Embedding store read failed: {error}")
+            return None
+    
+    async def _cache_result(self, cache_key: str, result: Dict[str, Any], role: str = 'document'):
         """Cache contextual embedding result"""
         if not self.config['cache_enabled']:
             return
         
+        # Results with the configured dimensions go to the binary store of their role
+        embedding = result.get('embedding', [])
+        store = self.get_embedding_store(role=role)
+        if store is not None and len(embedding) == store.dimensions:
+            try:
+                store.put(cache_key, embedding, {
+                    'original_content': result.get('original_content'),
+                    'enriched_context': result.get('enriched_context'),
+                    'enhanced_content': result.get('enhanced_content')
+                }, {**result.get('metadata', {}), 'embedding_role': role})
+                return
+            except Exception as error:
+                logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Embedding store write failed: {error}")
+        
         try:
             cache_data = {
                 'result': result,
@@ -335,7 +578,7 @@ class ContextualEmbeddingsStrategy:
             
             cache_file = self.cache_dir / f"{cache_key}.json"
             with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+                json.dump(cache_data, f, separators=(',', ':'))
                 
         except Exception as error:
             logger.warning(f"⚠️ [CONTEXTUAL EMBEDDINGS] Cache write failed: {error}")
@@ -348,20 +591,17 @@ class ContextualEmbeddingsStrategy:
         
         try:
             # Try basic embedding without context enhancement
-            basic_result = await self.js_bridge.call_js_component(
-                'embedding_service',
-                'generateContextualEmbedding',
-                [content]
-            )
+            basic_vector = await self.embedding_backend.embed_one(content)
             
             return {
-                'embedding': basic_result.get('embedding', []),
+                'embedding': basic_vector,
                 'original_content': content,
                 'enriched_context': 'Fallback: No context enhancement available',
                 'enhanced_content': content,
                 'metadata': {
-                    'model': 'fallback',
-                    'dimensions': len(basic_result.get('embedding', [])),
+                    'model': self.embedding_backend.model_name,
+                    'backend': self.embedding_backend.name,
+                    'dimensions': len(basic_vector),
                     'source': context.get('source', 'unknown'),
                     'context_enhanced': False,
                     'fallback': True,
@@ -373,15 +613,19 @@ class ContextualEmbeddingsStrategy:
         except Exception as fallback_error:
             logger.error(f"❌ [CONTEXTUAL EMBEDDINGS] Fallback also failed: {fallback_error}")
             
-            # Ultimate fallback - return basic structure
+            # Ultimate fallback - offline CPU embedding (still content-dependent)
+            self.metrics['native_fallback_embeddings'] += 1
+            native_vector = await self.native_embedding_backend.embed_one(content)
+            
             return {
-                'embedding': [0.1] * self.config['embedding_dimensions'],
+                'embedding': native_vector,
                 'original_content': content,
                 'enriched_context': 'Error: Context generation failed',
                 'enhanced_content': content,
                 'metadata': {
-                    'model': 'error_fallback',
-                    'dimensions': self.config['embedding_dimensions'],
+                    'model': self.native_embedding_backend.model_name,
+                    'backend': self.native_embedding_backend.name,
+                    'dimensions': len(native_vector),
                     'source': context.get('source', 'unknown'),
                     'context_enhanced': False,
                     'fallback': True,
@@ -404,10 +648,16 @@ class ContextualEmbeddingsStrategy:
         cache_total = self.metrics['cache_hits'] + self.metrics['cache_misses']
         cache_hit_rate = (self.metrics['cache_hits'] / cache_total * 100) if cache_total > 0 else 0
         
+        store = self.embedding_stores.get(('document', self.config['embedding_dimensions']))
+        query_store = self.embedding_stores.get(('query', self.config['embedding_dimensions']))
+        
         return {
             **self.metrics,
             'cache_hit_rate': cache_hit_rate,
-            'context_enhancement_efficiency': cache_hit_rate  # Cache hits improve efficiency
+            'context_enhancement_efficiency': cache_hit_rate,  # Cache hits improve efficiency
+            'embedding_backend': self.embedding_backend.get_metrics(),
+            'embedding_store': store.get_metrics() if store is not None else None,
+            'query_embedding_store': query_store.get_metrics() if query_store is not None else None
         }
     
     async def health_check(self) -> Dict[str, Any]:
@@ -416,7 +666,7 @@ class ContextualEmbeddingsStrategy:
             # Test basic functionality
             test_result = await self.generate_contextual_embeddings(
                 'test content',
-                {'document': 'test document context', 'source': 'health_check'}
+                {'document': 'test document context', 'source': 'health_check', 'embedding_role': 'query'}
             )
             
             return {
@@ -0,0 +1,555 @@
+#!/usr/bin/env python3
+
+"""
+MEMORY CORPUS INGESTION PIPELINE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Streaming ingestion of the @project-core/memory markdown corpus (plus
+self_correction_log.md and the Augment preferences) into the hybrid search
+indexes.
+
+Features:
+- Generator-based reader: files are stat-checked, read and chunked one at a time
+- Heading-hierarchy-aware markdown chunker with overlap, sized by the
+  contextual embeddings config (max_chunk_size / context_overlap)
+- Batched contextual embeddings written to the binary embedding store
+- Incremental BM25 and vector index updates (add/remove per chunk)
+- Content-hash manifest: unchanged files are skipped, changed files only
+  embed and index the chunks that actually changed; chunks whose vectors did
+  not reach the embedding store (offline fallback, new store) stay pending
+  and are embedded again on the next run
+- Optional ECL entity extraction per added chunk (chunk ids as sources), feeding
+  the knowledge graph behind the hybrid search graph leg
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+import sys
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawl4ai_strategies.contextual_embeddings import ContextualEmbeddingsStrategy
+from crawl4ai_strategies.hybrid_search import HybridSearchStrategy
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+_FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+MANIFEST_VERSION = 1
+
+
+def iter_markdown_sections(text: str) -> Iterator[Tuple[List[str], str]]:
+    """
+    Split markdown into (heading_path, section_text) pairs
+
+    Headings inside fenced code blocks are ignored; each section starts with
+    its own heading line.
+    """
+    stack: List[Tuple[int, str]] = []
+    lines: List[str] = []
+    in_fence = False
+
+    for line in text.splitlines():
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        heading = None if in_fence else _HEADING_PATTERN.match(line)
+
+        if heading:
+            if any(l.strip() for l in lines):
+                yield [title for _, title in stack], '\n'.join(lines).strip()
+            level = len(heading.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, heading.group(2)))
+            lines = [line]
+        else:
+            lines.append(line)
+
+    if any(l.strip() for l in lines):
+        yield [title for _, title in stack], '\n'.join(lines).strip()
+
+
+def iter_blocks(section: str) -> Iterator[str]:
+    """Blank-line separated blocks, fenced code blocks kept whole"""
+    block: List[str] = []
+    in_fence = False
+
+    for line in section.splitlines():
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if block:
+                yield '\n'.join(block)
+                block = []
+        else:
+            block.append(line)
+
+    if block:
+        yield '\n'.join(block)
+
+
+def split_oversized(block: str, limit: int) -> Iterator[str]:
+    """Split a block longer than `limit` on lines, then sentences, then whitespace"""
+    if len(block) <= limit:
+        yield block
+        return
+
+    for splitter, joiner in ((lambda text: text.split('\n'), '\n'), (_SENTENCE_BREAK.split, ' '), (str.split, ' ')):
+        units = splitter(block)
+        if len(units) > 1:
+            break
+    else:
+        # A single unbreakable token: hard split
+        for start in range(0, len(block), limit):
+            yield block[start:start + limit]
+        return
+
+    current = ''
+    for unit in units:
+        if current and len(current) + len(joiner) + len(unit) > limit:
+            yield from split_oversized(current, limit)
+            current = unit
+        else:
+            current = f'{current}{joiner}{unit}' if current else unit
+
+    if current:
+        yield from split_oversized(current, limit)
+
+
+class MarkdownChunker:
+    """
+    Heading-aware markdown chunker with overlap
+    """
+
+    def __init__(self, max_chunk_size: int = 1000, context_overlap: int = 100, min_chunk_size: int = 200):
+        self.max_chunk_size = max_chunk_size
+        self.context_overlap = context_overlap
+        self.min_chunk_size = min_chunk_size
+
+    def _overlap_tail(self, text: str) -> str:
+        if self.context_overlap <= 0 or len(text) <= self.context_overlap:
+            return ''
+        tail = text[-self.context_overlap:]
+        space = tail.find(' ')
+        return tail[space + 1:] if 0 <= space < len(tail) - 1 else tail
+
+    def iter_chunks(self, text: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield {'text', 'heading_path'} chunks of at most max_chunk_size characters
+
+        A chunk only continues into the next section while it is shorter than
+        min_chunk_size; consecutive chunks of one section share an overlap.
+        """
+        piece_limit = max(1, self.max_chunk_size - self.context_overlap - 2)
+        current = ''
+        current_path: List[str] = []
+
+        for heading_path, section in iter_markdown_sections(text):
+            if len(current) >= self.min_chunk_size:
+                yield {'text': current, 'heading_path': current_path}
+                current = ''
+
+            # A short parent section (e.g. a bare title) continues into its child
+            if not current or heading_path[:len(current_path)] == current_path:
+                current_path = heading_path
+
+            for block in iter_blocks(section):
+                for piece in split_oversized(block, piece_limit):
+                    if current and len(current) + 2 + len(piece) > self.max_chunk_size:
+                        yield {'text': current, 'heading_path': current_path}
+                        tail = self._overlap_tail(current)
+                        current = f'{tail}\n\n{piece}' if tail else piece
+                        current_path = heading_path
+                    else:
+                        current = f'{current}\n\n{piece}' if current else piece
+
+        if current:
+            yield {'text': current, 'heading_path': current_path}
+
+
+class MemoryIngestionPipeline:
+    """
+    Incremental ingestion of the memory corpus into hybrid search
+    """
+
+    def __init__(self, contextual_embeddings: Optional[ContextualEmbeddingsStrategy] = None,
+                 hybrid_search: Optional[HybridSearchStrategy] = None,
+                 memory_root: Optional[Path] = None, manifest_path: Optional[Path] = None,
+                 ecl_pipeline=None):
+        self.contextual_embeddings = contextual_embeddings or ContextualEmbeddingsStrategy()
+        self.hybrid_search = hybrid_search or HybridSearchStrategy()
+        # CogneeECLPipeline whose graph store backs the hybrid search graph leg (optional)
+        self.ecl_pipeline = ecl_pipeline
+
+        # Ingested chunks feed the hybrid search vector leg through the embedding store
+        if self.hybrid_search.embedding_store is None:
+            self.hybrid_search.attach_embedding_store(self.contextual_embeddings.get_embedding_store())
+        if self.ecl_pipeline is not None and self.hybrid_search.graph_index is None:
+            self.hybrid_search.attach_graph_store(self.ecl_pipeline.get_graph_store())
+
+        embeddings_config = self.contextual_embeddings.config
+        self.config = {
+            'memory_root': Path(memory_root) if memory_root else Path(__file__).parent.parent.parent,
+            'include_patterns': ['**/*.md'],
+            'exclude_dirs': ['native-rag-system', 'node_modules', 'backups', 'archives', 'deprecated', '@project-core'],
+            # Non-markdown sources: Augment preferences export (relative to memory_root or absolute)
+            'extra_files': ['self_correction_log.md', 'optimized-augment-memories.txt'],
+            'max_chunk_size': embeddings_config['max_chunk_size'],
+            'context_overlap': embeddings_config['context_overlap'],
+            'min_chunk_size': 200,
+            'embedding_batch_size': 32,
+            'embed_chunks': True,
+            'extract_entities': ecl_pipeline is not None
+        }
+
+        self.manifest_path = Path(manifest_path) if manifest_path else (
+            Path(__file__).parent.parent / 'cache' / 'ingestion' / 'manifest.json'
+        )
+        self.manifest = self._load_manifest()
+
+        self.metrics = {
+            'runs': 0,
+            'files_scanned': 0,
+            'files_skipped': 0,
+            'files_updated': 0,
+            'files_removed': 0,
+            'chunks_added': 0,
+            'chunks_removed': 0,
+            'chunks_unchanged': 0,
+            'chunks_pending': 0,
+            'embedding_failures': 0,
+            'entity_extraction_failures': 0,
+            'average_ingestion_time': 0
+        }
+
+        logger.info("✅ [INGESTION] Memory ingestion pipeline initialized successfully")
+
+    # READING
+
+    def _source_id(self, path: Path) -> str:
+        try:
+            return path.resolve().relative_to(self.config['memory_root'].resolve()).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def iter_source_files(self, paths: Optional[List[Path]] = None) -> Iterator[Path]:
+        """Yield corpus files lazily (explicit paths, or the configured corpus)"""
+        if paths is not None:
+            yield from (Path(path) for path in paths)
+            return
+
+        root = self.config['memory_root']
+        excluded = set(self.config['exclude_dirs'])
+        seen = set()
+
+        for pattern in self.config['include_patterns']:
+            for path in sorted(root.glob(pattern)):
+                if path.is_file() and not excluded.intersection(path.relative_to(root).parts[:-1]):
+                    seen.add(path.resolve())
+                    yield path
+
+        for extra in self.config['extra_files']:
+            path = Path(extra) if Path(extra).is_absolute() else root / extra
+            if path.is_file() and path.resolve() not in seen:
+                yield path
+
+    def iter_documents(self, paths: Optional[List[Path]] = None) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Yield (source, document) per corpus file; document is None when the
+        manifest shows the file is unchanged
+        """
+        for path in self.iter_source_files(paths):
+            source = self._source_id(path)
+            try:
+                yield source, self._read_if_changed(path, source)
+            except OSError as error:
+                logger.warning(f"⚠️ [INGESTION] Cannot read {source}: {error}")
+
+    def _read_if_changed(self, path: Path, source: str) -> Optional[Dict[str, Any]]:
+        stat = path.stat()
+        previous = self.manifest['files'].get(source)
+        # Files with pending chunks are re-read until every chunk is embedded
+        complete = previous is not None and not previous.get('pending')
+
+        # Fast path: same size and mtime, no read needed
+        if complete and previous['size'] == stat.st_size and previous['mtime_ns'] == stat.st_mtime_ns:
+            return None
+
+        data = path.read_bytes()
+        content_hash = hashlib.sha256(data).hexdigest()
+        if complete and previous['hash'] == content_hash:
+            previous['mtime_ns'] = stat.st_mtime_ns
+            return None
+
+        return {
+            'source': source,
+            'path': path,
+            'text': data.decode('utf-8', errors='replace'),
+            'hash': content_hash,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+
+    # CHUNKING
+
+    def chunk_document(self, text: str, source: str) -> Iterator[Dict[str, Any]]:
+        """Yield chunks with content-addressed ids"""
+        chunker = MarkdownChunker(
+            max_chunk_size=self.config['max_chunk_size'],
+            context_overlap=self.config['context_overlap'],
+            min_chunk_size=self.config['min_chunk_size']
+        )
+        occurrences: Dict[str, int] = {}
+
+        for position, chunk in enumerate(chunker.iter_chunks(text)):
+            # Identical chunks in one file get distinct ids
+            occurrence = occurrences.get(chunk['text'], 0)
+            occurrences[chunk['text']] = occurrence + 1
+            chunk_id = hashlib.blake2b(f"{source}\0{occurrence}\0{chunk['text']}".encode('utf-8'), digest_size=16).hexdigest()
+
+            yield {
+                'id': chunk_id,
+                'text': chunk['text'],
+                'source': source,
+                'heading_path': chunk['heading_path'],
+                'position': position
+            }
+
+    # INDEXING
+
+    async def ingest(self, paths: Optional[List[Path]] = None) -> Dict[str, Any]:
+        """
+        Ingest changed files and drop removed ones
+
+        Args:
+            paths: Specific files to (re)ingest; defaults to the whole corpus,
+                   in which case files missing from disk are removed
+
+        Returns:
+            Run summary
+        """
+        start_time = time.time()
+        self.metrics['runs'] += 1
+        summary = {
+            'files_scanned': 0,
+            'files_skipped': 0,
+            'files_updated': 0,
+            'files_removed': 0,
+            'chunks_added': 0,
+            'chunks_removed': 0,
+            'chunks_unchanged': 0,
+            'chunks_pending': 0
+        }
+
+        self.restore_indexes()
+        self._mark_missing_embeddings()
+        seen_sources = set()
+
+        for source, document in self.iter_documents(paths):
+            seen_sources.add(source)
+            summary['files_scanned'] += 1
+            if document is None:
+                summary['files_skipped'] += 1
+                continue
+            await self._ingest_document(document, summary)
+            summary['files_updated'] += 1
+
+        if paths is None:
+            for source in [s for s in self.manifest['files'] if s not in seen_sources]:
+                summary['chunks_removed'] += self._remove_chunks(self.manifest['files'].pop(source)['chunks'])
+                summary['files_removed'] += 1
+
+        self._save_manifest()
+
+        for key, value in summary.items():
+            self.metrics[key] += value
+
+        ingestion_time = (time.time() - start_time) * 1000
+        summary['ingestion_time_ms'] = ingestion_time
+        self.metrics['average_ingestion_time'] = (
+            ingestion_time if self.metrics['average_ingestion_time'] == 0
+            else (self.metrics['average_ingestion_time'] + ingestion_time) / 2
+        )
+
+        logger.info(f"✅ [INGESTION] {summary['files_updated']} files updated, {summary['files_skipped']} skipped, "
+                    f"+{summary['chunks_added']}/-{summary['chunks_removed']} chunks, {summary['chunks_pending']} pending "
+                    f"({ingestion_time:.1f}ms)")
+        return summary
+
+    async def _ingest_document(self, document: Dict[str, Any], summary: Dict[str, Any]):
+        source = document['source']
+        previous = self.manifest['files'].get(source)
+
+        chunks = list(self.chunk_document(document['text'], source))
+        title = next((c['heading_path'][0] for c in chunks if c['heading_path']), document['path'].stem)
+        document_context = f"{source}: {title}"
+
+        # A changed document context changes every chunk's embedding
+        same_context = previous is not None and previous['document'] == document_context
+        if previous and not same_context:
+            summary['chunks_removed'] += self._remove_chunks(previous['chunks'])
+
+        new_ids = [chunk['id'] for chunk in chunks]
+        previous_ids = set(previous['chunks']) if same_context else set()
+        # Pending chunks never reached the embedding store: index them again
+        old_ids = previous_ids - set(previous.get('pending', [])) if same_context else set()
+        removed = [chunk_id for chunk_id in previous_ids if chunk_id not in set(new_ids)]
+        added = [chunk for chunk in chunks if chunk['id'] not in old_ids]
+
+        summary['chunks_removed'] += self._remove_chunks(removed)
+        await self._index_chunks(added, document_context)
+        summary['chunks_added'] += len(added)
+        summary['chunks_unchanged'] += len(chunks) - len(added)
+
+        embedded = self._embedded_chunk_ids(new_ids)
+        pending = [chunk_id for chunk_id in new_ids if chunk_id not in embedded]
+        summary['chunks_pending'] += len(pending)
+
+        for chunk in chunks:
+            self.manifest['chunks'][chunk['id']] = {
+                'text': chunk['text'],
+                'source': source,
+                'heading_path': chunk['heading_path'],
+                'position': chunk['position']
+            }
+        self.manifest['files'][source] = {
+            'hash': document['hash'],
+            'size': document['size'],
+            'mtime_ns': document['mtime_ns'],
+            'document': document_context,
+            'chunks': new_ids,
+            'pending': pending
+        }
+
+    async def _index_chunks(self, chunks: List[Dict[str, Any]], document_context: str):
+        batch_size = self.config['embedding_batch_size']
+
+        for start in range(0, len(chunks), batch_size):
+            batch = chunks[start:start + batch_size]
+
+            if self.config['embed_chunks']:
+                try:
+                    await self.contextual_embeddings.generate_contextual_embeddings_batch(
+                        [chunk['text'] for chunk in batch],
+                        {'document': document_context, 'source': batch[0]['source'], 'position': batch[0]['position']},
+                        keys=[chunk['id'] for chunk in batch]
+                    )
+                except Exception as error:
+                    self.metrics['embedding_failures'] += len(batch)
+                    logger.warning(f"⚠️ [INGESTION] Embedding failed for {len(batch)} chunks: {error}")
+
+            self.hybrid_search.add_documents([self._keyword_document(chunk) for chunk in batch])
+
+            if self.config['extract_entities'] and self.ecl_pipeline is not None:
+                await self._extract_chunk_entities(batch)
+
+    async def _extract_chunk_entities(self, chunks: List[Dict[str, Any]]):
+        """ECL over new chunks; entities are loaded into the graph with the chunk id as source"""
+        try:
+            await self.ecl_pipeline.execute_ecl_batch([
+                {'content': chunk['text'], 'source': chunk['id'], 'context': {'source': chunk['source']}}
+                for chunk in chunks
+            ])
+        except Exception as error:
+            self.metrics['entity_extraction_failures'] += len(chunks)
+            logger.warning(f"⚠️ [INGESTION] Entity extraction failed for {len(chunks)} chunks: {error}")
+
+    @staticmethod
+    def _keyword_document(chunk: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': chunk['id'],
+            'content': chunk['text'],
+            'metadata': {
+                'source': chunk['source'],
+                'heading_path': chunk['heading_path']
+            }
+        }
+
+    def _embedded_chunk_ids(self, chunk_ids: List[str]) -> set:
+        """Chunk ids whose vectors are in the embedding store (all of them when there is no store to fill)"""
+        store = self.contextual_embeddings.get_embedding_store() if self.config['embed_chunks'] else None
+        if store is None:
+            return set(chunk_ids)
+        return {chunk_id for chunk_id in chunk_ids if chunk_id in store.entries}
+
+    def _mark_missing_embeddings(self):
+        """Flag manifest chunks missing from the embedding store (new, moved or compacted store) as pending"""
+        for entry in self.manifest['files'].values():
+            embedded = self._embedded_chunk_ids(entry['chunks'])
+            entry['pending'] = [chunk_id for chunk_id in entry['chunks'] if chunk_id not in embedded]
+
+    def _remove_chunks(self, chunk_ids: List[str]) -> int:
+        if not chunk_ids:
+            return 0
+        self.hybrid_search.remove_documents(chunk_ids)
+        self.contextual_embeddings.forget_embeddings(chunk_ids)
+        if self.ecl_pipeline is not None:
+            # Chunk ids are the graph sources of their entities
+            try:
+                self.ecl_pipeline.get_graph_store().remove_sources(chunk_ids)
+            except Exception as error:
+                logger.warning(f"⚠️ [INGESTION] Graph retraction failed for {len(chunk_ids)} chunks: {error}")
+        for chunk_id in chunk_ids:
+            self.manifest['chunks'].pop(chunk_id, None)
+        return len(chunk_ids)
+
+    def restore_indexes(self) -> int:
+        """
+        Load manifest chunks missing from the keyword index (new process);
+        their vectors are already persisted in the embedding store
+        """
+        missing = [
+            {'id': chunk_id, **chunk}
+            for chunk_id, chunk in self.manifest['chunks'].items()
+            if chunk_id not in self.hybrid_search.keyword_index
+        ]
+        if missing:
+            self.hybrid_search.add_documents([self._keyword_document(chunk) for chunk in missing])
+            logger.info(f"✅ [INGESTION] Restored {len(missing)} chunks into the keyword index")
+        return len(missing)
+
+    # MANIFEST
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            if self.manifest_path.exists():
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+                if manifest.get('version') == MANIFEST_VERSION:
+                    return manifest
+        except Exception as error:
+            logger.warning(f"⚠️ [INGESTION] Manifest load failed, starting fresh: {error}")
+
+        return {'version': MANIFEST_VERSION, 'files': {}, 'chunks': {}}
+
+    def _save_manifest(self):
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.manifest_path.with_suffix('.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, separators=(',', ':'), ensure_ascii=False)
+            os.replace(temp_path, self.manifest_path)
+        except Exception as error:
+            logger.warning(f"⚠️ [INGESTION] Manifest write failed: {error}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get ingestion pipeline metrics"""
+        return {
+            **self.metrics,
+            'indexed_files': len(self.manifest['files']),
+            'indexed_chunks': len(self.manifest['chunks'])
+        }
+
+# Export main classes
+__all__ = ['MemoryIngestionPipeline', 'MarkdownChunker', 'iter_markdown_sections']
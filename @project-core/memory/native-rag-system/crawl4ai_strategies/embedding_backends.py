@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+
+"""
+EMBEDDING BACKENDS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Pluggable embedding backends behind ContextualEmbeddingsStrategy.
+
+Backends:
+- bridge: embedding-service.js through the JavaScript bridge (default)
+- hashed_ngram: offline CPU backend, hashed word + character n-gram TF-IDF
+  features folded into a fixed dimension by a signed sparse random projection
+- sentence_transformers: small local sentence model (optional dependency)
+
+All backends embed batches, return L2-normalized vectors and are deterministic
+for the same input. Select per deployment with the NATIVE_RAG_EMBEDDING_BACKEND
+environment variable or the strategy config.
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+import logging
+from typing import Dict, Any, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BACKEND_ENV_VAR = 'NATIVE_RAG_EMBEDDING_BACKEND'
+DEFAULT_BACKEND = 'bridge'
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class EmbeddingBackend:
+    """
+    Base class for embedding backends
+    """
+
+    name = 'base'
+
+    def __init__(self, dimensions: int, model_name: str):
+        self.dimensions = dimensions
+        self.model_name = model_name
+        self.metrics = {
+            'batches': 0,
+            'texts_embedded': 0
+        }
+
+    async def embed(self, texts: List[str], options: Dict[str, Any] = None) -> List[List[float]]:
+        """Embed a batch of texts, returning one vector per text"""
+        raise NotImplementedError
+
+    async def embed_one(self, text: str, options: Dict[str, Any] = None) -> List[float]:
+        return (await self.embed([text], options))[0]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            'backend': self.name,
+            'model': self.model_name,
+            'dimensions': self.dimensions
+        }
+
+
+class HashedNgramEmbeddingBackend(EmbeddingBackend):
+    """
+    Offline CPU embeddings from hashed n-gram TF-IDF features
+
+    Each feature (word unigram/bigram, character n-gram) is hashed with a
+    stable digest to `projections` signed buckets, which is a sparse random
+    projection of the (unbounded) TF-IDF feature space into `dimensions`.
+    """
+
+    name = 'hashed_ngram'
+
+    def __init__(self, dimensions: int = 384, char_ngram_range=(3, 5), word_ngram_range=(1, 2),
+                 projections: int = 2, seed: int = 0):
+        super().__init__(dimensions, f'hashed-ngram-{dimensions}')
+        self.char_ngram_range = char_ngram_range
+        self.word_ngram_range = word_ngram_range
+        self.projections = projections
+        self.seed = seed.to_bytes(8, 'little')
+
+        # Optional document frequencies from `fit`; idf defaults to 1.0
+        self.document_frequencies: Dict[str, int] = {}
+        self.document_count = 0
+
+        # Feature -> [(bucket, sign), ...] memo, bounded
+        self._bucket_cache: Dict[str, List[tuple]] = {}
+        self._bucket_cache_limit = 200000
+
+    def _features(self, text: str) -> Dict[str, int]:
+        """Term frequencies of word and character n-gram features"""
+        words = _TOKEN_PATTERN.findall(text.lower())
+        counts: Dict[str, int] = {}
+
+        min_word, max_word = self.word_ngram_range
+        for n in range(min_word, max_word + 1):
+            for i in range(len(words) - n + 1):
+                feature = 'w:' + ' '.join(words[i:i + n])
+                counts[feature] = counts.get(feature, 0) + 1
+
+        min_char, max_char = self.char_ngram_range
+        for word in words:
+            padded = f'<{word}>'
+            for n in range(min_char, max_char + 1):
+                for i in range(len(padded) - n + 1):
+                    feature = 'c:' + padded[i:i + n]
+                    counts[feature] = counts.get(feature, 0) + 1
+
+        return counts
+
+    def _buckets(self, feature: str) -> List[tuple]:
+        buckets = self._bucket_cache.get(feature)
+        if buckets is not None:
+            return buckets
+
+        digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8 * self.projections, key=self.seed).digest()
+        buckets = []
+        for p in range(self.projections):
+            value = int.from_bytes(digest[p * 8:(p + 1) * 8], 'little')
+            buckets.append((value % self.dimensions, 1.0 if (value >> 63) & 1 else -1.0))
+
+        if len(self._bucket_cache) < self._bucket_cache_limit:
+            self._bucket_cache[feature] = buckets
+        return buckets
+
+    def _idf(self, feature: str) -> float:
+        if self.document_count == 0:
+            return 1.0
+        df = self.document_frequencies.get(feature, 0)
+        return math.log((1 + self.document_count) / (1 + df)) + 1.0
+
+    def fit(self, corpus: List[str]):
+        """Learn document frequencies so common features are down-weighted"""
+        for text in corpus:
+            for feature in self._features(text):
+                self.document_frequencies[feature] = self.document_frequencies.get(feature, 0) + 1
+        self.document_count += len(corpus)
+        logger.info(f"✅ [EMBEDDING BACKEND] Hashed n-gram IDF fitted on {self.document_count} documents")
+
+    def embed_sync(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for feature, tf in self._features(text).items():
+            weight = (1.0 + math.log(tf)) * self._idf(feature)
+            for bucket, sign in self._buckets(feature):
+                vector[bucket] += sign * weight
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm > 0:
+            vector = [v / norm for v in vector]
+        return vector
+
+    async def embed(self, texts: List[str], options: Dict[str, Any] = None) -> List[List[float]]:
+        self.metrics['batches'] += 1
+        self.metrics['texts_embedded'] += len(texts)
+        return [self.embed_sync(text) for text in texts]
+
+
+class SentenceTransformerEmbeddingBackend(EmbeddingBackend):
+    """
+    Local sentence-transformers model running on CPU (lazy loading)
+    """
+
+    name = 'sentence_transformers'
+
+    def __init__(self, model_name: str = 'sentence-transformers/all-MiniLM-L6-v2', dimensions: int = 384,
+                 batch_size: int = 32):
+        super().__init__(dimensions, model_name)
+        self.batch_size = batch_size
+        self.model = None
+
+    def _ensure_model_loaded(self):
+        if self.model is not None:
+            return
+
+        # Raises ImportError when sentence-transformers is not installed
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(self.model_name, device='cpu')
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+        logger.info(f"✅ [EMBEDDING BACKEND] Sentence model loaded: {self.model_name}")
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        self._ensure_model_loaded()
+        vectors = self.model.encode(texts, batch_size=self.batch_size, normalize_embeddings=True,
+                                    show_progress_bar=False)
+        return [vector.tolist() for vector in vectors]
+
+    async def embed(self, texts: List[str], options: Dict[str, Any] = None) -> List[List[float]]:
+        self.metrics['batches'] += 1
+        self.metrics['texts_embedded'] += len(texts)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._encode, texts)
+
+
+class BridgeEmbeddingBackend(EmbeddingBackend):
+    """
+    embedding-service.js through the JavaScript bridge
+    """
+
+    name = 'bridge'
+
+    def __init__(self, js_bridge, model_name: str = 'text-embedding-3-large', dimensions: int = 3072):
+        super().__init__(dimensions, model_name)
+        self.js_bridge = js_bridge
+
+    async def _embed_one_via_bridge(self, text: str, options: Dict[str, Any]) -> List[float]:
+        # The request deadline bounds the bridge call; it is not sent to Node
+        options = dict(options)
+        deadline = options.pop('deadline', None)
+        result = await self.js_bridge.call_js_component(
+            'embedding_service',
+            'generateContextualEmbedding',
+            [text, {
+                'model': self.model_name,
+                'dimensions': self.dimensions,
+                **options
+            }],
+            deadline=deadline
+        )
+        if not isinstance(result, dict) or result.get('fallback') or not result.get('embedding'):
+            raise RuntimeError("Embedding service returned no embedding")
+        return result['embedding']
+
+    async def embed(self, texts: List[str], options: Dict[str, Any] = None) -> List[List[float]]:
+        self.metrics['batches'] += 1
+        self.metrics['texts_embedded'] += len(texts)
+        return list(await asyncio.gather(*(self._embed_one_via_bridge(text, options or {}) for text in texts)))
+
+
+def resolve_backend_name(configured: Optional[str] = None) -> str:
+    """Backend name from explicit config, else environment, else default"""
+    return configured or os.environ.get(BACKEND_ENV_VAR) or DEFAULT_BACKEND
+
+
+def create_embedding_backend(name: str, config: Dict[str, Any] = None, js_bridge=None) -> EmbeddingBackend:
+    """
+    Build an embedding backend by name
+
+    Args:
+        name: 'bridge', 'hashed_ngram' or 'sentence_transformers'
+        config: Strategy configuration (model names and dimensions)
+        js_bridge: JavaScriptBridge instance, required for 'bridge'
+    """
+    config = config or {}
+
+    if name == 'hashed_ngram':
+        return HashedNgramEmbeddingBackend(dimensions=config.get('native_embedding_dimensions', 384))
+
+    if name == 'sentence_transformers':
+        return SentenceTransformerEmbeddingBackend(
+            model_name=config.get('local_embedding_model', 'sentence-transformers/all-MiniLM-L6-v2'),
+            dimensions=config.get('native_embedding_dimensions', 384)
+        )
+
+    if name == 'bridge':
+        if js_bridge is None:
+            raise ValueError("The bridge embedding backend requires a JavaScriptBridge")
+        return BridgeEmbeddingBackend(
+            js_bridge,
+            model_name=config.get('embedding_model', 'text-embedding-3-large'),
+            dimensions=config.get('embedding_dimensions', 3072)
+        )
+
+    raise ValueError(f"Unknown embedding backend: {name}")
+
+# Export backends
+__all__ = [
+    'EmbeddingBackend',
+    'HashedNgramEmbeddingBackend',
+    'SentenceTransformerEmbeddingBackend',
+    'BridgeEmbeddingBackend',
+    'create_embedding_backend',
+    'resolve_backend_name',
+    'BACKEND_ENV_VAR'
+]
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+
+"""
+BINARY EMBEDDING STORE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Memory-mapped embedding store replacing the JSON-serialized embedding caches.
+Vectors live in a single float32 (or float16) matrix file and are returned as
+zero-copy NumPy views; texts are stored once, addressed by content hash.
+
+Layout (one directory per store):
+- meta.json: dimensions, dtype and allocated row capacity
+- vectors.bin: row-major matrix, `capacity` x `dimensions`
+- texts.bin: append-only UTF-8 blobs, deduplicated by SHA-256
+- index.jsonl: append-only key -> row / text-offset records, replayed on open
+
+Features:
+- Zero-copy vector lookups via numpy.memmap
+- Text deduplication by content hash
+- Brute-force cosine search over the live matrix (feeds the vector index)
+- Compaction of expired and overwritten rows
+"""
+
+import hashlib
+import json
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SUPPORTED_DTYPES = ('float32', 'float16')
+
+
+class EmbeddingStore:
+    """
+    Memory-mapped float matrix plus compact key -> row index
+    """
+
+    def __init__(self, store_dir: Path, dimensions: int, dtype: str = 'float32', initial_capacity: int = 1024):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for the embedding store")
+        if dtype not in SUPPORTED_DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype} (expected one of {SUPPORTED_DTYPES})")
+
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+        self.meta_file = self.store_dir / 'meta.json'
+        self.vectors_file = self.store_dir / 'vectors.bin'
+        self.texts_file = self.store_dir / 'texts.bin'
+        self.index_file = self.store_dir / 'index.jsonl'
+
+        self.dimensions = dimensions
+        self.dtype = dtype
+        self.capacity = max(1, initial_capacity)
+
+        # key -> entry {'row', 'timestamp', 'texts': {field: hash}, 'metadata'}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        # content hash -> (offset, length) in texts.bin
+        self.text_offsets: Dict[str, Tuple[int, int]] = {}
+        # row -> key (None for free / superseded rows)
+        self.row_keys: List[Optional[str]] = []
+        self.count = 0
+        # Per-row search masks, kept in step with row_keys: rows that belong to a key,
+        # and rows tagged as query embeddings (metadata embedding_role='query')
+        self._live_mask = None
+        self._query_mask = None
+
+        self._matrix = None
+        self._norms = None
+
+        self.metrics = {
+            'puts': 0,
+            'gets': 0,
+            'hits': 0,
+            'misses': 0,
+            'texts_deduplicated': 0,
+            'grow_events': 0,
+            'compactions': 0
+        }
+
+        self._open()
+
+    # STORAGE LIFECYCLE
+
+    def _open(self):
+        """Open (or create) the matrix file and replay the index log"""
+        if self.meta_file.exists():
+            with open(self.meta_file, 'r') as f:
+                meta = json.load(f)
+            if meta['dimensions'] != self.dimensions or meta['dtype'] != self.dtype:
+                raise ValueError(
+                    f"Store at {self.store_dir} holds {meta['dimensions']}d {meta['dtype']} vectors, "
+                    f"requested {self.dimensions}d {self.dtype}"
+                )
+            self.capacity = meta['capacity']
+        else:
+            self._write_meta()
+
+        expected_size = self.capacity * self.dimensions * np.dtype(self.dtype).itemsize
+        if not self.vectors_file.exists() or self.vectors_file.stat().st_size < expected_size:
+            with open(self.vectors_file, 'ab') as f:
+                f.truncate(expected_size)
+
+        self._matrix = np.memmap(self.vectors_file, dtype=self.dtype, mode='r+',
+                                 shape=(self.capacity, self.dimensions))
+        self._replay_index()
+
+    def _write_meta(self):
+        meta = {'dimensions': self.dimensions, 'dtype': self.dtype, 'capacity': self.capacity, 'version': 1}
+        tmp_file = self.meta_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_file, self.meta_file)
+
+    def _replay_index(self):
+        """Rebuild the in-memory index from the append-only log"""
+        self.entries = {}
+        self.text_offsets = {}
+        self.row_keys = []
+        self.count = 0
+        self._live_mask = np.zeros(self.capacity, dtype=bool)
+        self._query_mask = np.zeros(self.capacity, dtype=bool)
+
+        if not self.index_file.exists():
+            return
+
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn write at the tail of the log
+                self._apply_record(record)
+
+    def _apply_record(self, record: Dict[str, Any]):
+        if 'x' in record:
+            self.text_offsets[record['x']] = (record['o'], record['n'])
+            return
+
+        key = record['k']
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.row_keys[previous['row']] = None
+            self._live_mask[previous['row']] = False
+
+        if record.get('d'):
+            return
+
+        row = record['r']
+        if row >= len(self.row_keys):
+            self.row_keys.extend([None] * (row + 1 - len(self.row_keys)))
+        if row >= len(self._live_mask):
+            self._resize_masks(max(row + 1, 2 * len(self._live_mask)))
+        self.row_keys[row] = key
+        self._live_mask[row] = True
+        self._query_mask[row] = record.get('m', {}).get('embedding_role') == 'query'
+        self.count = max(self.count, row + 1)
+        self.entries[key] = {
+            'row': row,
+            'timestamp': record.get('t', 0),
+            'texts': record.get('h', {}),
+            'metadata': record.get('m', {})
+        }
+
+    def _resize_masks(self, size: int):
+        live_mask = np.zeros(size, dtype=bool)
+        query_mask = np.zeros(size, dtype=bool)
+        live_mask[:len(self._live_mask)] = self._live_mask
+        query_mask[:len(self._query_mask)] = self._query_mask
+        self._live_mask, self._query_mask = live_mask, query_mask
+
+    def _append_records(self, records: List[Dict[str, Any]]):
+        with open(self.index_file, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+    def _grow(self, min_capacity: int):
+        """Double the matrix capacity until it fits `min_capacity` rows"""
+        new_capacity = self.capacity
+        while new_capacity < min_capacity:
+            new_capacity *= 2
+
+        self._matrix.flush()
+        self._matrix = None
+        with open(self.vectors_file, 'ab') as f:
+            f.truncate(new_capacity * self.dimensions * np.dtype(self.dtype).itemsize)
+
+        self.capacity = new_capacity
+        self._write_meta()
+        self._matrix = np.memmap(self.vectors_file, dtype=self.dtype, mode='r+',
+                                 shape=(self.capacity, self.dimensions))
+        self._norms = None
+        self.metrics['grow_events'] += 1
+
+    def flush(self):
+        """Flush pending matrix writes to disk"""
+        if self._matrix is not None:
+            self._matrix.flush()
+
+    def close(self):
+        """Flush and release the memory map"""
+        self.flush()
+        self._matrix = None
+        self._norms = None
+
+    # TEXT STORAGE
+
+    @staticmethod
+    def content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _store_text(self, text: str, pending: List[Dict[str, Any]]) -> str:
+        text_hash = self.content_hash(text)
+        if text_hash in self.text_offsets:
+            self.metrics['texts_deduplicated'] += 1
+            return text_hash
+
+        data = text.encode('utf-8')
+        with open(self.texts_file, 'ab') as f:
+            offset = f.tell()
+            f.write(data)
+
+        self.text_offsets[text_hash] = (offset, len(data))
+        pending.append({'x': text_hash, 'o': offset, 'n': len(data)})
+        return text_hash
+
+    def get_text(self, text_hash: str) -> Optional[str]:
+        """Read a stored text by content hash"""
+        location = self.text_offsets.get(text_hash)
+        if location is None:
+            return None
+
+        offset, length = location
+        with open(self.texts_file, 'rb') as f:
+            f.seek(offset)
+            return f.read(length).decode('utf-8')
+
+    # VECTOR OPERATIONS
+
+    def put(self, key: str, vector, texts: Dict[str, str] = None, metadata: Dict[str, Any] = None) -> int:
+        """
+        Store a vector (and its texts) under `key`
+
+        Args:
+            key: Lookup key (e.g. a cache key)
+            vector: Sequence or array with `dimensions` floats
+            texts: Named texts, stored once per content hash
+            metadata: Small JSON-serializable metadata
+
+        Returns:
+            Matrix row holding the vector
+        """
+        self.metrics['puts'] += 1
+        return self._put(key, vector, texts, metadata, time.time())
+
+    def _put(self, key: str, vector, texts: Optional[Dict[str, str]], metadata: Optional[Dict[str, Any]], timestamp: float) -> int:
+        vector = np.asarray(vector, dtype=np.float32)
+        if vector.shape != (self.dimensions,):
+            raise ValueError(f"Expected {self.dimensions}d vector, got shape {vector.shape}")
+
+        pending = []
+        text_hashes = {}
+        for field, text in (texts or {}).items():
+            if text is not None:
+                text_hashes[field] = self._store_text(text, pending)
+
+        row = self.count
+        if row >= self.capacity:
+            self._grow(row + 1)
+
+        self._matrix[row] = vector
+        if self._norms is not None:
+            self._norms = np.append(self._norms, np.float32(np.linalg.norm(vector)))
+
+        record = {'k': key, 'r': row, 't': timestamp, 'h': text_hashes, 'm': metadata or {}}
+        pending.append(record)
+        self._append_records(pending)
+        self._apply_record(record)
+
+        return row
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for `key` with a zero-copy vector view"""
+        self.metrics['gets'] += 1
+        entry = self.entries.get(key)
+        if entry is None:
+            self.metrics['misses'] += 1
+            return None
+
+        self.metrics['hits'] += 1
+        return {
+            'key': key,
+            'row': entry['row'],
+            'vector': self._matrix[entry['row']],
+            'timestamp': entry['timestamp'],
+            'metadata': entry['metadata'],
+            'texts': {field: self.get_text(text_hash) for field, text_hash in entry['texts'].items()}
+        }
+
+    def get_vector(self, key: str):
+        """Return a zero-copy view of the vector stored under `key`"""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return self._matrix[entry['row']]
+
+    def delete(self, key: str) -> bool:
+        """Remove `key` from the index (its row is reclaimed on compaction)"""
+        if key not in self.entries:
+            return False
+        record = {'k': key, 'd': 1}
+        self._append_records([record])
+        self._apply_record(record)
+        return True
+
+    def matrix(self):
+        """Zero-copy view over all written rows (dead rows included, see `row_keys`)"""
+        return self._matrix[:self.count]
+
+    def live_rows(self):
+        """Array of row numbers that currently belong to a key"""
+        return np.fromiter((entry['row'] for entry in self.entries.values()), dtype=np.int64, count=len(self.entries))
+
+    def _row_norms(self):
+        if self._norms is None or len(self._norms) != self.count:
+            matrix = self.matrix().astype(np.float32, copy=False)
+            self._norms = np.linalg.norm(matrix, axis=1).astype(np.float32)
+        return self._norms
+
+    def _excluded_rows(self, include_query_rows: bool):
+        """Mask of rows search must skip: superseded rows (and query-embedding rows)"""
+        excluded = ~self._live_mask[:self.count]
+        if not include_query_rows:
+            excluded |= self._query_mask[:self.count]
+        return excluded
+
+    def is_document_row(self, row: int) -> bool:
+        """True when `row` belongs to a key and is not tagged as a query embedding"""
+        return row < self.count and bool(self._live_mask[row]) and not self._query_mask[row]
+
+    def search(self, query_vector, k: int = 10, include_query_rows: bool = True) -> List[Dict[str, Any]]:
+        """
+        Cosine similarity search over the live rows
+
+        Args:
+            query_vector: Query vector with `dimensions` floats
+            k: Number of results
+            include_query_rows: False skips rows tagged embedding_role='query'
+                (they then take up none of the k results)
+
+        Returns:
+            List of {'key', 'row', 'score'} sorted by descending score
+        """
+        if self.count == 0 or not self.entries:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+        if query.shape != (self.dimensions,) or query_norm == 0:
+            return []
+
+        scores = self.matrix() @ query
+        norms = self._row_norms()
+        scores = scores / np.maximum(norms * query_norm, 1e-12)
+
+        # Exclude rows that no longer belong to a key (and query rows if asked)
+        excluded = self._excluded_rows(include_query_rows)
+        scores[excluded] = -np.inf
+
+        k = min(k, self.count - int(excluded.sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            {'key': self.row_keys[row], 'row': int(row), 'score': float(scores[row])}
+            for row in top
+        ]
+
+    def search_batch(self, query_vectors, k: int = 10, include_query_rows: bool = True) -> List[List[Dict[str, Any]]]:
+        """
+        Cosine search for several queries with one matrix product over the store
+        (`include_query_rows` as for search())
+
+        Returns:
+            One result list per query, as search() would return it (empty for
+            queries with the wrong shape or a zero norm)
+        """
+        if self.count == 0 or not self.entries or len(query_vectors) == 0:
+            return [[] for _ in range(len(query_vectors))]
+
+        queries = np.zeros((len(query_vectors), self.dimensions), dtype=np.float32)
+        valid = np.zeros(len(query_vectors), dtype=bool)
+        for index, vector in enumerate(query_vectors):
+            vector = np.asarray(vector, dtype=np.float32)
+            if vector.shape == (self.dimensions,):
+                queries[index] = vector
+                valid[index] = True
+        query_norms = np.linalg.norm(queries, axis=1)
+        valid &= query_norms > 0
+
+        # (count, queries) scores in one pass over the memory-mapped matrix
+        scores = self.matrix() @ queries.T
+        scores = scores / np.maximum(self._row_norms()[:, None] * query_norms[None, :], 1e-12)
+
+        excluded = self._excluded_rows(include_query_rows)
+        scores[excluded] = -np.inf
+
+        k = min(k, self.count - int(excluded.sum()))
+        if k <= 0:
+            return [[] for _ in range(len(query_vectors))]
+        top = np.argpartition(-scores, k - 1, axis=0)[:k]
+        results = []
+        for index in range(len(query_vectors)):
+            if not valid[index]:
+                results.append([])
+                continue
+            column = scores[:, index]
+            rows = top[:, index]
+            rows = rows[np.argsort(-column[rows])]
+            results.append([
+                {'key': self.row_keys[row], 'row': int(row), 'score': float(column[row])}
+                for row in rows
+            ])
+        return results
+
+    def compact(self, max_age: Optional[float] = None) -> int:
+        """
+        Rewrite the store keeping only live (and, with `max_age`, fresh) entries
+
+        Returns:
+            Number of rows reclaimed
+        """
+        now = time.time()
+        keep = [
+            (key, entry) for key, entry in self.entries.items()
+            if max_age is None or now - entry['timestamp'] <= max_age
+        ]
+        keep.sort(key=lambda item: item[1]['row'])
+
+        reclaimed = self.count - len(keep)
+        if reclaimed == 0:
+            return 0
+
+        rows = np.array([entry['row'] for _, entry in keep], dtype=np.int64)
+        vectors = np.array(self._matrix[rows]) if len(rows) else np.empty((0, self.dimensions), dtype=self.dtype)
+
+        texts = {}
+        for _, entry in keep:
+            for text_hash in entry['texts'].values():
+                if text_hash not in texts:
+                    texts[text_hash] = self.get_text(text_hash)
+
+        self.close()
+        for path in (self.vectors_file, self.texts_file, self.index_file):
+            if path.exists():
+                path.unlink()
+
+        self._open()
+        for position, (key, entry) in enumerate(keep):
+            stored = {field: texts[text_hash] for field, text_hash in entry['texts'].items()}
+            self._put(key, vectors[position], stored, entry['metadata'], entry['timestamp'])
+
+        self.metrics['compactions'] += 1
+
+        logger.info(f"🧹 [EMBEDDING STORE] Compaction reclaimed {reclaimed} rows")
+        return reclaimed
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get embedding store metrics"""
+        return {
+            **self.metrics,
+            'entries': len(self.entries),
+            'rows_written': self.count,
+            'capacity': self.capacity,
+            'dimensions': self.dimensions,
+            'dtype': self.dtype,
+            'unique_texts': len(self.text_offsets)
+        }
+
+# Export main class
+__all__ = ['EmbeddingStore', 'NUMPY_AVAILABLE']
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+"""
+GRAPH NEIGHBOURHOOD INDEX V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Graph-retrieval leg for hybrid search over the ECL knowledge graph store.
+
+A query is matched against entity names, the matched entities are expanded
+through a bounded k-hop neighbourhood, and the sources (indexed chunks) that
+mention the reached entities are scored.
+
+Features:
+- In-memory snapshot of the graph store, rebuilt only when its generation changes
+- Token-level Aho-Corasick matching of query text against entity names
+- Precomputed adjacency lists, capped to the strongest edges per entity
+- Activation spreading with per-hop decay and saturating edge weights
+- IDF-weighted source scoring (entities mentioned everywhere carry little signal)
+- Hard deadline: expansion stops and returns partial scores when the budget is spent
+"""
+
+import heapq
+import math
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Callable
+import sys
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cognee_ecl_pipeline.entity_scanner import TokenAhoCorasick, TOKEN_PATTERN
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class GraphNeighbourhoodIndex:
+    """
+    Cached adjacency index answering entity-neighbourhood queries
+    """
+
+    def __init__(self, graph_store, max_hops: int = 2, max_degree: int = 32,
+                 hop_decay: float = 0.5, max_expanded: int = 500, min_name_length: int = 3):
+        """
+        Args:
+            graph_store: KnowledgeGraphStore to snapshot
+            max_hops: Neighbourhood radius around the query entities
+            max_degree: Strongest edges kept per entity
+            hop_decay: Activation multiplier per hop
+            max_expanded: Upper bound on entities reached per query
+            min_name_length: Shorter entity names are not matched against queries
+        """
+        if max_hops < 0 or max_degree < 1:
+            raise ValueError("max_hops must be >= 0 and max_degree >= 1")
+
+        self.graph_store = graph_store
+        self.max_hops = max_hops
+        self.max_degree = max_degree
+        self.hop_decay = hop_decay
+        self.max_expanded = max_expanded
+        self.min_name_length = min_name_length
+
+        self.generation = None
+        self.name_automaton: Optional[TokenAhoCorasick] = None
+        self.entity_names: Dict[int, str] = {}
+        # entity id -> [(neighbour id, weight in (0, 1))], strongest first
+        self.adjacency: Dict[int, List[Tuple[int, float]]] = {}
+        # entity id -> ([(source, mentions)], idf)
+        self.entity_sources: Dict[int, Tuple[List[Tuple[str, int]], float]] = {}
+
+        self.metrics = {
+            'rebuilds': 0,
+            'last_rebuild_ms': 0.0,
+            'searches': 0,
+            'budget_exceeded': 0,
+            'average_search_time': 0
+        }
+
+    # INDEX
+
+    def refresh(self) -> bool:
+        """Rebuild from the store if it changed since the last snapshot"""
+        if self.generation is not None and self.graph_store.generation() == self.generation:
+            return False
+        self._rebuild()
+        return True
+
+    def _rebuild(self):
+        start_time = time.time()
+        snapshot = self.graph_store.export_graph()
+
+        names: Dict[Tuple[str, ...], List[int]] = {}
+        self.entity_names = {}
+        for entity_id, normalized_name, _ in snapshot['entities']:
+            self.entity_names[entity_id] = normalized_name
+            if len(normalized_name) >= self.min_name_length:
+                tokens = tuple(TOKEN_PATTERN.findall(normalized_name))
+                if tokens:
+                    names.setdefault(tokens, []).append(entity_id)
+        self.name_automaton = TokenAhoCorasick(names)
+
+        neighbours: Dict[int, Dict[int, float]] = {}
+        for source_id, target_id, strength in snapshot['edges']:
+            # Edges are traversed both ways; parallel edges of different types add up
+            for a, b in ((source_id, target_id), (target_id, source_id)):
+                neighbours.setdefault(a, {})
+                neighbours[a][b] = neighbours[a].get(b, 0.0) + strength
+        self.adjacency = {
+            entity_id: [
+                (neighbour, strength / (strength + 1.0))  # accumulated strength saturates towards 1
+                for neighbour, strength in heapq.nlargest(self.max_degree, edges.items(), key=lambda item: item[1])
+            ]
+            for entity_id, edges in neighbours.items()
+        }
+
+        sources: Dict[int, List[Tuple[str, int]]] = {}
+        for entity_id, source, mentions in snapshot['sources']:
+            sources.setdefault(entity_id, []).append((source, mentions))
+        total_sources = len({source for _, source, _ in snapshot['sources']}) or 1
+        self.entity_sources = {
+            entity_id: (entity_sources, math.log(1 + total_sources / len(entity_sources)))
+            for entity_id, entity_sources in sources.items()
+        }
+
+        self.generation = snapshot['generation']
+        rebuild_time = (time.time() - start_time) * 1000
+        self.metrics['rebuilds'] += 1
+        self.metrics['last_rebuild_ms'] = rebuild_time
+        logger.info(f"🕸️ [GRAPH INDEX] Rebuilt: {len(self.entity_names)} entities, "
+                    f"{len(self.adjacency)} with edges ({rebuild_time:.1f}ms)")
+
+    # QUERIES
+
+    def match_entities(self, query: str) -> List[int]:
+        """Entity ids whose names occur in the query as whole tokens"""
+        if self.name_automaton is None:
+            return []
+        tokens = [token.lower() for token in TOKEN_PATTERN.findall(query)]
+        matched = []
+        for _, _, entity_ids in self.name_automaton.iter_matches(tokens):
+            matched.extend(entity_ids)
+        return list(dict.fromkeys(matched))
+
+    def search(self, query: str, k: int = 10, time_budget_ms: Optional[float] = None,
+               valid_source: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """
+        Score sources by the activation of the entities they mention
+
+        Args:
+            query: Query text
+            k: Maximum sources returned
+            time_budget_ms: Expansion deadline; partial scores are returned when hit
+            valid_source: Filter for sources that can be resolved to documents
+
+        Returns:
+            {'results': [{'source', 'score', 'entities'}], 'seeds', 'expanded', 'truncated'}
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + time_budget_ms / 1000 if time_budget_ms is not None else None
+        self.metrics['searches'] += 1
+
+        seeds = self.match_entities(query)
+        activation = {entity_id: 1.0 for entity_id in seeds}
+        frontier = list(seeds)
+        truncated = False
+
+        for _ in range(self.max_hops):
+            next_frontier = []
+            for entity_id in frontier:
+                if deadline is not None and time.perf_counter() > deadline:
+                    truncated = True
+                    break
+                parent_activation = activation[entity_id] * self.hop_decay
+                for neighbour, weight in self.adjacency.get(entity_id, ()):
+                    score = parent_activation * weight
+                    if score > activation.get(neighbour, 0.0):
+                        if neighbour not in activation:
+                            if len(activation) >= self.max_expanded:
+                                continue
+                            next_frontier.append(neighbour)
+                        activation[neighbour] = score
+            if truncated or not next_frontier:
+                break
+            frontier = next_frontier
+
+        scores: Dict[str, float] = {}
+        contributions: Dict[str, List[Tuple[float, int]]] = {}
+        for entity_id, entity_activation in activation.items():
+            entity_sources, idf = self.entity_sources.get(entity_id, ((), 0.0))
+            for source, mentions in entity_sources:
+                if valid_source is not None and not valid_source(source):
+                    continue
+                contribution = entity_activation * idf * (1.0 + math.log(max(mentions, 1)))
+                scores[source] = scores.get(source, 0.0) + contribution
+                contributions.setdefault(source, []).append((contribution, entity_id))
+
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        results = [
+            {
+                'source': source,
+                'score': score,
+                'entities': [self.entity_names[entity_id] for _, entity_id in heapq.nlargest(5, contributions[source])]
+            }
+            for source, score in top
+        ]
+
+        search_time = (time.perf_counter() - start_time) * 1000
+        if truncated:
+            self.metrics['budget_exceeded'] += 1
+        self.metrics['average_search_time'] = (
+            search_time if self.metrics['average_search_time'] == 0
+            else (self.metrics['average_search_time'] + search_time) / 2
+        )
+
+        return {
+            'results': results,
+            'seeds': len(seeds),
+            'expanded': len(activation),
+            'truncated': truncated
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            'generation': self.generation,
+            'entities': len(self.entity_names),
+            'entities_with_edges': len(self.adjacency)
+        }
+
+# Export main class
+__all__ = ['GraphNeighbourhoodIndex']
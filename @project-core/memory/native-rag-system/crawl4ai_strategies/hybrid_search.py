@@ -16,8 +16,15 @@ Based on Crawl4AI research and RRF (Reciprocal Rank Fusion):
 Features:
 - Hybrid search combining semantic + lexical approaches
 - Integration with JavaScript bridge for vector search
+- Native vector search over the binary embedding store when a query embedding is available
+- Optional compressed vector index (Matryoshka/PCA reduction, int8/binary quantization, full-precision rescoring)
 - Native BM25 implementation using bm25s library
+- Incremental BM25 index with per-document add/remove for ingested corpora
+- Graph-neighbourhood leg over the ECL knowledge graph store (k-hop expansion of
+  query entities, scored onto the chunks that mention them) under a latency budget
 - RRF (Reciprocal Rank Fusion) merge algorithm
+- Batch search: one matrix product for the vector leg and shared posting walks
+  for the keyword leg across a batch of queries
 - Integration with existing hybrid cache system
 - Robust fallback mechanisms
 """
@@ -35,6 +42,9 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from integration.js_bridge import JavaScriptBridge
+from crawl4ai_strategies.vector_index import CompressedVectorIndex
+from crawl4ai_strategies.keyword_index import IncrementalBM25Index
+from crawl4ai_strategies.graph_index import GraphNeighbourhoodIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -60,14 +70,31 @@ class HybridSearchStrategy:
             'cache_enabled': True,
             'cache_ttl': 1800,  # 30 minutes (matching existing system)
             'fallback_enabled': True,
-            'performance_monitoring': True
+            'performance_monitoring': True,
+            # Compressed vector index over the embedding store ('none'/'none' = exact search)
+            'vector_index_reduction': 'none',  # 'none' | 'matryoshka' | 'pca'
+            'vector_index_dimensions': 256,
+            'vector_index_quantization': 'none',  # 'none' | 'int8' | 'binary'
+            'vector_index_rescore_multiplier': 4,
+            # Graph-neighbourhood leg (active once a knowledge graph store is attached)
+            'graph_weight': 0.2,
+            'graph_max_hops': 2,
+            'graph_max_degree': 32,
+            'graph_hop_decay': 0.5,
+            'graph_time_budget_ms': 20
         }
         
         # Performance metrics
         self.metrics = {
             'total_searches': 0,
+            'batch_searches': 0,
             'vector_search_calls': 0,
+            'native_vector_searches': 0,
             'keyword_search_calls': 0,
+            'graph_search_calls': 0,
+            'graph_budget_exceeded': 0,
+            'documents_added': 0,
+            'documents_removed': 0,
             'rrf_merge_calls': 0,
             'cache_hits': 0,
             'cache_misses': 0,
@@ -85,6 +112,16 @@ class HybridSearchStrategy:
         self.document_corpus = []
         self.tokenized_corpus = []
         
+        # Incremental keyword index fed by add_documents / remove_documents
+        self.keyword_index = IncrementalBM25Index(k1=self.config['bm25_k1'], b=self.config['bm25_b'])
+        
+        # Binary embedding store feeding the native vector leg (optional)
+        self.embedding_store = None
+        self.vector_index = None
+        
+        # Knowledge graph neighbourhood index feeding the graph leg (optional)
+        self.graph_index = None
+        
         # Initialize BM25 system
         self._initialize_bm25_system()
         
@@ -139,10 +176,13 @@ class HybridSearchStrategy:
             # Step 2: Perform keyword search using native BM25
             keyword_results = await self._perform_keyword_search(query, context)
             
-            # Step 3: Merge results using RRF algorithm
-            hybrid_results = self._merge_results_rrf(vector_results, keyword_results)
+            # Step 3: Expand query entities through the knowledge graph
+            graph_results = self._perform_graph_search(query, context)
+            
+            # Step 4: Merge results using RRF algorithm
+            hybrid_results = self._merge_results_rrf(vector_results, keyword_results, graph_results)
             
-            # Step 4: Enhance results with metadata
+            # Step 5: Enhance results with metadata
             enhanced_results = self._enhance_results_metadata(hybrid_results, query, context)
             
             # Cache the results
@@ -164,12 +204,210 @@ class HybridSearchStrategy:
             
             raise
     
+    async def perform_hybrid_search_batch(self, queries: List[str], contexts: Optional[List[Dict[str, Any]]] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Hybrid search for several queries
+        
+        Cached queries are answered from the cache; for the rest the vector leg
+        is one matrix product over the embedding store (when every query brings
+        a query embedding) and the keyword leg walks each distinct term's
+        postings once.
+        
+        Args:
+            queries: Search query strings
+            contexts: Per-query context (query_embedding, source, ...)
+            
+        Returns:
+            One result list per query, as perform_hybrid_search would return it
+        """
+        start_time = time.time()
+        contexts = [dict(context or {}) for context in (contexts or [{}] * len(queries))]
+        self.metrics['batch_searches'] += 1
+        self.metrics['total_searches'] += len(queries)
+        
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        pending = []
+        for index, (query, context) in enumerate(zip(queries, contexts)):
+            cache_key = self._generate_cache_key(query, context)
+            cached_result = await self._get_cached_result(cache_key)
+            if cached_result is not None:
+                self.metrics['cache_hits'] += 1
+                results[index] = cached_result
+            else:
+                self.metrics['cache_misses'] += 1
+                pending.append((index, cache_key))
+        
+        if pending:
+            try:
+                pending_queries = [queries[index] for index, _ in pending]
+                pending_contexts = [contexts[index] for index, _ in pending]
+                vector_results = await self._perform_vector_search_batch(pending_queries, pending_contexts)
+                keyword_results = await self._perform_keyword_search_batch(pending_queries, pending_contexts)
+                
+                for (index, cache_key), query, context, vector_hits, keyword_hits in zip(
+                    pending, pending_queries, pending_contexts, vector_results, keyword_results
+                ):
+                    graph_results = self._perform_graph_search(query, context)
+                    hybrid_results = self._merge_results_rrf(vector_hits, keyword_hits, graph_results)
+                    enhanced_results = self._enhance_results_metadata(hybrid_results, query, context)
+                    await self._cache_result(cache_key, enhanced_results)
+                    results[index] = enhanced_results
+                    
+            except Exception as error:
+                logger.error(f"❌ [HYBRID SEARCH] Batch search failed: {error}")
+                if not self.config['fallback_enabled']:
+                    raise
+                for index, _ in pending:
+                    if results[index] is None:
+                        results[index] = await self._fallback_search(queries[index], contexts[index], error)
+        
+        search_time = (time.time() - start_time) * 1000
+        self._update_search_time_metrics(search_time)
+        logger.info(f"✅ [HYBRID SEARCH] Batch of {len(queries)} searches ({len(pending)} computed, {search_time:.1f}ms)")
+        return results
+    
+    async def _perform_vector_search_batch(self, queries: List[str], contexts: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Vector leg for a batch: one store-wide matrix product when possible
+        """
+        embeddings = [context.get('query_embedding') for context in contexts]
+        if (self.embedding_store is not None and self.vector_index is None and
+                all(embedding is not None and len(embedding) == self.embedding_store.dimensions for embedding in embeddings)):
+            self.metrics['vector_search_calls'] += len(queries)
+            self.metrics['native_vector_searches'] += len(queries)
+            try:
+                matches = self.embedding_store.search_batch(embeddings, k=self.config['max_results'],
+                                                            include_query_rows=False)
+                return [
+                    self._vector_results_from_matches(query, query_matches, 'embedding_store_cosine')
+                    for query, query_matches in zip(queries, matches)
+                ]
+            except Exception as error:
+                logger.warning(f"⚠️ [HYBRID SEARCH] Batch vector search failed: {error}")
+        
+        # Compressed index or bridge: per query, bridge calls overlap
+        return list(await asyncio.gather(*(
+            self._perform_vector_search(query, context) for query, context in zip(queries, contexts)
+        )))
+    
+    async def _perform_keyword_search_batch(self, queries: List[str], contexts: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Keyword leg for a batch: shared posting walks over the incremental index
+        """
+        if len(self.keyword_index) == 0:
+            return [await self._perform_keyword_search(query, context) for query, context in zip(queries, contexts)]
+        
+        self.metrics['keyword_search_calls'] += len(queries)
+        try:
+            hits = self.keyword_index.search_batch(queries, k=self.config['max_results'])
+            return [self._keyword_results_from_hits(query_hits) for query_hits in hits]
+        except Exception as error:
+            logger.warning(f"⚠️ [HYBRID SEARCH] Batch keyword search failed: {error}")
+            return [[] for _ in queries]
+    
+    def attach_embedding_store(self, embedding_store):
+        """
+        Attach a binary embedding store as the native vector index
+        """
+        self.embedding_store = embedding_store
+        self.vector_index = None
+        if embedding_store is None:
+            return
+        
+        logger.info(f"✅ [HYBRID SEARCH] Embedding store attached ({embedding_store.get_metrics()['entries']} vectors)")
+        
+        if self.config['vector_index_reduction'] != 'none' or self.config['vector_index_quantization'] != 'none':
+            try:
+                self.vector_index = CompressedVectorIndex(
+                    reduction=self.config['vector_index_reduction'],
+                    target_dimensions=self.config['vector_index_dimensions'],
+                    quantization=self.config['vector_index_quantization'],
+                    rescore_multiplier=self.config['vector_index_rescore_multiplier']
+                )
+                self.vector_index.sync_with_store(embedding_store)
+            except Exception as error:
+                logger.warning(f"⚠️ [HYBRID SEARCH] Compressed vector index unavailable, using exact search: {error}")
+                self.vector_index = None
+    
+    def attach_graph_store(self, graph_store):
+        """
+        Attach an ECL knowledge graph store as the graph-neighbourhood leg
+
+        Entity sources in the store are matched against keyword index document
+        ids, so the graph must be loaded with chunk ids as ECL sources.
+        """
+        if graph_store is None:
+            self.graph_index = None
+            return
+        
+        self.graph_index = GraphNeighbourhoodIndex(
+            graph_store,
+            max_hops=self.config['graph_max_hops'],
+            max_degree=self.config['graph_max_degree'],
+            hop_decay=self.config['graph_hop_decay']
+        )
+        logger.info("✅ [HYBRID SEARCH] Knowledge graph store attached")
+    
+    def _perform_graph_search(self, query: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Score indexed chunks through the k-hop neighbourhood of the query's entities
+        """
+        if self.graph_index is None or len(self.keyword_index) == 0:
+            return []
+        
+        self.metrics['graph_search_calls'] += 1
+        
+        try:
+            # Adjacency is cached; a rebuild only happens after new ECL loads
+            self.graph_index.refresh()
+            
+            documents = self.keyword_index.documents
+            search = self.graph_index.search(
+                query,
+                k=self.config['max_results'],
+                time_budget_ms=context.get('graph_time_budget_ms', self.config['graph_time_budget_ms']),
+                valid_source=documents.__contains__
+            )
+            if search['truncated']:
+                self.metrics['graph_budget_exceeded'] += 1
+            
+            graph_results = []
+            for i, hit in enumerate(search['results']):
+                document = documents[hit['source']]
+                graph_results.append({
+                    'content': document['content'],
+                    'score': hit['score'],
+                    'rank': i + 1,
+                    'search_type': 'graph',
+                    'metadata': {
+                        **document['metadata'],
+                        'doc_id': hit['source'],
+                        'graph_entities': hit['entities'],
+                        'graph_truncated': search['truncated'],
+                        'algorithm': 'graph_neighbourhood'
+                    }
+                })
+            
+            logger.info(f"🕸️ [HYBRID SEARCH] Graph search: {len(graph_results)} results "
+                        f"({search['seeds']} seed entities, {search['expanded']} reached)")
+            return graph_results
+            
+        except Exception as error:
+            logger.warning(f"⚠️ [HYBRID SEARCH] Graph search failed: {error}")
+            return []
+    
     async def _perform_vector_search(self, query: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Perform vector search using JavaScript bridge
+        Perform vector search using the embedding store or JavaScript bridge
         """
         self.metrics['vector_search_calls'] += 1
         
+        query_embedding = context.get('query_embedding')
+        if self.embedding_store is not None and query_embedding is not None:
+            native_results = self._native_vector_search(query, query_embedding)
+            if native_results is not None:
+                return native_results
+        
         try:
             # Call vector search via JavaScript bridge
             search_args = [query, {
@@ -182,7 +420,8 @@ class HybridSearchStrategy:
             result = await self.js_bridge.call_js_component(
                 'embedding_service',
                 'vectorSearch',
-                search_args
+                search_args,
+                deadline=context.get('deadline')
             )
             
             # Normalize vector search results
@@ -204,6 +443,69 @@ class HybridSearchStrategy:
             logger.warning(f"⚠️ [HYBRID SEARCH] Vector search failed: {error}")
             return []
     
+    def _native_vector_search(self, query: str, query_embedding: List[float]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Cosine search over the memory-mapped embedding store
+        """
+        try:
+            if len(query_embedding) != self.embedding_store.dimensions:
+                return None
+            
+            self.metrics['native_vector_searches'] += 1
+            
+            k = self.config['max_results']
+            if self.vector_index is not None:
+                self.vector_index.sync_with_store(self.embedding_store)
+                row_keys = self.embedding_store.row_keys
+                matches = [
+                    {'key': row_keys[row], 'row': row, 'score': score}
+                    for row, score in self.vector_index.search(
+                        query_embedding, k=k, valid_rows=self.embedding_store.is_document_row
+                    )
+                ]
+                algorithm = 'compressed_index_rescored'
+            else:
+                matches = self.embedding_store.search(query_embedding, k=k, include_query_rows=False)
+                algorithm = 'embedding_store_cosine'
+            
+            vector_results = self._vector_results_from_matches(query, matches, algorithm)
+            logger.info(f"🔍 [HYBRID SEARCH] Native vector search: {len(vector_results)} results")
+            return vector_results
+            
+        except Exception as error:
+            logger.warning(f"⚠️ [HYBRID SEARCH] Native vector search failed: {error}")
+            return None
+    
+    def _vector_results_from_matches(self, query: str, matches: List[Dict[str, Any]], algorithm: str) -> List[Dict[str, Any]]:
+        """
+        Embedding store matches -> vector leg results
+        
+        Query-embedding rows are filtered inside the store search, so they never
+        take up any of the max_results slots; a document whose text equals the
+        query is a legitimate (best) hit.
+        """
+        vector_results = []
+        for match in matches:
+            entry = self.embedding_store.get(match['key'])
+            if entry is None:
+                continue
+            content = entry['texts'].get('original_content') or ''
+            if not content:
+                continue
+            vector_results.append({
+                'content': content,
+                'score': match['score'],
+                'rank': len(vector_results) + 1,
+                'search_type': 'vector',
+                'metadata': {
+                    **entry['metadata'],
+                    'store_row': match['row'],
+                    'algorithm': algorithm
+                }
+            })
+        
+        return vector_results[:self.config['max_results']]
+    
     async def _perform_keyword_search(self, query: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Perform keyword search using native BM25
@@ -211,7 +513,10 @@ class HybridSearchStrategy:
         self.metrics['keyword_search_calls'] += 1
         
         try:
-            if self.bm25s is not None and self.bm25_retriever is not None:
+            if len(self.keyword_index) > 0:
+                # Incrementally maintained index (ingested memory corpus)
+                return self._incremental_bm25_search(query)
+            elif self.bm25s is not None and self.bm25_retriever is not None:
                 # Use BM25S library for keyword search
                 return await self._bm25s_search(query, context)
             else:
@@ -222,6 +527,35 @@ class HybridSearchStrategy:
             logger.warning(f"⚠️ [HYBRID SEARCH] Keyword search failed: {error}")
             return []
     
+    def _incremental_bm25_search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Perform BM25 search over the incremental keyword index
+        """
+        keyword_results = self._keyword_results_from_hits(self.keyword_index.search(query, k=self.config['max_results']))
+        
+        logger.info(f"📝 [HYBRID SEARCH] Incremental BM25 search: {len(keyword_results)} results")
+        return keyword_results
+    
+    def _keyword_results_from_hits(self, hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Incremental BM25 hits -> keyword leg results
+        """
+        return [
+            {
+                'content': hit['content'],
+                'score': hit['score'],
+                'rank': i + 1,
+                'search_type': 'keyword',
+                'metadata': {
+                    **hit['metadata'],
+                    'doc_id': hit['id'],
+                    'bm25_score': hit['score'],
+                    'algorithm': 'incremental_bm25'
+                }
+            }
+            for i, hit in enumerate(hits)
+        ]
+    
     async def _bm25s_search(self, query: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Perform BM25 search using bm25s library
@@ -310,7 +644,8 @@ class HybridSearchStrategy:
             logger.warning(f"⚠️ [HYBRID SEARCH] Simple keyword search failed: {error}")
             return []
     
-    def _merge_results_rrf(self, vector_results: List[Dict[str, Any]], keyword_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _merge_results_rrf(self, vector_results: List[Dict[str, Any]], keyword_results: List[Dict[str, Any]],
+                           graph_results: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Merge results using Reciprocal Rank Fusion (RRF) algorithm
         
@@ -324,53 +659,41 @@ class HybridSearchStrategy:
             doc_scores = {}
             doc_metadata = {}
             
-            # Process vector results
-            for result in vector_results:
-                content = result['content']
-                rank = result['rank']
-                
-                # RRF score contribution from vector search
-                rrf_score = 1.0 / (self.config['rrf_k'] + rank)
-                weighted_score = rrf_score * self.config['vector_weight']
-                
-                if content not in doc_scores:
-                    doc_scores[content] = 0.0
-                    doc_metadata[content] = {
-                        'search_types': [],
-                        'vector_rank': None,
-                        'keyword_rank': None,
-                        'vector_score': None,
-                        'keyword_score': None
-                    }
-                
-                doc_scores[content] += weighted_score
-                doc_metadata[content]['search_types'].append('vector')
-                doc_metadata[content]['vector_rank'] = rank
-                doc_metadata[content]['vector_score'] = result['score']
-            
-            # Process keyword results
-            for result in keyword_results:
-                content = result['content']
-                rank = result['rank']
-                
-                # RRF score contribution from keyword search
-                rrf_score = 1.0 / (self.config['rrf_k'] + rank)
-                weighted_score = rrf_score * self.config['keyword_weight']
-                
-                if content not in doc_scores:
-                    doc_scores[content] = 0.0
-                    doc_metadata[content] = {
-                        'search_types': [],
-                        'vector_rank': None,
-                        'keyword_rank': None,
-                        'vector_score': None,
-                        'keyword_score': None
-                    }
-                
-                doc_scores[content] += weighted_score
-                doc_metadata[content]['search_types'].append('keyword')
-                doc_metadata[content]['keyword_rank'] = rank
-                doc_metadata[content]['keyword_score'] = result['score']
+            legs = [
+                ('vector', vector_results, self.config['vector_weight']),
+                ('keyword', keyword_results, self.config['keyword_weight']),
+                ('graph', graph_results or [], self.config['graph_weight'])
+            ]
+            
+            for search_type, results, weight in legs:
+                for result in results:
+                    content = result['content']
+                    rank = result['rank']
+                    
+                    # Weighted RRF score contribution from this leg
+                    rrf_score = 1.0 / (self.config['rrf_k'] + rank)
+                    weighted_score = rrf_score * weight
+                    
+                    if content not in doc_scores:
+                        doc_scores[content] = 0.0
+                        doc_metadata[content] = {
+                            'search_types': [],
+                            'vector_rank': None,
+                            'keyword_rank': None,
+                            'graph_rank': None,
+                            'vector_score': None,
+                            'keyword_score': None,
+                            'graph_score': None,
+                            'graph_entities': None
+                        }
+                    
+                    doc_scores[content] += weighted_score
+                    doc_metadata[content]['search_types'].append(search_type)
+                    doc_metadata[content][f'{search_type}_rank'] = rank
+                    doc_metadata[content][f'{search_type}_score'] = result['score']
+                    if search_type == 'graph':
+                        # Which entities connected the document to the query
+                        doc_metadata[content]['graph_entities'] = result['metadata']['graph_entities']
             
             # Create merged results
             merged_results = []
@@ -378,12 +701,8 @@ class HybridSearchStrategy:
                 merged_results.append({
                     'content': content,
                     'hybrid_score': hybrid_score,
-                    'search_types': doc_metadata[content]['search_types'],
-                    'vector_rank': doc_metadata[content]['vector_rank'],
-                    'keyword_rank': doc_metadata[content]['keyword_rank'],
-                    'vector_score': doc_metadata[content]['vector_score'],
-                    'keyword_score': doc_metadata[content]['keyword_score'],
-                    'boosted': len(doc_metadata[content]['search_types']) > 1  # Found in both searches
+                    **doc_metadata[content],
+                    'boosted': len(doc_metadata[content]['search_types']) > 1  # Found by several legs
                 })
             
             # Sort by hybrid score
@@ -399,7 +718,7 @@ class HybridSearchStrategy:
         except Exception as error:
             logger.error(f"❌ [HYBRID SEARCH] RRF merge failed: {error}")
             # Fallback to simple concatenation
-            return vector_results + keyword_results
+            return vector_results + keyword_results + (graph_results or [])
     
     def _enhance_results_metadata(self, results: List[Dict[str, Any]], query: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -417,6 +736,7 @@ class HybridSearchStrategy:
                     'rrf_k': self.config['rrf_k'],
                     'vector_weight': self.config['vector_weight'],
                     'keyword_weight': self.config['keyword_weight'],
+                    'graph_weight': self.config['graph_weight'],
                     'timestamp': time.time(),
                     'context': context.get('source', 'unknown')
                 }
@@ -452,6 +772,24 @@ class HybridSearchStrategy:
         except Exception as error:
             logger.error(f"❌ [HYBRID SEARCH] Corpus indexing failed: {error}")
     
+    def add_documents(self, documents: List[Dict[str, Any]]):
+        """
+        Add or replace documents in the incremental keyword index
+        
+        Args:
+            documents: Dicts with 'id', 'content' and optional 'metadata'
+        """
+        for document in documents:
+            self.keyword_index.add_document(document['id'], document['content'], document.get('metadata'))
+        
+        self.metrics['documents_added'] += len(documents)
+    
+    def remove_documents(self, doc_ids: List[str]):
+        """
+        Remove documents from the incremental keyword index
+        """
+        self.metrics['documents_removed'] += sum(1 for doc_id in doc_ids if self.keyword_index.remove_document(doc_id))
+    
     def _generate_cache_key(self, query: str, context: Dict[str, Any]) -> str:
         """Generate cache key for hybrid search"""
         key_data = {
@@ -460,6 +798,9 @@ class HybridSearchStrategy:
             'vector_weight': self.config['vector_weight'],
             'keyword_weight': self.config['keyword_weight'],
             'rrf_k': self.config['rrf_k'],
+            'keyword_index': self.keyword_index.fingerprint,  # Cached results follow index updates
+            'graph_weight': self.config['graph_weight'],
+            'graph_index': self.graph_index.graph_store.generation() if self.graph_index is not None else None,
             'strategy': 'hybrid_search'
         }
         key_string = json.dumps(key_data, sort_keys=True)
@@ -572,7 +913,10 @@ class HybridSearchStrategy:
         return {
             **self.metrics,
             'cache_hit_rate': cache_hit_rate,
-            'search_efficiency': cache_hit_rate  # Cache hits improve efficiency
+            'search_efficiency': cache_hit_rate,  # Cache hits improve efficiency
+            'vector_index': self.vector_index.get_metrics() if self.vector_index is not None else None,
+            'keyword_index': self.keyword_index.get_metrics(),
+            'graph_index': self.graph_index.get_metrics() if self.graph_index is not None else None
         }
     
     async def health_check(self) -> Dict[str, Any]:
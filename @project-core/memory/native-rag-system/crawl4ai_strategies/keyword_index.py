@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+
+"""
+INCREMENTAL BM25 INDEX V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Inverted-index BM25 that supports adding and removing single documents,
+so re-ingesting a changed file only touches its changed chunks instead of
+re-indexing the whole corpus (bm25s indexes are static).
+
+Features:
+- Stable string document ids with per-document metadata
+- O(terms in document) add/remove, corpus statistics kept up to date
+- Okapi BM25 scoring (Lucene IDF) over the query terms' postings only
+"""
+
+import hashlib
+import heapq
+import math
+import re
+import logging
+from typing import Dict, Any, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens, single characters dropped"""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1]
+
+
+class IncrementalBM25Index:
+    """
+    BM25 keyword index with document-level updates
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+        # term -> {doc_id: term frequency}
+        self.postings: Dict[str, Dict[str, int]] = {}
+        # doc_id -> {'content', 'metadata', 'length', 'terms'}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+        self.total_length = 0
+
+        # Order-independent digest of the indexed (id, content) pairs
+        self.fingerprint = 0
+
+    @staticmethod
+    def _document_digest(doc_id: str, content: str) -> int:
+        digest = hashlib.blake2b(f'{doc_id}\0{content}'.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.documents
+
+    def add_document(self, doc_id: str, content: str, metadata: Optional[Dict[str, Any]] = None):
+        """Index a document, replacing any previous version with the same id"""
+        if doc_id in self.documents:
+            self.remove_document(doc_id)
+
+        frequencies: Dict[str, int] = {}
+        tokens = tokenize(content)
+        for token in tokens:
+            frequencies[token] = frequencies.get(token, 0) + 1
+
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        self.documents[doc_id] = {
+            'content': content,
+            'metadata': metadata or {},
+            'length': len(tokens),
+            'terms': list(frequencies)
+        }
+        self.total_length += len(tokens)
+        self.fingerprint ^= self._document_digest(doc_id, content)
+
+    def remove_document(self, doc_id: str) -> bool:
+        """Drop a document and its postings"""
+        document = self.documents.pop(doc_id, None)
+        if document is None:
+            return False
+
+        for term in document['terms']:
+            postings = self.postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self.postings[term]
+
+        self.total_length -= document['length']
+        self.fingerprint ^= self._document_digest(doc_id, document['content'])
+        return True
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        BM25 search
+
+        Returns:
+            List of {'id', 'content', 'score', 'metadata'} sorted by descending score
+        """
+        if not self.documents:
+            return []
+
+        document_count = len(self.documents)
+        average_length = self.total_length / document_count or 1.0
+        scores: Dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                length_norm = 1 - self.b + self.b * self.documents[doc_id]['length'] / average_length
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)
+
+        return self._top_hits(scores, k)
+
+    def search_batch(self, queries: List[str], k: int = 10) -> List[List[Dict[str, Any]]]:
+        """
+        BM25 search for several queries, walking each distinct term's postings once
+
+        Returns:
+            One result list per query, identical to search(query, k)
+        """
+        if not self.documents:
+            return [[] for _ in queries]
+
+        document_count = len(self.documents)
+        average_length = self.total_length / document_count or 1.0
+        query_terms = [set(tokenize(query)) for query in queries]
+        all_scores: List[Dict[str, float]] = [{} for _ in queries]
+
+        # term -> queries containing it; the posting walk is shared by all of them
+        term_queries: Dict[str, List[int]] = {}
+        for index, terms in enumerate(query_terms):
+            for term in terms:
+                term_queries.setdefault(term, []).append(index)
+
+        length_norms: Dict[str, float] = {}
+        for term, indexes in term_queries.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (document_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            contributions = []
+            for doc_id, frequency in postings.items():
+                length_norm = length_norms.get(doc_id)
+                if length_norm is None:
+                    length_norm = length_norms[doc_id] = 1 - self.b + self.b * self.documents[doc_id]['length'] / average_length
+                contributions.append((doc_id, idf * frequency * (self.k1 + 1) / (frequency + self.k1 * length_norm)))
+            for index in indexes:
+                scores = all_scores[index]
+                for doc_id, contribution in contributions:
+                    scores[doc_id] = scores.get(doc_id, 0.0) + contribution
+
+        return [self._top_hits(scores, k) for scores in all_scores]
+
+    def _top_hits(self, scores: Dict[str, float], k: int) -> List[Dict[str, Any]]:
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        return [
+            {
+                'id': doc_id,
+                'content': self.documents[doc_id]['content'],
+                'score': score,
+                'metadata': self.documents[doc_id]['metadata']
+            }
+            for doc_id, score in top
+        ]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            'documents': len(self.documents),
+            'terms': len(self.postings),
+            'average_document_length': self.total_length / len(self.documents) if self.documents else 0
+        }
+
+# Export main class
+__all__ = ['IncrementalBM25Index', 'tokenize']
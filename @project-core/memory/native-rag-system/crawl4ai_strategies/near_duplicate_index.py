@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+
+"""
+NEAR-DUPLICATE VECTOR INDEX V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Incrementally maintained cosine index for near-duplicate detection.
+Used by the crosscheck system to find existing memories that a new piece of
+information repeats or extends before it is written to the memory bank.
+
+Features:
+- Random-hyperplane LSH tables (SimHash bands) so a lookup only scores the
+  entries that share a band with the query, not the whole collection
+- Multi-probe lookups (flip the least certain bits) for recall at the merge
+  threshold without adding tables
+- Exact float32 re-scoring of the candidates; exact scan for small collections
+- O(1) amortized add, update and remove keyed by memory id
+"""
+
+import time
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class NearDuplicateIndex:
+    """
+    Keyed LSH index over L2-normalized vectors with exact re-scoring
+    """
+
+    def __init__(self, dimensions: int, tables: int = 32, bits_per_table: int = 14, probes: int = 4,
+                 exact_scan_limit: int = 4096, initial_capacity: int = 1024, seed: int = 0):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for the near-duplicate index")
+        if bits_per_table > 62:
+            raise ValueError("bits_per_table must be at most 62")
+
+        self.config = {
+            'dimensions': dimensions,
+            'tables': tables,
+            'bits_per_table': bits_per_table,
+            'probes': probes,                      # extra buckets probed per table
+            'exact_scan_limit': exact_scan_limit,  # below this size every entry is scored
+            'seed': seed
+        }
+
+        rng = np.random.default_rng(seed)
+        self.hyperplanes = rng.standard_normal((tables * bits_per_table, dimensions)).astype(np.float32)
+        self._bit_weights = (1 << np.arange(bits_per_table, dtype=np.int64))
+
+        # Row storage (grown by doubling); rows of removed keys are recycled
+        self.vectors = np.zeros((initial_capacity, dimensions), dtype=np.float32)
+        self.row_codes = np.zeros((initial_capacity, tables), dtype=np.int64)
+        self.row_keys: List[Optional[str]] = []
+        self.rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+        # One dict per table: band code -> rows
+        self.buckets: List[Dict[int, List[int]]] = [{} for _ in range(tables)]
+
+        self.metrics = {
+            'adds': 0,
+            'removals': 0,
+            'searches': 0,
+            'exact_scans': 0,
+            'candidates_scored': 0,
+            'average_search_time': 0.0
+        }
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.rows
+
+    # ENCODING
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _projections(self, vectors):
+        """(n, dimensions) -> (n, tables, bits) hyperplane projections"""
+        projections = vectors @ self.hyperplanes.T
+        return projections.reshape(len(vectors), self.config['tables'], self.config['bits_per_table'])
+
+    def _codes(self, projections):
+        return (projections > 0).astype(np.int64) @ self._bit_weights
+
+    def _probe_codes(self, projections) -> List[List[int]]:
+        """Query band codes per table, followed by codes with the least certain bits flipped"""
+        codes = self._codes(projections[None])[0]
+        probes = self.config['probes']
+        if probes <= 0:
+            return [[int(code)] for code in codes]
+
+        uncertain = np.argsort(np.abs(projections), axis=1)[:, :probes]
+        return [
+            [int(code)] + [int(code) ^ (1 << int(bit)) for bit in uncertain[table]]
+            for table, code in enumerate(codes)
+        ]
+
+    # MAINTENANCE
+
+    def _grow(self, required: int):
+        capacity = len(self.vectors)
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.config['dimensions']), dtype=np.float32)
+        vectors[:len(self.vectors)] = self.vectors
+        row_codes = np.zeros((capacity, self.config['tables']), dtype=np.int64)
+        row_codes[:len(self.row_codes)] = self.row_codes
+        self.vectors, self.row_codes = vectors, row_codes
+
+    def add_batch(self, keys: List[str], vectors):
+        """Insert or replace a batch of keyed vectors"""
+        if len(keys) == 0:
+            return
+        for key in keys:
+            if key in self.rows:
+                self.remove(key)
+
+        vectors = self._normalize(np.asarray(vectors, dtype=np.float32).reshape(len(keys), -1))
+        codes = self._codes(self._projections(vectors))
+
+        rows = []
+        for key in keys:
+            if self._free_rows:
+                row = self._free_rows.pop()
+                self.row_keys[row] = key
+            else:
+                row = len(self.row_keys)
+                self.row_keys.append(key)
+            self.rows[key] = row
+            rows.append(row)
+
+        self._grow(len(self.row_keys))
+        self.vectors[rows] = vectors
+        self.row_codes[rows] = codes
+
+        for table, bucket in enumerate(self.buckets):
+            for row, code in zip(rows, codes[:, table].tolist()):
+                bucket.setdefault(code, []).append(row)
+
+        self.metrics['adds'] += len(keys)
+
+    def add(self, key: str, vector):
+        """Insert or replace one keyed vector"""
+        self.add_batch([key], [vector])
+
+    def remove(self, key: str) -> bool:
+        row = self.rows.pop(key, None)
+        if row is None:
+            return False
+
+        for table, code in enumerate(self.row_codes[row].tolist()):
+            bucket = self.buckets[table][code]
+            bucket.remove(row)
+            if not bucket:
+                del self.buckets[table][code]
+
+        self.row_keys[row] = None
+        self.vectors[row] = 0.0
+        self._free_rows.append(row)
+        self.metrics['removals'] += 1
+        return True
+
+    def clear(self):
+        self.row_keys = []
+        self.rows = {}
+        self._free_rows = []
+        self.buckets = [{} for _ in range(self.config['tables'])]
+
+    # SEARCH
+
+    def _candidate_rows(self, query):
+        probe_codes = self._probe_codes(self._projections(query[None])[0])
+        candidates = []
+        for bucket, codes in zip(self.buckets, probe_codes):
+            for code in codes:
+                rows = bucket.get(code)
+                if rows:
+                    candidates.extend(rows)
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.asarray(candidates, dtype=np.int64))
+
+    def search(self, query_vector, k: int = 10, min_score: float = -1.0) -> List[Tuple[str, float]]:
+        """
+        Nearest keys by cosine similarity
+
+        Args:
+            query_vector: Query embedding (normalized internally)
+            k: Maximum number of results
+            min_score: Drop neighbours below this cosine similarity
+
+        Returns:
+            List of (key, score) sorted by descending score
+        """
+        start_time = time.time()
+        if not self.rows:
+            return []
+
+        self.metrics['searches'] += 1
+        query = self._normalize(query_vector)
+
+        if len(self.rows) <= self.config['exact_scan_limit']:
+            self.metrics['exact_scans'] += 1
+            rows = np.fromiter(self.rows.values(), dtype=np.int64, count=len(self.rows))
+        else:
+            rows = self._candidate_rows(query)
+
+        results = []
+        if len(rows):
+            scores = self.vectors[rows] @ query
+            self.metrics['candidates_scored'] += len(rows)
+
+            keep = scores >= min_score
+            rows, scores = rows[keep], scores[keep]
+            if len(rows) > k:
+                top = np.argpartition(-scores, k - 1)[:k]
+                rows, scores = rows[top], scores[top]
+            order = np.argsort(-scores)
+            results = [(self.row_keys[int(rows[i])], float(scores[i])) for i in order]
+
+        search_time = (time.time() - start_time) * 1000
+        self.metrics['average_search_time'] = (
+            search_time if self.metrics['average_search_time'] == 0
+            else (self.metrics['average_search_time'] + search_time) / 2
+        )
+        return results
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get near-duplicate index metrics"""
+        return {
+            **self.metrics,
+            **self.config,
+            'indexed_vectors': len(self.rows),
+            'buckets': sum(len(bucket) for bucket in self.buckets)
+        }
+
+# Export main class
+__all__ = ['NearDuplicateIndex', 'NUMPY_AVAILABLE']
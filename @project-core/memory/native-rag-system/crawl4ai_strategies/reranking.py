@@ -21,6 +21,7 @@ Features:
 - Intelligent caching with TTL 30 minutes
 - Robust fallback mechanisms
 - Relevance improvement tracking
+- Batch reranking: one cross-encoder call for the pairs of many queries
 """
 
 import asyncio
@@ -68,6 +69,7 @@ class RerankingStrategy:
         # Performance metrics
         self.metrics = {
             'total_reranking_calls': 0,
+            'batch_reranking_calls': 0,
             'bridge_integration_calls': 0,
             'native_reranking_calls': 0,
             'cache_hits': 0,
@@ -182,7 +184,8 @@ class RerankingStrategy:
             result = await self.js_bridge.call_js_component(
                 'consultation_optimization',
                 'rerankedConsultation',
-                reranking_args
+                reranking_args,
+                deadline=context.get('deadline')
             )
             
             # Validate and normalize bridge results
@@ -222,56 +225,141 @@ class RerankingStrategy:
             query_text = self._extract_query_text(query)
             
             # Score each result using cross-encoder
-            scored_results = []
+            scores = []
             for result in results:
-                # Extract result text
-                result_text = self._extract_result_text(result)
-                
-                # Calculate cross-encoder score
-                cross_encoder_score = await self._calculate_cross_encoder_score(query_text, result_text)
-                
-                # Calculate combined score
-                original_score = result.get('hybridScore') or result.get('similarity') or result.get('confidence') or 0
-                combined_score = self._calculate_combined_score(original_score, cross_encoder_score)
-                
-                scored_results.append({
-                    **result,
-                    'originalScore': original_score,
-                    'crossEncoderScore': cross_encoder_score,
-                    'combinedScore': combined_score,
-                    'reranked': True,
-                    'reranking_method': 'native_cross_encoder',
-                    'reranking_metadata': {
-                        'model': self.config['reranking_model'],
-                        'query_text': query_text[:100] + '...' if len(query_text) > 100 else query_text,
-                        'result_text': result_text[:100] + '...' if len(result_text) > 100 else result_text,
-                        'timestamp': time.time()
-                    }
-                })
+                scores.append(await self._calculate_cross_encoder_score(query_text, self._extract_result_text(result)))
             
-            # Sort by combined score
-            reranked_results = sorted(scored_results, key=lambda x: x['combinedScore'], reverse=True)
-            
-            # Filter by confidence threshold
-            filtered_results = [
-                result for result in reranked_results 
-                if result['combinedScore'] >= self.config['confidence_threshold']
-            ]
-            
-            # Limit results
-            final_results = filtered_results[:self.config['max_results']]
-            
-            # Calculate relevance improvement
-            improvement = self._calculate_relevance_improvement(results, final_results)
-            self.metrics['relevance_improvements'].append(improvement)
-            
-            logger.info(f"🔄 [RERANKING] Native reranking: {len(results)} → {len(final_results)} results ({improvement:.1f}% improvement)")
-            return final_results
+            return self._apply_cross_encoder_scores(query_text, results, scores)
             
         except Exception as error:
             logger.error(f"❌ [RERANKING] Native reranking failed: {error}")
             raise
     
+    def _apply_cross_encoder_scores(self, query_text: str, results: List[Dict[str, Any]], cross_encoder_scores: List[float]) -> List[Dict[str, Any]]:
+        """
+        Combine, sort, filter and limit results given their cross-encoder scores
+        """
+        scored_results = []
+        for result, cross_encoder_score in zip(results, cross_encoder_scores):
+            # Extract result text
+            result_text = self._extract_result_text(result)
+            
+            # Calculate combined score
+            original_score = result.get('hybridScore') or result.get('similarity') or result.get('confidence') or 0
+            combined_score = self._calculate_combined_score(original_score, cross_encoder_score)
+            
+            scored_results.append({
+                **result,
+                'originalScore': original_score,
+                'crossEncoderScore': cross_encoder_score,
+                'combinedScore': combined_score,
+                'reranked': True,
+                'reranking_method': 'native_cross_encoder',
+                'reranking_metadata': {
+                    'model': self.config['reranking_model'],
+                    'query_text': query_text[:100] + '...' if len(query_text) > 100 else query_text,
+                    'result_text': result_text[:100] + '...' if len(result_text) > 100 else result_text,
+                    'timestamp': time.time()
+                }
+            })
+        
+        # Sort by combined score
+        reranked_results = sorted(scored_results, key=lambda x: x['combinedScore'], reverse=True)
+        
+        # Filter by confidence threshold
+        filtered_results = [
+            result for result in reranked_results 
+            if result['combinedScore'] >= self.config['confidence_threshold']
+        ]
+        
+        # Limit results
+        final_results = filtered_results[:self.config['max_results']]
+        
+        # Calculate relevance improvement
+        improvement = self._calculate_relevance_improvement(results, final_results)
+        self.metrics['relevance_improvements'].append(improvement)
+        
+        logger.info(f"🔄 [RERANKING] Native reranking: {len(results)} → {len(final_results)} results ({improvement:.1f}% improvement)")
+        return final_results
+    
+    async def rerank_results_batch(self, queries: List[str], results_lists: List[List[Dict[str, Any]]],
+                                   context: Dict[str, Any] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Rerank the result lists of several queries
+        
+        Cache hits are served per query, bridge reranking runs concurrently and
+        every remaining (query, result) pair is scored in one cross-encoder call.
+        
+        Returns:
+            One reranked list per query, as rerank_results would return it
+        """
+        start_time = time.time()
+        if context is None:
+            context = {}
+        self.metrics['batch_reranking_calls'] += 1
+        self.metrics['total_reranking_calls'] += len(queries)
+        
+        reranked: List[Optional[List[Dict[str, Any]]]] = [None] * len(queries)
+        pending = []
+        for index, (query, results) in enumerate(zip(queries, results_lists)):
+            if not query or not results:
+                reranked[index] = results
+                continue
+            cache_key = self._generate_cache_key(query, results, context)
+            cached_result = await self._get_cached_result(cache_key)
+            if cached_result is not None:
+                self.metrics['cache_hits'] += 1
+                reranked[index] = cached_result
+            else:
+                self.metrics['cache_misses'] += 1
+                pending.append((index, cache_key))
+        
+        if pending and self.config['bridge_integration']:
+            bridge_results = await asyncio.gather(*(
+                self._bridge_reranking(queries[index], results_lists[index], context) for index, _ in pending
+            ))
+            remaining = []
+            for (index, cache_key), bridge_result in zip(pending, bridge_results):
+                if bridge_result is not None:
+                    await self._cache_result(cache_key, bridge_result)
+                    reranked[index] = bridge_result
+                else:
+                    remaining.append((index, cache_key))
+            pending = remaining
+        
+        if pending:
+            try:
+                self.metrics['native_reranking_calls'] += len(pending)
+                await self._ensure_model_loaded()
+                
+                query_texts = {index: self._extract_query_text(queries[index]) for index, _ in pending}
+                pairs = [
+                    (query_texts[index], self._extract_result_text(result))
+                    for index, _ in pending for result in results_lists[index]
+                ]
+                scores = await self._calculate_cross_encoder_scores(pairs)
+                
+                offset = 0
+                for index, cache_key in pending:
+                    count = len(results_lists[index])
+                    final_results = self._apply_cross_encoder_scores(query_texts[index], results_lists[index], scores[offset:offset + count])
+                    offset += count
+                    await self._cache_result(cache_key, final_results)
+                    reranked[index] = final_results
+                    
+            except Exception as error:
+                logger.error(f"❌ [RERANKING] Batch reranking failed: {error}")
+                if not self.config['fallback_enabled']:
+                    raise
+                for index, _ in pending:
+                    if reranked[index] is None:
+                        reranked[index] = await self._fallback_reranking(queries[index], results_lists[index], context, error)
+        
+        latency = (time.time() - start_time) * 1000
+        self._update_latency_metrics(latency)
+        logger.info(f"✅ [RERANKING] Batch of {len(queries)} reranked ({latency:.1f}ms)")
+        return reranked
+    
     async def _ensure_model_loaded(self):
         """
         Ensure cross-encoder model is loaded (lazy loading)
@@ -316,6 +404,19 @@ class RerankingStrategy:
             logger.warning(f"⚠️ [RERANKING] Cross-encoder scoring failed: {error}")
             return await self._fallback_cross_encoder_score(query_text, result_text)
     
+    async def _calculate_cross_encoder_scores(self, pairs: List[tuple]) -> List[float]:
+        """
+        Cross-encoder scores for many (query, result) pairs with one model call
+        """
+        if not pairs:
+            return []
+        try:
+            if self.cross_encoder is not None:
+                return [max(0.0, min(1.0, float(score))) for score in self.cross_encoder.predict(pairs)]
+        except Exception as error:
+            logger.warning(f"⚠️ [RERANKING] Cross-encoder batch scoring failed: {error}")
+        return [await self._fallback_cross_encoder_score(query_text, result_text) for query_text, result_text in pairs]
+    
     async def _fallback_cross_encoder_score(self, query_text: str, result_text: str) -> float:
         """
         Fallback cross-encoder scoring without model
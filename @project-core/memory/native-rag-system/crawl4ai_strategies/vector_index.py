@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+"""
+COMPRESSED VECTOR INDEX V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Index-time compression for the retrieval vectors. 3072-dimensional float32
+embeddings cost 12 KB per chunk and make brute-force search memory-bandwidth
+bound; this index searches a compressed copy and re-scores a shortlist at
+full precision from the source matrix (typically the embedding store memmap).
+
+Compression options:
+- Dimension reduction: 'none', 'matryoshka' (keep the leading dimensions, valid
+  for Matryoshka-trained models such as text-embedding-3) or 'pca' (fitted
+  projection, randomized SVD)
+- Quantization: 'none' (float32), 'int8' (per-dimension scalar quantization)
+  or 'binary' (sign bits, Hamming distance)
+"""
+
+import time
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REDUCTIONS = ('none', 'matryoshka', 'pca')
+QUANTIZATIONS = ('none', 'int8', 'binary')
+
+# Bytes of compressed codes scored per block so int8 -> float32 conversion stays cache-sized
+SCORE_BLOCK_BYTES = 1 << 18
+
+
+class CompressedVectorIndex:
+    """
+    Compressed approximate search with full-precision re-scoring
+    """
+
+    def __init__(self, reduction: str = 'none', target_dimensions: int = 256, quantization: str = 'none',
+                 rescore_multiplier: int = 4, pca_sample_size: int = 10000, seed: int = 0):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for the compressed vector index")
+        if reduction not in REDUCTIONS:
+            raise ValueError(f"Unknown reduction: {reduction} (expected one of {REDUCTIONS})")
+        if quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization: {quantization} (expected one of {QUANTIZATIONS})")
+
+        self.config = {
+            'reduction': reduction,
+            'target_dimensions': target_dimensions,
+            'quantization': quantization,
+            'rescore_multiplier': rescore_multiplier,  # shortlist = k * multiplier (0 disables rescoring)
+            'pca_sample_size': pca_sample_size,
+            'seed': seed
+        }
+
+        # Full-precision source (rows of a 2-d array, e.g. EmbeddingStore.matrix())
+        self.source = None
+        self.source_rows = np.empty(0, dtype=np.int64)
+
+        # Fitted compression parameters
+        self.fitted = False
+        self.mean = None
+        self.components = None  # PCA: (target_dimensions, source_dimensions)
+        self.int8_scale = None
+        self.binary_threshold = None
+
+        # Compressed vectors, one per entry of source_rows
+        self.codes = None
+
+        self.metrics = {
+            'searches': 0,
+            'rescored_candidates': 0,
+            'build_time_ms': 0.0,
+            'average_search_time': 0.0
+        }
+
+        # Watermarks for EmbeddingStore synchronisation
+        self._store_watermark = 0
+        self._store_compactions = 0
+
+    # FITTING AND ENCODING
+
+    @staticmethod
+    def _normalize(vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _reduce(self, vectors):
+        """Normalized full vectors -> normalized reduced vectors"""
+        reduction = self.config['reduction']
+        if reduction == 'matryoshka':
+            vectors = vectors[..., :self.config['target_dimensions']]
+        elif reduction == 'pca':
+            vectors = (vectors - self.mean) @ self.components.T
+        else:
+            return vectors
+        return self._normalize(vectors)
+
+    def _fit_pca(self, sample):
+        """Randomized SVD of the centered sample (two power iterations)"""
+        rng = np.random.default_rng(self.config['seed'])
+        target = min(self.config['target_dimensions'], sample.shape[0], sample.shape[1])
+
+        self.mean = sample.mean(axis=0)
+        centered = sample - self.mean
+
+        probe = rng.standard_normal((centered.shape[1], min(target + 10, centered.shape[1]))).astype(np.float32)
+        basis = centered @ probe
+        for _ in range(2):
+            basis, _ = np.linalg.qr(basis)
+            basis = centered @ (centered.T @ basis)
+        basis, _ = np.linalg.qr(basis)
+
+        _, _, vt = np.linalg.svd(basis.T @ centered, full_matrices=False)
+        components = vt[:target]
+
+        if self.config['quantization'] == 'binary':
+            # Random rotation spreads the variance evenly across sign bits
+            rotation, _ = np.linalg.qr(rng.standard_normal((target, target)))
+            components = rotation @ components
+
+        self.components = components.astype(np.float32)
+
+    def fit(self, vectors):
+        """Fit reduction and quantization parameters on (a sample of) the vectors"""
+        vectors = self._normalize(vectors)
+        if len(vectors) > self.config['pca_sample_size']:
+            rng = np.random.default_rng(self.config['seed'])
+            vectors = vectors[rng.choice(len(vectors), self.config['pca_sample_size'], replace=False)]
+
+        if self.config['reduction'] == 'pca':
+            self._fit_pca(vectors)
+
+        reduced = self._reduce(vectors)
+        if self.config['quantization'] == 'int8':
+            self.int8_scale = np.maximum(np.abs(reduced).max(axis=0), 1e-6) / 127.0
+        elif self.config['quantization'] == 'binary':
+            self.binary_threshold = np.median(reduced, axis=0)
+
+        self.fitted = True
+
+    def _quantize(self, reduced):
+        quantization = self.config['quantization']
+        if quantization == 'int8':
+            return np.clip(np.rint(reduced / self.int8_scale), -127, 127).astype(np.int8)
+        if quantization == 'binary':
+            return np.packbits(reduced > self.binary_threshold, axis=-1)
+        return reduced.astype(np.float32)
+
+    def _encode(self, vectors):
+        return self._quantize(self._reduce(self._normalize(vectors)))
+
+    # BUILDING
+
+    def build(self, source, rows=None):
+        """
+        Fit (if needed) and index `rows` of the full-precision `source` matrix
+        """
+        start_time = time.time()
+        self.source = source
+        rows = np.arange(len(source), dtype=np.int64) if rows is None else np.asarray(rows, dtype=np.int64)
+
+        if len(rows) == 0:
+            self.source_rows = rows
+            self.codes = None
+            return
+
+        full = np.asarray(source[rows], dtype=np.float32)
+        if not self.fitted:
+            self.fit(full)
+
+        self.source_rows = rows
+        self.codes = self._encode(full)
+        self.metrics['build_time_ms'] = (time.time() - start_time) * 1000
+
+        logger.info(f"✅ [VECTOR INDEX] Indexed {len(rows)} vectors "
+                    f"({self.config['reduction']}/{self.config['quantization']}, {self.bytes_per_vector()} B/vector)")
+
+    def add(self, rows, source=None):
+        """Append source rows to an already-fitted index"""
+        if source is not None:
+            self.source = source
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) == 0:
+            return
+        if not self.fitted or self.codes is None:
+            self.build(self.source, np.concatenate([self.source_rows, rows]))
+            return
+
+        codes = self._encode(np.asarray(self.source[rows], dtype=np.float32))
+        self.codes = np.concatenate([self.codes, codes])
+        self.source_rows = np.concatenate([self.source_rows, rows])
+
+    def sync_with_store(self, store):
+        """
+        Bring the index up to date with an EmbeddingStore
+
+        New rows are appended incrementally; a compaction (which renumbers
+        rows) triggers a rebuild. Dead rows are filtered at query time.
+        """
+        compactions = store.metrics['compactions']
+        if self.codes is None or compactions != self._store_compactions:
+            self.build(store.matrix(), store.live_rows())
+        elif store.count > self._store_watermark:
+            new_rows = [row for row in range(self._store_watermark, store.count) if store.row_keys[row] is not None]
+            self.add(new_rows, store.matrix())
+        else:
+            self.source = store.matrix()
+
+        self._store_watermark = store.count
+        self._store_compactions = compactions
+
+    # SEARCH
+
+    def _approximate_scores(self, reduced_query):
+        quantization = self.config['quantization']
+        if quantization == 'none':
+            return self.codes @ reduced_query
+
+        scores = np.empty(len(self.codes), dtype=np.float32)
+        block_rows = max(64, SCORE_BLOCK_BYTES // self.codes[0].nbytes)
+
+        if quantization == 'binary':
+            query_code = self._quantize(reduced_query)
+            for start in range(0, len(self.codes), block_rows):
+                block = np.bitwise_xor(self.codes[start:start + block_rows], query_code)
+                scores[start:start + len(block)] = -_popcount_rows(block)
+            return scores
+
+        # int8: asymmetric distance, float query against dequantized codes
+        query = (reduced_query * self.int8_scale).astype(np.float32)
+        for start in range(0, len(self.codes), block_rows):
+            block = self.codes[start:start + block_rows]
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+        return scores
+
+    def search(self, query_vector, k: int = 10, valid_rows=None) -> List[Tuple[int, float]]:
+        """
+        Approximate search over the compressed vectors with full-precision re-scoring
+
+        Args:
+            query_vector: Full-precision query embedding
+            k: Number of results
+            valid_rows: Optional callable(source_row) -> bool to skip dead rows
+
+        Returns:
+            List of (source_row, score) sorted by descending score
+        """
+        start_time = time.time()
+        if self.codes is None or len(self.codes) == 0:
+            return []
+
+        self.metrics['searches'] += 1
+        query = self._normalize(query_vector)
+        scores = self._approximate_scores(self._reduce(query))
+
+        multiplier = self.config['rescore_multiplier']
+        shortlist_size = min(len(scores), max(k, k * multiplier) if multiplier else k)
+        # Extra headroom for rows filtered by valid_rows
+        shortlist_size = min(len(scores), shortlist_size + (k if valid_rows else 0))
+        shortlist = np.argpartition(-scores, shortlist_size - 1)[:shortlist_size]
+
+        rows = self.source_rows[shortlist]
+        if valid_rows is not None:
+            keep = np.fromiter((valid_rows(int(row)) for row in rows), dtype=bool, count=len(rows))
+            shortlist, rows = shortlist[keep], rows[keep]
+
+        if multiplier and len(rows):
+            # Re-score at full precision (sorted rows keep memmap reads sequential)
+            order = np.argsort(rows)
+            full = self._normalize(np.asarray(self.source[rows[order]], dtype=np.float32))
+            final_scores = np.empty(len(rows), dtype=np.float32)
+            final_scores[order] = full @ query
+            self.metrics['rescored_candidates'] += len(rows)
+        else:
+            final_scores = scores[shortlist]
+
+        top = np.argsort(-final_scores)[:k]
+        results = [(int(rows[i]), float(final_scores[i])) for i in top]
+
+        search_time = (time.time() - start_time) * 1000
+        self.metrics['average_search_time'] = (
+            search_time if self.metrics['average_search_time'] == 0
+            else (self.metrics['average_search_time'] + search_time) / 2
+        )
+        return results
+
+    def bytes_per_vector(self) -> int:
+        if self.codes is None or len(self.codes) == 0:
+            return 0
+        return int(self.codes.itemsize * self.codes[0].size)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get vector index metrics"""
+        return {
+            **self.metrics,
+            **self.config,
+            'indexed_vectors': len(self.source_rows),
+            'bytes_per_vector': self.bytes_per_vector()
+        }
+
+
+_POPCOUNT_TABLE = None
+
+
+def _popcount_rows(packed):
+    """Number of set bits per row of a packed uint8 array"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(packed).sum(axis=1, dtype=np.int32).astype(np.float32)
+
+    global _POPCOUNT_TABLE
+    if _POPCOUNT_TABLE is None:
+        _POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+    return _POPCOUNT_TABLE[packed].sum(axis=1, dtype=np.int32).astype(np.float32)
+
+# Export main class
+__all__ = ['CompressedVectorIndex', 'REDUCTIONS', 'QUANTIZATIONS']
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+
+"""
+FRAMED BRIDGE PROTOCOL V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Length-prefixed binary message format shared by the Python bridge and
+bridge_runner.js. Replaces JSON interpolated into generated JavaScript source
+and stdout line scanning.
+
+Frame layout (all integers unsigned 32-bit big-endian):
+    [frame_length][header_length][header JSON (UTF-8)][padding][binary section]
+
+Float arrays with at least `min_array_length` elements are moved out of the
+header into the binary section as raw little-endian float32 and replaced by a
+`{"$f32": [offset, count]}` reference (offset relative to the binary section).
+"""
+
+import json
+import struct
+from array import array
+from typing import Any, Dict, List, Tuple
+import sys
+
+PROTOCOL_VERSION = 1
+FLOAT32_MARKER = '$f32'
+MIN_ARRAY_LENGTH = 16
+MAX_FRAME_BYTES = 256 * 1024 * 1024  # 256 MB
+
+_U32 = struct.Struct('>I')
+
+
+class BridgeProtocolError(Exception):
+    """Raised when a frame cannot be encoded or decoded"""
+
+
+def _is_numeric_array(value: Any, min_array_length: int) -> bool:
+    # Only float lists are packed so integer lists (ids, ranks) keep their type
+    if len(value) < min_array_length:
+        return False
+    return all(type(item) is float for item in value)
+
+
+def _pack(value: Any, buffers: List[bytes], offset: List[int], min_array_length: int) -> Any:
+    """Replace numeric arrays with buffer references (depth-first)"""
+    if isinstance(value, dict):
+        return {key: _pack(item, buffers, offset, min_array_length) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        if _is_numeric_array(value, min_array_length):
+            values = array('f', value)
+            if sys.byteorder != 'little':
+                values.byteswap()
+            return _add_buffer(values.tobytes(), len(values), buffers, offset)
+        return [_pack(item, buffers, offset, min_array_length) for item in value]
+
+    # numpy arrays (duck-typed to keep numpy optional)
+    if hasattr(value, 'dtype') and hasattr(value, 'tobytes') and getattr(value, 'ndim', 0) == 1:
+        if value.dtype.kind == 'f' and len(value) >= min_array_length:
+            return _add_buffer(value.astype('<f4', copy=False).tobytes(), len(value), buffers, offset)
+        return value.tolist()
+
+    return value
+
+
+def _add_buffer(data: bytes, count: int, buffers: List[bytes], offset: List[int]) -> Dict[str, List[int]]:
+    reference = {FLOAT32_MARKER: [offset[0], count]}
+    buffers.append(data)
+    offset[0] += len(data)
+    return reference
+
+
+def encode_message(payload: Any, min_array_length: int = MIN_ARRAY_LENGTH, default=None) -> bytes:
+    """
+    Encode a JSON-compatible payload into a single frame
+
+    Args:
+        payload: Dict/list/scalars; float lists and 1-d float numpy arrays are packed
+        min_array_length: Shorter numeric arrays stay inline in the JSON header
+        default: Optional json.dumps fallback for values that are not JSON types
+
+    Returns:
+        Frame bytes including the length prefix
+    """
+    buffers: List[bytes] = []
+    offset = [0]
+    header = _pack(payload, buffers, offset, min_array_length)
+
+    header_bytes = json.dumps(header, separators=(',', ':'), ensure_ascii=False, default=default).encode('utf-8')
+    padding = (-(len(header_bytes) + 8)) % 4  # Keep the binary section 4-byte aligned
+    body_length = 4 + len(header_bytes) + padding + offset[0]
+
+    if body_length + 4 > MAX_FRAME_BYTES:
+        raise BridgeProtocolError(f"Frame of {body_length} bytes exceeds {MAX_FRAME_BYTES} byte limit")
+
+    parts = [_U32.pack(body_length), _U32.pack(len(header_bytes)), header_bytes, b' ' * padding]
+    parts.extend(buffers)
+    return b''.join(parts)
+
+
+def _unpack(value: Any, binary: memoryview) -> Any:
+    if isinstance(value, dict):
+        reference = value.get(FLOAT32_MARKER)
+        if reference is not None and len(value) == 1:
+            start, count = reference
+            end = start + count * 4
+            if end > len(binary):
+                raise BridgeProtocolError("Array reference outside binary section")
+            values = array('f')
+            values.frombytes(binary[start:end])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            return values.tolist()
+        return {key: _unpack(item, binary) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [_unpack(item, binary) for item in value]
+
+    return value
+
+
+def decode_body(body: bytes) -> Any:
+    """Decode a frame body (everything after the frame length prefix)"""
+    if len(body) < 4:
+        raise BridgeProtocolError("Truncated frame body")
+
+    view = memoryview(body)
+    header_length = _U32.unpack_from(view, 0)[0]
+    header_end = 4 + header_length
+    if header_end > len(body):
+        raise BridgeProtocolError("Header length exceeds frame body")
+
+    padding = (-(header_length + 8)) % 4
+    try:
+        header = json.loads(bytes(view[4:header_end]).decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError) as error:
+        raise BridgeProtocolError(f"Invalid frame header: {error}")
+
+    return _unpack(header, view[header_end + padding:])
+
+
+def decode_message(frame: bytes) -> Tuple[Any, int]:
+    """
+    Decode the first complete frame in `frame`
+
+    Returns:
+        (payload, bytes consumed)
+    """
+    if len(frame) < 4:
+        raise BridgeProtocolError("Truncated frame length prefix")
+
+    body_length = _U32.unpack_from(frame, 0)[0]
+    if body_length + 4 > MAX_FRAME_BYTES:
+        raise BridgeProtocolError(f"Frame of {body_length} bytes exceeds {MAX_FRAME_BYTES} byte limit")
+    if len(frame) < 4 + body_length:
+        raise BridgeProtocolError(f"Incomplete frame: expected {body_length} bytes, got {len(frame) - 4}")
+
+    return decode_body(frame[4:4 + body_length]), 4 + body_length
+
+
+async def read_message(reader) -> Any:
+    """Read one frame from an asyncio.StreamReader"""
+    prefix = await reader.readexactly(4)
+    body_length = _U32.unpack(prefix)[0]
+    if body_length + 4 > MAX_FRAME_BYTES:
+        raise BridgeProtocolError(f"Frame of {body_length} bytes exceeds {MAX_FRAME_BYTES} byte limit")
+    body = await reader.readexactly(body_length)
+    return decode_body(body)
+
+# Export protocol helpers
+__all__ = [
+    'BridgeProtocolError',
+    'PROTOCOL_VERSION',
+    'encode_message',
+    'decode_message',
+    'decode_body',
+    'read_message'
+]
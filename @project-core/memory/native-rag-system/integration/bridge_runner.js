@@ -0,0 +1,189 @@
+#!/usr/bin/env node
+
+/**
+ * FRAMED BRIDGE RUNNER V1.0
+ * GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+ *
+ * Node.js side of the framed bridge protocol (see bridge_protocol.py):
+ * - Reads one length-prefixed request frame from stdin
+ * - Loads the component module and calls the requested method
+ * - Writes one length-prefixed response frame to stdout
+ * - Float arrays travel as raw little-endian float32 buffers
+ * - Component console output is redirected to stderr so stdout stays binary
+ */
+
+const os = require("os");
+
+const FLOAT32_MARKER = "$f32";
+const MIN_ARRAY_LENGTH = 16;
+const LITTLE_ENDIAN = os.endianness() === "LE";
+
+// Keep stdout reserved for the response frame
+const writeLog = (...parts) => process.stderr.write(parts.join(" ") + "\n");
+console.log = writeLog;
+console.info = writeLog;
+console.debug = writeLog;
+console.warn = writeLog;
+
+function readStdin() {
+  return new Promise((resolve, reject) => {
+    const chunks = [];
+    process.stdin.on("data", (chunk) => chunks.push(chunk));
+    process.stdin.on("end", () => resolve(Buffer.concat(chunks)));
+    process.stdin.on("error", reject);
+  });
+}
+
+function unpack(value, binary) {
+  if (Array.isArray(value)) {
+    return value.map((item) => unpack(item, binary));
+  }
+  if (value && typeof value === "object") {
+    const keys = Object.keys(value);
+    if (keys.length === 1 && keys[0] === FLOAT32_MARKER) {
+      const [offset, count] = value[FLOAT32_MARKER];
+      if (LITTLE_ENDIAN) {
+        const start = binary.byteOffset + offset;
+        return Array.from(new Float32Array(binary.buffer.slice(start, start + count * 4)));
+      }
+      const floats = new Float32Array(count);
+      for (let i = 0; i < count; i++) {
+        floats[i] = binary.readFloatLE(offset + i * 4);
+      }
+      return Array.from(floats);
+    }
+    const result = {};
+    for (const key of keys) {
+      result[key] = unpack(value[key], binary);
+    }
+    return result;
+  }
+  return value;
+}
+
+function decodeFrame(frame) {
+  const bodyLength = frame.readUInt32BE(0);
+  if (frame.length < 4 + bodyLength) {
+    throw new Error(`Incomplete frame: expected ${bodyLength} bytes`);
+  }
+  const headerLength = frame.readUInt32BE(4);
+  const headerEnd = 8 + headerLength;
+  const padding = (4 - ((headerLength + 8) % 4)) % 4;
+  const header = JSON.parse(frame.toString("utf8", 8, headerEnd));
+  return unpack(header, frame.subarray(headerEnd + padding, 4 + bodyLength));
+}
+
+function isFloatArray(value) {
+  if (value instanceof Float32Array || value instanceof Float64Array) {
+    return value.length >= MIN_ARRAY_LENGTH;
+  }
+  if (!Array.isArray(value) || value.length < MIN_ARRAY_LENGTH) {
+    return false;
+  }
+  let hasFraction = false;
+  for (const item of value) {
+    if (typeof item !== "number" || !Number.isFinite(item)) {
+      return false;
+    }
+    if (!Number.isInteger(item)) {
+      hasFraction = true;
+    }
+  }
+  // Integer-only arrays (ids, ranks) stay inline to keep their type
+  return hasFraction;
+}
+
+function pack(value, buffers, state) {
+  if (isFloatArray(value)) {
+    const floats = Float32Array.from(value);
+    let buffer;
+    if (LITTLE_ENDIAN) {
+      buffer = Buffer.from(floats.buffer, floats.byteOffset, floats.byteLength);
+    } else {
+      buffer = Buffer.alloc(floats.length * 4);
+      for (let i = 0; i < floats.length; i++) {
+        buffer.writeFloatLE(floats[i], i * 4);
+      }
+    }
+    const reference = { [FLOAT32_MARKER]: [state.offset, floats.length] };
+    buffers.push(buffer);
+    state.offset += buffer.length;
+    return reference;
+  }
+  if (Array.isArray(value)) {
+    return value.map((item) => pack(item, buffers, state));
+  }
+  if (value && typeof value === "object" && !(value instanceof Date)) {
+    if (typeof value.toJSON === "function") {
+      return pack(value.toJSON(), buffers, state);
+    }
+    const result = {};
+    for (const key of Object.keys(value)) {
+      if (value[key] !== undefined && typeof value[key] !== "function") {
+        result[key] = pack(value[key], buffers, state);
+      }
+    }
+    return result;
+  }
+  return value === undefined ? null : value;
+}
+
+function encodeFrame(payload) {
+  const buffers = [];
+  const state = { offset: 0 };
+  const header = Buffer.from(JSON.stringify(pack(payload, buffers, state)), "utf8");
+  const padding = (4 - ((header.length + 8) % 4)) % 4;
+  const prefix = Buffer.alloc(8);
+  prefix.writeUInt32BE(4 + header.length + padding + state.offset, 0);
+  prefix.writeUInt32BE(header.length, 4);
+  return Buffer.concat([prefix, header, Buffer.alloc(padding, " "), ...buffers]);
+}
+
+async function executeRequest(request) {
+  const component = require(request.component_path);
+
+  let instance;
+  if (typeof component === "function") {
+    instance = new component();
+  } else if (typeof component === "object" && component !== null) {
+    instance = component;
+  } else {
+    throw new Error("Invalid component type");
+  }
+
+  if (typeof instance[request.method] !== "function") {
+    throw new Error(`Method ${request.method} not found`);
+  }
+
+  return await instance[request.method](...(request.args || []));
+}
+
+async function main() {
+  let request = {};
+  let response;
+
+  try {
+    request = decodeFrame(await readStdin());
+    const result = await executeRequest(request);
+    response = {
+      success: true,
+      result: result === undefined ? null : result,
+      timestamp: new Date().toISOString(),
+      component: request.component,
+      method: request.method,
+    };
+  } catch (error) {
+    response = {
+      success: false,
+      error: error.message,
+      stack: error.stack,
+      timestamp: new Date().toISOString(),
+      component: request.component,
+      method: request.method,
+    };
+  }
+
+  process.stdout.write(encodeFrame(response), () => process.exit(0));
+}
+
+main();
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+"""
+REQUEST DEADLINE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Time budget shared by every step of one request. The coordinator creates a
+deadline per consultation (or takes the caller's) and passes it in the
+consultation context to each strategy and on to the JavaScript bridge, which
+caps every Node attempt at the remaining budget, only retries when the
+budget still covers the backoff, and kills the subprocess when the budget
+runs out or the deadline is cancelled.
+
+Features:
+- Monotonic-clock budget with remaining time / attempt timeout helpers
+- Explicit cancellation that aborts in-flight waits
+- wait_for() that cancels the awaited work on expiry or cancellation
+"""
+
+import asyncio
+import math
+import time
+from typing import Any, Awaitable, Optional, Union
+
+
+class DeadlineExceededError(asyncio.TimeoutError):
+    """Raised when a request's deadline passed or the deadline was cancelled"""
+
+
+class Deadline:
+    """
+    Absolute deadline for one request
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Budget in seconds from now (None = no time limit, cancellation only)
+        """
+        self.budget = timeout
+        self.expires_at = time.monotonic() + timeout if timeout is not None else None
+        self.cancelled = False
+        self._cancel_event = asyncio.Event()
+
+    @classmethod
+    def coerce(cls, value: Union['Deadline', float, int, None]) -> Optional['Deadline']:
+        """Accept a Deadline, a budget in seconds or None"""
+        if value is None or isinstance(value, Deadline):
+            return value
+        return cls(float(value))
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired or cancelled, inf without a time limit)"""
+        if self.cancelled:
+            return 0.0
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def allows(self, seconds: float) -> bool:
+        """True when more than `seconds` of budget remain"""
+        return self.remaining() > seconds
+
+    def timeout(self, cap: Optional[float] = None) -> Optional[float]:
+        """Timeout for the next step: the remaining budget, capped at `cap`"""
+        remaining = self.remaining()
+        if cap is not None:
+            remaining = min(remaining, cap)
+        return None if math.isinf(remaining) else remaining
+
+    def check(self, operation: str = 'operation'):
+        """Raise DeadlineExceededError when no budget is left"""
+        if self.cancelled:
+            raise DeadlineExceededError(f"{operation} cancelled")
+        if self.expired:
+            raise DeadlineExceededError(f"{operation} exceeded its {self.budget:.1f}s budget")
+
+    def cancel(self):
+        """Cancel the request: waits in wait_for() abort immediately"""
+        self.cancelled = True
+        self._cancel_event.set()
+
+    async def wait_for(self, awaitable: Awaitable[Any], cap: Optional[float] = None,
+                       operation: str = 'operation') -> Any:
+        """
+        Await `awaitable` within the remaining budget (and `cap`)
+
+        The awaited work is cancelled when the deadline expires, when cancel()
+        is called or when the caller itself is cancelled.
+
+        Raises:
+            DeadlineExceededError: the deadline expired or was cancelled
+            asyncio.TimeoutError: only `cap` ran out, budget remains
+        """
+        task = asyncio.ensure_future(awaitable)
+        try:
+            self.check(operation)
+            # Decided before waiting: a loop timer that fires slightly early must
+            # still be reported against whichever limit it was set from
+            budget_bound = cap is None or self.remaining() <= cap
+            cancel_wait = asyncio.ensure_future(self._cancel_event.wait())
+            try:
+                await asyncio.wait({task, cancel_wait}, timeout=self.timeout(cap),
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                cancel_wait.cancel()
+
+            if task.done():
+                return task.result()
+            self.check(operation)
+            if budget_bound:
+                raise DeadlineExceededError(f"{operation} exceeded its {self.budget:.1f}s budget")
+            raise asyncio.TimeoutError(f"{operation} timed out after {cap:.1f}s")
+
+        finally:
+            if not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    # The work's own cancellation is expected; one aimed at the caller
+                    # (arriving while the work cleans up) must propagate
+                    current = asyncio.current_task()
+                    if current is not None and current.cancelling():
+                        raise
+                except Exception:
+                    pass
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f}s, cancelled={self.cancelled})"
+
+# Export main class
+__all__ = ['Deadline', 'DeadlineExceededError']
@@ -11,7 +11,9 @@ Features:
 - IPC communication with Node.js components
 - Intelligent caching for <50ms latency
 - Robust fallback mechanisms
-- JSON-RPC protocol for structured communication
+- Framed binary protocol (length-prefixed, float32 array buffers) via bridge_runner.js
+- Request deadlines: attempts capped at the remaining budget, retries only when
+  the budget covers them, Node subprocess killed on expiry or cancellation
 - Performance monitoring and optimization
 """
 
@@ -24,6 +26,13 @@ import os
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import logging
+import sys
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.bridge_protocol import encode_message, decode_message
+from integration.deadline import Deadline, DeadlineExceededError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -64,9 +73,18 @@ class JavaScriptBridge:
             'circuit_breaker_timeout': 60,  # seconds before retry
             'preemptive_fallback': True,
             'component_validation': True,
-            'retry_backoff': True
+            'retry_backoff': True,
+            'min_attempt_budget': 1.0,  # seconds an attempt needs to be worth starting
+            # Transport: 'framed' (binary protocol via bridge_runner.js) or 'legacy' (node -e source)
+            'transport': 'framed'
         }
         
+        # Node.js entry point for the framed transport
+        self.runner_path = Path(__file__).parent / 'bridge_runner.js'
+        
+        # Offline embedder for embedding_service fallbacks (lazy)
+        self._native_embedder = None
+        
         # Performance metrics - FASE 3 Enhanced
         self.metrics = {
             'total_calls': 0,
@@ -81,6 +99,9 @@ class JavaScriptBridge:
             'auto_recovery_count': 0,
             'component_validation_failures': 0,
             'retry_attempts': 0,
+            'retries_skipped_for_budget': 0,
+            'deadline_exceeded': 0,
+            'subprocesses_killed': 0,
             'preemptive_fallbacks': 0,
             'connection_pool_hits': 0
         }
@@ -113,7 +134,8 @@ class JavaScriptBridge:
             logger.error(f"❌ [JS BRIDGE] Initialization failed: {error}")
             raise
     
-    async def call_js_component(self, component: str, method: str, args: List[Any] = None) -> Dict[str, Any]:
+    async def call_js_component(self, component: str, method: str, args: List[Any] = None,
+                                deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Call JavaScript component method with caching and fallback
         
@@ -121,12 +143,15 @@ class JavaScriptBridge:
             component: Component name (embedding_service, consultation_optimization, knowledge_graph)
             method: Method name to call
             args: Arguments to pass to the method
+            deadline: Request deadline (Deadline or budget in seconds); attempts and
+                retries stay within it and the Node process is killed when it runs out
             
         Returns:
             Result from JavaScript component
         """
         start_time = time.time()
         self.metrics['total_calls'] += 1
+        deadline = Deadline.coerce(deadline)
         
         try:
             # Prepare arguments
@@ -152,7 +177,7 @@ class JavaScriptBridge:
             self.metrics['cache_misses'] += 1
             
             # FASE 3: Execute with retry and circuit breaker management
-            result = await self._execute_js_component_with_retry(component, method, args)
+            result = await self._execute_js_component_with_retry(component, method, args, deadline)
 
             # FASE 3: Record successful execution (reset circuit breaker)
             self._record_success(component)
@@ -171,6 +196,16 @@ class JavaScriptBridge:
             logger.info(f"✅ [JS BRIDGE] {component}.{method} completed in {latency:.1f}ms")
             return result
             
+        except DeadlineExceededError as error:
+            # The request ran out of budget; the component itself did not fail
+            self.metrics['deadline_exceeded'] += 1
+            logger.warning(f"⏱️ [JS BRIDGE] {component}.{method} stopped: {error}")
+
+            if self.config['fallback_enabled']:
+                return await self._fallback_handler(component, method, args, error)
+
+            raise
+
         except Exception as error:
             self.metrics['error_count'] += 1
             self._update_success_rate()
@@ -186,8 +221,75 @@ class JavaScriptBridge:
 
             raise
     
-    async def _execute_js_component(self, component: str, method: str, args: List[Any]) -> Dict[str, Any]:
+    async def _execute_js_component(self, component: str, method: str, args: List[Any],
+                                    deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Execute JavaScript component via Node.js subprocess"""
+        if self.config['transport'] == 'legacy':
+            return await self._execute_js_component_legacy(component, method, args, deadline)
+        return await self._execute_js_component_framed(component, method, args, deadline)
+    
+    async def _communicate(self, process, input_data: Optional[bytes], deadline: Optional[Deadline]):
+        """
+        Exchange data with a Node.js process within the attempt timeout and deadline
+        
+        The process is killed whenever it is still running on the way out:
+        timeout, expired or cancelled deadline, or cancellation of the caller.
+        """
+        try:
+            if deadline is None:
+                return await asyncio.wait_for(process.communicate(input_data), timeout=self.config['timeout'])
+            return await deadline.wait_for(process.communicate(input_data), cap=self.config['timeout'],
+                                           operation='JavaScript component call')
+        except DeadlineExceededError:
+            raise
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"JavaScript component timeout after {self.config['timeout']}s")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                self.metrics['subprocesses_killed'] += 1
+                await process.wait()
+    
+    async def _execute_js_component_framed(self, component: str, method: str, args: List[Any],
+                                           deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Execute JavaScript component through bridge_runner.js using framed messages"""
+        
+        if component not in self.js_components:
+            raise ValueError(f"Unknown component: {component}")
+        
+        request_frame = encode_message({
+            'component': component,
+            'component_path': str(self.memory_dir / self.js_components[component]),
+            'method': method,
+            'args': args
+        })
+        
+        process = await asyncio.create_subprocess_exec(
+            'node', str(self.runner_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.memory_dir
+        )
+        
+        stdout, stderr = await self._communicate(process, request_frame, deadline)
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"Node.js process failed: {stderr.decode(errors='replace')}")
+        
+        if not stdout:
+            raise RuntimeError("No output from JavaScript component")
+        
+        result, _ = decode_message(stdout)
+        
+        if not result.get('success', False):
+            raise RuntimeError(f"JavaScript error: {result.get('error', 'Unknown error')}")
+        
+        return result.get('result', {})
+    
+    async def _execute_js_component_legacy(self, component: str, method: str, args: List[Any],
+                                           deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Execute JavaScript component via generated `node -e` source (legacy transport)"""
         
         if component not in self.js_components:
             raise ValueError(f"Unknown component: {component}")
@@ -255,48 +357,40 @@ class JavaScriptBridge:
             cwd=self.memory_dir
         )
         
-        try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(), 
-                timeout=self.config['timeout']
-            )
-            
-            if process.returncode != 0:
-                raise RuntimeError(f"Node.js process failed: {stderr.decode()}")
-            
-            # Parse result - handle multiple lines and find JSON
-            result_text = stdout.decode().strip()
-            if not result_text:
-                raise RuntimeError("No output from JavaScript component")
-
-            # Try to find valid JSON in the output (may have console logs before JSON)
-            result = None
-            lines = result_text.split('\n')
-
-            for line in lines:
-                line = line.strip()
-                if line.startswith('{') and line.endswith('}'):
-                    try:
-                        result = json.loads(line)
-                        break
-                    except json.JSONDecodeError:
-                        continue
-
-            if result is None:
-                # Fallback: try to parse the entire output
+        stdout, stderr = await self._communicate(process, None, deadline)
+        
+        if process.returncode != 0:
+            raise RuntimeError(f"Node.js process failed: {stderr.decode()}")
+        
+        # Parse result - handle multiple lines and find JSON
+        result_text = stdout.decode().strip()
+        if not result_text:
+            raise RuntimeError("No output from JavaScript component")
+
+        # Try to find valid JSON in the output (may have console logs before JSON)
+        result = None
+        lines = result_text.split('\n')
+
+        for line in lines:
+            line = line.strip()
+            if line.startswith('{') and line.endswith('}'):
                 try:
-                    result = json.loads(result_text)
+                    result = json.loads(line)
+                    break
                 except json.JSONDecodeError:
-                    raise RuntimeError(f"No valid JSON found in output: {result_text[:200]}...")
+                    continue
 
-            if not result.get('success', False):
-                raise RuntimeError(f"JavaScript error: {result.get('error', 'Unknown error')}")
+        if result is None:
+            # Fallback: try to parse the entire output
+            try:
+                result = json.loads(result_text)
+            except json.JSONDecodeError:
+                raise RuntimeError(f"No valid JSON found in output: {result_text[:200]}...")
 
-            return result.get('result', {})
-            
-        except asyncio.TimeoutError:
-            process.kill()
-            raise RuntimeError(f"JavaScript component timeout after {self.config['timeout']}s")
+        if not result.get('success', False):
+            raise RuntimeError(f"JavaScript error: {result.get('error', 'Unknown error')}")
+
+        return result.get('result', {})
     
     def _generate_cache_key(self, component: str, method: str, args: List[Any]) -> str:
         """Generate cache key for component call"""
@@ -347,7 +441,7 @@ class JavaScriptBridge:
             
             cache_file = self.cache_dir / f"{cache_key}.json"
             with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+                json.dump(cache_data, f, separators=(',', ':'))
                 
         except Exception as error:
             logger.warning(f"⚠️ [JS BRIDGE] Cache write failed: {error}")
@@ -377,13 +471,18 @@ class JavaScriptBridge:
     async def _embedding_fallback(self, method: str, args: List[Any]) -> Dict[str, Any]:
         """Fallback for embedding service"""
         if method == 'generateContextualEmbedding':
-            # Simple fallback embedding
+            # Offline hashed n-gram embedding keeps vectors content-dependent
+            from crawl4ai_strategies.embedding_backends import HashedNgramEmbeddingBackend
+            
+            if self._native_embedder is None:
+                self._native_embedder = HashedNgramEmbeddingBackend()
+            
             text = args[0] if args else ""
-            embedding = [0.1] * 384  # Simple fallback embedding
+            embedding = await self._native_embedder.embed_one(str(text))
             return {
                 'embedding': embedding,
-                'model': 'fallback',
-                'dimensions': 384,
+                'model': self._native_embedder.model_name,
+                'dimensions': len(embedding),
                 'fallback': True
             }
         
@@ -516,28 +615,45 @@ class JavaScriptBridge:
             # Reset failure count on success
             state['failures'] = max(0, state['failures'] - 1)
 
-    async def _execute_js_component_with_retry(self, component: str, method: str, args: List[Any]) -> Dict[str, Any]:
-        """Execute JavaScript component with retry logic"""
+    async def _execute_js_component_with_retry(self, component: str, method: str, args: List[Any],
+                                               deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Execute JavaScript component with retry logic (retries only within the deadline)"""
         last_error = None
 
         for attempt in range(self.config['max_retries'] + 1):
             try:
                 if attempt > 0:
                     # Exponential backoff for retries
-                    if self.config['retry_backoff']:
-                        delay = min(2 ** attempt, 10)  # Cap at 10 seconds
-                        await asyncio.sleep(delay)
+                    delay = min(2 ** attempt, 10) if self.config['retry_backoff'] else 0  # Cap at 10 seconds
+                    
+                    # Only retry when the budget covers the backoff plus a useful attempt
+                    if deadline is not None and not deadline.allows(delay + self.config['min_attempt_budget']):
+                        self.metrics['retries_skipped_for_budget'] += 1
+                        logger.warning(f"⏱️ [JS BRIDGE] Not retrying {component}.{method}: "
+                                       f"{deadline.remaining():.1f}s of budget left")
+                        break
+                    
+                    if delay:
+                        if deadline is not None:
+                            await deadline.wait_for(asyncio.sleep(delay), operation='JavaScript component retry')
+                        else:
+                            await asyncio.sleep(delay)
 
                     self.metrics['retry_attempts'] += 1
                     logger.info(f"🔄 [JS BRIDGE] Retry attempt {attempt} for {component}.{method}")
 
-                result = await self._execute_js_component(component, method, args)
+                if deadline is not None:
+                    deadline.check(f"{component}.{method}")
+                result = await self._execute_js_component(component, method, args, deadline)
 
                 if attempt > 0:
                     logger.info(f"✅ [JS BRIDGE] Retry successful for {component}.{method}")
 
                 return result
 
+            except DeadlineExceededError:
+                raise
+
             except Exception as error:
                 last_error = error
 
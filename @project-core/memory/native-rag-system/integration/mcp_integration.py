@@ -8,6 +8,11 @@ Integração completa do sistema RAG nativo Python com workflow MCP existente:
 Sequential Thinking → think-mcp-server → MCP Shrimp Task Manager
 
 Mantém 100% backward compatibility e implementa como camada de processamento interno.
+
+Tasks submitted through submit_task() go through a bounded priority work queue
+(configurable workers, highest complexity first) with admission control and
+backpressure on queue depth and p95 latency. Within a task, the memory
+consultation and the Augment project-core sync run concurrently.
 """
 
 import asyncio
@@ -26,6 +31,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 from central_hub.memory_coordinator import CentralMemoryCoordinator
 from central_hub.augment_bridge import AugmentMemoriesBridge
 from central_hub.crosscheck_system import IntelligentCrosscheckSystem
+from integration.deadline import Deadline, DeadlineExceededError
+from integration.memory_service import MemoryServiceCoordinator
+from integration.task_queue import BoundedPriorityWorkQueue, QueueRejectedError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -37,8 +45,12 @@ class MCPWorkflowIntegration:
     """
     
     def __init__(self):
-        # Initialize native RAG components
-        self.memory_coordinator = CentralMemoryCoordinator()
+        # Initialize native RAG components (the resident memory service when one is running,
+        # an in-process coordinator otherwise)
+        if os.getenv('MEMORY_SERVICE_ENABLED', 'true').lower() == 'true':
+            self.memory_coordinator = MemoryServiceCoordinator()
+        else:
+            self.memory_coordinator = CentralMemoryCoordinator()
         self.augment_bridge = AugmentMemoriesBridge()
         self.crosscheck_system = IntelligentCrosscheckSystem()
         
@@ -48,9 +60,21 @@ class MCPWorkflowIntegration:
             'think_mcp_server_enabled': True,
             'mcp_shrimp_integration': True,
             'backward_compatibility': True,
-            'fallback_enabled': True
+            'fallback_enabled': True,
+            'task_budget_seconds': 60,  # Default deadline per task (None = no deadline)
+            # Work queue in front of integrate_with_mcp_workflow (submit_task)
+            'queue_workers': 4,
+            'queue_max_depth': 32,  # Tasks waiting beyond the running ones
+            'queue_target_p95_ms': 30000,  # Shed load above this end-to-end p95 (None = off)
+            'queue_admission_wait': 2.0  # Seconds a submission waits for capacity before rejection
         }
         
+        # Bounded task queue (created on first submit_task)
+        self.task_queue = None
+        
+        # Augment project-core sync shared by concurrent tasks
+        self._project_core_sync = None
+        
         # Integration state
         self.integration_state = {
             'initialized': False,
@@ -61,7 +85,10 @@ class MCPWorkflowIntegration:
                 'total_integrations': 0,
                 'successful_integrations': 0,
                 'fallback_activations': 0,
-                'average_processing_time': 0
+                'average_processing_time': 0,
+                'admission_rejections': 0,
+                'deadline_expired_in_queue': 0,
+                'project_core_syncs_shared': 0
             }
         }
         
@@ -70,7 +97,8 @@ class MCPWorkflowIntegration:
             'NATIVE_RAG_ENABLED': os.getenv('NATIVE_RAG_ENABLED', 'true').lower() == 'true',
             'MCP_FALLBACK_ENABLED': os.getenv('MCP_FALLBACK_ENABLED', 'true').lower() == 'true',
             'SEQUENTIAL_THINKING_INTEGRATION': os.getenv('SEQUENTIAL_THINKING_INTEGRATION', 'true').lower() == 'true',
-            'MEMORY_COORDINATOR_ACTIVE': os.getenv('MEMORY_COORDINATOR_ACTIVE', 'true').lower() == 'true'
+            'MEMORY_COORDINATOR_ACTIVE': os.getenv('MEMORY_COORDINATOR_ACTIVE', 'true').lower() == 'true',
+            'MEMORY_SERVICE_ENABLED': os.getenv('MEMORY_SERVICE_ENABLED', 'true').lower() == 'true'
         }
         
         logger.info("✅ [MCP INTEGRATION] MCP Workflow Integration initialized successfully")
@@ -102,13 +130,18 @@ class MCPWorkflowIntegration:
             logger.error(f"❌ [MCP INTEGRATION] Initialization failed: {error}")
             return False
     
-    async def integrate_with_mcp_workflow(self, task_context: Dict[str, Any]) -> Dict[str, Any]:
+    async def integrate_with_mcp_workflow(self, task_context: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Main integration method: Process task through native RAG system while maintaining MCP workflow
+        
+        The task deadline (argument, task_context['deadline'] or task_budget_seconds)
+        bounds the memory consultation down to the JavaScript bridge calls.
         """
         start_time = time.time()
         self.integration_state['performance_metrics']['total_integrations'] += 1
         
+        deadline = self._resolve_task_deadline(task_context, deadline)
+        
         try:
             # Extract task information
             task_description = task_context.get('description', '')
@@ -126,7 +159,7 @@ class MCPWorkflowIntegration:
             
             # Phase 2: Native RAG Processing
             native_processing_result = await self._process_with_native_rag(
-                task_context, sequential_thinking_result
+                task_context, sequential_thinking_result, deadline
             )
             
             # Phase 3: think-mcp-server Coordination
@@ -265,6 +298,71 @@ class MCPWorkflowIntegration:
             logger.error(f"❌ [MCP INTEGRATION] Environment configuration failed: {error}")
             raise
     
+    async def submit_task(self, task_context: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Queue a task for integrate_with_mcp_workflow on the bounded work queue
+        
+        Higher complexity tasks are served first. When the queue is full or the
+        p95 latency exceeds its target, the caller waits up to queue_admission_wait
+        seconds for capacity and is then turned away with an admission_rejected
+        result carrying retry_after_ms. The task deadline starts at submission,
+        so time spent queued counts against it.
+        """
+        deadline = self._resolve_task_deadline(task_context, deadline)
+        metrics = self.integration_state['performance_metrics']
+        
+        try:
+            return await self._get_task_queue().submit(
+                task_context, priority=-task_context.get('complexity', 5), deadline=deadline
+            )
+            
+        except QueueRejectedError as error:
+            metrics['admission_rejections'] += 1
+            logger.warning(f"⚠️ [MCP INTEGRATION] Task {task_context.get('task_id', 'unknown')} not admitted: {error}")
+            return {
+                'success': False,
+                'task_id': task_context.get('task_id', 'unknown'),
+                'admission_rejected': True,
+                'reason': error.reason,
+                'error': str(error),
+                'retry_after_ms': error.retry_after_ms,
+                'queue': self.task_queue.get_metrics()
+            }
+            
+        except DeadlineExceededError as error:
+            metrics['deadline_expired_in_queue'] += 1
+            logger.warning(f"⏱️ [MCP INTEGRATION] Task {task_context.get('task_id', 'unknown')} expired in queue")
+            return {
+                'success': False,
+                'task_id': task_context.get('task_id', 'unknown'),
+                'deadline_exceeded': True,
+                'error': str(error)
+            }
+    
+    async def stop_task_queue(self, drain: bool = True):
+        """Stop the task queue workers (after the queued tasks when drain is set)"""
+        if self.task_queue is not None:
+            await self.task_queue.stop(drain)
+    
+    def _get_task_queue(self) -> BoundedPriorityWorkQueue:
+        if self.task_queue is None:
+            self.task_queue = BoundedPriorityWorkQueue(
+                lambda task_context, deadline: self.integrate_with_mcp_workflow(task_context, deadline),
+                workers=self.mcp_config['queue_workers'],
+                max_depth=self.mcp_config['queue_max_depth'],
+                target_p95_ms=self.mcp_config['queue_target_p95_ms'],
+                admission_wait=self.mcp_config['queue_admission_wait'],
+                name='mcp task queue'
+            )
+        return self.task_queue
+    
+    def _resolve_task_deadline(self, task_context: Dict[str, Any], deadline: Optional[Deadline]) -> Optional[Deadline]:
+        """Explicit deadline, else task_context['deadline'], else a task_budget_seconds budget"""
+        deadline = Deadline.coerce(deadline) or Deadline.coerce(task_context.get('deadline'))
+        if deadline is None and self.mcp_config['task_budget_seconds']:
+            deadline = Deadline(self.mcp_config['task_budget_seconds'])
+        return deadline
+    
     async def _integrate_sequential_thinking(self, task_description: str, complexity: int, mcp_context: Dict[str, Any]) -> Dict[str, Any]:
         """Integrate with Sequential Thinking for complex tasks (complexity ≥ 7)"""
         try:
@@ -297,20 +395,26 @@ class MCPWorkflowIntegration:
             logger.warning(f"⚠️ [MCP INTEGRATION] Sequential Thinking integration failed: {error}")
             return None
     
-    async def _process_with_native_rag(self, task_context: Dict[str, Any], sequential_result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _process_with_native_rag(self, task_context: Dict[str, Any], sequential_result: Optional[Dict[str, Any]],
+                                       deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Process task with native RAG system"""
         try:
             if not self.env_config['NATIVE_RAG_ENABLED']:
                 return {'native_rag_skipped': True, 'reason': 'disabled_by_environment'}
             
-            # Phase 1: Memory Coordination
-            memory_result = await self.memory_coordinator.coordinate_memory_consultation(
-                task_context.get('description', ''),
-                {'source': 'mcp_integration', 'sequential_thinking_result': sequential_result}
+            # Phase 1 + 2: Memory Coordination and Augment Bridge Processing (independent, run together)
+            memory_result, bridge_result = await asyncio.gather(
+                self.memory_coordinator.coordinate_memory_consultation(
+                    task_context.get('description', ''),
+                    {'source': 'mcp_integration', 'sequential_thinking_result': sequential_result},
+                    deadline=deadline
+                ),
+                self._shared_project_core_sync(),
+                return_exceptions=True
             )
-
-            # Phase 2: Augment Bridge Processing
-            bridge_result = await self.augment_bridge.sync_with_project_core()
+            for phase_result in (memory_result, bridge_result):
+                if isinstance(phase_result, BaseException):
+                    raise phase_result
             bridge_result['query_context'] = task_context.get('description', '')
             
             # Phase 3: Crosscheck Analysis
@@ -353,6 +457,18 @@ class MCPWorkflowIntegration:
                 'fallback_required': True
             }
     
+    async def _shared_project_core_sync(self) -> Dict[str, Any]:
+        """
+        Augment project-core sync, joined by concurrent tasks while one is in flight
+        """
+        if self._project_core_sync is None or self._project_core_sync.done():
+            self._project_core_sync = asyncio.ensure_future(self.augment_bridge.sync_with_project_core())
+        else:
+            self.integration_state['performance_metrics']['project_core_syncs_shared'] += 1
+        
+        # Shielded so one task's cancellation does not cancel the sync for the others
+        return dict(await asyncio.shield(self._project_core_sync))
+    
     async def _coordinate_with_think_server(self, native_result: Dict[str, Any], mcp_context: Dict[str, Any]) -> Dict[str, Any]:
         """Coordinate with think-mcp-server"""
         try:
@@ -477,9 +593,11 @@ class MCPWorkflowIntegration:
             'env_config': self.env_config,
             'components_status': {
                 'memory_coordinator': self.memory_coordinator is not None,
+                'memory_backend': getattr(self.memory_coordinator, 'backend', 'in_process'),
                 'augment_bridge': self.augment_bridge is not None,
                 'crosscheck_system': self.crosscheck_system is not None
-            }
+            },
+            'task_queue': self.task_queue.get_metrics() if self.task_queue is not None else None
         }
     
     async def health_check(self) -> Dict[str, Any]:
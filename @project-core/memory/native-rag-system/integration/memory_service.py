@@ -0,0 +1,908 @@
+#!/usr/bin/env python3
+
+"""
+MEMORY SERVICE DAEMON V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Resident asyncio service hosting one CentralMemoryCoordinator, so callers pay
+steady-state latency instead of rebuilding bridges, strategies, indexes and
+caches on every invocation.
+
+Transport: Unix domain socket (localhost TCP where AF_UNIX is unavailable),
+using the framed bridge protocol (bridge_protocol.py). Requests are
+{id, method, params, token}; responses are {id, ok, result | error}. A
+connection may pipeline requests; responses are matched by id.
+
+The socket is only accessible to its owner. Any local process can reach a TCP
+port, so in TCP mode the daemon writes a random token to a 0600 token file
+(next to the endpoint file) and rejects requests that do not carry it.
+
+Methods: consult, batch, ingest, index_code, metrics, health, reload, ping, shutdown
+
+Features:
+- Endpoint file (cache/memory-service.json) so clients find the socket or port
+- Owner-only token authentication for the TCP transport
+- Bounded request concurrency shared by all connections
+- Background warm-up (incremental memory corpus ingestion) after start
+- Graceful reload: drains in-flight requests, re-applies the config file,
+  clears consultation caches and refreshes indexes incrementally (warm
+  indexes and models are kept)
+- SIGHUP reloads, SIGINT / SIGTERM stop gracefully (where supported)
+- MemoryServiceClient library and command line interface
+- MemoryServiceCoordinator: coordinator interface for callers (MCP integration,
+  Augment bridge, CLI) that uses the daemon when running and an in-process
+  coordinator otherwise
+"""
+
+import argparse
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import signal
+import socket
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+import sys
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.bridge_protocol import encode_message, read_message
+from integration.deadline import Deadline
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SERVICE_DIR = Path(__file__).parent.parent / 'cache'
+DEFAULT_SOCKET_PATH = SERVICE_DIR / 'memory-service.sock'
+DEFAULT_ENDPOINT_FILE = SERVICE_DIR / 'memory-service.json'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+UNIX_SOCKETS_AVAILABLE = hasattr(socket, 'AF_UNIX')
+
+# Client commands the CLI can still run without a daemon (ping / reload / stop need one)
+IN_PROCESS_COMMANDS = ('consult', 'batch', 'ingest', 'index-code', 'metrics', 'health')
+
+Address = Union[str, Path, Tuple[str, int]]
+
+
+class MemoryServiceError(Exception):
+    """Raised by the client when the service reports a failed request"""
+
+
+def _token_file_for(endpoint_file: Path) -> Path:
+    """The TCP token file lives next to the endpoint file (cache/memory-service.token)"""
+    return Path(endpoint_file).with_suffix('.token')
+
+
+def _json_default(value: Any) -> Any:
+    """Encode numpy values, sets and other non-JSON results"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+class MemoryService:
+    """
+    Resident memory service exposing the coordinator over a local socket
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None, host: str = DEFAULT_HOST, port: Optional[int] = None,
+                 coordinator=None, config_path: Optional[Path] = None,
+                 endpoint_file: Path = DEFAULT_ENDPOINT_FILE, token_file: Optional[Path] = None):
+        use_unix = UNIX_SOCKETS_AVAILABLE and port is None
+        self.config = {
+            'transport': 'unix' if use_unix else 'tcp',
+            'socket_path': Path(socket_path or DEFAULT_SOCKET_PATH),
+            'host': host,
+            'port': DEFAULT_PORT if port is None else port,  # 0 picks a free port
+            'endpoint_file': Path(endpoint_file),
+            'token_file': Path(token_file) if token_file else _token_file_for(endpoint_file),
+            'config_path': Path(config_path) if config_path else None,
+            'max_concurrent_requests': 8,
+            'drain_timeout': 30,  # seconds to wait for in-flight requests on reload / stop
+            'warm_start': True,  # ingest the memory corpus in the background after start
+            'reload_refreshes_indexes': True
+        }
+
+        self.coordinator = coordinator
+        self.server = None
+        self.address: Optional[Address] = None
+        self._token: Optional[str] = None  # required on every request in TCP mode
+
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._accepting = None  # cleared while a reload drains and runs
+        self._idle = None  # set when no request is in flight
+        self._stopped = None
+        self._inflight = 0
+        self._connections = set()
+        self._warm_task = None
+        self._reload_lock = None
+        self._started_at = 0.0
+
+        self.handlers = {
+            'consult': self._handle_consult,
+            'batch': self._handle_batch,
+            'ingest': self._handle_ingest,
+            'index_code': self._handle_index_code,
+            'metrics': self._handle_metrics,
+            'health': self._handle_health,
+            'reload': self._handle_reload,
+            'ping': self._handle_ping,
+            'shutdown': self._handle_shutdown
+        }
+
+        self.metrics = {
+            'connections_accepted': 0,
+            'requests_total': 0,
+            'requests_failed': 0,
+            'requests_rejected': 0,
+            'requests_by_method': {},
+            'average_request_time': 0.0,
+            'reloads': 0,
+            'last_reload_time_ms': 0.0,
+            'warm_up_time_ms': 0.0
+        }
+
+    # LIFECYCLE
+
+    async def start(self):
+        """Build (or adopt) the coordinator and start listening"""
+        self._request_slots = asyncio.Semaphore(self.config['max_concurrent_requests'])
+        self._accepting = asyncio.Event()
+        self._accepting.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._stopped = asyncio.Event()
+        self._reload_lock = asyncio.Lock()
+
+        if self.coordinator is None:
+            from central_hub.memory_coordinator import CentralMemoryCoordinator
+            self.coordinator = CentralMemoryCoordinator()
+        await self.coordinator.initialize()
+        self._apply_config_file()
+
+        if self.config['transport'] == 'unix':
+            socket_path = self.config['socket_path']
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if socket_path.exists():
+                if await _endpoint_alive(str(socket_path)):
+                    raise RuntimeError(f"Memory service already running at {socket_path}")
+                socket_path.unlink()  # stale socket from a crashed daemon
+            self.server = await asyncio.start_unix_server(self._handle_connection, path=str(socket_path))
+            os.chmod(socket_path, 0o600)
+            self.address = str(socket_path)
+            endpoint = {'transport': 'unix', 'path': self.address}
+        else:
+            # The token exists before the port opens, so no request is ever served unauthenticated
+            self._token = self._write_token_file()
+            self.server = await asyncio.start_server(self._handle_connection, self.config['host'], self.config['port'])
+            port = self.server.sockets[0].getsockname()[1]
+            self.address = (self.config['host'], port)
+            endpoint = {'transport': 'tcp', 'host': self.config['host'], 'port': port}
+
+        self._write_endpoint_file({**endpoint, 'pid': os.getpid()})
+        self._started_at = time.time()
+
+        if self.config['warm_start']:
+            self._warm_task = asyncio.create_task(self._warm_up())
+
+        logger.info(f"✅ [MEMORY SERVICE] Listening on {self.address}")
+
+    async def serve_forever(self):
+        """Start, install signal handlers and run until stopped"""
+        await self.start()
+        loop = asyncio.get_running_loop()
+        for signal_name, callback in (('SIGINT', self._request_stop), ('SIGTERM', self._request_stop),
+                                      ('SIGHUP', self._request_reload)):
+            if hasattr(signal, signal_name):
+                try:
+                    loop.add_signal_handler(getattr(signal, signal_name), callback)
+                except (NotImplementedError, RuntimeError):
+                    pass  # Windows event loops have no signal handlers
+        await self._stopped.wait()
+
+    def _request_stop(self):
+        asyncio.ensure_future(self.stop())
+
+    def _request_reload(self):
+        asyncio.ensure_future(self.reload())
+
+    async def stop(self):
+        """Stop accepting connections, drain in-flight requests and clean up"""
+        if self._stopped is None or self._stopped.is_set() or self.server is None:
+            return
+
+        self.server.close()
+        if self._warm_task is not None and not self._warm_task.done():
+            self._warm_task.cancel()
+        await self._wait_idle()
+
+        for writer in list(self._connections):
+            writer.close()
+        await self.server.wait_closed()
+        self.server = None
+
+        service_files = [self.config['endpoint_file']]
+        service_files.append(self.config['socket_path'] if self.config['transport'] == 'unix' else self.config['token_file'])
+        for service_file in service_files:
+            try:
+                service_file.unlink()
+            except FileNotFoundError:
+                pass
+
+        self._stopped.set()
+        logger.info("🛑 [MEMORY SERVICE] Stopped")
+
+    async def reload(self) -> Dict[str, Any]:
+        """
+        Graceful reload: drain requests, re-apply config, clear consultation
+        caches and refresh the indexes incrementally (warm state is kept)
+        """
+        async with self._reload_lock:
+            start_time = time.time()
+            self._accepting.clear()
+            try:
+                await self._wait_idle()
+
+                config_applied = self._apply_config_file()
+
+                coordinator = self.coordinator
+                cache_entries = len(getattr(coordinator, 'intelligent_cache', {}))
+                for cache_name in ('intelligent_cache', 'cache_metadata', 'cache_access_patterns', 'preload_cache'):
+                    cache = getattr(coordinator, cache_name, None)
+                    if cache is not None:
+                        cache.clear()
+
+                refresh = None
+                if self.config['reload_refreshes_indexes'] and hasattr(coordinator, 'ingest_memory_corpus'):
+                    refresh = await coordinator.ingest_memory_corpus()
+            finally:
+                self._accepting.set()
+
+            self.metrics['reloads'] += 1
+            self.metrics['last_reload_time_ms'] = (time.time() - start_time) * 1000
+            logger.info(f"🔄 [MEMORY SERVICE] Reloaded ({self.metrics['last_reload_time_ms']:.1f}ms)")
+            return {
+                'reloaded': True,
+                'config_applied': config_applied,
+                'cache_entries_cleared': cache_entries,
+                'index_refresh': refresh,
+                'reload_time_ms': self.metrics['last_reload_time_ms']
+            }
+
+    async def _warm_up(self):
+        start_time = time.time()
+        try:
+            if hasattr(self.coordinator, 'ingest_memory_corpus'):
+                await self.coordinator.ingest_memory_corpus()
+            self.metrics['warm_up_time_ms'] = (time.time() - start_time) * 1000
+            logger.info(f"🔥 [MEMORY SERVICE] Warm-up completed ({self.metrics['warm_up_time_ms']:.1f}ms)")
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.warning(f"⚠️ [MEMORY SERVICE] Warm-up failed: {error}")
+
+    async def _wait_idle(self):
+        try:
+            await asyncio.wait_for(self._idle.wait(), self.config['drain_timeout'])
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ [MEMORY SERVICE] {self._inflight} requests still running after drain timeout")
+
+    def _apply_config_file(self) -> bool:
+        """Apply {"service": {...}, "coordinator": {...}} overrides from the config file"""
+        config_path = self.config['config_path']
+        if config_path is None or not config_path.exists():
+            return False
+
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                overrides = json.load(f)
+        except (OSError, json.JSONDecodeError) as error:
+            logger.warning(f"⚠️ [MEMORY SERVICE] Config file ignored: {error}")
+            return False
+
+        for key in ('max_concurrent_requests', 'drain_timeout', 'reload_refreshes_indexes'):
+            if key in overrides.get('service', {}):
+                self.config[key] = overrides['service'][key]
+        if self._request_slots is not None and 'max_concurrent_requests' in overrides.get('service', {}):
+            self._request_slots = asyncio.Semaphore(self.config['max_concurrent_requests'])
+        getattr(self.coordinator, 'config', {}).update(overrides.get('coordinator', {}))
+        return True
+
+    def _write_endpoint_file(self, endpoint: Dict[str, Any]):
+        endpoint_file = self.config['endpoint_file']
+        endpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = endpoint_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(endpoint, f)
+        os.replace(tmp_file, endpoint_file)
+
+    def _write_token_file(self) -> str:
+        """Write a fresh random token readable only by the daemon's user"""
+        token = secrets.token_hex(32)
+        token_file = self.config['token_file']
+        token_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = token_file.with_suffix('.token.tmp')
+        try:
+            tmp_file.unlink()
+        except FileNotFoundError:
+            pass
+        # O_EXCL: never write the token into a file (or symlink) someone else prepared
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(token)
+        os.replace(tmp_file, token_file)
+        return token
+
+    # CONNECTIONS
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.metrics['connections_accepted'] += 1
+        self._connections.add(writer)
+        tasks = set()
+        try:
+            while True:
+                try:
+                    request = await read_message(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                # Requests on one connection run concurrently; responses carry the request id
+                task = asyncio.create_task(self._handle_request(request, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception as error:
+            logger.warning(f"⚠️ [MEMORY SERVICE] Connection error: {error}")
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _handle_request(self, request: Dict[str, Any], writer: asyncio.StreamWriter):
+        request_id = request.get('id') if isinstance(request, dict) else None
+        method = request.get('method') if isinstance(request, dict) else None
+        params = (request.get('params') or {}) if isinstance(request, dict) else {}
+
+        if self._token is not None:
+            token = request.get('token') if isinstance(request, dict) else None
+            if not isinstance(token, str) or not hmac.compare_digest(token, self._token):
+                self.metrics['requests_rejected'] += 1
+                logger.warning(f"⚠️ [MEMORY SERVICE] Rejected {method} request without a valid token")
+                await self._send_response(writer, {'id': request_id, 'ok': False,
+                                                   'error': 'PermissionError: Invalid or missing service token'})
+                return
+
+        await self._accepting.wait()
+        self._inflight += 1
+        self._idle.clear()
+        start_time = time.time()
+        try:
+            handler = self.handlers.get(method)
+            if handler is None:
+                raise ValueError(f"Unknown method: {method}")
+            # reload waits for in-flight requests, so it must not hold a request slot itself
+            if method in ('reload', 'shutdown', 'ping', 'metrics'):
+                result = await handler(params)
+            else:
+                async with self._request_slots:
+                    result = await handler(params)
+            response = {'id': request_id, 'ok': True, 'result': result}
+        except Exception as error:
+            self.metrics['requests_failed'] += 1
+            logger.warning(f"⚠️ [MEMORY SERVICE] {method} failed: {error}")
+            response = {'id': request_id, 'ok': False, 'error': f"{type(error).__name__}: {error}"}
+        finally:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._idle.set()
+
+        self._record_request(method, (time.time() - start_time) * 1000)
+        await self._send_response(writer, response)
+
+    async def _send_response(self, writer: asyncio.StreamWriter, response: Dict[str, Any]):
+        try:
+            writer.write(encode_message(response, default=_json_default))
+            await writer.drain()
+        except (ConnectionError, RuntimeError):
+            pass  # Client went away before the response was ready
+
+    def _record_request(self, method: str, request_time: float):
+        self.metrics['requests_total'] += 1
+        by_method = self.metrics['requests_by_method']
+        by_method[method] = by_method.get(method, 0) + 1
+        if self.metrics['average_request_time'] == 0:
+            self.metrics['average_request_time'] = request_time
+        else:
+            self.metrics['average_request_time'] = (self.metrics['average_request_time'] + request_time) / 2
+
+    # METHODS
+
+    async def _handle_consult(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.coordinator.coordinate_memory_consultation(params['query'], params.get('context') or {},
+                                                                     params.get('timeout'))
+
+    async def _handle_batch(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self.coordinator.coordinate_memory_consultations_batch(
+            params['queries'], dict(params.get('context') or {}), params.get('timeout')
+        )
+
+    async def _handle_ingest(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.coordinator.ingest_memory_corpus(params.get('paths'))
+
+    async def _handle_index_code(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.coordinator.index_code_repository()
+
+    async def _handle_metrics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {'service': self.get_metrics(), 'coordinator': self.coordinator.get_metrics()}
+
+    async def _handle_health(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.coordinator.health_check()
+
+    async def _handle_reload(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Runs outside the in-flight count so the drain does not wait on itself
+        self._inflight -= 1
+        if self._inflight == 0:
+            self._idle.set()
+        try:
+            return await self.reload()
+        finally:
+            self._inflight += 1
+            self._idle.clear()
+
+    async def _handle_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {'pong': True, 'pid': os.getpid(), 'uptime_seconds': time.time() - self._started_at}
+
+    async def _handle_shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        # Stop after this response has been written
+        asyncio.get_running_loop().call_later(0.05, self._request_stop)
+        return {'stopping': True}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get memory service metrics"""
+        return {
+            **self.metrics,
+            'transport': self.config['transport'],
+            'address': self.address if isinstance(self.address, str) else list(self.address or ()),
+            'active_connections': len(self._connections),
+            'inflight_requests': self._inflight,
+            'uptime_seconds': time.time() - self._started_at if self._started_at else 0.0,
+            'warm': self._warm_task is None or self._warm_task.done()
+        }
+
+
+# CLIENT
+
+def read_service_token(token_file: Path) -> Optional[str]:
+    """Token a TCP daemon requires, or None if the file is missing or unreadable"""
+    try:
+        with open(token_file, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def resolve_service_address(address: Optional[Address] = None,
+                            endpoint_file: Path = DEFAULT_ENDPOINT_FILE) -> Optional[Address]:
+    """Explicit address, else the one advertised in the endpoint file"""
+    if address is not None:
+        return address
+    try:
+        with open(endpoint_file, 'r', encoding='utf-8') as f:
+            endpoint = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if endpoint.get('transport') == 'unix':
+        return endpoint['path']
+    return (endpoint['host'], endpoint['port'])
+
+
+async def _open_connection(address: Address):
+    if isinstance(address, (str, Path)):
+        return await asyncio.open_unix_connection(str(address))
+    return await asyncio.open_connection(address[0], address[1])
+
+
+async def _endpoint_alive(address: Address) -> bool:
+    try:
+        _, writer = await asyncio.wait_for(_open_connection(address), 1.0)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+class MemoryServiceClient:
+    """
+    Thin asyncio client for the memory service (pipelined requests)
+    """
+
+    def __init__(self, address: Optional[Address] = None, timeout: Optional[float] = 300,
+                 endpoint_file: Path = DEFAULT_ENDPOINT_FILE, token_file: Optional[Path] = None):
+        self.address = address
+        self.endpoint_file = Path(endpoint_file)
+        self.token_file = Path(token_file) if token_file else _token_file_for(endpoint_file)
+        self.timeout = timeout
+        self._token: Optional[str] = None
+        self._reader = None
+        self._writer = None
+        self._reader_task = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+
+    async def connect(self) -> 'MemoryServiceClient':
+        address = resolve_service_address(self.address, self.endpoint_file)
+        if address is None:
+            raise ConnectionError("Memory service endpoint not found (is the daemon running?)")
+        if not isinstance(address, (str, Path)):
+            # Re-read on every connect: a restarted daemon writes a new token
+            self._token = read_service_token(self.token_file)
+            if self._token is None:
+                raise ConnectionError(f"Memory service token not readable ({self.token_file})")
+        self._reader, self._writer = await _open_connection(address)
+        self.address = address
+        self._reader_task = asyncio.create_task(self._read_responses())
+        return self
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._reader_task = None
+
+    async def __aenter__(self) -> 'MemoryServiceClient':
+        return await self.connect()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _read_responses(self):
+        error = ConnectionError("Memory service connection closed")
+        try:
+            while True:
+                response = await read_message(self._reader)
+                future = self._pending.pop(response.get('id'), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as read_error:
+            error = ConnectionError(f"Memory service connection failed: {read_error}")
+        finally:
+            # The next call reconnects (or fails fast) instead of writing to a dead socket
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def call(self, method: str, **params) -> Any:
+        """Send one request and wait for its response"""
+        if self._writer is None:
+            await self.connect()
+
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        request = {'id': request_id, 'method': method, 'params': params}
+        if self._token is not None:
+            request['token'] = self._token
+        try:
+            self._writer.write(encode_message(request, default=_json_default))
+            await self._writer.drain()
+            response = await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                future.exception()  # a failed write raised its own error already
+
+        if not response.get('ok'):
+            raise MemoryServiceError(response.get('error', 'Unknown service error'))
+        return response.get('result')
+
+    async def consult(self, query: str, context: Dict[str, Any] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        return await self.call('consult', query=query, context=context or {}, timeout=timeout)
+
+    async def batch(self, queries: List[str], context: Dict[str, Any] = None,
+                    timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        return await self.call('batch', queries=list(queries), context=context or {}, timeout=timeout)
+
+    async def ingest(self, paths: Optional[List[str]] = None) -> Dict[str, Any]:
+        return await self.call('ingest', paths=[str(path) for path in paths] if paths is not None else None)
+
+    async def index_code(self) -> Dict[str, Any]:
+        return await self.call('index_code')
+
+    async def metrics(self) -> Dict[str, Any]:
+        return await self.call('metrics')
+
+    async def health(self) -> Dict[str, Any]:
+        return await self.call('health')
+
+    async def reload(self) -> Dict[str, Any]:
+        return await self.call('reload')
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self.call('ping')
+
+    async def shutdown(self) -> Dict[str, Any]:
+        return await self.call('shutdown')
+
+
+async def connect_memory_service(address: Optional[Address] = None,
+                                 endpoint_file: Path = DEFAULT_ENDPOINT_FILE) -> Optional[MemoryServiceClient]:
+    """
+    Connected client if a daemon is running, otherwise None (callers fall back to in-process)
+    """
+    try:
+        return await MemoryServiceClient(address, endpoint_file=endpoint_file).connect()
+    except (OSError, ConnectionError):
+        return None
+
+
+def _in_process_coordinator():
+    from central_hub.memory_coordinator import CentralMemoryCoordinator
+    return CentralMemoryCoordinator()
+
+
+class MemoryServiceCoordinator:
+    """
+    Coordinator interface that uses the memory service when a daemon is
+    running and falls back to an in-process coordinator otherwise (also when
+    the daemon goes away mid-session)
+    """
+
+    def __init__(self, address: Optional[Address] = None, endpoint_file: Path = DEFAULT_ENDPOINT_FILE,
+                 fallback_factory=None, timeout: Optional[float] = 300):
+        self.address = address
+        self.endpoint_file = Path(endpoint_file)
+        self.timeout = timeout
+        self.fallback_factory = fallback_factory or _in_process_coordinator
+        self.client: Optional[MemoryServiceClient] = None
+        self.fallback = None
+        self._fallback_lock = asyncio.Lock()
+        self.metrics = {
+            'service_requests': 0,
+            'in_process_requests': 0,
+            'fallback_activations': 0
+        }
+
+    @property
+    def backend(self) -> str:
+        if self.fallback is not None:
+            return 'in_process'
+        return 'service' if self.client is not None else 'unconnected'
+
+    async def initialize(self) -> bool:
+        """Connect to the daemon, else build and initialize the in-process coordinator"""
+        if self.fallback is not None:
+            return True
+        try:
+            self.client = await MemoryServiceClient(self.address, self.timeout, self.endpoint_file).connect()
+            await self.client.ping()
+            logger.info(f"✅ [MEMORY SERVICE] Using memory service at {self.client.address}")
+            return True
+        except (OSError, ConnectionError, asyncio.TimeoutError) as error:
+            return await self._activate_fallback(f"Memory service unavailable ({error})")
+
+    async def _activate_fallback(self, reason: str) -> bool:
+        async with self._fallback_lock:
+            if self.fallback is None:
+                logger.info(f"🔄 [MEMORY SERVICE] {reason}, using an in-process coordinator")
+                if self.client is not None:
+                    await self.client.close()
+                    self.client = None
+                coordinator = self.fallback_factory()
+                if not await coordinator.initialize():
+                    return False
+                self.fallback = coordinator
+                self.metrics['fallback_activations'] += 1
+        return True
+
+    async def _dispatch(self, remote, local):
+        """remote(client) on the daemon; local(coordinator) in-process or once the daemon is gone"""
+        if self.client is None and self.fallback is None:
+            await self.initialize()
+        if self.fallback is None:
+            try:
+                result = await remote(self.client)
+                self.metrics['service_requests'] += 1
+                return result
+            except asyncio.TimeoutError:
+                raise  # a slow daemon is not a missing one (TimeoutError is an OSError)
+            except (OSError, ConnectionError) as error:
+                if not await self._activate_fallback(f"Memory service lost ({error})"):
+                    raise
+        self.metrics['in_process_requests'] += 1
+        return await local(self.fallback)
+
+    async def coordinate_memory_consultation(self, query: str, context: Dict[str, Any] = None,
+                                             deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        timeout = deadline.timeout() if isinstance(deadline, Deadline) else deadline
+        return await self._dispatch(
+            lambda client: client.consult(query, context, timeout),
+            lambda coordinator: coordinator.coordinate_memory_consultation(query, context, deadline)
+        )
+
+    async def coordinate_memory_operations(self, query: str, context: Dict[str, Any] = None,
+                                           deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Alias for coordinate_memory_consultation for MCP integration compatibility"""
+        return await self.coordinate_memory_consultation(query, context, deadline)
+
+    async def coordinate_memory_consultations_batch(self, queries: List[Any], context: Dict[str, Any] = None,
+                                                    deadline: Optional[Deadline] = None) -> List[Dict[str, Any]]:
+        timeout = deadline.timeout() if isinstance(deadline, Deadline) else deadline
+        return await self._dispatch(
+            lambda client: client.batch(queries, context, timeout),
+            lambda coordinator: coordinator.coordinate_memory_consultations_batch(queries, context, deadline)
+        )
+
+    async def ingest_memory_corpus(self, paths: Optional[List[str]] = None) -> Dict[str, Any]:
+        return await self._dispatch(lambda client: client.ingest(paths),
+                                    lambda coordinator: coordinator.ingest_memory_corpus(paths))
+
+    async def index_code_repository(self) -> Dict[str, Any]:
+        return await self._dispatch(lambda client: client.index_code(),
+                                    lambda coordinator: coordinator.index_code_repository())
+
+    async def health_check(self) -> Dict[str, Any]:
+        health = await self._dispatch(lambda client: client.health(),
+                                      lambda coordinator: coordinator.health_check())
+        return {**health, 'backend': self.backend}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Routing counters (plus the in-process coordinator's metrics after a fallback)"""
+        return {
+            **self.metrics,
+            'backend': self.backend,
+            'coordinator': self.fallback.get_metrics() if self.fallback is not None else None
+        }
+
+    async def close(self):
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+
+# COMMAND LINE
+
+def _parse_address(args) -> Optional[Address]:
+    if args.port is not None:
+        return (args.host, args.port)
+    if args.socket:
+        return args.socket
+    return None
+
+
+async def _run_cli(args) -> int:
+    if args.command == 'serve':
+        service = MemoryService(
+            socket_path=Path(args.socket) if args.socket else None,
+            host=args.host,
+            port=args.port,
+            config_path=Path(args.config) if args.config else None
+        )
+        service.config['warm_start'] = not args.no_warm
+        await service.serve_forever()
+        return 0
+
+    client = MemoryServiceClient(_parse_address(args), timeout=args.timeout)
+    try:
+        await client.connect()
+    except (OSError, ConnectionError) as error:
+        if args.command not in IN_PROCESS_COMMANDS or args.require_service:
+            print(f"❌ Memory service unavailable: {error}", file=sys.stderr)
+            return 2
+        return await _run_in_process(args, error)
+
+    try:
+        if args.command == 'consult':
+            result = await client.consult(args.query, {'source': args.source}, args.budget)
+        elif args.command == 'batch':
+            result = await client.batch(args.queries, {'source': args.source}, args.budget)
+        elif args.command == 'ingest':
+            result = await client.ingest(args.paths or None)
+        elif args.command == 'stop':
+            result = await client.shutdown()
+        else:
+            result = await client.call(args.command.replace('-', '_'))
+        print(json.dumps(result, indent=2, ensure_ascii=False, default=_json_default))
+        return 0
+    except MemoryServiceError as error:
+        print(f"❌ {error}", file=sys.stderr)
+        return 1
+    finally:
+        await client.close()
+
+
+async def _run_in_process(args, error: Exception) -> int:
+    """Run a client command on a one-off in-process coordinator (no daemon running)"""
+    print(f"⚠️ Memory service unavailable ({error}), running in-process", file=sys.stderr)
+    coordinator = _in_process_coordinator()
+    if not await coordinator.initialize():
+        print("❌ In-process memory coordinator failed to initialize", file=sys.stderr)
+        return 1
+
+    if args.command == 'consult':
+        result = await coordinator.coordinate_memory_consultation(args.query, {'source': args.source}, args.budget)
+    elif args.command == 'batch':
+        result = await coordinator.coordinate_memory_consultations_batch(args.queries, {'source': args.source},
+                                                                         args.budget)
+    elif args.command == 'ingest':
+        result = await coordinator.ingest_memory_corpus(args.paths or None)
+    elif args.command == 'index-code':
+        result = await coordinator.index_code_repository()
+    elif args.command == 'metrics':
+        result = {'service': None, 'coordinator': coordinator.get_metrics()}
+    else:
+        result = await coordinator.health_check()
+    print(json.dumps(result, indent=2, ensure_ascii=False, default=_json_default))
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Native RAG memory service daemon and client')
+    parser.add_argument('--socket', help='Unix socket path')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='TCP host (with --port)')
+    parser.add_argument('--port', type=int, help='Use localhost TCP on this port instead of a Unix socket')
+    parser.add_argument('--timeout', type=float, default=300, help='Client request timeout in seconds')
+    parser.add_argument('--require-service', action='store_true',
+                        help='Fail instead of running in-process when no daemon is running')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='Run the daemon in the foreground')
+    serve.add_argument('--config', help='JSON config file re-applied on reload')
+    serve.add_argument('--no-warm', action='store_true', help='Skip the background warm-up')
+
+    consult = commands.add_parser('consult', help='Run one memory consultation')
+    consult.add_argument('query')
+    consult.add_argument('--source', default='memory_service_cli')
+    consult.add_argument('--budget', type=float, help='Consultation deadline in seconds')
+
+    batch = commands.add_parser('batch', help='Run several consultations')
+    batch.add_argument('queries', nargs='+')
+    batch.add_argument('--source', default='memory_service_cli')
+    batch.add_argument('--budget', type=float, help='Batch deadline in seconds')
+
+    ingest = commands.add_parser('ingest', help='Incrementally ingest the memory corpus or specific files')
+    ingest.add_argument('paths', nargs='*')
+
+    for name, help_text in (('index-code', 'Refresh the code pattern index'), ('metrics', 'Service and coordinator metrics'),
+                            ('health', 'Coordinator health check'), ('reload', 'Graceful reload'),
+                            ('ping', 'Check that the daemon is up'), ('stop', 'Stop the daemon')):
+        commands.add_parser(name, help=help_text)
+
+    args = parser.parse_args(argv)
+    return asyncio.run(_run_cli(args))
+
+# Export main classes
+__all__ = [
+    'MemoryService',
+    'MemoryServiceClient',
+    'MemoryServiceCoordinator',
+    'MemoryServiceError',
+    'connect_memory_service',
+    'read_service_token',
+    'resolve_service_address'
+]
+
+if __name__ == "__main__":
+    sys.exit(main())
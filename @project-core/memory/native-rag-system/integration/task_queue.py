@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+
+"""
+BOUNDED PRIORITY WORK QUEUE V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Async work queue placed in front of expensive handlers (MCP workflow tasks)
+so bursts of submissions are served by a fixed number of workers instead of
+all hitting the memory coordinator and the JavaScript bridge at once.
+
+Features:
+- Configurable worker count, lower priority value served first (FIFO on ties)
+- Admission control: a submission waits up to admission_wait seconds for
+  capacity (backpressure), then is rejected with QueueRejectedError
+- Load shedding on latency: while the p95 end-to-end latency of recent tasks
+  exceeds its target, only as many tasks as there are workers are admitted
+- Request deadlines: time spent queued counts against the budget, expired
+  tasks are dropped before running, and a caller that gives up cancels its task
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.deadline import Deadline, DeadlineExceededError
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class QueueRejectedError(Exception):
+    """Raised when a submission is not admitted to the queue"""
+
+    def __init__(self, reason: str, retry_after_ms: float, message: str):
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after_ms = retry_after_ms
+
+
+class BoundedPriorityWorkQueue:
+    """
+    Bounded async priority queue with a fixed worker pool and admission control
+    """
+
+    def __init__(self, handler: Callable[[Any, Optional[Deadline]], Awaitable[Any]], workers: int = 4,
+                 max_depth: int = 32, target_p95_ms: Optional[float] = None, admission_wait: float = 1.0,
+                 latency_window: int = 200, min_latency_samples: int = 20, name: str = 'work-queue'):
+        """
+        Args:
+            handler: Coroutine function called as handler(item, deadline)
+            workers: Number of tasks processed concurrently
+            max_depth: Tasks allowed to wait beyond the running ones
+            target_p95_ms: End-to-end p95 latency target (None = no latency shedding)
+            admission_wait: Seconds a submission waits for capacity before rejection
+            latency_window: Completed tasks kept for the p95 estimate
+            min_latency_samples: Samples needed before latency shedding kicks in
+        """
+        self.handler = handler
+        self.name = name
+        self.config = {
+            'workers': workers,
+            'max_depth': max_depth,
+            'target_p95_ms': target_p95_ms,
+            'admission_wait': admission_wait,
+            'min_latency_samples': min_latency_samples
+        }
+
+        self.metrics = {
+            'submitted': 0,
+            'admitted': 0,
+            'rejected_queue_full': 0,
+            'rejected_latency': 0,
+            'backpressure_waits': 0,
+            'completed': 0,
+            'failed': 0,
+            'expired_in_queue': 0,
+            'cancelled': 0,
+            'max_depth_seen': 0,
+            'average_queue_wait_ms': 0.0
+        }
+
+        self._latencies = deque(maxlen=latency_window)
+        self._sequence = itertools.count()
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._capacity: Optional[asyncio.Condition] = None
+        self._workers = []
+        self._running = 0
+
+    # LIFECYCLE
+
+    def start(self):
+        """Start the worker pool (submit() starts it on demand)"""
+        if self._workers:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._capacity = asyncio.Condition()
+        self._workers = [asyncio.ensure_future(self._worker()) for _ in range(self.config['workers'])]
+        logger.info(f"✅ [{self.name.upper()}] {self.config['workers']} workers started")
+
+    async def stop(self, drain: bool = True):
+        """Stop the workers, after finishing queued tasks when drain is set"""
+        if not self._workers:
+            return
+        if drain:
+            await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        # Anything still queued will never run
+        while not self._queue.empty():
+            *_, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(QueueRejectedError('stopped', 0, f"{self.name} stopped"))
+
+    # ADMISSION
+
+    @property
+    def depth(self) -> int:
+        """Tasks waiting for a worker"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def p95_latency_ms(self) -> Optional[float]:
+        """p95 end-to-end latency (queue wait + processing) of recent tasks"""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+    def _latency_overloaded(self) -> bool:
+        target = self.config['target_p95_ms']
+        if target is None or len(self._latencies) < self.config['min_latency_samples']:
+            return False
+        return self.p95_latency_ms() > target
+
+    def _capacity_limit(self) -> int:
+        # Over the latency target nothing queues beyond what the workers can start now
+        if self._latency_overloaded():
+            return self.config['workers']
+        return self.config['workers'] + self.config['max_depth']
+
+    def _has_capacity(self) -> bool:
+        return self._running + self.depth < self._capacity_limit()
+
+    async def _admit(self, deadline: Optional[Deadline]):
+        if self._has_capacity():
+            return
+
+        # Backpressure: hold the caller until a task completes or the wait runs out
+        self.metrics['backpressure_waits'] += 1
+        wait = self.config['admission_wait']
+        if deadline is not None:
+            wait = min(wait, deadline.remaining())
+        try:
+            async with self._capacity:
+                await asyncio.wait_for(self._capacity.wait_for(self._has_capacity), timeout=wait)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+        p95 = self.p95_latency_ms() or 0.0
+        if self._latency_overloaded():
+            self.metrics['rejected_latency'] += 1
+            raise QueueRejectedError(
+                'latency_target_exceeded', p95,
+                f"{self.name} p95 latency {p95:.0f}ms exceeds {self.config['target_p95_ms']:.0f}ms"
+            )
+        self.metrics['rejected_queue_full'] += 1
+        raise QueueRejectedError(
+            'queue_full', p95,
+            f"{self.name} full ({self._running} running, {self.depth} queued)"
+        )
+
+    # SUBMISSION
+
+    async def submit(self, item: Any, priority: float = 0, deadline: Optional[Deadline] = None) -> Any:
+        """
+        Queue an item and wait for its handler result
+
+        Raises:
+            QueueRejectedError: not admitted (queue full or latency over target)
+            DeadlineExceededError: the deadline ran out while the item was queued
+        """
+        self.start()
+        self.metrics['submitted'] += 1
+        await self._admit(deadline)
+        self.metrics['admitted'] += 1
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((priority, next(self._sequence), item, deadline, future, time.time()))
+        self.metrics['max_depth_seen'] = max(self.metrics['max_depth_seen'], self.depth)
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # The caller gave up: drop the queued item or cancel the running handler
+            future.cancel()
+            raise
+
+    # WORKERS
+
+    async def _worker(self):
+        while True:
+            _, _, item, deadline, future, enqueued_at = await self._queue.get()
+            try:
+                if future.done():
+                    self.metrics['cancelled'] += 1
+                    continue
+                if deadline is not None and deadline.expired:
+                    self.metrics['expired_in_queue'] += 1
+                    future.set_exception(DeadlineExceededError(f"Deadline expired after queueing in {self.name}"))
+                    continue
+
+                self._update_queue_wait((time.time() - enqueued_at) * 1000)
+                self._running += 1
+                task = asyncio.ensure_future(self.handler(item, deadline))
+                future.add_done_callback(lambda done, task=task: task.cancel() if done.cancelled() else None)
+                try:
+                    await asyncio.wait({task})
+                    if task.cancelled():
+                        self.metrics['cancelled'] += 1
+                    elif task.exception() is not None:
+                        self.metrics['failed'] += 1
+                        if not future.done():
+                            future.set_exception(task.exception())
+                    else:
+                        self.metrics['completed'] += 1
+                        if not future.done():
+                            future.set_result(task.result())
+                except asyncio.CancelledError:
+                    # Worker stopped without draining
+                    task.cancel()
+                    if not future.done():
+                        future.set_exception(QueueRejectedError('stopped', 0, f"{self.name} stopped"))
+                    raise
+                finally:
+                    self._running -= 1
+                    self._latencies.append((time.time() - enqueued_at) * 1000)
+            finally:
+                self._queue.task_done()
+                async with self._capacity:
+                    self._capacity.notify_all()
+
+    def _update_queue_wait(self, wait_ms: float):
+        if self.metrics['average_queue_wait_ms'] == 0:
+            self.metrics['average_queue_wait_ms'] = wait_ms
+        else:
+            self.metrics['average_queue_wait_ms'] = (self.metrics['average_queue_wait_ms'] + wait_ms) / 2
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            **self.metrics,
+            'workers': self.config['workers'],
+            'running': self._running,
+            'depth': self.depth,
+            'p95_latency_ms': self.p95_latency_ms(),
+            'latency_overloaded': self._latency_overloaded()
+        }
+
+# Export main class
+__all__ = ['BoundedPriorityWorkQueue', 'QueueRejectedError']
@@ -84,11 +84,11 @@ class MonitoringIntegration:
             # Monkey patch the call_js_component method
             original_method = JavaScriptBridge.call_js_component
             
-            async def monitored_call_js_component(self, component: str, method: str, args: list):
+            async def monitored_call_js_component(self, component: str, method: str, args: list, deadline=None):
                 start_time = time.time()
                 
                 try:
-                    result = await original_method(self, component, method, args)
+                    result = await original_method(self, component, method, args, deadline)
                     execution_time = (time.time() - start_time) * 1000
                     
                     # Record metrics
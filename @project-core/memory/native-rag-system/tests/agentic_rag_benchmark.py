@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+"""
+AGENTIC RAG PATTERN BENCHMARK V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Pattern recognition time versus input size for the previous regex path
+(DOTALL pattern_definitions with nested lazy quantifiers) and CodeAnalyzer
+(ast for Python, token scan for JavaScript).
+
+The regex path grows exponentially with the number of lines after a `class`
+or `def` (16 lines take seconds, 25 lines take minutes), so it is only run on
+the smallest inputs.
+"""
+
+import asyncio
+import json
+import re
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawl4ai_strategies.code_analysis import CodeAnalyzer
+
+LINE_COUNTS = [8, 12, 16, 800, 3200, 12800, 51200]
+LEGACY_MAX_LINES = 16
+
+# Pattern definitions as they were in AgenticRAGStrategy before CodeAnalyzer
+LEGACY_PATTERN_DEFINITIONS = {
+    'DESIGN_PATTERN': {
+        'singleton': r'class\s+\w+.*?(?:__new__|getInstance)',
+        'factory': r'(?:create|make|build)\w*\s*\(',
+        'observer': r'(?:subscribe|notify|observer|listener)',
+        'decorator': r'@\w+|def\s+\w+\s*\([^)]*\)\s*->.*?:',
+        'strategy': r'class\s+\w*Strategy\w*'
+    },
+    'ARCHITECTURAL_PATTERN': {
+        'mvc': r'(?:model|view|controller)',
+        'repository': r'class\s+\w*Repository\w*',
+        'service': r'class\s+\w*Service\w*',
+        'adapter': r'class\s+\w*Adapter\w*',
+        'facade': r'class\s+\w*Facade\w*'
+    },
+    'CODE_SMELL': {
+        'long_method': r'def\s+\w+.*?(?:\n.*?){20,}',
+        'large_class': r'class\s+\w+.*?(?:\n.*?){50,}',
+        'duplicate_code': r'(?:def\s+\w+.*?\n.*?){2,}',
+        'magic_numbers': r'\b(?:\d{2,}|\d+\.\d+)\b',
+        'god_object': r'class\s+\w+.*?(?:def\s+\w+.*?\n.*?){10,}'
+    }
+}
+
+def _legacy_recognize(code: str) -> int:
+    matches = 0
+    for pattern_dict in LEGACY_PATTERN_DEFINITIONS.values():
+        for pattern_regex in pattern_dict.values():
+            matches += sum(1 for _ in re.finditer(pattern_regex, code, re.IGNORECASE | re.DOTALL))
+    return matches
+
+def _python_source(lines: int) -> str:
+    """Service classes with a handful of short methods each"""
+    out = []
+    index = 0
+    while len(out) < lines:
+        out.append(f"class OrderService{index}:")
+        for method in range(4):
+            out.extend([
+                f"    def create_order_{method}(self, items):",
+                f"        total = sum(item.price for item in items)",
+                f"        if total > {100 + method}:",
+                f"            return self.notify(total * 0.9)",
+                f"        return total",
+                ""
+            ])
+        index += 1
+    return '\n'.join(out[:lines]) + '\n'
+
+def _javascript_source(lines: int) -> str:
+    out = []
+    index = 0
+    while len(out) < lines:
+        out.append(f"class CartAdapter{index} {{")
+        for method in range(4):
+            out.extend([
+                f"  buildCart{method}(items) {{",
+                f"    const total = items.reduce((a, b) => a + b.price, 0);",
+                f"    return total > {100 + method} ? total * 0.9 : total;",
+                "  }"
+            ])
+        out.append("}")
+        index += 1
+    return '\n'.join(out[:lines]) + '\n'
+
+def _timed(function, *args, repeats: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start_time)
+    return best * 1000
+
+async def run_agentic_rag_benchmark():
+    """Compare regex and CodeAnalyzer pattern recognition"""
+    print("🚀 [AGENTIC RAG BENCHMARK] Starting...")
+
+    analyzer = CodeAnalyzer(max_chars=10_000_000)
+    results = {'legacy_max_lines': LEGACY_MAX_LINES, 'runs': []}
+
+    for language, generator in (('python', _python_source), ('javascript', _javascript_source)):
+        for lines in LINE_COUNTS:
+            code = generator(lines)
+            analysis = analyzer.analyze(code, language)
+            analyzer_ms = _timed(analyzer.analyze, code, language)
+            run = {
+                'language': language,
+                'lines': lines,
+                'chars': len(code),
+                'parser': analysis['parser'],
+                'patterns': len(analysis['patterns']),
+                'analyzer_ms': analyzer_ms,
+                'legacy_ms': None
+            }
+            if lines <= LEGACY_MAX_LINES:
+                run['legacy_ms'] = _timed(_legacy_recognize, code, repeats=1)
+                run['speedup'] = run['legacy_ms'] / analyzer_ms
+
+            results['runs'].append(run)
+            legacy = f"{run['legacy_ms']:10.1f}ms" if run['legacy_ms'] is not None else "   skipped  "
+            print(f"   {language:<10} {lines:6} lines | regex {legacy} | "
+                  f"{run['parser']:<10} {analyzer_ms:8.1f}ms | {run['patterns']} patterns")
+
+    # Save results
+    results_file = Path(__file__).parent / 'agentic_rag_benchmark_results.json'
+    with open(results_file, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n💾 Results saved to: {results_file}")
+    return results
+
+if __name__ == "__main__":
+    asyncio.run(run_agentic_rag_benchmark())
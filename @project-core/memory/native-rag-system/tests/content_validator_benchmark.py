@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+"""
+CONTENT VALIDATOR BENCHMARK V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Duplicate-check latency of memory-content-validator.py with the MinHash-LSH
+candidate index, against the exact pairwise SequenceMatcher scan it replaced,
+and how many of the exact scan's matches the LSH path also reports.
+
+Corpora are synthetic self-correction logs of growing size; queries are
+mutated copies of existing entries (some above, some below the similarity
+threshold) plus unrelated new entries.
+"""
+
+import asyncio
+import difflib
+import json
+import random
+import time
+import tempfile
+import sys
+from pathlib import Path
+
+# Add parent directory for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from tests.test_memory_content_validator import load_validator_module, _section, _mutate
+
+CORPUS_SIZES = [250, 1000, 4000]
+QUERIES = 100
+
+def _exact_matches(query: str, entries, threshold: float) -> set:
+    """The pre-LSH duplicate check: SequenceMatcher against every entry"""
+    query = query.lower()
+    matches = set()
+    for position, entry in enumerate(entries):
+        matcher = difflib.SequenceMatcher(None, query, entry.lower())
+        if matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold and matcher.ratio() >= threshold:
+            matches.add(position)
+    return matches
+
+async def run_content_validator_benchmark():
+    """Compare LSH and exact duplicate checks across corpus sizes"""
+    print("🚀 [CONTENT VALIDATOR BENCHMARK] Starting...")
+
+    module = load_validator_module()
+    results = {'queries': QUERIES, 'runs': []}
+
+    for size in CORPUS_SIZES:
+        rng = random.Random(size)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / 'self_correction_log.md'
+            log_path.write_text('# Log\n\n' + ''.join(f"## {_section(rng, index)}\n\n" for index in range(size)),
+                                encoding='utf-8')
+
+            validator = module.MemoryContentValidator()
+            validator.memory_files = {'self_correction_log': log_path}
+            validator.config['signature_cache_dir'] = Path(temp_dir) / 'cache'
+
+            start_time = time.perf_counter()
+            validator.load_existing_content()
+            cold_load_seconds = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            validator.load_existing_content()
+            warm_load_seconds = time.perf_counter() - start_time
+
+            entries = validator.existing_content['self_correction_log']
+            threshold = validator.config['similarity_threshold']
+            queries = [_mutate(rng, entries[rng.randrange(len(entries))], rng.randint(1, 8)) for _ in range(QUERIES * 4 // 5)]
+            queries += [_section(rng, size + index) for index in range(QUERIES - len(queries))]
+
+            start_time = time.perf_counter()
+            exact = [_exact_matches(query, entries, threshold) for query in queries]
+            exact_seconds = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            lsh = [validator._check_duplicates(query, 'self_correction_log') for query in queries]
+            lsh_seconds = time.perf_counter() - start_time
+
+            agreement = sum(result['is_duplicate'] == bool(matches) for result, matches in zip(lsh, exact))
+            candidates = validator.duplicate_stats['candidates_checked'] / validator.duplicate_stats['validations']
+
+        run = {
+            'entries': len(entries),
+            'exact_ms_per_check': exact_seconds * 1000 / QUERIES,
+            'lsh_ms_per_check': lsh_seconds * 1000 / QUERIES,
+            'speedup': exact_seconds / lsh_seconds,
+            'candidates_per_check': candidates,
+            'duplicates_expected': sum(1 for matches in exact if matches),
+            'decisions_matching_exact': agreement,
+            'cold_index_ms': cold_load_seconds * 1000,
+            'warm_index_ms': warm_load_seconds * 1000
+        }
+        results['runs'].append(run)
+        print(f"   {run['entries']:5d} entries | exact {run['exact_ms_per_check']:8.2f}ms | "
+              f"LSH {run['lsh_ms_per_check']:6.2f}ms ({run['speedup']:.0f}x, {candidates:.1f} candidates) | "
+              f"{agreement}/{QUERIES} decisions match | index cold {run['cold_index_ms']:.0f}ms, "
+              f"warm {run['warm_index_ms']:.0f}ms")
+
+    # Save results
+    results_file = Path(__file__).parent / 'content_validator_benchmark_results.json'
+    with open(results_file, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n💾 Results saved to: {results_file}")
+    return results
+
+if __name__ == "__main__":
+    asyncio.run(run_content_validator_benchmark())
@@ -306,7 +306,90 @@ async def test_agentic_rag_strategy():
         
     except Exception as e:
         print(f"❌ Test 12 failed: {e}")
-    
+
+    # Test 13: Linear-time pattern analysis
+    print("\nTest 13: Linear-time pattern analysis")
+    try:
+        # 40 lines after a def made the old DOTALL regexes run for hours
+        long_method = "def sync_orders(orders):\n" + "    total = 0\n" * 40 + "    return total\n"
+        patterns = await strategy._recognize_patterns(long_method, {'source': 'test_linear'})
+        long_methods = [p for p in patterns if p['name'] == 'long_method']
+        assert len(long_methods) == 1 and long_methods[0]['lines'] == 42
+        assert long_methods[0]['detection'] == 'python_ast' and long_methods[0]['confidence'] >= 0.9
+
+        # Indented snippets keep positions in the original text
+        factory = [p for p in await strategy._recognize_patterns(test_codes['factory_pattern'], {})
+                   if p['name'] == 'factory'][0]
+        assert test_codes['factory_pattern'][factory['start_position']:].startswith('def create_shape')
+
+        # Other languages (and unparseable Python) go through the token scanner
+        js_patterns = await strategy._recognize_patterns(test_codes['javascript_code'], {'language': 'javascript'})
+        assert [p['detection'] for p in js_patterns if p['name'] == 'factory'] == ['token_scan']
+
+        # A large file stays fast and oversized input is truncated, not rejected
+        large_file = ''.join(f"class OrderService{i}:\n    def handle(self, order):\n        return order\n\n"
+                             for i in range(5000))
+        start_time = time.time()
+        analysis = strategy.code_analyzer.analyze(large_file)
+        elapsed_ms = (time.time() - start_time) * 1000
+        assert analysis['parser'] == 'python_ast' and not analysis['truncated']
+        assert len([p for p in analysis['patterns'] if p['name'] == 'service']) == 5000
+        guarded = AgenticRAGStrategy()
+        guarded.code_analyzer.max_chars = 1000
+        truncated = guarded.code_analyzer.analyze(large_file)
+        assert truncated['truncated'] and all(p['end_position'] <= 1000 for p in truncated['patterns'])
+
+        print(f"✅ Long method: {long_methods[0]['lines']} lines ({long_methods[0]['confidence']:.2f})")
+        print(f"✅ {len(large_file.splitlines())}-line file analysed in {elapsed_ms:.1f}ms")
+        print(f"✅ Oversized input truncated: {len(truncated['patterns'])} patterns in the first 1000 chars")
+
+    except Exception as e:
+        print(f"❌ Test 13 failed: {e}")
+
+    # Test 14: Concurrent analysis stages
+    print("\nTest 14: Concurrent analysis stages")
+    try:
+        concurrent = AgenticRAGStrategy()
+        concurrent.config['cache_enabled'] = False
+        concurrent.config['summary_concurrency'] = 2
+        active_summaries = {'now': 0, 'peak': 0}
+
+        async def slow_ast(code, context):
+            await asyncio.sleep(0.2)
+            return {'entities': [{'name': 'OrderService'}], 'analysis_type': 'ast_parsing', 'success': True}
+
+        async def slow_graph(code, ast_analysis, context):
+            await asyncio.sleep(0.1)
+            return {'relationships': [], 'graph_nodes': ast_analysis['entities'], 'integration_success': True}
+
+        async def slow_summary(code, context):
+            active_summaries['now'] += 1
+            active_summaries['peak'] = max(active_summaries['peak'], active_summaries['now'])
+            await asyncio.sleep(0.1)
+            active_summaries['now'] -= 1
+            return "summary"
+
+        concurrent._perform_ast_analysis = slow_ast
+        concurrent._integrate_knowledge_graph = slow_graph
+        concurrent._call_llm_for_summary = slow_summary
+
+        blocks = '\n\n'.join(f"```python\n{test_codes['singleton_pattern']}\n# block {i}\n```" for i in range(4))
+        result = await concurrent.extract_code_patterns(blocks, {'source': 'test_concurrent'})
+        timings = result['metadata']['stage_timings_ms']
+        assert set(timings) == {'code_blocks', 'patterns', 'ast_analysis', 'summaries', 'knowledge_graph'}
+        # Knowledge graph waits for AST analysis; summaries (2 at a time) overlap both
+        assert result['knowledge_graph']['graph_nodes'] == [{'name': 'OrderService'}]
+        assert len(result['summaries']) == len(result['code_blocks']) >= 4 and active_summaries['peak'] == 2
+        assert [summary['block_index'] for summary in result['summaries']] == list(range(len(result['code_blocks'])))
+        sequential_ms = timings['ast_analysis'] + timings['knowledge_graph'] + timings['summaries']
+        assert result['metadata']['processing_time_ms'] < sequential_ms * 0.75
+
+        print(f"✅ Stage timings: {', '.join(f'{name} {ms:.0f}ms' for name, ms in timings.items())}")
+        print(f"✅ Total {result['metadata']['processing_time_ms']:.0f}ms vs {sequential_ms:.0f}ms sequential")
+
+    except Exception as e:
+        print(f"❌ Test 14 failed: {e}")
+
     print("\n✅ [AGENTIC RAG TESTS] All tests completed")
     
     # Final metrics summary
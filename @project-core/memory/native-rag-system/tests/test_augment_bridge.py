@@ -12,6 +12,7 @@ import asyncio
 import time
 import json
 import os
+import tempfile
 import sys
 from pathlib import Path
 
@@ -19,6 +20,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from central_hub.augment_bridge import AugmentMemoriesBridge
+from central_hub.backup_store import ContentAddressedBackupStore
 
 async def test_augment_bridge():
     """Test Augment Memories Bridge functionality"""
@@ -328,6 +330,206 @@ async def test_augment_bridge():
     except Exception as e:
         print(f"❌ Test 14 failed: {e}")
     
+    # Test 15: Incremental re-parsing by line-hash diff
+    print("\nTest 15: Incremental re-parsing")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            incremental = AugmentMemoriesBridge()
+            incremental.augment_path = Path(temp_dir) / 'Augment-Memories'
+            lines = ["# Preferences"] + [
+                f"- User prefers {topic} with systematic validation protocol." for topic in (
+                    'Next.js 15 + React 19', 'Sequential Thinking MCP for complex tasks', 'Supabase for auth',
+                    'comprehensive architectural audits', 'Playwright for end-to-end testing'
+                ) * 20
+            ]
+            incremental.augment_path.write_text('\n'.join(lines), encoding='utf-8')
+            await incremental.read_augment_memories()
+            assert incremental.last_change['lines_reparsed'] == len(lines)
+            
+            # Edit one line, insert one above it, remove the last one
+            lines[40] = "- User requires Docker images pinned by digest."
+            lines.insert(10, "- User prefers TypeScript strict mode.")
+            lines.pop()
+            incremental.augment_path.write_text('\n'.join(lines), encoding='utf-8')
+            
+            start_time = time.perf_counter()
+            patched = await incremental.read_augment_memories()
+            patch_ms = (time.perf_counter() - start_time) * 1000
+            full = await incremental.parse_augment_preferences('\n'.join(lines))
+            
+            assert incremental.last_change['lines_reparsed'] == len(lines) - 10
+            assert [(p['line_number'], p['text']) for p in patched['preferences']] == \
+                [(p['line_number'], p['text']) for p in full['preferences']]
+            assert {c: [p['line_number'] for p in ps] for c, ps in patched['categories'].items()} == \
+                {c: [p['line_number'] for p in ps] for c, ps in full['categories'].items()}
+            assert sorted(patched['technologies']) == sorted(full['technologies'])
+            
+            # A single-line edit near the end only re-parses that line
+            lines[-2] = "- User prefers Tailwind for styling."
+            incremental.augment_path.write_text('\n'.join(lines), encoding='utf-8')
+            await incremental.read_augment_memories()
+            assert incremental.last_change['lines_reparsed'] == 1
+            assert incremental.preferences_cache['preferences'][-2]['technologies'] == ['Tailwind']
+            
+            print(f"✅ Patched index matches full parse ({patch_ms:.2f}ms for {len(lines)} lines)")
+        
+    except Exception as e:
+        print(f"❌ Test 15 failed: {e}")
+    
+    # Test 16: Debounced, coalesced file events
+    print("\nTest 16: Debounced file events")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watched = AugmentMemoriesBridge()
+            watched.augment_path = Path(temp_dir) / 'Augment-Memories'
+            watched.augment_path.write_text("- User prefers Next.js 15.\n", encoding='utf-8')
+            watched.config['change_debounce_seconds'] = 0.2
+            watched.config['backup_enabled'] = False
+            await watched.read_augment_memories()
+            
+            syncs = []
+            async def record_sync():
+                syncs.append(len(watched.preferences_cache['preferences']))
+                return {'success': True}
+            watched.sync_with_project_core = record_sync
+            
+            await watched.start_file_monitoring()
+            for i in range(5):  # one editor save emits several events
+                with open(watched.augment_path, 'a', encoding='utf-8') as f:
+                    f.write(f"- User prefers React 19 pattern {i}.\n")
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.6)
+            
+            watched.augment_path.write_text(watched.augment_path.read_text(encoding='utf-8'), encoding='utf-8')  # touch only
+            await asyncio.sleep(0.6)
+            await watched.stop_file_monitoring()
+            
+            metrics = watched.get_metrics()
+            assert metrics['file_changes_detected'] == 2, metrics['file_changes_detected']
+            assert syncs == [6]  # the touch-only save is not propagated
+            assert metrics['file_events_coalesced'] >= 4
+            print(f"✅ {metrics['file_events_received']} events -> {metrics['file_changes_detected']} change handlings, 1 sync")
+        
+    except Exception as e:
+        print(f"❌ Test 16 failed: {e}")
+    
+    # Test 17: Content-addressed, deduplicated backups
+    print("\nTest 17: Content-addressed backups")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            versioned = AugmentMemoriesBridge()
+            versioned.augment_path = Path(temp_dir) / 'Augment-Memories'
+            versioned.backup_store = ContentAddressedBackupStore(Path(temp_dir) / 'backups', full_every=3)
+            lines = [f"- User prefers pattern {i} with systematic validation protocol." for i in range(200)]
+            versioned.augment_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            
+            first = await versioned.create_backup()
+            assert first['success'] and not first['deduplicated'] and first['storage'] == 'full'
+            
+            # Repeated backups (one per consultation) of unchanged content write nothing
+            bytes_written = versioned.backup_store.metrics['bytes_written']
+            for _ in range(20):
+                again = await versioned.create_backup()
+                assert again['deduplicated'] and again['version'] == 1
+            versioned.augment_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')  # touch only
+            assert (await versioned.create_backup())['deduplicated']
+            assert versioned.backup_store.metrics['bytes_written'] == bytes_written
+            assert versioned.backup_store.metrics['stat_skips'] == 20
+            
+            # Edits are stored as deltas until the next full copy
+            contents = []
+            for i in range(4):
+                lines[i * 50] = f"- User requires revision {i}."
+                contents.append('\n'.join(lines) + '\n')
+                versioned.augment_path.write_text(contents[-1], encoding='utf-8')
+                contents_result = await versioned.create_backup()
+                assert not contents_result['deduplicated']
+            storages = [record['storage'] for record in versioned.list_backups() if record['version'] > 1]
+            assert storages[:3] == ['delta', 'delta', 'full'], storages
+            
+            # Every version restores byte for byte, including across the delta chain
+            restored_path = Path(temp_dir) / 'restored'
+            for version, content in enumerate(contents, start=2):
+                restore = await versioned.restore_backup(version, target_path=restored_path)
+                assert restore['success'] and restored_path.read_text(encoding='utf-8') == content
+            
+            # Reverting reuses the stored blob
+            versioned.augment_path.write_text(contents[0], encoding='utf-8')
+            reverted = await versioned.create_backup()
+            assert reverted['deduplicated'] and reverted['version'] == 6
+            
+            # Retention keeps the latest version and the blobs its chain needs
+            versioned.backup_store.prune(0)
+            assert [record['version'] for record in versioned.list_backups()] == [6]
+            assert versioned.backup_store.restore() == contents[0]
+            print(f"✅ 27 backups -> {len(list((Path(temp_dir) / 'backups' / 'blobs').glob('*/*')))} blob(s) after pruning, "
+                  f"{versioned.get_metrics()['backups_deduplicated']} deduplicated")
+        
+    except Exception as e:
+        print(f"❌ Test 17 failed: {e}")
+    
+    # Test 18: Every saved change reaches the backup history
+    print("\nTest 18: Change-triggered backups")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            changed = AugmentMemoriesBridge()
+            changed.augment_path = Path(temp_dir) / 'Augment-Memories'
+            changed.backup_store = ContentAddressedBackupStore(Path(temp_dir) / 'backups')
+            syncs = []
+            async def record_sync():
+                syncs.append(changed.last_file_hash)
+                return {'success': True}
+            changed.sync_with_project_core = record_sync
+            
+            saves = [
+                "# Preferences\n- User prefers Next.js 15.\n",
+                "# Preferences\n- User prefers Next.js 15.\n- User prefers Supabase for auth.\n",
+                "# Preferences (reviewed)\n- User prefers Next.js 15.\n- User prefers Supabase for auth.\n",  # heading only
+                "# Preferences (reviewed)\n- User prefers Next.js 15.\n- User prefers Supabase for auth.\n"   # touch only
+            ]
+            for content in saves:
+                changed.augment_path.write_text(content, encoding='utf-8')
+                await changed.handle_augment_change()
+            
+            history = changed.list_backups()
+            assert [record['version'] for record in history] == [1, 2, 3]
+            assert changed.backup_store.restore(3) == saves[2] and len(syncs) == 2
+            print(f"✅ {len(saves)} saves -> {len(history)} versions (non-preference edit kept, touch deduplicated)")
+        
+    except Exception as e:
+        print(f"❌ Test 18 failed: {e}")
+    
+    # Test 19: CRLF files round-trip byte for byte
+    print("\nTest 19: CRLF backup round-trip")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            crlf = AugmentMemoriesBridge()
+            crlf.augment_path = Path(temp_dir) / 'Augment-Memories'
+            crlf.backup_store = ContentAddressedBackupStore(Path(temp_dir) / 'backups', full_every=3)
+            lines = [f"- User prefers pattern {i} with systematic validation protocol." for i in range(100)]
+            original = ('\r\n'.join(lines) + '\r\n').encode('utf-8')
+            crlf.augment_path.write_bytes(original)
+            
+            first = await crlf.create_backup()
+            assert crlf.list_backups()[0]['size'] == len(original) == crlf.augment_path.stat().st_size
+            assert (await crlf.create_backup())['deduplicated']
+            assert crlf.backup_store.metrics['stat_skips'] == 1  # size matches, no re-read
+            
+            # An edit stored as a delta keeps its line endings too
+            lines[50] = "- User requires Windows line endings preserved."
+            edited = ('\r\n'.join(lines) + '\r\n').encode('utf-8')
+            crlf.augment_path.write_bytes(edited)
+            assert (await crlf.create_backup())['storage'] == 'delta'
+            
+            restored_path = Path(temp_dir) / 'restored'
+            for version, expected in ((first['version'], original), (first['version'] + 1, edited)):
+                assert (await crlf.restore_backup(version, target_path=restored_path))['success']
+                assert restored_path.read_bytes() == expected
+            print(f"✅ CRLF content restored byte for byte ({len(edited)} bytes, delta chain included)")
+        
+    except Exception as e:
+        print(f"❌ Test 19 failed: {e}")
+    
     print("\n✅ [AUGMENT BRIDGE TESTS] All tests completed")
     
     # Final metrics summary
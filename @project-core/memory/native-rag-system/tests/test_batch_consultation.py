@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+"""
+BATCH CONSULTATION TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the bulk consultation API.
+Validates that batched keyword, vector, hybrid and coordinator consultations
+return the same per-query results as the single-query paths while sharing
+work across the batch.
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from central_hub.memory_coordinator import CentralMemoryCoordinator
+from crawl4ai_strategies.embedding_store import EmbeddingStore, NUMPY_AVAILABLE
+from crawl4ai_strategies.hybrid_search import HybridSearchStrategy
+from crawl4ai_strategies.keyword_index import IncrementalBM25Index
+
+VOCABULARY = [
+    'react', 'hooks', 'state', 'supabase', 'auth', 'policy', 'nextjs', 'routing', 'cache',
+    'memory', 'vector', 'index', 'query', 'python', 'async', 'error', 'deploy', 'vercel',
+    'typescript', 'component', 'server', 'client', 'schema', 'migration', 'token', 'session'
+]
+
+def make_documents(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    return [
+        {'id': f'doc-{i}', 'content': ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(8, 40)))}
+        for i in range(count)
+    ]
+
+async def test_batch_consultation():
+    """Test batch consultation functionality"""
+    print("🧪 [BATCH CONSULTATION TESTS] Starting tests...")
+
+    rng = random.Random(11)
+    queries = [' '.join(rng.sample(VOCABULARY, 3)) for _ in range(48)]
+
+    # Test 1: Keyword batch matches single-query BM25
+    print("\nTest 1: Keyword index batch search")
+    try:
+        index = IncrementalBM25Index()
+        for document in make_documents(3000):
+            index.add_document(document['id'], document['content'])
+
+        start_time = time.perf_counter()
+        single = [index.search(query, 10) for query in queries]
+        loop_ms = (time.perf_counter() - start_time) * 1000
+        start_time = time.perf_counter()
+        batch = index.search_batch(queries, 10)
+        batch_ms = (time.perf_counter() - start_time) * 1000
+
+        for expected, actual in zip(single, batch):
+            assert [hit['id'] for hit in expected] == [hit['id'] for hit in actual]
+            assert all(abs(e['score'] - a['score']) < 1e-9 for e, a in zip(expected, actual))
+        assert index.search_batch([], 10) == [] and IncrementalBM25Index().search_batch(['x'], 5) == [[]]
+        print(f"✅ {len(queries)} queries: loop {loop_ms:.1f}ms, batch {batch_ms:.1f}ms")
+    except Exception as e:
+        print(f"❌ Test 1 failed: {e}")
+
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy not available, skipping vector batch tests")
+        return
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        dimensions = 64
+        generator = np.random.default_rng(3)
+        documents = make_documents(2000)
+        store = EmbeddingStore(temp_path / 'store', dimensions=dimensions)
+        for document in documents:
+            store.put(document['id'], generator.standard_normal(dimensions).astype(np.float32),
+                      {'original_content': document['content']})
+        store.delete('doc-5')
+        query_vectors = generator.standard_normal((len(queries), dimensions)).astype(np.float32)
+
+        # Test 2: Vector batch is one matrix product with the same ranking
+        print("\nTest 2: Embedding store batch search")
+        try:
+            start_time = time.perf_counter()
+            single = [store.search(vector, 10) for vector in query_vectors]
+            loop_ms = (time.perf_counter() - start_time) * 1000
+            start_time = time.perf_counter()
+            batch = store.search_batch(query_vectors, 10)
+            batch_ms = (time.perf_counter() - start_time) * 1000
+
+            for expected, actual in zip(single, batch):
+                assert [hit['key'] for hit in expected] == [hit['key'] for hit in actual]
+                assert all(abs(e['score'] - a['score']) < 1e-5 for e, a in zip(expected, actual))
+                assert 'doc-5' not in [hit['key'] for hit in actual]
+            zero_query = store.search_batch(np.zeros((1, dimensions), dtype=np.float32), 10)
+            assert zero_query == [store.search(np.zeros(dimensions, dtype=np.float32), 10)]
+            print(f"✅ {len(queries)} queries: loop {loop_ms:.1f}ms, batch {batch_ms:.1f}ms "
+                  f"({loop_ms / max(batch_ms, 1e-3):.1f}x)")
+        except Exception as e:
+            print(f"❌ Test 2 failed: {e}")
+
+        # Test 3: Hybrid batch matches per-query hybrid search
+        print("\nTest 3: Hybrid search batch")
+        try:
+            strategy = HybridSearchStrategy()
+            strategy.cache_dir = temp_path / 'hybrid-cache'
+            strategy.cache_dir.mkdir()
+            strategy.config['cache_enabled'] = False
+            strategy.add_documents(documents)
+            strategy.attach_embedding_store(store)
+            contexts = [{'source': 'test_batch', 'query_embedding': vector.tolist()} for vector in query_vectors]
+
+            start_time = time.perf_counter()
+            single = [await strategy.perform_hybrid_search(query, dict(context)) for query, context in zip(queries, contexts)]
+            loop_ms = (time.perf_counter() - start_time) * 1000
+            start_time = time.perf_counter()
+            batch = await strategy.perform_hybrid_search_batch(queries, contexts)
+            batch_ms = (time.perf_counter() - start_time) * 1000
+
+            # Matrix and per-vector products differ in float32 rounding, which
+            # can swap near-ties deep in the vector ranking: compare the head
+            for expected, actual in zip(single, batch):
+                assert [r['content'] for r in expected[:10]] == [r['content'] for r in actual[:10]]
+                assert all(abs(e['hybrid_score'] - a['hybrid_score']) < 1e-6 for e, a in zip(expected[:10], actual[:10]))
+                assert {r['content'] for r in expected} == {r['content'] for r in actual}
+            assert strategy.metrics['batch_searches'] == 1
+            print(f"✅ Identical rankings: loop {loop_ms:.1f}ms, batch {batch_ms:.1f}ms "
+                  f"({loop_ms / max(batch_ms, 1e-3):.1f}x)")
+        except Exception as e:
+            print(f"❌ Test 3 failed: {e}")
+
+        # Test 4: Coordinator batch matches the per-query loop
+        print("\nTest 4: Coordinator batch consultation")
+        try:
+            def make_coordinator(name):
+                coordinator = CentralMemoryCoordinator()
+                coordinator.js_bridge.config['max_retries'] = 0
+                coordinator.cache_dir = temp_path / name
+                coordinator.cache_dir.mkdir()
+                return coordinator
+
+            consultation_queries = [
+                "What is React?",
+                "Debug TypeError in async function execution",
+                "Search for Next.js configuration examples and best practices",
+                "What is React?",
+                "Supabase row level security policies",
+                "Find patterns in JavaScript function definitions and class methods",
+                "Retrieve Supabase auth session examples"
+            ]
+            # Strategies branch on each query's own routing analysis, not on the caller's context
+            context = {'source': 'test_batch'}
+
+            loop_coordinator = make_coordinator('loop-cache')
+            single = [await loop_coordinator.coordinate_memory_consultation(query, dict(context))
+                      for query in consultation_queries]
+
+            batch_coordinator = make_coordinator('batch-cache')
+            embeddings = batch_coordinator.crawl4ai_strategies['contextual_embeddings']
+            batch = await batch_coordinator.coordinate_memory_consultations_batch(consultation_queries, dict(context))
+
+            assert len(batch) == len(consultation_queries)
+            for expected, actual in zip(single, batch):
+                assert actual['success'] == expected['success']
+                assert actual['strategies_used'] == expected['strategies_used']
+                assert actual['results']['result_count'] == expected['results']['result_count']
+                crawl4ai = actual['results']['combined_data'].get('crawl4ai_rag', {})
+                assert set(crawl4ai) == set(expected['results']['combined_data'].get('crawl4ai_rag', {}))
+            executed = [set(r['results']['combined_data'].get('crawl4ai_rag', {})) for r in batch]
+            assert {'hybrid_search', 'reranking'} <= executed[2] and {'hybrid_search', 'reranking'} <= executed[6]
+            assert executed[5] & {'code_index', 'agentic_rag'} and 'hybrid_search' not in executed[5]
+            assert batch[0] is batch[3]  # duplicate consulted once
+            assert batch_coordinator.metrics['batch_queries_deduplicated'] == 1
+            assert batch_coordinator.metrics['total_consultations'] == len(consultation_queries)
+            assert embeddings.metrics['batch_calls'] >= 1
+
+            # A repeated batch is served from the cache
+            misses = batch_coordinator.metrics['cache_misses']
+            await batch_coordinator.coordinate_memory_consultations_batch(consultation_queries[:3], dict(context))
+            assert batch_coordinator.metrics['cache_misses'] == misses
+            print(f"✅ {len(batch)} results match the loop, strategies: {sorted({s for r in batch for s in r['strategies_used']})}")
+        except Exception as e:
+            print(f"❌ Test 4 failed: {e}")
+
+        store.close()
+
+    print("\n✅ [BATCH CONSULTATION TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_batch_consultation())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""
+FRAMED BRIDGE PROTOCOL TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the length-prefixed binary bridge protocol.
+Validates codec round trips and the Node.js runner end to end.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.bridge_protocol import encode_message, decode_message, BridgeProtocolError
+from integration.js_bridge import JavaScriptBridge
+
+async def test_bridge_protocol():
+    """Test framed protocol encoding and transport"""
+    print("🧪 [BRIDGE PROTOCOL TESTS] Starting tests...")
+
+    # Test 1: Round trip keeps structure and packs float arrays
+    print("\nTest 1: Codec round trip")
+    vector = [i / 7 for i in range(64)]
+    payload = {
+        'args': ["text with 'quotes' and `backticks` ${injection}", {'ids': list(range(32)), 'vector': vector}],
+        'nested': [{'embedding': vector[:16]}, None, True, 1.5]
+    }
+    frame = encode_message(payload)
+    decoded, consumed = decode_message(frame)
+    assert consumed == len(frame)
+    assert decoded['args'][0] == payload['args'][0]
+    assert decoded['args'][1]['ids'] == list(range(32))
+    assert all(abs(a - b) < 1e-6 for a, b in zip(decoded['args'][1]['vector'], vector))
+    assert decoded['nested'][1:] == [None, True, 1.5]
+    assert len(frame) < len(str(payload))
+    print(f"✅ Frame size: {len(frame)} bytes")
+
+    # Test 2: Truncated frames are rejected
+    print("\nTest 2: Truncated frame")
+    try:
+        decode_message(frame[:-3])
+        raise AssertionError("Truncated frame accepted")
+    except BridgeProtocolError as error:
+        print(f"✅ Rejected: {error}")
+
+    # Test 3: End to end through bridge_runner.js
+    print("\nTest 3: Node.js runner round trip")
+    bridge = JavaScriptBridge()
+    bridge.config['cache_enabled'] = False
+    result = await bridge._execute_js_component(
+        'embedding_service',
+        'generateContextualEmbedding',
+        ["framed 'transport' test", {}]
+    )
+    print(f"✅ Embedding result: {len(result.get('embedding', []))} dimensions")
+
+    print("\n✅ [BRIDGE PROTOCOL TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_bridge_protocol())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+"""
+CODE PATTERN INDEX TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the repository-wide code pattern index.
+Validates the incremental manifest, worker pool analysis, pattern and symbol
+queries and the AgenticRAGStrategy lookup path.
+"""
+
+import asyncio
+import os
+import tempfile
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawl4ai_strategies.code_index import CodePatternIndex
+from crawl4ai_strategies.agentic_rag import AgenticRAGStrategy
+
+REPOSITORY_PY = """
+class UserRepository:
+    _instance = None
+
+    def __new__(cls):
+        return super().__new__(cls)
+
+    def create_user(self, name):
+        return {'name': name, 'quota': 500}
+"""
+
+LONG_METHOD_PY = "def sync_everything(items):\n" + "    items = list(items)\n" * 30 + "    return items\n"
+
+ADAPTER_JS = """
+class PaymentAdapter {
+  notifySubscribers(event) {
+    return this.listeners.map(listener => listener(event));
+  }
+}
+"""
+
+async def test_code_index():
+    """Test code pattern index functionality"""
+    print("🧪 [CODE INDEX TESTS] Starting tests...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project = Path(temp_dir) / 'project'
+        (project / 'automation').mkdir(parents=True)
+        (project / 'scripts' / 'node_modules').mkdir(parents=True)
+        (project / 'memory' / 'native-rag-system').mkdir(parents=True)
+        (project / 'automation' / 'users.py').write_text(REPOSITORY_PY)
+        (project / 'automation' / 'sync.py').write_text(LONG_METHOD_PY)
+        (project / 'scripts' / 'payment.js').write_text(ADAPTER_JS)
+        (project / 'scripts' / 'node_modules' / 'vendor.js').write_text(ADAPTER_JS)
+        (project / 'memory' / 'notes.py').write_text(LONG_METHOD_PY)  # outside the indexed roots
+
+        index = CodePatternIndex(project_root=project, index_path=Path(temp_dir) / 'code_index.db')
+        index.config['worker_processes'] = 2
+
+        # Test 1: First refresh analyses every source file under the roots
+        print("\nTest 1: Initial index build")
+        summary = await index.refresh()
+        assert summary['files_scanned'] == 3 and summary['files_analyzed'] == 3
+        counts = index.pattern_counts()
+        assert counts['ARCHITECTURAL_PATTERN'] == {'repository': 1, 'adapter': 1}
+        assert counts['CODE_SMELL']['long_method'] == 1 and counts['DESIGN_PATTERN']['singleton'] == 1
+        print(f"✅ {summary['files_analyzed']} files analysed: {counts}")
+
+        # Test 2: Unchanged and touched-but-identical files are not re-analysed
+        print("\nTest 2: Incremental refresh")
+        summary = await index.refresh()
+        assert summary['files_skipped'] == 3 and summary['files_analyzed'] == 0
+        users = project / 'automation' / 'users.py'
+        os.utime(users, ns=(users.stat().st_atime_ns, users.stat().st_mtime_ns + 10_000_000))
+        (project / 'automation' / 'sync.py').write_text(LONG_METHOD_PY.replace('sync_everything', 'sync_orders'))
+        (project / 'scripts' / 'payment.js').unlink()
+        summary = await index.refresh()
+        assert summary['files_rehashed'] == 1 and summary['files_analyzed'] == 1 and summary['files_removed'] == 1
+        assert index.find_symbols('sync_everything') == [] and index.find_patterns(name='adapter') == []
+        print(f"✅ 1 rehashed, 1 re-analysed, 1 removed")
+
+        # Test 3: Pattern and symbol queries
+        print("\nTest 3: Index queries")
+        long_methods = index.find_patterns('CODE_SMELL', 'long_method')
+        assert long_methods[0]['path'] == 'automation/sync.py' and long_methods[0]['symbol'] == 'sync_orders'
+        assert (long_methods[0]['start_line'], long_methods[0]['end_line']) == (1, 32)
+        create_user = index.find_symbols('create_u')[0]
+        assert (create_user['parent'], create_user['start_line'], create_user['kind']) == ('UserRepository', 8, 'function')
+        file_summary = index.file_summary('automation/users.py')
+        assert file_summary['parser'] == 'python_ast' and len(file_summary['symbols']) == 3
+        print(f"✅ sync_orders lines {long_methods[0]['start_line']}-{long_methods[0]['end_line']}, "
+              f"create_user in {create_user['parent']}")
+
+        # Test 4: Free-text lookups scope patterns to the symbols they name
+        print("\nTest 4: Lookups")
+        lookup = index.lookup('where are the singletons?')
+        assert lookup['matched_patterns'] == ['singleton'] and lookup['patterns'][0]['symbol'] == 'UserRepository'
+        scoped = index.lookup('magic numbers in UserRepository')
+        assert [p['name'] for p in scoped['patterns']] == ['magic_numbers']
+        assert scoped['symbols'][0]['name'] == 'UserRepository'
+        print(f"✅ {len(lookup['patterns'])} singleton, {len(scoped['patterns'])} magic number in UserRepository")
+        index.close()
+
+        # Test 5: AgenticRAGStrategy answers code questions from the index
+        print("\nTest 5: Strategy lookup")
+        strategy = AgenticRAGStrategy()
+        strategy.config['code_index_path'] = Path(temp_dir) / 'strategy_index.db'
+        strategy.get_code_index().config['project_root'] = project
+        result = await strategy.lookup_code_index('long method sync_orders', {'source': 'test'})
+        assert result['metadata']['refreshed'] and result['patterns'][0]['name'] == 'long_method'
+        assert result['patterns'][0]['description'] == 'Method is too long and should be refactored'
+        again = await strategy.lookup_code_index('long method sync_orders')
+        assert not again['metadata']['refreshed']
+        assert strategy.contains_code(f"```python\n{LONG_METHOD_PY}\n```") and not strategy.contains_code('long methods?')
+        strategy.get_code_index().close()
+        print(f"✅ Lookup {result['metadata']['lookup_time_ms']:.1f}ms, second lookup {again['metadata']['lookup_time_ms']:.1f}ms")
+
+    print("\n✅ [CODE INDEX TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_code_index())
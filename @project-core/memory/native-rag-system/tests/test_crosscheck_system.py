@@ -11,6 +11,7 @@ Validates duplication detection, merge strategies, and integration with all nati
 import asyncio
 import time
 import json
+import tempfile
 import sys
 from pathlib import Path
 
@@ -23,7 +24,9 @@ async def test_crosscheck_system():
     """Test Intelligent Crosscheck System functionality"""
     print("🧪 [CROSSCHECK SYSTEM TESTS] Starting comprehensive tests...")
     
+    store_dir = tempfile.TemporaryDirectory()
     crosscheck = IntelligentCrosscheckSystem()
+    crosscheck.config['memory_store_dir'] = Path(store_dir.name) / 'crosscheck-memory'
     
     # Test 1: System initialization
     print("\nTest 1: System initialization")
@@ -321,6 +324,135 @@ async def test_crosscheck_system():
     except Exception as e:
         print(f"❌ Test 11 failed: {e}")
     
+    # Test 12: Near-duplicate decisions against the vector index
+    print("\nTest 12: Near-duplicate decisions")
+    try:
+        fresh = IntelligentCrosscheckSystem()
+        fresh.memory_entries = {
+            memory_id: MemoryEntry(memory_id, content, 'technology', [], '', 0.9, 'test')
+            for memory_id, content in (
+                ('pipeline', "The deployment pipeline runs unit tests before building the Docker image."),
+                ('nextjs', "Next.js is a React framework for production applications."),
+                ('rust', "Rust guarantees memory safety without a garbage collector.")
+            )
+        }
+        await fresh.build_memory_index()
+        
+        duplicate = await fresh.analyze_new_information(
+            "The deployment pipeline runs the unit tests before it builds the Docker image.")
+        assert duplicate.action == 'skip' and duplicate.similar_entries[0].id == 'pipeline'
+        assert duplicate.similar_entries[0].similarity_score >= fresh.config['similarity_threshold']
+        
+        overlap_info = "Next.js is a React framework for production applications. It supports incremental static regeneration."
+        overlap = await fresh.analyze_new_information(overlap_info)
+        assert overlap.action == 'merge' and overlap.similar_entries[0].id == 'nextjs'
+        merged = await fresh.execute_crosscheck_action(overlap_info, overlap)
+        assert merged['target_memory_id'] == 'nextjs' and merged['sentences_added'] == 1
+        assert fresh.memory_entries['nextjs'].content.endswith("It supports incremental static regeneration.")
+        
+        unrelated = await fresh.analyze_new_information("PostgreSQL supports JSONB columns with GIN indexes.")
+        assert unrelated.action == 'add' and unrelated.similar_entries == []
+        added = await fresh.execute_crosscheck_action("PostgreSQL supports JSONB columns with GIN indexes.", unrelated)
+        repeat = await fresh.analyze_new_information("PostgreSQL supports JSONB columns with GIN indexes.")
+        assert repeat.action == 'skip' and repeat.similar_entries[0].id == added['memory_id']
+        
+        print(f"✅ Duplicate skipped ({duplicate.similar_entries[0].similarity_score:.3f}), "
+              f"overlap merged ({overlap.similar_entries[0].similarity_score:.3f}), new entry indexed on add")
+        
+    except Exception as e:
+        print(f"❌ Test 12 failed: {e}")
+    
+    # Test 13: Recall and latency at 100k clustered entries
+    print("\nTest 13: Recall and latency at 100k entries")
+    try:
+        import numpy as np
+        
+        def unit(vectors):
+            return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+        
+        large = IntelligentCrosscheckSystem()
+        dimensions = large.config['embedding_dimensions']
+        merge_threshold = large.config['merge_threshold']
+        rng = np.random.default_rng(0)
+        
+        # 2000 topics; members of a topic sit around cosine 0.8 to each other, like reworded memories
+        centers = unit(rng.standard_normal((2000, dimensions)))
+        entries = unit(0.9 * centers[rng.integers(0, len(centers), 100000)]
+                       + 0.436 * unit(rng.standard_normal((100000, dimensions)))).astype(np.float32)
+        large.vector_index.add_batch([f"synthetic-{i}" for i in range(len(entries))], entries)
+        
+        # Near-duplicates of indexed entries, from just above the merge threshold up to the skip range
+        targets = rng.choice(len(entries), 100, replace=False)
+        cosines = rng.uniform(merge_threshold + 0.01, 0.97, (100, 1))
+        queries = unit(cosines * entries[targets] + np.sqrt(1 - cosines ** 2) * unit(rng.standard_normal((100, dimensions))))
+        
+        expected = found = planted = 0
+        timings = []
+        for target, query in zip(targets, queries):
+            exact = entries @ query
+            top = np.argsort(-exact)[:10]
+            truth = {f"synthetic-{i}" for i in top[exact[top] >= merge_threshold]}
+            start_time = time.perf_counter()
+            neighbours = large.vector_index.search(query, 10, merge_threshold)
+            timings.append((time.perf_counter() - start_time) * 1000)
+            keys = {key for key, _ in neighbours}
+            expected += len(truth)
+            found += len(truth & keys)
+            planted += f"synthetic-{target}" in keys
+        recall = found / expected
+        assert expected > len(queries) * 2  # clustered: most queries have more than the planted neighbour
+        assert recall >= 0.9 and planted >= 98, f"recall {recall:.3f}, planted {planted}/100"
+        search_median = sorted(timings)[len(timings) // 2]
+        
+        timings = []
+        for i in range(50):
+            start_time = time.perf_counter()
+            await large.analyze_new_information(f"Release {i} moves session storage from Redis to PostgreSQL tables")
+            timings.append((time.perf_counter() - start_time) * 1000)
+        median = sorted(timings)[len(timings) // 2]
+        assert median < 10 and search_median < 10, f"median analysis {median:.1f}ms, search {search_median:.1f}ms"
+        
+        print(f"✅ Recall@10 {recall:.3f} vs brute force ({planted}/100 planted duplicates found), "
+              f"median search {search_median:.2f}ms, analysis {median:.2f}ms over {len(large.vector_index)} entries")
+        
+    except Exception as e:
+        print(f"❌ Test 13 failed: {e}")
+    
+    # Test 14: Persistent store and warm reload
+    print("\nTest 14: Persistent store and warm reload")
+    try:
+        stored_ids = set(crosscheck.memory_entries)
+        await crosscheck.shutdown()
+        
+        reloaded = IntelligentCrosscheckSystem()
+        reloaded.config['memory_store_dir'] = crosscheck.config['memory_store_dir']
+        assert await reloaded.initialize()
+        assert set(reloaded.memory_entries) == stored_ids
+        assert reloaded.memory_store.metrics['snapshot_entries_loaded'] == len(stored_ids)
+        assert reloaded.metrics['embeddings_reused'] == len(stored_ids)
+        
+        repeat = await reloaded.analyze_new_information("Vue.js is a progressive JavaScript framework")
+        assert repeat.action == 'skip', repeat.action
+        
+        general = reloaded.memory_store.find(category='general')
+        assert len(general) == len(stored_ids) and all(memory.category == 'general' for memory in general)
+        assert reloaded.memory_index['by_category']['general'] == {memory.id for memory in general}
+        
+        added = await reloaded.execute_crosscheck_action(
+            "Deno ships a built-in formatter, linter and test runner",
+            await reloaded.analyze_new_information("Deno ships a built-in formatter, linter and test runner"),
+            {'category': 'runtime', 'source': 'test_persistence'}
+        )
+        assert reloaded.memory_store.get_metrics()['pending_log_records'] == 1
+        assert reloaded.memory_index['by_source']['test_persistence'] == {added['memory_id']}
+        await reloaded.shutdown()
+        
+        print(f"✅ {len(stored_ids)} memories reloaded in {reloaded.memory_store.metrics['load_time_ms']:.1f}ms, "
+              f"history duplicate skipped, secondary indexes live")
+        
+    except Exception as e:
+        print(f"❌ Test 14 failed: {e}")
+    
     print("\n✅ [CROSSCHECK SYSTEM TESTS] All tests completed")
     
     # Final metrics summary
@@ -332,6 +464,8 @@ async def test_crosscheck_system():
     print(f"   Merges performed: {final_metrics['merges_performed']}")
     print(f"   Duplicates prevented: {final_metrics['duplicates_prevented']}")
     print(f"   Average analysis time: {final_metrics['average_analysis_time']:.1f}ms")
+    
+    store_dir.cleanup()
 
 if __name__ == "__main__":
     # Run comprehensive tests
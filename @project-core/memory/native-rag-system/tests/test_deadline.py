@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+"""
+REQUEST DEADLINE TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for deadline and cancellation propagation.
+Validates the Deadline budget helpers, budget-aware bridge retries, killing
+the Node.js subprocess on expiry or cancellation, and consultations that
+finish within their budget.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.deadline import Deadline, DeadlineExceededError
+from integration.js_bridge import JavaScriptBridge
+from central_hub.memory_coordinator import CentralMemoryCoordinator
+
+SLOW_COMPONENT = """
+const fs = require("fs");
+module.exports = {
+  async hang(pidFile, ms) {
+    fs.writeFileSync(pidFile, String(process.pid));
+    await new Promise((resolve) => setTimeout(resolve, ms));
+    return { done: true };
+  },
+};
+"""
+
+def process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+async def wait_for_pid(pid_file: Path) -> int:
+    for _ in range(500):
+        if pid_file.exists() and pid_file.read_text():
+            return int(pid_file.read_text())
+        await asyncio.sleep(0.01)
+    raise RuntimeError('Node component did not start')
+
+async def test_deadline():
+    """Test deadline propagation functionality"""
+    print("🧪 [DEADLINE TESTS] Starting tests...")
+
+    # Test 1: Budget helpers and wait_for
+    print("\nTest 1: Deadline budget")
+    try:
+        deadline = Deadline(0.2)
+        assert 0.1 < deadline.remaining() <= 0.2 and deadline.allows(0.1) and not deadline.allows(0.5)
+        assert deadline.timeout(0.05) == 0.05 and Deadline().timeout() is None and Deadline().timeout(3) == 3
+        assert Deadline.coerce(None) is None and Deadline.coerce(deadline) is deadline
+        assert 1.9 < Deadline.coerce(2).remaining() <= 2
+
+        assert await deadline.wait_for(asyncio.sleep(0.01, result='done')) == 'done'
+        work = asyncio.ensure_future(asyncio.sleep(5))
+        start_time = time.perf_counter()
+        try:
+            await deadline.wait_for(work)
+            assert False, 'deadline not enforced'
+        except DeadlineExceededError:
+            pass
+        assert work.cancelled() and time.perf_counter() - start_time < 0.3 and deadline.expired
+
+        try:
+            await Deadline(10).wait_for(asyncio.sleep(5), cap=0.05)
+            assert False, 'cap not enforced'
+        except DeadlineExceededError:
+            assert False, 'cap reported as deadline'
+        except asyncio.TimeoutError:
+            pass
+
+        cancelled = Deadline(10)
+        asyncio.get_running_loop().call_later(0.05, cancelled.cancel)
+        start_time = time.perf_counter()
+        try:
+            await cancelled.wait_for(asyncio.sleep(5))
+            assert False, 'cancel not enforced'
+        except DeadlineExceededError as error:
+            assert 'cancelled' in str(error)
+        assert time.perf_counter() - start_time < 0.5 and cancelled.remaining() == 0
+
+        # The budget, not the cap, ran out
+        try:
+            await Deadline(0.05).wait_for(asyncio.sleep(5), cap=10)
+            assert False, 'deadline not enforced'
+        except DeadlineExceededError:
+            pass
+
+        # Timer firing before the budget is quite spent (clock resolution), with and without a cap
+        for cap in (None, 10):
+            early = Deadline(0.05)
+            asyncio.get_running_loop().call_later(0.03, lambda d=early: setattr(d, 'expires_at', d.expires_at + 0.001))
+            try:
+                await early.wait_for(asyncio.sleep(5), cap=cap)
+                assert False, 'deadline not enforced'
+            except DeadlineExceededError:
+                assert early.remaining() > 0  # budget left by the clock, still a deadline error
+        for _ in range(50):
+            try:
+                await Deadline(0.0005).wait_for(asyncio.sleep(1))
+                assert False, 'deadline not enforced'
+            except DeadlineExceededError:
+                pass
+        print("✅ Budget, cap and cancellation enforced")
+    except Exception as e:
+        print(f"❌ Test 1 failed: {e}")
+
+    # Test 2: Caller cancellation while the awaited work cleans up
+    print("\nTest 2: Caller cancellation during cleanup")
+    try:
+        async def slow_cleanup():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.2)  # cleanup outlives the deadline
+                raise
+
+        caller = asyncio.ensure_future(Deadline(0.05).wait_for(slow_cleanup()))
+        await asyncio.sleep(0.1)  # deadline expired, wait_for is awaiting the cleanup
+        caller.cancel()
+        try:
+            await caller
+            assert False, 'caller cancellation swallowed'
+        except asyncio.CancelledError:
+            pass
+        assert caller.cancelled()
+
+        # Without a caller cancellation the work's own CancelledError is absorbed
+        try:
+            await Deadline(0.05).wait_for(slow_cleanup())
+            assert False, 'deadline not enforced'
+        except DeadlineExceededError:
+            pass
+        print("✅ Caller cancellation propagated, work cancellation absorbed")
+    except Exception as e:
+        print(f"❌ Test 2 failed: {e}")
+
+    if shutil.which('node') is None:
+        print("⚠️ Node.js not available, skipping bridge tests")
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        component_path = temp_path / 'slow-component.js'
+        component_path.write_text(SLOW_COMPONENT)
+
+        bridge = JavaScriptBridge()
+        bridge.config['cache_enabled'] = False
+        bridge.config['circuit_breaker'] = False
+        bridge.js_components['slow'] = str(component_path)
+
+        # Test 3: Expired deadline kills the Node subprocess
+        print("\nTest 3: Subprocess killed at the deadline")
+        try:
+            pid_file = temp_path / 'expired.pid'
+            bridge.config['fallback_enabled'] = False
+            start_time = time.perf_counter()
+            try:
+                await bridge.call_js_component('slow', 'hang', [str(pid_file), 20000], deadline=Deadline(0.8))
+                assert False, 'deadline not enforced'
+            except DeadlineExceededError:
+                pass
+            elapsed = time.perf_counter() - start_time
+            pid = await wait_for_pid(pid_file)
+            assert elapsed < 2.0 and not process_alive(pid)
+            assert bridge.metrics['deadline_exceeded'] == 1 and bridge.metrics['subprocesses_killed'] == 1
+            assert bridge.metrics['error_count'] == 0  # not counted against the component
+            print(f"✅ Call stopped after {elapsed:.2f}s, node process {pid} killed")
+        except Exception as e:
+            print(f"❌ Test 3 failed: {e}")
+
+        # Test 4: Caller cancellation kills the Node subprocess
+        print("\nTest 4: Subprocess killed on cancellation")
+        try:
+            pid_file = temp_path / 'cancelled.pid'
+            call = asyncio.ensure_future(bridge.call_js_component('slow', 'hang', [str(pid_file), 20000]))
+            pid = await wait_for_pid(pid_file)
+            call.cancel()
+            try:
+                await call
+            except asyncio.CancelledError:
+                pass
+            assert not process_alive(pid) and bridge.metrics['subprocesses_killed'] == 2
+
+            pid_file = temp_path / 'deadline-cancelled.pid'
+            deadline = Deadline(30)
+            call = asyncio.ensure_future(bridge.call_js_component('slow', 'hang', [str(pid_file), 20000], deadline=deadline))
+            pid = await wait_for_pid(pid_file)
+            deadline.cancel()
+            try:
+                await call
+                assert False, 'cancel not enforced'
+            except DeadlineExceededError:
+                pass
+            assert not process_alive(pid) and bridge.metrics['subprocesses_killed'] == 3
+            print("✅ Task cancellation and Deadline.cancel() both kill node")
+        except Exception as e:
+            print(f"❌ Test 4 failed: {e}")
+
+        # Test 5: Retries only when the budget covers them
+        print("\nTest 5: Budget-aware retries")
+        try:
+            bridge.config['fallback_enabled'] = True
+            start_time = time.perf_counter()
+            result = await bridge.call_js_component('slow', 'missingMethod', [], deadline=Deadline(1.5))
+            elapsed = time.perf_counter() - start_time
+            assert result.get('fallback') and elapsed < 1.5  # first backoff alone is 2s
+            assert bridge.metrics['retries_skipped_for_budget'] == 1 and bridge.metrics['retry_attempts'] == 0
+
+            result = await bridge.call_js_component('slow', 'missingMethod', [], deadline=Deadline(4.5))
+            assert result.get('fallback') and bridge.metrics['retry_attempts'] == 1  # 2s backoff fits, 4s does not
+            assert bridge.metrics['retries_skipped_for_budget'] == 2
+            print(f"✅ Without budget for the backoff the call gave up after {elapsed:.2f}s")
+        except Exception as e:
+            print(f"❌ Test 5 failed: {e}")
+
+        # Test 6: Consultations finish within their budget
+        print("\nTest 6: Consultation budget")
+        try:
+            coordinator = CentralMemoryCoordinator()
+            coordinator.cache_dir = temp_path / 'central-hub'
+            coordinator.cache_dir.mkdir()
+            coordinator.js_bridge.config['cache_enabled'] = False
+            coordinator.js_bridge.config['circuit_breaker'] = False
+
+            start_time = time.perf_counter()
+            result = await coordinator.coordinate_memory_consultation("What is React?", {'source': 'test_deadline'},
+                                                                      deadline=1.0)
+            elapsed = time.perf_counter() - start_time
+            assert elapsed < 2.0  # 3 retries with backoff take ~14s without a deadline
+            assert result['success'] and result['strategies_used'] == ['enhanced_memory']
+            assert coordinator.js_bridge.metrics['retries_skipped_for_budget'] >= 1
+
+            # A strategy that ignores the budget is cancelled at the deadline
+            async def stuck(query, context):
+                await asyncio.sleep(30)
+            coordinator._execute_enhanced_memory = stuck
+            start_time = time.perf_counter()
+            result = await coordinator.coordinate_memory_consultation("What is Vue?", {'source': 'test_deadline', 'deadline': 0.5})
+            elapsed = time.perf_counter() - start_time
+            combined = result['results']['combined_data']['enhanced_memory']
+            assert elapsed < 1.5 and result['results']['failed_strategies'] == ['enhanced_memory']
+            assert 'budget' in combined['error'] and coordinator.metrics['deadline_exceeded'] == 1
+            print(f"✅ Consultation returned in {elapsed:.2f}s with the stuck strategy cancelled")
+        except Exception as e:
+            print(f"❌ Test 6 failed: {e}")
+
+    print("\n✅ [DEADLINE TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_deadline())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+"""
+MEMORY CORPUS INGESTION TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the markdown ingestion pipeline.
+Validates heading-aware chunking, manifest-based skipping, chunk-level
+incremental updates, hybrid search over the ingested corpus and the retry
+of chunks whose vectors never reached the embedding store.
+"""
+
+import asyncio
+import os
+import tempfile
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawl4ai_strategies.document_ingestion import MarkdownChunker, MemoryIngestionPipeline
+from crawl4ai_strategies.embedding_backends import BACKEND_ENV_VAR
+
+SAMPLE_DOCUMENT = """# Self Correction Log
+
+## Bridge Errors
+
+""" + "\n\n".join(
+    f"Entry {i}: the JavaScript bridge timed out while loading the embedding service component." for i in range(30)
+) + """
+
+```markdown
+# Not a heading inside a code fence
+```
+
+## Cache Strategy
+
+Hybrid cache keeps hot entries in memory and cold entries on disk.
+"""
+
+async def test_document_ingestion():
+    """Test ingestion pipeline functionality"""
+    print("🧪 [DOCUMENT INGESTION TESTS] Starting tests...")
+
+    # Test 1: Heading-aware chunking with size limit and overlap
+    print("\nTest 1: Markdown chunking")
+    chunks = list(MarkdownChunker(max_chunk_size=400, context_overlap=60).iter_chunks(SAMPLE_DOCUMENT))
+    assert all(len(chunk['text']) <= 400 for chunk in chunks)
+    # Heading-only title section continues into its first subsection
+    assert chunks[0]['heading_path'] == ['Self Correction Log', 'Bridge Errors']
+    assert chunks[0]['text'].startswith('# Self Correction Log\n\n## Bridge Errors')
+    assert chunks[-1]['heading_path'] == ['Self Correction Log', 'Cache Strategy']
+    assert not any('Not a heading' in title for chunk in chunks for title in chunk['heading_path'])
+    # Consecutive chunks of one section overlap
+    assert chunks[1]['text'].split('\n\n')[0] in chunks[0]['text']
+    print(f"✅ {len(chunks)} chunks, max {max(len(c['text']) for c in chunks)} chars")
+
+    os.environ[BACKEND_ENV_VAR] = 'hashed_ngram'
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir) / 'memory'
+            (root / 'protocols').mkdir(parents=True)
+            (root / 'native-rag-system').mkdir()
+            (root / 'self_correction_log.md').write_text(SAMPLE_DOCUMENT)
+            (root / 'protocols' / 'cache.md').write_text("# Cache Protocol\n\nAlways warm the hybrid cache before benchmarks.\n")
+            (root / 'native-rag-system' / 'ignored.md').write_text("# Ignored\n\nInternal notes.\n")
+
+            pipeline = MemoryIngestionPipeline(memory_root=root, manifest_path=Path(temp_dir) / 'manifest.json')
+            pipeline.contextual_embeddings.embedding_store_dir = Path(temp_dir) / 'store'
+            pipeline.contextual_embeddings.embedding_stores = {}
+            pipeline.hybrid_search.attach_embedding_store(pipeline.contextual_embeddings.get_embedding_store())
+            pipeline.hybrid_search.config['cache_enabled'] = False
+            pipeline.config['max_chunk_size'] = 400
+            pipeline.config['context_overlap'] = 60
+
+            # Test 2: First run ingests every corpus file
+            print("\nTest 2: Initial ingestion")
+            summary = await pipeline.ingest()
+            assert summary['files_updated'] == 2
+            assert summary['chunks_added'] == len(pipeline.hybrid_search.keyword_index) > 2
+            store = pipeline.contextual_embeddings.get_embedding_store()
+            assert store.get_metrics()['entries'] == summary['chunks_added']
+            print(f"✅ {summary['chunks_added']} chunks indexed")
+
+            # Test 3: Unchanged files are skipped
+            print("\nTest 3: Unchanged re-run")
+            summary = await pipeline.ingest()
+            assert summary['files_skipped'] == 2 and summary['chunks_added'] == 0
+            print("✅ All files skipped")
+
+            # Test 4: Appending to a file only embeds the changed chunks
+            print("\nTest 4: Incremental update")
+            before = len(pipeline.hybrid_search.keyword_index)
+            with open(root / 'self_correction_log.md', 'a') as f:
+                f.write("\n## Reranking\n\nCross-encoder reranking needs the model downloaded first.\n")
+            summary = await pipeline.ingest()
+            assert summary['files_updated'] == 1 and summary['files_skipped'] == 1
+            assert summary['chunks_unchanged'] > 0 and summary['chunks_added'] <= 2
+            assert len(pipeline.hybrid_search.keyword_index) == before + summary['chunks_added'] - summary['chunks_removed']
+            print(f"✅ +{summary['chunks_added']}/-{summary['chunks_removed']} chunks, {summary['chunks_unchanged']} unchanged")
+
+            # Test 5: Hybrid search finds the new content in both legs
+            print("\nTest 5: Hybrid search over ingested corpus")
+            query = 'cross-encoder reranking model'
+            query_embedding = await pipeline.contextual_embeddings.embedding_backend.embed_one(query)
+            results = await pipeline.hybrid_search.perform_hybrid_search(query, {'query_embedding': query_embedding})
+            assert 'Cross-encoder' in results[0]['content']
+            assert set(results[0]['search_types']) == {'vector', 'keyword'}
+            print(f"✅ Top result found by {results[0]['search_types']}")
+
+            # Test 6: Deleted files are removed; a fresh pipeline restores the keyword index
+            print("\nTest 6: Removal and restore")
+            (root / 'protocols' / 'cache.md').unlink()
+            summary = await pipeline.ingest()
+            assert summary['files_removed'] == 1
+            restored = MemoryIngestionPipeline(memory_root=root, manifest_path=Path(temp_dir) / 'manifest.json')
+            assert restored.restore_indexes() == len(pipeline.hybrid_search.keyword_index)
+            print(f"✅ {len(restored.hybrid_search.keyword_index)} chunks restored from manifest")
+
+            # Test 7: Chunks embedded by the offline fallback stay pending and are retried
+            print("\nTest 7: Fallback chunks retried")
+            backend = pipeline.contextual_embeddings.embedding_backend
+            working_embed = backend.embed
+
+            async def unavailable(texts, options=None):
+                raise RuntimeError('embedding service unavailable')
+
+            backend.embed = unavailable
+            (root / 'protocols' / 'retry.md').write_text("# Retry Protocol\n\nRetry the embedding service with backoff.\n")
+            summary = await pipeline.ingest()
+            retry_entry = pipeline.manifest['files']['protocols/retry.md']
+            assert summary['chunks_added'] == summary['chunks_pending'] == len(retry_entry['pending']) > 0
+            assert not any(chunk_id in store.entries for chunk_id in retry_entry['pending'])
+
+            backend.embed = working_embed
+            keyword_count = len(pipeline.hybrid_search.keyword_index)
+            summary = await pipeline.ingest()
+            assert summary['files_updated'] == 1 and summary['chunks_pending'] == 0
+            assert all(chunk_id in store.entries for chunk_id in retry_entry['chunks'])
+            assert pipeline.manifest['files']['protocols/retry.md']['pending'] == []
+            assert len(pipeline.hybrid_search.keyword_index) == keyword_count
+
+            # Vectors missing from the store (new or compacted store) are embedded again
+            dropped = pipeline.manifest['files']['self_correction_log.md']['chunks'][0]
+            store.delete(dropped)
+            summary = await pipeline.ingest()
+            assert summary['chunks_added'] == 1 and dropped in store.entries
+            print(f"✅ Pending chunks embedded on the next run, {summary['chunks_unchanged']} unchanged")
+    finally:
+        del os.environ[BACKEND_ENV_VAR]
+
+    print("\n✅ [DOCUMENT INGESTION TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_document_ingestion())
@@ -12,6 +12,9 @@ import asyncio
 import time
 import json
 import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -356,7 +359,243 @@ async def test_ecl_pipeline():
         
     except Exception as e:
         print(f"❌ Test 12 failed: {e}")
-    
+
+    # Test 13: Sliding-window relationship candidates
+    print("\nTest 13: Sliding-window relationship candidates")
+    try:
+        dense_content = ''.join(
+            f"The Service{i} module calls handler_{i}() with Docker and React. " for i in range(120)
+        )
+        entities = pipeline._extract_entities_native(dense_content, 'test_dense')
+        assert len(entities) > 50  # no entity cap
+
+        window = pipeline.config['relationship_window']
+        pairs = pipeline._generate_candidate_pairs(entities, window)
+        brute_force = [
+            (i, j) for i in range(len(entities)) for j in range(i + 1, len(entities))
+            if abs(entities[i]['position']['start'] - entities[j]['position']['start']) < window
+        ]
+        assert pairs == brute_force
+        print(f"✅ {len(pairs)} candidate pairs instead of {len(entities) * (len(entities) - 1) // 2}")
+
+        # Batch scores match the per-pair strength calculation
+        sentences, sentence_sets = pipeline._build_sentence_index(dense_content, entities)
+        scores = pipeline._score_relationship_candidates(entities, pairs, sentence_sets, len(sentences))
+        for (i, j), score in list(zip(pairs, scores))[:200]:
+            expected = pipeline._calculate_relationship_strength(entities[i], entities[j], dense_content)
+            assert abs(score[0] - expected) < 1e-9
+        print("✅ Batch scores match per-pair strengths")
+
+        # Fast path keeps every close pair (no 20-relationship cutoff)
+        fast_relationships = pipeline._extract_relationships_fast(entities, dense_content)
+        assert len(fast_relationships) > 20
+        assert all(r['properties']['distance'] < pipeline.config['fast_relationship_window'] for r in fast_relationships)
+        print(f"✅ Fast path: {len(fast_relationships)} proximity relationships")
+
+    except Exception as e:
+        print(f"❌ Test 13 failed: {e}")
+
+    # Test 14: Windowed streaming for large documents
+    print("\nTest 14: Windowed streaming ECL")
+    try:
+        large_content = ''.join(
+            f"## Component{i}\nThe Service{i} module calls handler_{i}() with Docker and React.\n" for i in range(600)
+        )
+        assert len(large_content) > pipeline.config['window_size']
+        pipeline.config['worker_processes'] = 2
+        pipeline.config['incremental_sections'] = False
+
+        windowed_result = await pipeline.execute_ecl_pipeline(large_content, 'test_large', {'source': 'window_test'})
+        extract = windowed_result['extract']
+        assert extract['windows'] > 1
+        names = {entity['name'] for entity in extract['entities']}
+        # The middle of the document is no longer truncated away
+        assert {'Component0', 'Component300', 'Component599'} <= names
+        # Positions are global offsets and entities are merged across windows
+        for entity in extract['entities']:
+            start, end = entity['position']['start'], entity['position']['end']
+            assert entity['name'] in large_content[start:end]
+        assert len([e for e in extract['entities'] if e['name'] == 'Docker']) == 1
+        print(f"✅ {extract['windows']} windows, {extract['entities_final']} entities, "
+              f"{windowed_result['metadata']['relationships_count']} relationships")
+
+        # Worker pool and inline processing agree
+        inline_pipeline = CogneeECLPipeline()
+        inline_pipeline.config['worker_processes'] = 1
+        inline_pipeline.config['cache_enabled'] = False
+        inline_pipeline.config['incremental_sections'] = False
+        inline_result = await inline_pipeline.execute_ecl_pipeline(large_content, 'test_large', {'source': 'window_test'})
+        assert [e['name'] for e in inline_result['extract']['entities']] == [e['name'] for e in extract['entities']]
+        assert inline_result['metadata']['relationships_count'] == windowed_result['metadata']['relationships_count']
+        print(f"✅ Inline and pooled ({pipeline.config['worker_processes']} workers) results match")
+
+    except Exception as e:
+        print(f"❌ Test 14 failed: {e}")
+
+    # Test 15: Batch ECL through the worker pool
+    print("\nTest 15: Batch ECL execution")
+    try:
+        documents = [
+            {'content': test_contents[name], 'source': f'batch_{name}', 'context': {'source': 'batch_test'}}
+            for name in test_contents
+        ] * 4
+        for index, document in enumerate(documents):
+            documents[index] = {**document, 'source': f"{document['source']}_{index}"}
+        pipeline.config['batch_chunk_size'] = 3
+        pipeline.config['batch_load_size'] = 5
+
+        batch_result = await pipeline.execute_ecl_batch(documents)
+        assert batch_result['metadata']['documents'] == len(documents)
+        # Results come back in input order whatever the completion order
+        assert [r['metadata']['source'] for r in batch_result['results']] == [d['source'] for d in documents]
+        # Same entities as the single-document pipeline
+        single_pipeline = CogneeECLPipeline()
+        single_pipeline.config['cache_enabled'] = False
+        for document, result in list(zip(documents, batch_result['results']))[:3]:
+            single = await single_pipeline.execute_ecl_pipeline(document['content'], document['source'], document['context'])
+            assert [e['name'] for e in single['extract']['entities']] == [e['name'] for e in result['extract']['entities']]
+        assert all(r['load']['bulk_documents'] <= 5 for r in batch_result['results'])
+        # Pool workers only build the extractor state
+        worker_pipeline = CogneeECLPipeline.for_extraction(pipeline.config)
+        assert not hasattr(worker_pipeline, 'js_bridge') and not hasattr(worker_pipeline, '_graph_store')
+        worker_result = worker_pipeline._process_document_chunk([{**documents[0], 'index': 0}])[0]
+        assert [e['name'] for e in worker_result['extract']['entities']] == \
+            [e['name'] for e in batch_result['results'][0]['extract']['entities']]
+        print(f"✅ {len(documents)} documents at {batch_result['metadata']['throughput_docs_per_sec']:.1f} docs/s "
+              f"({batch_result['metadata']['workers']} workers)")
+
+        # A second run is served from the cache
+        cached_batch = await pipeline.execute_ecl_batch(documents)
+        assert cached_batch['metadata']['cache_hits'] == len(documents)
+        print(f"✅ Cached re-run: {cached_batch['metadata']['cache_hits']} cache hits")
+
+    except Exception as e:
+        print(f"❌ Test 15 failed: {e}")
+    finally:
+        pipeline.close()
+
+    # Test 16: Incremental re-processing by section hash
+    print("\nTest 16: Incremental section ECL")
+    try:
+        sections = [
+            f"## Component{i}\n\n" + ''.join(
+                f"The **Service{i} Layer** calls `handler_{i}_{j}()` with Docker, React and Supabase.\n" for j in range(20)
+            ) + "\n"
+            for i in range(20)
+        ]
+        original = ''.join(sections)
+        sections[10] = sections[10].replace('handler_10_5()', 'handler_10_5() and Kubernetes', 1)
+        edited = ''.join(sections)
+
+        def make_pipeline(db_path):
+            ecl = CogneeECLPipeline()
+            ecl.config['cache_enabled'] = False
+            ecl.config['worker_processes'] = 1
+            ecl.config['graph_store_path'] = db_path
+            return ecl
+
+        def graph_snapshot(ecl):
+            graph = ecl.get_graph_store()
+            return ({(e['name'].lower(), e['type']): e['mentions'] for e in graph.find_entities(limit=10000)},
+                    graph.get_metrics()['edges'])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            incremental_pipeline = make_pipeline(Path(temp_dir) / 'incremental.db')
+            first = await incremental_pipeline.execute_ecl_pipeline(original, 'incremental_doc', {'source': 'incremental_test'})
+            assert first['extract']['sections_processed'] == first['extract']['sections'] > 2
+            original_graph = graph_snapshot(incremental_pipeline)
+
+            start_time = time.time()
+            second = await incremental_pipeline.execute_ecl_pipeline(edited, 'incremental_doc', {'source': 'incremental_test'})
+            incremental_time = (time.time() - start_time) * 1000
+            # Only the edited section and the seams on either side are recomputed
+            assert second['extract']['sections_processed'] == 1 and second['extract']['seams_processed'] <= 2
+
+            # Same result, and the same graph, as processing the edited document from scratch
+            fresh_pipeline = make_pipeline(Path(temp_dir) / 'fresh.db')
+            start_time = time.time()
+            fresh = await fresh_pipeline.execute_ecl_pipeline(edited, 'incremental_doc', {'source': 'incremental_test'})
+            full_time = (time.time() - start_time) * 1000
+            assert [e['name'] for e in fresh['extract']['entities']] == [e['name'] for e in second['extract']['entities']]
+            assert fresh['metadata']['relationships_count'] == second['metadata']['relationships_count']
+            assert 'Kubernetes' in {e['name'] for e in second['extract']['entities']}
+            edited_graph = graph_snapshot(fresh_pipeline)
+            assert graph_snapshot(incremental_pipeline) == edited_graph
+            assert edited_graph[0][('docker', 'TECHNOLOGY')] == original_graph[0][('docker', 'TECHNOLOGY')]
+
+            # Reverting the edit retracts Kubernetes
+            await incremental_pipeline.execute_ecl_pipeline(original, 'incremental_doc', {'source': 'incremental_test'})
+            assert graph_snapshot(incremental_pipeline) == original_graph
+            incremental_pipeline.close()
+
+            # A restart (empty section cache) reloads the document instead of adding to it
+            restarted_pipeline = make_pipeline(Path(temp_dir) / 'incremental.db')
+            restarted = await restarted_pipeline.execute_ecl_pipeline(edited, 'incremental_doc', {'source': 'incremental_test'})
+            assert restarted['extract']['sections_processed'] == restarted['extract']['sections']
+            assert graph_snapshot(restarted_pipeline) == edited_graph
+            restarted_pipeline.close()
+            fresh_pipeline.close()
+        print(f"✅ 1/{second['extract']['sections']} sections re-processed: {incremental_time:.1f}ms vs {full_time:.1f}ms full, "
+              f"graph matches a fresh load")
+
+    except Exception as e:
+        print(f"❌ Test 16 failed: {e}")
+
+    # Test 17: A worker pool that breaks mid-run
+    print("\nTest 17: Broken worker pool recovery")
+    try:
+        class BreakingPool(ThreadPoolExecutor):
+            """Fails every submission after the first few, as a pool with a dead worker does"""
+
+            def __init__(self, healthy_submissions: int):
+                super().__init__(max_workers=2)
+                self.healthy_submissions = healthy_submissions
+                self.shutdown_calls = []
+
+            def submit(self, fn, *args, **kwargs):
+                if self.healthy_submissions <= 0:
+                    future = Future()
+                    future.set_exception(BrokenProcessPool('worker died'))
+                    return future
+                self.healthy_submissions -= 1
+                return super().submit(fn, *args, **kwargs)
+
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                self.shutdown_calls.append({'wait': wait, 'cancel_futures': cancel_futures})
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        large_content = ''.join(
+            f"## Component{i}\nThe Service{i} module calls handler_{i}() with Docker and React.\n" for i in range(600)
+        )
+        inline_pipeline = CogneeECLPipeline()
+        inline_pipeline.config['worker_processes'] = 1
+        inline_pipeline.config['cache_enabled'] = False
+        inline_pipeline.config['incremental_sections'] = False
+        inline_result = await inline_pipeline.execute_ecl_pipeline(large_content, 'test_broken', {'source': 'broken_test'})
+
+        broken_pipeline = CogneeECLPipeline()
+        broken_pipeline.config['worker_processes'] = 2
+        broken_pipeline.config['cache_enabled'] = False
+        broken_pipeline.config['incremental_sections'] = False
+        broken_pool = BreakingPool(healthy_submissions=3)
+        broken_pipeline._worker_pool = broken_pool
+        broken_result = await broken_pipeline.execute_ecl_pipeline(large_content, 'test_broken', {'source': 'broken_test'})
+
+        # The broken pool is shut down without waiting, and only the lost windows are redone inline
+        assert broken_pool.shutdown_calls == [{'wait': False, 'cancel_futures': True}]
+        assert broken_pipeline._worker_pool is None and broken_pipeline._worker_pool_disabled
+        assert [e['name'] for e in broken_result['extract']['entities']] == [e['name'] for e in inline_result['extract']['entities']]
+        assert broken_result['extract']['windows'] == inline_result['extract']['windows']
+        metrics = broken_pipeline.get_metrics()
+        assert metrics['windowed_executions'] == 1 and metrics['worker_pool_failures'] == 1
+        assert metrics['extract_operations'] == metrics['cognify_operations'] == 1
+        assert metrics['windows_processed'] == broken_result['extract']['windows']
+        broken_pipeline.close()
+        print(f"✅ Pool shut down once, {metrics['windows_processed']} windows counted once, results match inline")
+
+    except Exception as e:
+        print(f"❌ Test 17 failed: {e}")
+
     print("\n✅ [ECL PIPELINE TESTS] All tests completed")
     
     # Final metrics summary
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+"""
+BINARY EMBEDDING STORE TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the memory-mapped embedding store.
+Validates zero-copy lookups, text deduplication, persistence, search and
+the separation of query embeddings from document chunks.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from crawl4ai_strategies.contextual_embeddings import ContextualEmbeddingsStrategy
+from crawl4ai_strategies.embedding_backends import BACKEND_ENV_VAR
+from crawl4ai_strategies.embedding_store import EmbeddingStore, NUMPY_AVAILABLE
+from crawl4ai_strategies.hybrid_search import HybridSearchStrategy
+
+async def test_embedding_store():
+    """Test embedding store functionality"""
+    print("🧪 [EMBEDDING STORE TESTS] Starting tests...")
+
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy not available, skipping embedding store tests")
+        return
+
+    import numpy as np
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store_dir = Path(temp_dir) / 'store'
+        store = EmbeddingStore(store_dir, dimensions=8, initial_capacity=2)
+
+        # Test 1: Put / get round trip with zero-copy view
+        print("\nTest 1: Put and zero-copy get")
+        vector = np.arange(8, dtype=np.float32)
+        shared_context = 'Enhanced context: shared across chunks'
+        store.put('chunk-1', vector, {
+            'original_content': 'first chunk',
+            'enriched_context': shared_context
+        }, {'source': 'test'})
+
+        entry = store.get('chunk-1')
+        assert np.array_equal(entry['vector'], vector)
+        assert np.shares_memory(entry['vector'], store.matrix())
+        assert entry['texts']['original_content'] == 'first chunk'
+        assert entry['metadata']['source'] == 'test'
+        print("✅ Vector view shares memory with the mapped matrix")
+
+        # Test 2: Text deduplication and growth
+        print("\nTest 2: Text deduplication and growth")
+        for i in range(2, 6):
+            store.put(f'chunk-{i}', np.full(8, i, dtype=np.float32), {
+                'original_content': f'chunk {i}',
+                'enriched_context': shared_context
+            })
+        metrics = store.get_metrics()
+        assert metrics['texts_deduplicated'] == 4
+        assert metrics['capacity'] >= 5
+        assert metrics['grow_events'] >= 1
+        print(f"✅ {metrics['unique_texts']} unique texts for {metrics['entries']} entries")
+
+        # Test 3: Search returns the most similar row first
+        print("\nTest 3: Cosine search")
+        results = store.search(vector, k=3)
+        assert results[0]['key'] == 'chunk-1'
+        assert abs(results[0]['score'] - 1.0) < 1e-5
+        print(f"✅ Top result: {results[0]}")
+
+        # Test 4: Overwrite and delete
+        print("\nTest 4: Overwrite and delete")
+        store.put('chunk-2', np.ones(8, dtype=np.float32))
+        assert store.delete('chunk-3')
+        assert store.get('chunk-3') is None
+        assert all(r['key'] != 'chunk-3' for r in store.search(np.ones(8), k=10))
+        print("✅ Deleted keys excluded from search")
+
+        # Test 5: Persistence across reopen
+        print("\nTest 5: Reopen from disk")
+        store.close()
+        reopened = EmbeddingStore(store_dir, dimensions=8, initial_capacity=2)
+        assert np.array_equal(reopened.get_vector('chunk-2'), np.ones(8, dtype=np.float32))
+        assert reopened.get('chunk-3') is None
+        assert reopened.get('chunk-1')['texts']['enriched_context'] == shared_context
+        print(f"✅ Reopened store with {len(reopened.entries)} entries")
+
+        # Test 6: Compaction drops dead rows and keeps data intact
+        print("\nTest 6: Compaction")
+        reclaimed = reopened.compact()
+        assert reclaimed == 2  # Overwritten chunk-2 row + deleted chunk-3
+        assert reopened.count == len(reopened.entries) == 4
+        assert np.array_equal(reopened.get_vector('chunk-1'), vector)
+        assert reopened.get('chunk-5')['texts']['original_content'] == 'chunk 5'
+        print(f"✅ Reclaimed {reclaimed} rows")
+
+        # Test 7: float16 storage
+        print("\nTest 7: float16 storage")
+        half_store = EmbeddingStore(Path(temp_dir) / 'half', dimensions=8, dtype='float16')
+        half_store.put('half', vector)
+        assert half_store.get_vector('half').dtype == np.float16
+        assert half_store.vectors_file.stat().st_size == half_store.capacity * 8 * 2
+        print("✅ float16 matrix uses 2 bytes per dimension")
+
+        # Test 8: Lookup latency
+        print("\nTest 8: Lookup latency")
+        start_time = time.time()
+        for _ in range(1000):
+            reopened.get_vector('chunk-4')
+        lookup_time = (time.time() - start_time) * 1000
+        print(f"✅ 1000 lookups in {lookup_time:.1f}ms")
+
+        # Test 9: Query embeddings never come back as documents
+        print("\nTest 9: Query embeddings kept out of document search")
+        os.environ[BACKEND_ENV_VAR] = 'hashed_ngram'
+        try:
+            strategy = ContextualEmbeddingsStrategy()
+            strategy.config['embedding_dimensions'] = strategy.config['native_embedding_dimensions']
+            strategy.cache_dir = Path(temp_dir) / 'json-cache'
+            strategy.cache_dir.mkdir()
+            strategy.embedding_store_dir = Path(temp_dir) / 'roles'
+            documents = [
+                "Configure the PostgreSQL connection pool size and timeouts",
+                "JWT token authentication for REST API endpoints"
+            ]
+            await strategy.generate_contextual_embeddings_batch(documents, {'source': 'docs'}, keys=['doc-a', 'doc-b'])
+            query = "JWT authentication for the REST API"
+            query_result = await strategy.generate_contextual_embeddings(query, {'source': 'docs', 'embedding_role': 'query'})
+
+            document_store = strategy.get_embedding_store()
+            query_store = strategy.get_embedding_store(role='query')
+            assert document_store is not query_store and query_store.store_dir != document_store.store_dir
+            assert len(document_store.entries) == 2 and len(query_store.entries) == 1
+            assert document_store.get('doc-a')['metadata']['embedding_role'] == 'document'
+
+            # Rows tagged as queries in a shared store are filtered as well
+            document_store.put('old-query', query_result['embedding'], {'original_content': 'older query text'},
+                               {'embedding_role': 'query'})
+            hybrid_search = HybridSearchStrategy()
+            hybrid_search.attach_embedding_store(document_store)
+            hits = hybrid_search._native_vector_search(query, query_result['embedding'])
+            assert [hit['content'] for hit in hits][0] == documents[1]
+            assert {hit['content'] for hit in hits} == set(documents)
+
+            # A document with the query's exact text is a hit; query rows take no result slots
+            document_store.put('doc-c', query_result['embedding'], {'original_content': query},
+                               {'embedding_role': 'document'})
+            hybrid_search.config['max_results'] = 2
+            hits = hybrid_search._native_vector_search(query, query_result['embedding'])
+            batch_hits = await hybrid_search._perform_vector_search_batch(
+                [query, query], [{'query_embedding': query_result['embedding']}] * 2
+            )
+            assert [hit['content'] for hit in hits] == [query, documents[1]]
+            assert all([hit['content'] for hit in batch] == [query, documents[1]] for batch in batch_hits)
+            assert len(document_store.search(query_result['embedding'], k=10)) == 4
+            assert 'old-query' not in [match['key'] for match in document_store.search(
+                query_result['embedding'], k=10, include_query_rows=False)]
+
+            # Row masks follow overwrites, deletes, reopening and compaction
+            document_store.put('doc-c', query_result['embedding'], {'original_content': query},
+                               {'embedding_role': 'query'})
+            document_store.delete('doc-a')
+            reopened = EmbeddingStore(document_store.store_dir, dimensions=document_store.dimensions)
+            for store_view in (document_store, reopened):
+                keys = [m['key'] for m in store_view.search(query_result['embedding'], k=10, include_query_rows=False)]
+                assert keys == ['doc-b'] and not store_view.is_document_row(store_view.entries['doc-c']['row'])
+            assert reopened.compact() > 0
+            assert [m['key'] for m in reopened.search(query_result['embedding'], k=10, include_query_rows=False)] == ['doc-b']
+            assert {m['key'] for m in reopened.search(query_result['embedding'], k=10)} == {'doc-b', 'doc-c', 'old-query'}
+            print(f"✅ {len(hits)} document hits, query rows in their own store ({query_store.store_dir.name})")
+        finally:
+            del os.environ[BACKEND_ENV_VAR]
+
+    print("\n✅ [EMBEDDING STORE TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_embedding_store())
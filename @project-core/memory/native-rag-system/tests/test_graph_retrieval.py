@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+"""
+GRAPH RETRIEVAL TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the graph-neighbourhood leg of hybrid search.
+Validates query entity matching, bounded k-hop expansion, the cached
+adjacency index, the latency budget, RRF fusion with the other legs and the
+coordinator's corpus ingestion wiring.
+"""
+
+import asyncio
+import os
+import tempfile
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cognee_ecl_pipeline.graph_store import KnowledgeGraphStore
+from cognee_ecl_pipeline.ecl_pipeline import CogneeECLPipeline
+from crawl4ai_strategies.graph_index import GraphNeighbourhoodIndex
+from crawl4ai_strategies.hybrid_search import HybridSearchStrategy
+from crawl4ai_strategies.document_ingestion import MemoryIngestionPipeline
+from crawl4ai_strategies.embedding_backends import BACKEND_ENV_VAR
+from central_hub.memory_coordinator import CentralMemoryCoordinator
+
+CHUNKS = {
+    'chunk_auth': "Supabase Auth issues the session tokens for the dashboard.",
+    'chunk_rls': "Row level policies restrict each tenant to its own rows.",
+    'chunk_edge': "Edge functions validate webhooks before writing to storage.",
+    'chunk_other': "Tailwind utility classes style the marketing pages."
+}
+
+def _entity(entity_id, name, source):
+    return {'id': entity_id, 'name': name, 'type': 'CONCEPT', 'confidence': 0.8, 'source': source, 'properties': {}}
+
+def _relationship(source_entity, target_entity, strength):
+    return {'source_entity': source_entity, 'target_entity': target_entity,
+            'relationship_type': 'RELATED_TO', 'strength': strength, 'confidence': strength}
+
+async def test_graph_retrieval():
+    """Test graph retrieval functionality"""
+    print("🧪 [GRAPH RETRIEVAL TESTS] Starting tests...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = KnowledgeGraphStore(Path(temp_dir) / 'graph.db')
+        # Supabase Auth -> Row Level Security -> Tenant Isolation; Tailwind is unconnected
+        store.upsert_graph(
+            [_entity('e1', 'Supabase Auth', 'chunk_auth'), _entity('e2', 'Row Level Security', 'chunk_rls'),
+             _entity('e3', 'Tenant Isolation', 'chunk_rls'), _entity('e4', 'Edge Functions', 'chunk_edge'),
+             _entity('e5', 'Tailwind', 'chunk_other'), _entity('e6', 'Tenant Isolation', 'removed_chunk')],
+            [_relationship('e1', 'e2', 0.9), _relationship('e2', 'e4', 0.6), _relationship('e2', 'e3', 0.8)]
+        )
+
+        # Test 1: Query entities are matched on whole tokens and expanded k hops
+        print("\nTest 1: Neighbourhood expansion")
+        index = GraphNeighbourhoodIndex(store, max_hops=2)
+        assert index.refresh()
+        assert [index.entity_names[e] for e in index.match_entities('how does supabase auth work?')] == ['supabase auth']
+        assert index.match_entities('supabase') == []
+        search = index.search('supabase auth sessions')
+        sources = [hit['source'] for hit in search['results']]
+        assert sources[0] == 'chunk_auth' and {'chunk_rls', 'chunk_edge'} <= set(sources)
+        assert 'chunk_other' not in sources and search['expanded'] == 4
+        one_hop = GraphNeighbourhoodIndex(store, max_hops=1)
+        one_hop.refresh()
+        assert 'chunk_edge' not in [hit['source'] for hit in one_hop.search('supabase auth')['results']]
+        print(f"✅ {search['seeds']} seed, {search['expanded']} entities reached: {sources}")
+
+        # Test 2: Adjacency index is cached until the graph changes
+        print("\nTest 2: Cached adjacency index")
+        assert not index.refresh()
+        store.upsert_graph([_entity('e7', 'Storage Buckets', 'chunk_edge'), _entity('e8', 'Edge Functions', 'chunk_edge')],
+                           [_relationship('e7', 'e8', 0.7)])
+        assert index.refresh() and index.metrics['rebuilds'] == 2
+        print(f"✅ Rebuilt only after a new load (generation {index.generation})")
+
+        # Test 3: Latency budget truncates expansion instead of blowing the deadline
+        print("\nTest 3: Latency budget")
+        truncated = index.search('supabase auth', time_budget_ms=0)
+        assert truncated['truncated'] and truncated['results'][0]['source'] == 'chunk_auth'
+        assert index.metrics['budget_exceeded'] == 1
+        print(f"✅ Zero budget: {truncated['expanded']} entities reached, seeds still scored")
+
+        # Test 4: Graph leg is fused with BM25 through RRF
+        print("\nTest 4: Hybrid search fusion")
+        strategy = HybridSearchStrategy()
+        strategy.config['cache_enabled'] = False
+        strategy.add_documents([{'id': doc_id, 'content': content} for doc_id, content in CHUNKS.items()])
+        strategy.attach_graph_store(store)
+        results = await strategy.perform_hybrid_search('supabase auth', {'source': 'graph_test'})
+        by_content = {result['content']: result for result in results}
+        assert set(results[0]['search_types']) == {'keyword', 'graph'} and results[0]['boosted']
+        # Found only through the graph: shares no terms with the query
+        rls = by_content[CHUNKS['chunk_rls']]
+        assert rls['search_types'] == ['graph'] and rls['graph_rank'] is not None
+        assert 'row level security' in rls['graph_entities']
+        # Sources missing from the keyword index are skipped
+        assert set(by_content) <= set(CHUNKS.values())
+        assert strategy.get_metrics()['graph_search_calls'] == 1
+        print(f"✅ {len(results)} fused results, graph-only hit at rank {rls['final_rank']}")
+        store.close()
+
+        # Test 5: Ingestion with an ECL pipeline feeds the graph leg with chunk ids
+        print("\nTest 5: Ingestion wiring")
+        os.environ[BACKEND_ENV_VAR] = 'hashed_ngram'
+        try:
+            root = Path(temp_dir) / 'memory'
+            root.mkdir()
+            (root / 'stack.md').write_text(
+                "# Stack\n\n## Auth\n\nSupabase handles login for the React dashboard.\n\n"
+                "## Deploy\n\nDocker images ship the Supabase migrations together with the API.\n"
+            )
+            ecl_pipeline = CogneeECLPipeline()
+            ecl_pipeline.config['cache_enabled'] = False
+            ecl_pipeline.config['graph_store_path'] = Path(temp_dir) / 'ingested.db'
+            pipeline = MemoryIngestionPipeline(memory_root=root, manifest_path=Path(temp_dir) / 'manifest.json',
+                                               ecl_pipeline=ecl_pipeline)
+            pipeline.contextual_embeddings.config['cache_enabled'] = False
+            await pipeline.ingest()
+            graph_results = pipeline.hybrid_search._perform_graph_search('docker', {})
+            assert graph_results and graph_results[0]['metadata']['doc_id'] in pipeline.manifest['chunks']
+            ecl_pipeline.close()
+            print(f"✅ {len(graph_results)} chunks reachable from 'docker'")
+
+            # Test 6: Coordinator corpus ingestion fills the graph its hybrid search reads
+            print("\nTest 6: Coordinator wiring")
+            (root / 'infra.md').write_text(
+                "# Infra\n\n## Containers\n\nDocker runs Redis next to the PostgreSQL primary.\n\n"
+                "## Cache\n\nRedis keeps the session cache warm between deploys.\n"
+            )
+            coordinator = CentralMemoryCoordinator()
+            coordinator.config['memory_root'] = root
+            coordinator.config['ingestion_manifest_path'] = Path(temp_dir) / 'coordinator_manifest.json'
+            coordinator.cognee_pipeline.close()
+            coordinator.cognee_pipeline.config['cache_enabled'] = False
+            coordinator.cognee_pipeline.config['graph_store_path'] = Path(temp_dir) / 'coordinator.db'
+            hybrid_search = coordinator.crawl4ai_strategies['hybrid_search']
+            hybrid_search.attach_graph_store(coordinator.cognee_pipeline.get_graph_store())
+            hybrid_search.config['cache_enabled'] = False
+            coordinator.crawl4ai_strategies['contextual_embeddings'].config['cache_enabled'] = False
+
+            summary = await coordinator.ingest_memory_corpus()
+            assert coordinator.ingestion_pipeline.ecl_pipeline is coordinator.cognee_pipeline
+            assert coordinator.cognee_pipeline.get_graph_store().get_metrics()['entities'] > 0
+            # stack.md never mentions containers, it is reached through Containers -> Docker
+            results = await hybrid_search.perform_hybrid_search('containers', {'source': 'graph_test'})
+            graph_hits = [result for result in results if 'graph' in result['search_types']]
+            assert any(hit['search_types'] == ['graph'] and 'Supabase handles login' in hit['content'] for hit in graph_hits)
+            coordinator.cognee_pipeline.close()
+            print(f"✅ {summary['chunks_added']} chunks ingested, {len(graph_hits)} graph-leg hits in fused results")
+        finally:
+            del os.environ[BACKEND_ENV_VAR]
+
+    print("\n✅ [GRAPH RETRIEVAL TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_graph_retrieval())
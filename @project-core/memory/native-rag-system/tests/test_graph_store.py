@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+"""
+KNOWLEDGE GRAPH STORE TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the persistent SQLite knowledge graph.
+Validates entity deduplication, edge strength accumulation across sources,
+per-source replace and retraction, neighbourhood queries, persistence across
+connections and the ECL LOAD phase integration.
+"""
+
+import asyncio
+import tempfile
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from cognee_ecl_pipeline.graph_store import KnowledgeGraphStore, normalize_entity_name
+from cognee_ecl_pipeline.ecl_pipeline import CogneeECLPipeline
+
+def _entity(entity_id, name, entity_type, source='doc_a', confidence=0.8, frequency=1):
+    return {
+        'id': entity_id,
+        'name': name,
+        'type': entity_type,
+        'confidence': confidence,
+        'source': source,
+        'properties': {'frequency': frequency}
+    }
+
+def _relationship(source_entity, target_entity, strength, relationship_type='RELATED_TO'):
+    return {
+        'source_entity': source_entity,
+        'target_entity': target_entity,
+        'relationship_type': relationship_type,
+        'strength': strength,
+        'confidence': strength
+    }
+
+async def test_graph_store():
+    """Test knowledge graph store functionality"""
+    print("🧪 [GRAPH STORE TESTS] Starting tests...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = Path(temp_dir) / 'graph.db'
+        store = KnowledgeGraphStore(db_path)
+
+        # Test 1: Entities deduplicate by normalized name and type
+        print("\nTest 1: Entity upserts")
+        assert normalize_entity_name('  Supabase   Auth ') == 'supabase auth'
+        store.upsert_graph(
+            [_entity('a1', 'React', 'TECHNOLOGY', frequency=3), _entity('a2', 'react', 'TECHNOLOGY', confidence=0.9),
+             _entity('a3', 'React', 'CONCEPT'), _entity('a4', 'Supabase Auth', 'CONCEPT')],
+            []
+        )
+        store.upsert_graph([_entity('b1', 'REACT', 'TECHNOLOGY', source='doc_b', frequency=2)], [])
+        react = store.get_entity('React', 'TECHNOLOGY')
+        assert len(react) == 1 and react[0]['mentions'] == 6 and react[0]['confidence'] == 0.9
+        assert len(store.get_entity('react')) == 2
+        sources = store.entity_sources(react[0]['id'])
+        assert [(s['source'], s['mentions']) for s in sources] == [('doc_a', 4), ('doc_b', 2)]
+        print(f"✅ React: {react[0]['mentions']} mentions across {len(sources)} sources")
+
+        # Test 2: Edge strength accumulates across sources
+        print("\nTest 2: Edge upserts")
+        for run in range(3):
+            result = store.upsert_graph(
+                [_entity(f'r{run}_1', 'React', 'TECHNOLOGY', source=f'run_{run}'),
+                 _entity(f'r{run}_2', 'Supabase Auth', 'CONCEPT', source=f'run_{run}'),
+                 _entity(f'r{run}_3', 'Docker', 'TECHNOLOGY', source=f'run_{run}')],
+                [_relationship(f'r{run}_1', f'r{run}_2', 0.5), _relationship(f'r{run}_1', f'r{run}_3', 0.2),
+                 _relationship(f'r{run}_1', 'missing', 0.9)]
+            )
+            assert result['edges_upserted'] == 2 and result['edges_skipped'] == 1
+        edges = store.neighbors([react[0]['id']])
+        assert [edge['neighbor']['name'] for edge in edges] == ['Supabase Auth', 'Docker']
+        assert abs(edges[0]['strength'] - 1.5) < 1e-9 and edges[0]['observations'] == 3
+        print(f"✅ React -> Supabase Auth strength {edges[0]['strength']:.2f} over {edges[0]['observations']} sources")
+
+        # Test 3: Neighbourhood queries work from either endpoint and filter by strength
+        print("\nTest 3: Neighbourhood queries")
+        docker = store.get_entity('docker')[0]
+        incoming = store.neighbors([docker['id']])
+        assert incoming[0]['direction'] == 'in' and incoming[0]['neighbor']['name'] == 'React'
+        assert len(store.neighbors([react[0]['id']], min_strength=1.0)) == 1
+        assert [e['name'] for e in store.find_entities('supa')] == ['Supabase Auth']
+        assert {e['type'] for e in store.find_entities(entity_type='TECHNOLOGY')} == {'TECHNOLOGY'}
+        print(f"✅ Docker <- {incoming[0]['neighbor']['name']} ({incoming[0]['relationship_type']})")
+
+        # Test 4: Graph survives reopening the database
+        print("\nTest 4: Persistence")
+        store.close()
+        reopened = KnowledgeGraphStore(db_path)
+        metrics = reopened.get_metrics()
+        assert metrics['entities'] == 4 and metrics['edges'] == 2
+        reopened.close()
+        print(f"✅ {metrics['entities']} entities, {metrics['edges']} edges after reopen")
+
+        # Test 5: Reloading a source replaces its contribution and retracts what it dropped
+        print("\nTest 5: Per-source replace")
+        store = KnowledgeGraphStore(Path(temp_dir) / 'replace.db')
+        for _ in range(3):
+            store.upsert_graph(
+                [_entity('d1', 'Docker', 'TECHNOLOGY', frequency=2), _entity('d2', 'React', 'TECHNOLOGY'),
+                 _entity('d3', 'Redis', 'TECHNOLOGY')],
+                [_relationship('d1', 'd2', 0.4), _relationship('d1', 'd3', 0.3)]
+            )
+        store.upsert_graph([_entity('o1', 'Docker', 'TECHNOLOGY', source='doc_b'), _entity('o2', 'React', 'TECHNOLOGY', source='doc_b')],
+                           [_relationship('o1', 'o2', 0.2)])
+        docker = store.get_entity('Docker')[0]
+        edges = store.neighbors([docker['id']])
+        assert docker['mentions'] == 3 and abs(edges[0]['strength'] - 0.6) < 1e-9 and edges[0]['observations'] == 2
+
+        # doc_a no longer mentions Redis and lowers its Docker count
+        result = store.upsert_graph([_entity('e1', 'Docker', 'TECHNOLOGY'), _entity('e2', 'React', 'TECHNOLOGY')],
+                                    [_relationship('e1', 'e2', 0.1)])
+        docker = store.get_entity('Docker')[0]
+        edges = store.neighbors([docker['id']])
+        assert result['entities_retracted'] == 1 and store.get_entity('Redis') == []
+        assert docker['mentions'] == 2 and [e['neighbor']['name'] for e in edges] == ['React']
+        assert abs(edges[0]['strength'] - 0.3) < 1e-9
+        assert [(s['source'], s['mentions']) for s in store.entity_sources(docker['id'])] == [('doc_a', 1), ('doc_b', 1)]
+
+        # Removing a source retracts only what nobody else mentions
+        generation = store.generation()
+        assert store.remove_sources(['doc_b'])['entities_retracted'] == 0
+        edges = store.neighbors([docker['id']])
+        assert store.get_entity('Docker')[0]['mentions'] == 1 and abs(edges[0]['strength'] - 0.1) < 1e-9
+        assert store.remove_sources(['doc_a'])['entities_retracted'] == 2 and store.get_metrics()['edges'] == 0
+        assert store.generation() == generation + 2 and store.remove_sources(['doc_a'])['entities_retracted'] == 0
+        store.close()
+        print(f"✅ Docker {docker['mentions']} mentions, edge strength 0.30, Redis retracted, removed sources retracted")
+
+        # Test 6: ECL LOAD phase upserts into the store in both performance modes
+        print("\nTest 6: ECL LOAD integration")
+        content = ("# React Architecture\nReact uses Supabase for auth. Docker runs React and Supabase.\n"
+                   "def render_page(props): return React\n")
+        for mode in ('optimized', 'standard'):
+            pipeline = CogneeECLPipeline()
+            pipeline.config['cache_enabled'] = False
+            pipeline.config['bridge_integration'] = False
+            pipeline.config['performance_mode'] = mode
+            pipeline.config['graph_store_path'] = Path(temp_dir) / f'ecl_{mode}.db'
+
+            for _ in range(2):
+                result = await pipeline.execute_ecl_pipeline(content, f'{mode}_doc', {'source': f'{mode}_doc'})
+            graph_result = result['load']['graph_store_result']
+            assert graph_result['success'] and graph_result['entities_upserted'] > 0
+
+            graph_store = pipeline.get_graph_store()
+            supabase = graph_store.get_entity('Supabase', 'TECHNOLOGY')
+            assert len(supabase) == 1
+            assert graph_store.entity_sources(supabase[0]['id'])[0]['source'] == f'{mode}_doc'
+            if result['cognify']['relationships']:
+                assert graph_store.get_metrics()['edges'] > 0
+            pipeline.close()
+            print(f"✅ {mode}: {graph_result['entities_upserted']} entities, {graph_result['edges_upserted']} edges")
+
+        # Test 7: Query-time runs leave the graph alone, batch documents sharing a source stay apart
+        print("\nTest 7: Read-only runs and batch loads")
+        pipeline = CogneeECLPipeline()
+        pipeline.config['cache_enabled'] = False
+        pipeline.config['bridge_integration'] = False
+        pipeline.config['worker_processes'] = 0
+        pipeline.config['graph_store_path'] = Path(temp_dir) / 'ecl_batch.db'
+        graph_store = pipeline.get_graph_store()
+
+        result = await pipeline.execute_ecl_pipeline(content, 'query', {'source': 'query', 'persist_graph': False})
+        assert result['load']['graph_store_result']['reason'] == 'read_only'
+        assert graph_store.generation() == 0 and graph_store.get_metrics()['entities'] == 0
+
+        batch = await pipeline.execute_ecl_batch([
+            {'content': "React uses Supabase for auth.", 'source': 'shared'},
+            {'content': "Docker runs PostgreSQL and TypeScript services.", 'source': 'shared'}
+        ])
+        names = {e['name'].lower() for e in graph_store.find_entities(limit=100)}
+        assert {'react', 'supabase', 'docker', 'typescript'} <= names
+        docker_neighbors = {edge['neighbor']['name'] for edge in graph_store.neighbors([graph_store.get_entity('Docker')[0]['id']])}
+        react_neighbors = {edge['neighbor']['name'] for edge in graph_store.neighbors([graph_store.get_entity('React')[0]['id']])}
+        assert docker_neighbors == {'TypeScript'} and react_neighbors == {'Supabase'}
+        assert graph_store.generation() == 1
+        pipeline.close()
+        print(f"✅ Query run wrote nothing, batch loaded {len(names)} entities from "
+              f"{batch['metadata']['documents']} documents")
+
+    print("\n✅ [GRAPH STORE TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_graph_store())
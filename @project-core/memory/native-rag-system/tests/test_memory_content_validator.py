@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+"""
+MEMORY CONTENT VALIDATOR TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the MinHash-LSH duplicate check in memory-content-validator.py.
+Validates that LSH candidates cover every entry the exact pairwise
+SequenceMatcher scan flags (including a near-duplicate just above the
+threshold), and that signatures persist under the cache directory.
+"""
+
+import asyncio
+import difflib
+import importlib.util
+import random
+import tempfile
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+VALIDATOR_PATH = Path(__file__).parent.parent.parent / 'memory-content-validator.py'
+
+# Synthetic vocabulary, varied enough that unrelated entries share few shingles
+_vocabulary_rng = random.Random(0)
+WORDS = [
+    ''.join(_vocabulary_rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(_vocabulary_rng.randint(4, 9)))
+    for _ in range(600)
+]
+
+def load_validator_module():
+    """memory-content-validator.py is a script (hyphenated name), load it by path"""
+    spec = importlib.util.spec_from_file_location('memory_content_validator', VALIDATOR_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def _section(rng: random.Random, index: int) -> str:
+    lines = [' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 14))) for _ in range(rng.randint(3, 6))]
+    return f"ENTRY {index} - {lines[0].title()}\n\n" + '\n'.join(f"- {line}" for line in lines[1:])
+
+def _mutate(rng: random.Random, text: str, words: int) -> str:
+    tokens = text.split(' ')
+    for position in rng.sample(range(len(tokens)), min(words, len(tokens))):
+        tokens[position] = rng.choice(WORDS) + 'x'
+    return ' '.join(tokens)
+
+def _ratio(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a.lower(), b.lower()).ratio()
+
+async def test_memory_content_validator():
+    """Test memory content validator duplicate detection"""
+    print("🧪 [MEMORY CONTENT VALIDATOR TESTS] Starting tests...")
+
+    module = load_validator_module()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = Path(temp_dir) / 'self_correction_log.md'
+        sections = [_section(rng, index) for index in range(300)]
+        log_path.write_text('# Log\n\n' + ''.join(f"## {section}\n\n" for section in sections), encoding='utf-8')
+
+        validator = module.MemoryContentValidator()
+        validator.memory_files = {'self_correction_log': log_path}
+        validator.config['signature_cache_dir'] = Path(temp_dir) / 'cache'
+        validator.load_existing_content()
+        entries = validator.existing_content['self_correction_log']
+        threshold = validator.config['similarity_threshold']
+
+        # Test 1: LSH candidates cover the exact pairwise result
+        print("\nTest 1: LSH candidates against the exact pairwise scan")
+        try:
+            # Mutate one word at a time until no further edit stays above the threshold
+            target = entries[42]
+            near_duplicate = target
+            attempts = 0
+            while attempts < 50:
+                candidate = _mutate(rng, near_duplicate, 1)
+                if _ratio(candidate, target) < threshold:
+                    attempts += 1
+                    continue
+                near_duplicate = candidate
+            near_ratio = _ratio(near_duplicate, target)
+            assert threshold <= near_ratio < threshold + 0.03, f"near-duplicate ratio {near_ratio:.3f}"
+
+            queries = [near_duplicate] + [
+                _mutate(rng, entries[rng.randrange(len(entries))], rng.randint(1, 6)) for _ in range(60)
+            ] + [_section(rng, 1000 + index) for index in range(20)]
+
+            flagged = missed = 0
+            for query in queries:
+                exact = {position for position, entry in enumerate(entries) if _ratio(query, entry) >= threshold}
+                candidates = set(validator._lsh_candidates(validator._minhash_signature(query), 'self_correction_log'))
+                missed += len(exact - candidates)
+                flagged += len(exact)
+                assert validator._check_duplicates(query, 'self_correction_log')['is_duplicate'] == bool(exact)
+
+            near_candidates = validator._lsh_candidates(validator._minhash_signature(near_duplicate), 'self_correction_log')
+            assert entries.index(target) in near_candidates
+            assert missed == 0 and flagged > 30, f"{missed}/{flagged} exact matches missed"
+            stats = validator.duplicate_stats
+            assert stats['candidates_checked'] < stats['validations'] * len(entries) / 10
+            print(f"✅ {flagged} exact matches over {len(queries)} queries all in LSH candidates "
+                  f"(near-duplicate at ratio {near_ratio:.3f}); "
+                  f"{stats['candidates_checked'] / stats['validations']:.1f} candidates per check of {len(entries)}")
+
+        except Exception as e:
+            print(f"❌ Test 1 failed: {e}")
+
+        # Test 2: Signatures persist in the cache directory, not next to the memory file
+        print("\nTest 2: Signature cache location and reuse")
+        try:
+            cache_path = Path(temp_dir) / 'cache' / 'self_correction_log.minhash.json'
+            assert cache_path.exists() and not list(Path(temp_dir).glob('*.minhash.json'))
+
+            reloaded = module.MemoryContentValidator()
+            reloaded.memory_files = {'self_correction_log': log_path}
+            reloaded.config['signature_cache_dir'] = Path(temp_dir) / 'cache'
+            signature_calls = []
+            original = reloaded._minhash_signature
+            reloaded._minhash_signature = lambda content: signature_calls.append(content) or original(content)
+            reloaded.load_existing_content()
+            assert signature_calls == [] and reloaded.signatures == validator.signatures
+            print(f"✅ {len(reloaded.signatures['self_correction_log'])} signatures reloaded from {cache_path.parent.name}/")
+
+        except Exception as e:
+            print(f"❌ Test 2 failed: {e}")
+
+    print("\n✅ [MEMORY CONTENT VALIDATOR TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_memory_content_validator())
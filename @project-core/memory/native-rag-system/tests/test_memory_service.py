@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+
+"""
+MEMORY SERVICE DAEMON TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the resident memory service.
+Validates the socket API, pipelined client requests, graceful reload with
+warm state, the endpoint file, the command line client, the service-first
+coordinator callers use (in-process fallback when no daemon is running) and
+token authentication on the TCP transport.
+"""
+
+import asyncio
+import json
+import os
+import stat
+import tempfile
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.bridge_protocol import encode_message, read_message
+from integration.deadline import Deadline
+from integration.mcp_integration import MCPWorkflowIntegration
+from integration.memory_service import (
+    MemoryService, MemoryServiceClient, MemoryServiceCoordinator, MemoryServiceError, connect_memory_service, main
+)
+
+class WarmCoordinator:
+    """Coordinator double: a slow first call stands in for cold-start loading"""
+
+    def __init__(self):
+        self.config = {'cache_enabled': True}
+        self.intelligent_cache = {}
+        self.preload_cache = {}
+        self.loaded = False
+        self.ingest_calls = 0
+        self.consultations = 0
+
+    async def initialize(self):
+        return True
+
+    async def coordinate_memory_consultation(self, query, context=None, deadline=None):
+        if not self.loaded:
+            await asyncio.sleep(0.3)
+            self.loaded = True
+        await asyncio.sleep(0.01)
+        self.consultations += 1
+        self.intelligent_cache[query] = True
+        return {'success': True, 'query': query, 'source': (context or {}).get('source'), 'scores': {0.5, 0.75}}
+
+    async def coordinate_memory_consultations_batch(self, queries, context=None, deadline=None):
+        return list(await asyncio.gather(*(self.coordinate_memory_consultation(query, context) for query in queries)))
+
+    async def ingest_memory_corpus(self, paths=None):
+        self.ingest_calls += 1
+        return {'files_changed': 0, 'paths': paths}
+
+    async def index_code_repository(self):
+        return {'files_analyzed': 0}
+
+    async def health_check(self):
+        return {'status': 'healthy'}
+
+    def get_metrics(self):
+        return {'total_consultations': self.consultations}
+
+async def test_memory_service():
+    """Test memory service daemon functionality"""
+    print("🧪 [MEMORY SERVICE TESTS] Starting tests...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        config_path = temp_path / 'service.json'
+        endpoint_file = temp_path / 'endpoint.json'
+        coordinator = WarmCoordinator()
+        service = MemoryService(socket_path=temp_path / 'memory.sock', coordinator=coordinator,
+                                config_path=config_path, endpoint_file=endpoint_file)
+        await service.start()
+
+        # Test 1: Endpoint discovery and warm-up
+        print("\nTest 1: Start and endpoint discovery")
+        try:
+            endpoint = json.loads(endpoint_file.read_text())
+            assert endpoint['transport'] == 'unix' and endpoint['path'] == str(temp_path / 'memory.sock')
+            assert stat.S_IMODE(os.stat(temp_path / 'memory.sock').st_mode) == 0o600
+            client = await connect_memory_service(endpoint_file=endpoint_file)
+            assert client is not None and (await client.ping())['pong']
+            await asyncio.sleep(0.05)
+            assert coordinator.ingest_calls == 1  # background warm-up
+            assert await connect_memory_service(endpoint_file=temp_path / 'missing.json') is None
+            print(f"✅ Service listening at {client.address}")
+        except Exception as e:
+            print(f"❌ Test 1 failed: {e}")
+
+        # Test 2: Consultations pay the cold start once
+        print("\nTest 2: Steady-state consultations")
+        try:
+            start_time = time.perf_counter()
+            first = await client.consult('react hooks patterns', {'source': 'test'})
+            cold_ms = (time.perf_counter() - start_time) * 1000
+            start_time = time.perf_counter()
+            second = await client.consult('supabase auth')
+            warm_ms = (time.perf_counter() - start_time) * 1000
+            assert first['success'] and first['source'] == 'test' and sorted(first['scores']) == [0.5, 0.75]
+            assert second['query'] == 'supabase auth' and warm_ms < cold_ms / 3
+            print(f"✅ First consultation {cold_ms:.1f}ms, next {warm_ms:.1f}ms")
+        except Exception as e:
+            print(f"❌ Test 2 failed: {e}")
+
+        # Test 3: Pipelined requests, batch and errors on one connection
+        print("\nTest 3: Pipelined requests")
+        try:
+            results = await asyncio.gather(*(client.consult(f"query {i}") for i in range(8)),
+                                           client.batch(['a', 'b', 'c']), client.ingest(['notes.md']))
+            assert [r['query'] for r in results[:8]] == [f"query {i}" for i in range(8)]
+            assert [r['query'] for r in results[8]] == ['a', 'b', 'c'] and results[9]['paths'] == ['notes.md']
+            try:
+                await client.call('drop_tables')
+                assert False, 'unknown method accepted'
+            except MemoryServiceError as error:
+                assert 'Unknown method' in str(error)
+            metrics = await client.metrics()
+            assert metrics['service']['requests_by_method']['consult'] == 10
+            assert metrics['service']['requests_failed'] == 1 and metrics['coordinator']['total_consultations'] == 13
+            print(f"✅ {metrics['service']['requests_total']} requests, average {metrics['service']['average_request_time']:.1f}ms")
+        except Exception as e:
+            print(f"❌ Test 3 failed: {e}")
+
+        # Test 4: Graceful reload drains requests and keeps warm state
+        print("\nTest 4: Graceful reload")
+        try:
+            config_path.write_text(json.dumps({'coordinator': {'cache_enabled': False}, 'service': {'max_concurrent_requests': 4}}))
+            second_client = await MemoryServiceClient(endpoint_file=endpoint_file).connect()
+            slow = asyncio.ensure_future(second_client.consult('in flight'))
+            await asyncio.sleep(0.005)
+            reload = await client.reload()
+            assert slow.done() and (await slow)['query'] == 'in flight'  # drained before the reload ran
+            assert reload['config_applied'] and reload['cache_entries_cleared'] == 14
+            assert coordinator.config['cache_enabled'] is False and service.config['max_concurrent_requests'] == 4
+            assert coordinator.loaded and coordinator.intelligent_cache == {} and coordinator.ingest_calls == 3
+            assert (await second_client.consult('after reload'))['success']
+            await second_client.close()
+            print(f"✅ Reloaded in {reload['reload_time_ms']:.1f}ms, warm state kept")
+        except Exception as e:
+            print(f"❌ Test 4 failed: {e}")
+
+        # Test 5: Command line client and shutdown
+        print("\nTest 5: CLI and shutdown")
+        try:
+            socket_path = str(temp_path / 'memory.sock')
+            exit_code = await asyncio.to_thread(main, ['--socket', socket_path, 'consult', 'cli query'])
+            assert exit_code == 0
+            assert (await client.shutdown())['stopping']
+            await client.close()
+            await asyncio.wait_for(service._stopped.wait(), 5)
+            assert not endpoint_file.exists() and not Path(socket_path).exists()
+            assert await asyncio.to_thread(main, ['--socket', socket_path, 'ping']) == 2
+            print("✅ CLI consultation succeeded, service stopped and cleaned up")
+        except Exception as e:
+            print(f"❌ Test 5 failed: {e}")
+
+        # Test 6: Callers use the daemon when it runs, in-process otherwise
+        print("\nTest 6: Service-first coordinator with in-process fallback")
+        try:
+            # No daemon: MCP integration initializes an in-process coordinator
+            integration = MCPWorkflowIntegration()
+            offline = integration.memory_coordinator
+            assert isinstance(offline, MemoryServiceCoordinator)
+            local = WarmCoordinator()
+            offline.endpoint_file = temp_path / 'missing.json'
+            offline.fallback_factory = lambda: local
+
+            async def component_ready():
+                return True
+
+            integration.augment_bridge.initialize = component_ready
+            integration.crosscheck_system.initialize = component_ready
+            await integration._initialize_native_components()
+            assert integration.get_integration_status()['components_status']['memory_backend'] == 'in_process'
+            assert (await offline.coordinate_memory_consultation('offline', {'source': 'test'}))['source'] == 'test'
+            assert local.consultations == 1 and offline.metrics['in_process_requests'] == 1
+
+            # Daemon running: requests go to it, deadlines travel as timeouts
+            remote = WarmCoordinator()
+            service = MemoryService(socket_path=temp_path / 'memory.sock', coordinator=remote, endpoint_file=endpoint_file)
+            service.config['warm_start'] = False
+            await service.start()
+            fallback = WarmCoordinator()
+            routed = MemoryServiceCoordinator(endpoint_file=endpoint_file, fallback_factory=lambda: fallback)
+            assert await routed.initialize() and routed.backend == 'service'
+            result = await routed.coordinate_memory_consultation('online', {'source': 'test'}, deadline=Deadline(5))
+            batch = await routed.coordinate_memory_consultations_batch(['a', 'b'])
+            assert result['query'] == 'online' and [r['query'] for r in batch] == ['a', 'b']
+            assert remote.consultations == 3 and fallback.consultations == 0
+
+            # Daemon stops mid-session: the next call runs in-process
+            await service.stop()
+            result = await routed.coordinate_memory_consultation('after stop')
+            assert result['query'] == 'after stop' and routed.backend == 'in_process' and fallback.consultations == 1
+            assert routed.metrics == {'service_requests': 2, 'in_process_requests': 1, 'fallback_activations': 1}
+
+            # The CLI only refuses without a daemon when asked to
+            missing_socket = str(temp_path / 'missing.sock')
+            assert await asyncio.to_thread(main, ['--socket', missing_socket, '--require-service', 'consult', 'x']) == 2
+            print(f"✅ In-process without a daemon, {routed.metrics['service_requests']} requests via the service, "
+                  f"fell back after it stopped")
+        except Exception as e:
+            print(f"❌ Test 6 failed: {e}")
+
+        # Test 7: The TCP transport only serves requests carrying the token
+        print("\nTest 7: TCP token authentication")
+        try:
+            tcp_endpoint = temp_path / 'tcp-endpoint.json'
+            token_file = temp_path / 'tcp-endpoint.token'
+            tcp_coordinator = WarmCoordinator()
+            service = MemoryService(port=0, coordinator=tcp_coordinator, endpoint_file=tcp_endpoint)
+            service.config['warm_start'] = False
+            await service.start()
+            assert json.loads(tcp_endpoint.read_text())['transport'] == 'tcp'
+            assert stat.S_IMODE(os.stat(token_file).st_mode) == 0o600 and len(token_file.read_text()) == 64
+
+            # A local process that cannot read the token file gets nothing done
+            reader, writer = await asyncio.open_connection(*service.address)
+            for request in ({'id': 1, 'method': 'shutdown', 'params': {}},
+                            {'id': 2, 'method': 'ingest', 'params': {}, 'token': 'guess'},
+                            {'id': 3, 'method': 'ping', 'params': {}, 'token': None}):
+                writer.write(encode_message(request))
+                await writer.drain()
+                response = await read_message(reader)
+                assert response['id'] == request['id'] and not response['ok'] and 'token' in response['error']
+            writer.close()
+            assert service.metrics['requests_rejected'] == 3 and service.metrics['requests_total'] == 0
+            assert tcp_coordinator.ingest_calls == 0 and not service._stopped.is_set()
+
+            # The coordinator's client reads the token next to the endpoint file and sends it
+            routed = MemoryServiceCoordinator(endpoint_file=tcp_endpoint, fallback_factory=WarmCoordinator)
+            assert await routed.initialize() and routed.backend == 'service'
+            assert (await routed.coordinate_memory_consultation('over tcp'))['query'] == 'over tcp'
+            assert (await routed.ingest_memory_corpus())['files_changed'] == 0 and tcp_coordinator.ingest_calls == 1
+            await routed.close()
+
+            # Without the token file a client does not connect (callers fall back in-process)
+            tokenless = MemoryServiceClient(endpoint_file=tcp_endpoint, token_file=temp_path / 'missing.token')
+            try:
+                await tokenless.connect()
+                assert False, 'connected without a token'
+            except ConnectionError as error:
+                assert 'token' in str(error)
+
+            await service.stop()
+            assert not token_file.exists() and not tcp_endpoint.exists()
+            print(f"✅ {service.metrics['requests_rejected']} unauthenticated requests rejected, "
+                  f"token client served, token file 0600")
+        except Exception as e:
+            print(f"❌ Test 7 failed: {e}")
+
+    print("\n✅ [MEMORY SERVICE TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_memory_service())
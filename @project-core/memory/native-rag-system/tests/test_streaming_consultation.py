@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+"""
+STREAMING CONSULTATION TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for streaming memory consultations.
+Validates partial results in completion order, the final aggregated event,
+caching of the final result and cancellation when a caller stops early.
+"""
+
+import asyncio
+import tempfile
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from central_hub.memory_coordinator import (
+    CentralMemoryCoordinator, ConsultationPartialResult, ConsultationFinalResult
+)
+
+# Simulated strategy latencies (seconds); routing lists the slow ones first
+STRATEGY_DELAYS = {'enhanced_memory': 0.3, 'crawl4ai_rag': 0.15, 'self_correction': 0.01}
+
+def make_coordinator(cache_dir: Path) -> CentralMemoryCoordinator:
+    coordinator = CentralMemoryCoordinator()
+    coordinator.cache_dir = cache_dir
+    coordinator.cache_dir.mkdir()
+    coordinator.config['mcp_integration'] = False
+    coordinator.cancelled = []
+
+    async def routing(query, context):
+        return {
+            'execution_order': list(STRATEGY_DELAYS),
+            'fallback_chain': ['self_correction'],
+            'query_analysis': {}
+        }
+
+    async def strategy(strategy_name, query, context):
+        try:
+            await asyncio.sleep(STRATEGY_DELAYS[strategy_name])
+        except asyncio.CancelledError:
+            coordinator.cancelled.append(strategy_name)
+            raise
+        if strategy_name == 'crawl4ai_rag' and 'fail' in query:
+            raise RuntimeError('index unavailable')
+        return {'success': True, 'data': {'query': query, 'source': strategy_name}, 'strategy': strategy_name}
+
+    coordinator._make_routing_decision = routing
+    coordinator._execute_single_strategy = strategy
+    return coordinator
+
+async def test_streaming_consultation():
+    """Test streaming consultation functionality"""
+    print("🧪 [STREAMING CONSULTATION TESTS] Starting tests...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        coordinator = make_coordinator(temp_path / 'stream-cache')
+
+        # Test 1: Partial results arrive as strategies complete
+        print("\nTest 1: Partial results in completion order")
+        try:
+            start_time = time.perf_counter()
+            events = []
+            first_ms = None
+            async for event in coordinator.stream_memory_consultation("react hooks", {'source': 'test_stream'}):
+                if first_ms is None:
+                    first_ms = (time.perf_counter() - start_time) * 1000
+                events.append(event)
+
+            partials, final = events[:-1], events[-1]
+            assert all(isinstance(event, ConsultationPartialResult) for event in partials)
+            assert isinstance(final, ConsultationFinalResult) and final.type == 'final' and not final.cached
+            assert [event.strategy for event in partials] == ['self_correction', 'crawl4ai_rag', 'enhanced_memory']
+            assert [event.completed for event in partials] == [1, 2, 3] and partials[0].total == 3
+            assert partials[0].results['data']['source'] == 'self_correction' and partials[0].confidence == 1.0
+            assert partials[0].elapsed_ms < partials[-1].elapsed_ms and first_ms < 150
+            print(f"✅ First partial after {first_ms:.1f}ms, final after {final.elapsed_ms:.1f}ms")
+        except Exception as e:
+            print(f"❌ Test 1 failed: {e}")
+
+        # Test 2: Final event matches the non-streaming result
+        print("\nTest 2: Final aggregated result")
+        try:
+            reference = await make_coordinator(temp_path / 'reference-cache').coordinate_memory_consultation(
+                "react hooks", {'source': 'test_stream'}
+            )
+            result = final.result
+            assert result['strategies_used'] == reference['strategies_used'] == list(STRATEGY_DELAYS)
+            assert result['results']['combined_data'] == reference['results']['combined_data']
+            assert result['metadata']['confidence_score'] == final.confidence == 1.0
+            assert final.elapsed_ms < sum(STRATEGY_DELAYS.values()) * 1000  # strategies overlapped
+            print(f"✅ Same strategies and data as coordinate_memory_consultation")
+        except Exception as e:
+            print(f"❌ Test 2 failed: {e}")
+
+        # Test 3: Final result is cached for both entry points
+        print("\nTest 3: Final result cached")
+        try:
+            events = [event async for event in coordinator.stream_memory_consultation("react hooks", {'source': 'test_stream'})]
+            assert len(events) == 1 and events[0].cached and events[0].result['strategies_used'] == list(STRATEGY_DELAYS)
+            cached = await coordinator.coordinate_memory_consultation("react hooks", {'source': 'test_stream'})
+            assert cached['results']['combined_data'] == final.result['results']['combined_data']
+            assert coordinator.metrics['cache_hits'] == 2 and coordinator.metrics['streamed_consultations'] == 2
+            print(f"✅ Cached result served to stream and coordinate_memory_consultation")
+        except Exception as e:
+            print(f"❌ Test 3 failed: {e}")
+
+        # Test 4: Failed strategies stream as failed partials
+        print("\nTest 4: Failed strategy partial")
+        try:
+            events = [event async for event in coordinator.stream_memory_consultation("fail fast", {'source': 'test_stream'})]
+            failed = [event for event in events[:-1] if not event.success]
+            assert [event.strategy for event in failed] == ['crawl4ai_rag']
+            assert failed[0].results['error'] == 'index unavailable' and failed[0].confidence == 0.5
+            assert events[-1].result['results']['failed_strategies'] == ['crawl4ai_rag']
+            assert abs(events[-1].confidence - 2 / 3) < 1e-9
+            print(f"✅ Failure reported at {failed[0].elapsed_ms:.1f}ms, final confidence {events[-1].confidence:.2f}")
+        except Exception as e:
+            print(f"❌ Test 4 failed: {e}")
+
+        # Test 5: Stopping early cancels the remaining strategies
+        print("\nTest 5: Early stop")
+        try:
+            stream = coordinator.stream_memory_consultation("supabase auth", {'source': 'test_stream'})
+            first = await stream.__anext__()
+            assert first.strategy == 'self_correction'
+            await stream.aclose()
+            await asyncio.sleep(0)
+            assert sorted(coordinator.cancelled) == ['crawl4ai_rag', 'enhanced_memory']
+            misses = coordinator.metrics['cache_misses']
+            events = [event async for event in coordinator.stream_memory_consultation("supabase auth", {'source': 'test_stream'})]
+            assert len(events) == 4 and coordinator.metrics['cache_misses'] == misses + 1  # nothing cached
+            print(f"✅ Remaining strategies cancelled: {sorted(coordinator.cancelled)}")
+        except Exception as e:
+            print(f"❌ Test 5 failed: {e}")
+
+    print("\n✅ [STREAMING CONSULTATION TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_streaming_consultation())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+"""
+TASK QUEUE TESTS V1.0
+GRUPO US VIBECODE SYSTEM - Native RAG Implementation
+
+Tests for the bounded priority work queue and its use in MCP workflow integration.
+Validates priority order, the worker bound, backpressure and admission rejection,
+latency-based load shedding, deadlines spent in the queue, caller cancellation
+and the overlapping memory consultation / project-core sync phases.
+"""
+
+import asyncio
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from integration.deadline import Deadline, DeadlineExceededError
+from integration.mcp_integration import MCPWorkflowIntegration
+from integration.task_queue import BoundedPriorityWorkQueue, QueueRejectedError
+
+class RecordingHandler:
+    """Handler that records start order and peak concurrency"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.started = []
+        self.cancelled = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, item, deadline):
+        self.started.append(item)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(item.get('delay', self.delay) if isinstance(item, dict) else self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(item)
+            raise
+        finally:
+            self.active -= 1
+        return {'item': item}
+
+async def test_task_queue():
+    """Test task queue functionality"""
+    print("🧪 [TASK QUEUE TESTS] Starting tests...")
+
+    # Test 1: Priority order and worker bound
+    print("\nTest 1: Priority order and worker bound")
+    try:
+        handler = RecordingHandler(0.05)
+        queue = BoundedPriorityWorkQueue(handler, workers=2, max_depth=16)
+        blockers = [asyncio.ensure_future(queue.submit(f'blocker-{i}', priority=0)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        submissions = [asyncio.ensure_future(queue.submit(f'p{priority}', priority=priority))
+                       for priority in (5, 1, 3, 1, 9)]
+        results = await asyncio.gather(*blockers, *submissions)
+
+        assert handler.started[2:] == ['p1', 'p1', 'p3', 'p5', 'p9']  # lowest first, FIFO on ties
+        assert handler.peak == 2 and results[2] == {'item': 'p5'}
+        assert queue.metrics['completed'] == 7 and queue.get_metrics()['depth'] == 0
+        await queue.stop()
+        print(f"✅ Started in order {handler.started[2:]}, peak concurrency {handler.peak}")
+    except Exception as e:
+        print(f"❌ Test 1 failed: {e}")
+
+    # Test 2: Backpressure, then rejection when the queue stays full
+    print("\nTest 2: Backpressure and admission rejection")
+    try:
+        handler = RecordingHandler(0.1)
+        queue = BoundedPriorityWorkQueue(handler, workers=1, max_depth=1, admission_wait=0.3)
+        running = [asyncio.ensure_future(queue.submit(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+
+        # Capacity frees up within the admission wait: the caller is held, not rejected
+        start_time = time.perf_counter()
+        assert await queue.submit('waited') == {'item': 'waited'}
+        assert time.perf_counter() - start_time >= 0.09 and queue.metrics['backpressure_waits'] == 1
+        await asyncio.gather(*running)
+
+        slow = BoundedPriorityWorkQueue(RecordingHandler(1.0), workers=1, max_depth=1, admission_wait=0.1)
+        running = [asyncio.ensure_future(slow.submit(i)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        start_time = time.perf_counter()
+        try:
+            await slow.submit('rejected')
+            assert False, 'full queue admitted a task'
+        except QueueRejectedError as error:
+            assert error.reason == 'queue_full'
+        assert time.perf_counter() - start_time < 0.3 and slow.metrics['rejected_queue_full'] == 1
+        await slow.stop(drain=False)
+        stopped = await asyncio.gather(*running, return_exceptions=True)
+        assert all(isinstance(error, QueueRejectedError) and error.reason == 'stopped' for error in stopped)
+        await queue.stop()
+        print("✅ Caller held until capacity freed, rejected when it did not")
+    except Exception as e:
+        print(f"❌ Test 2 failed: {e}")
+
+    # Test 3: Load shedding above the p95 latency target
+    print("\nTest 3: Latency load shedding")
+    try:
+        handler = RecordingHandler(0.02)
+        queue = BoundedPriorityWorkQueue(handler, workers=2, max_depth=10, target_p95_ms=10,
+                                         admission_wait=0.05, min_latency_samples=4)
+        await asyncio.gather(*(queue.submit(i) for i in range(4)))
+        assert queue.p95_latency_ms() > 10 and queue.get_metrics()['latency_overloaded']
+
+        handler.delay = 0.5
+        running = [asyncio.ensure_future(queue.submit(f'run-{i}')) for i in range(2)]
+        await asyncio.sleep(0.01)
+        try:
+            await queue.submit('shed')
+            assert False, 'overloaded queue admitted a task'
+        except QueueRejectedError as error:
+            assert error.reason == 'latency_target_exceeded' and error.retry_after_ms > 10
+        assert queue.metrics['rejected_latency'] == 1 and queue.depth == 0
+        await queue.stop(drain=False)
+        await asyncio.gather(*running, return_exceptions=True)
+        print(f"✅ Shed at p95 {queue.p95_latency_ms():.1f}ms with only {len(running)} tasks running")
+    except Exception as e:
+        print(f"❌ Test 3 failed: {e}")
+
+    # Test 4: Deadlines expire in the queue, cancelled callers free their slot
+    print("\nTest 4: Queue deadlines and caller cancellation")
+    try:
+        handler = RecordingHandler(0.2)
+        queue = BoundedPriorityWorkQueue(handler, workers=1, max_depth=8)
+        blocker = asyncio.ensure_future(queue.submit('blocker'))
+        await asyncio.sleep(0.01)
+        try:
+            await queue.submit('late', deadline=Deadline(0.05))
+            assert False, 'expired task ran'
+        except DeadlineExceededError:
+            pass
+        assert 'late' not in handler.started and queue.metrics['expired_in_queue'] == 1
+
+        running = asyncio.ensure_future(queue.submit({'delay': 5}))
+        await asyncio.sleep(0.05)
+        running.cancel()
+        try:
+            await running
+        except asyncio.CancelledError:
+            pass
+        await asyncio.sleep(0.01)
+        assert handler.cancelled == [{'delay': 5}] and queue.get_metrics()['running'] == 0
+        await blocker
+        await queue.stop()
+        print("✅ Expired task dropped before running, cancelled caller's handler cancelled")
+    except Exception as e:
+        print(f"❌ Test 4 failed: {e}")
+
+    # Test 5: MCP tasks through the queue with overlapping phases
+    print("\nTest 5: MCP submit_task")
+    try:
+        integration = MCPWorkflowIntegration()
+        integration.mcp_config['queue_workers'] = 2
+        integration.mcp_config['queue_max_depth'] = 1
+        integration.mcp_config['queue_admission_wait'] = 0.05
+        calls = {'syncs': 0}
+
+        async def consultation(query, context=None, deadline=None):
+            await asyncio.sleep(0.2)
+            return {'success': True, 'query': query}
+
+        async def sync():
+            calls['syncs'] += 1
+            await asyncio.sleep(0.2)
+            return {'success': True, 'synced': calls['syncs']}
+
+        integration.memory_coordinator.coordinate_memory_consultation = consultation
+        integration.augment_bridge.sync_with_project_core = sync
+
+        start_time = time.perf_counter()
+        tasks = [
+            {'task_id': f'task-{i}', 'description': f'Implement feature {i}', 'complexity': complexity}
+            for i, complexity in enumerate((3, 6, 4, 8))
+        ]
+        results = await asyncio.gather(*(integration.submit_task(task) for task in tasks))
+        elapsed = time.perf_counter() - start_time
+
+        admitted = [result for result in results if not result.get('admission_rejected')]
+        rejected = [result for result in results if result.get('admission_rejected')]
+        assert len(admitted) == 3 and rejected[0]['task_id'] == 'task-3' and rejected[0]['reason'] == 'queue_full'
+        assert rejected[0]['retry_after_ms'] >= 0 and rejected[0]['queue']['workers'] == 2
+        native = admitted[0]['native_rag_processing']
+        assert native['processing_successful'] and native['augment_bridge']['query_context'] == 'Implement feature 0'
+        assert admitted[1]['native_rag_processing']['augment_bridge']['query_context'] == 'Implement feature 1'
+
+        # Consultation and sync overlap, the two running tasks share one sync
+        assert calls['syncs'] == 2 and integration.integration_state['performance_metrics']['project_core_syncs_shared'] == 1
+        assert elapsed < 0.8  # sequential phases would take 3 x 0.4s
+        status = integration.get_integration_status()
+        assert status['task_queue']['completed'] == 3
+        assert integration.integration_state['performance_metrics']['admission_rejections'] == 1
+
+        result = await integration.submit_task({'task_id': 'expired', 'description': 'x'}, deadline=Deadline(0))
+        assert result['deadline_exceeded'] and not result['success']
+        await integration.stop_task_queue()
+        print(f"✅ 3 tasks in {elapsed:.2f}s, 1 rejected, {calls['syncs']} project-core syncs")
+    except Exception as e:
+        print(f"❌ Test 5 failed: {e}")
+
+    print("\n✅ [TASK QUEUE TESTS] All tests completed")
+
+if __name__ == "__main__":
+    asyncio.run(test_task_queue())